@@ -0,0 +1,114 @@
+"""Add persisted tsvector column with GIN index to document_chunks.
+
+Revision ID: 019
+Revises: 018_add_missing_fks
+Create Date: 2026-10-16
+
+Lexical (full-text) search previously evaluated
+to_tsvector('english', content) inline for every chunk of the tenant on
+every query, which forces a sequential scan and re-tokenizes the corpus.
+
+Adds:
+- document_chunks.content_tsv tsvector (nullable)
+- document_chunks_content_tsv_trigger() + BEFORE INSERT/UPDATE OF content
+  trigger that keeps content_tsv in sync with content
+- ix_chunks_content_tsv GIN index (built CONCURRENTLY)
+
+Backfill:
+- Existing rows are filled in batches of _BACKFILL_BATCH_SIZE, each batch
+  committed on its own so no long-running transaction holds row locks on
+  a large table. The trigger is installed first, so rows written while
+  the backfill runs are covered as well.
+
+Notes:
+- The text-search configuration must match CONTENT_TSV_CONFIG in
+  src/models/document.py and the lexical query in src/rag/hybrid_search.py.
+- CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so it
+  runs in an alembic autocommit block.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "019"
+down_revision: str | None = "018_add_missing_fks"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TS_CONFIG = "english"
+_BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Add content_tsv, its maintenance trigger, backfill, and GIN index."""
+    op.add_column(
+        "document_chunks",
+        sa.Column(
+            "content_tsv",
+            postgresql.TSVECTOR(),
+            nullable=True,
+            comment=f"to_tsvector('{_TS_CONFIG}', content); trigger-maintained",
+        ),
+    )
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION document_chunks_content_tsv_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.content_tsv := to_tsvector('{_TS_CONFIG}', NEW.content);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER document_chunks_content_tsv_update
+        BEFORE INSERT OR UPDATE OF content ON document_chunks
+        FOR EACH ROW EXECUTE FUNCTION document_chunks_content_tsv_trigger()
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        backfill = sa.text(
+            f"""
+            UPDATE document_chunks
+            SET content_tsv = to_tsvector('{_TS_CONFIG}', content)
+            WHERE id IN (
+                SELECT id FROM document_chunks
+                WHERE content_tsv IS NULL AND content IS NOT NULL
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+            """
+        )
+        # SKIP LOCKED can return a short batch while rows remain (locked by a
+        # concurrent writer), so only an empty batch means the backfill is done.
+        while conn.execute(backfill, {"batch_size": _BACKFILL_BATCH_SIZE}).rowcount:
+            pass
+
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chunks_content_tsv
+            ON document_chunks USING gin (content_tsv)
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop the GIN index, trigger, function and column."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chunks_content_tsv")
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS document_chunks_content_tsv_update ON document_chunks"
+    )
+    op.execute("DROP FUNCTION IF EXISTS document_chunks_content_tsv_trigger()")
+    op.drop_column("document_chunks", "content_tsv")
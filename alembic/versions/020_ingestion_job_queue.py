@@ -0,0 +1,76 @@
+"""Turn ingestion_jobs into a durable work queue with progress counters.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16
+
+Uploads are now queued (PENDING with the file stored on the job) and
+processed by background workers instead of inside the HTTP request.
+
+Adds to ingestion_jobs:
+- file_content bytea - uploaded bytes awaiting processing
+- attempts, locked_by, locked_at - claim/lease bookkeeping
+- chunks_total, chunks_embedded - progress counters (chunk_count = stored)
+- ix_ingestion_jobs_pending_created - partial index used by the claim query
+
+Adds to tenant_settings:
+- ingestion_concurrency - per-tenant cap on jobs processed in parallel
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "020"
+down_revision: str | None = "019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add queue, lease and progress columns."""
+    op.add_column(
+        "ingestion_jobs",
+        sa.Column("chunks_total", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "ingestion_jobs",
+        sa.Column("chunks_embedded", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("ingestion_jobs", sa.Column("file_content", sa.LargeBinary(), nullable=True))
+    op.add_column(
+        "ingestion_jobs",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("ingestion_jobs", sa.Column("locked_by", sa.String(128), nullable=True))
+    op.add_column(
+        "ingestion_jobs",
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_ingestion_jobs_pending_created",
+        "ingestion_jobs",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+    op.add_column(
+        "tenant_settings",
+        sa.Column("ingestion_concurrency", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop queue, lease and progress columns."""
+    op.drop_column("tenant_settings", "ingestion_concurrency")
+
+    op.drop_index("ix_ingestion_jobs_pending_created", table_name="ingestion_jobs")
+    op.drop_column("ingestion_jobs", "locked_at")
+    op.drop_column("ingestion_jobs", "locked_by")
+    op.drop_column("ingestion_jobs", "attempts")
+    op.drop_column("ingestion_jobs", "file_content")
+    op.drop_column("ingestion_jobs", "chunks_embedded")
+    op.drop_column("ingestion_jobs", "chunks_total")
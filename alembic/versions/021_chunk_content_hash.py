@@ -0,0 +1,78 @@
+"""Add content hash and embedding model to document_chunks; dedup counter on jobs.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-16
+
+Ingestion now reuses embeddings for chunk text that was already embedded
+with the same model, looked up by (tenant_id, content_hash).
+
+Adds to document_chunks:
+- content_hash varchar(64) - SHA-256 hex digest of content
+- embedding_model varchar(255) - model that produced the embedding
+- ix_chunks_tenant_content_hash (built CONCURRENTLY)
+
+Adds to ingestion_jobs:
+- chunks_deduplicated - chunks whose embedding was reused
+
+Notes:
+- Existing rows are not backfilled: the model that embedded them is not
+  recorded, so they could not be safely reused anyway. They keep NULLs and
+  are simply never matched.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "021"
+down_revision: str | None = "020"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add dedup columns and the lookup index."""
+    op.add_column(
+        "document_chunks",
+        sa.Column(
+            "content_hash",
+            sa.String(64),
+            nullable=True,
+            comment="SHA-256 hex digest of content",
+        ),
+    )
+    op.add_column(
+        "document_chunks",
+        sa.Column(
+            "embedding_model",
+            sa.String(255),
+            nullable=True,
+            comment="Embedding model that produced the embedding",
+        ),
+    )
+    op.add_column(
+        "ingestion_jobs",
+        sa.Column("chunks_deduplicated", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chunks_tenant_content_hash
+            ON document_chunks (tenant_id, content_hash)
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop dedup columns and the lookup index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chunks_tenant_content_hash")
+
+    op.drop_column("ingestion_jobs", "chunks_deduplicated")
+    op.drop_column("document_chunks", "embedding_model")
+    op.drop_column("document_chunks", "content_hash")
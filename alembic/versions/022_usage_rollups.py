@@ -0,0 +1,112 @@
+"""Add hourly/daily usage rollups and their watermarks.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-16
+
+Dashboard queries selected raw usage_metrics rows (or their JSONB
+dimensions) for the whole date range and aggregated them in Python, so
+latency and memory grew with traffic. AnalyticsRollupJob now materializes
+closed hours and days into usage_rollups and the analytics service reads
+raw rows only for the hours not rolled up yet.
+
+Adds:
+- usage_rollups - sums per (tenant, granularity, bucket_start, metric_type,
+  model, agent_id, user_id); unique index ix_usage_rollups_grain is the
+  upsert target and serves tenant/time-range scans
+- usage_rollup_watermarks - exclusive upper bound of complete buckets per
+  granularity
+
+Notes:
+- No backfill here: the job starts from the oldest usage_metrics row on
+  its first pass and catches up in bounded chunks
+  (ANALYTICS_ROLLUP_MAX_HOURS_PER_PASS hours per transaction).
+- metric_type reuses the enum type created in 007.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "022"
+down_revision: str | None = "021"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create usage_rollups and usage_rollup_watermarks."""
+    op.create_table(
+        "usage_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("granularity", sa.String(8), nullable=False, comment="hour or day"),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "metric_type",
+            postgresql.ENUM(name="metric_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("model", sa.String(255), nullable=False, server_default=""),
+        sa.Column("agent_id", sa.String(255), nullable=False, server_default=""),
+        sa.Column("user_id", sa.String(64), nullable=False, server_default=""),
+        sa.Column("event_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("value_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("prompt_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("completion_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("cost", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("error_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("success_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("response_time_ms_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("response_time_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("duration_ms_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("steps_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_usage_rollups_grain",
+        "usage_rollups",
+        [
+            "tenant_id",
+            "granularity",
+            "bucket_start",
+            "metric_type",
+            "model",
+            "agent_id",
+            "user_id",
+        ],
+        unique=True,
+    )
+
+    op.create_table(
+        "usage_rollup_watermarks",
+        sa.Column("granularity", sa.String(8), primary_key=True),
+        sa.Column("rolled_up_to", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the rollup tables."""
+    op.drop_table("usage_rollup_watermarks")
+    op.drop_index("ix_usage_rollups_grain", table_name="usage_rollups")
+    op.drop_table("usage_rollups")
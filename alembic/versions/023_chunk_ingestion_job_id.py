@@ -0,0 +1,75 @@
+"""Add an indexed ingestion_job_id column to document_chunks.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-16
+
+Failed and requeued ingestion jobs delete the chunks they already wrote.
+That delete filtered on chunk_metadata->>'ingestion_job_id', which no index
+covers, so every retry scanned the tenant's whole chunk set.
+
+Adds to document_chunks:
+- ingestion_job_id uuid - job that wrote the chunk (NULL for chunks written
+  by the synchronous ingest pipeline)
+- ix_chunks_ingestion_job_id - partial index on non-NULL ingestion_job_id
+  (built CONCURRENTLY)
+
+Notes:
+- Only chunks of jobs that are not completed are backfilled from
+  chunk_metadata; chunks of completed jobs are never deleted by job id,
+  so they keep NULL.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "023"
+down_revision: str | None = "022"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add ingestion_job_id, backfill in-flight jobs and build the index."""
+    op.add_column(
+        "document_chunks",
+        sa.Column(
+            "ingestion_job_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="IngestionJob that wrote this chunk",
+        ),
+    )
+
+    op.execute(
+        """
+        UPDATE document_chunks dc
+        SET ingestion_job_id = j.id
+        FROM ingestion_jobs j
+        WHERE dc.chunk_metadata->>'ingestion_job_id' = j.id::text
+          AND dc.tenant_id = j.tenant_id
+          AND j.status <> 'completed'
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chunks_ingestion_job_id
+            ON document_chunks (ingestion_job_id)
+            WHERE ingestion_job_id IS NOT NULL
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop the index and the column."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chunks_ingestion_job_id")
+
+    op.drop_column("document_chunks", "ingestion_job_id")
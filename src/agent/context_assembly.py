@@ -0,0 +1,150 @@
+"""Concurrent context assembly for a chat turn.
+
+A chat turn pulls context from several independent sources (conversation
+history, RAG retrieval, agent memories, active goals). Running them one
+after another puts every round-trip on the critical path. assemble_context
+runs them concurrently and gives each an optional deadline:
+
+- A source that finishes in time contributes its value.
+- A source that exceeds its deadline or raises degrades to its default
+  (e.g. "no memories") and never fails the turn, unless it is marked
+  required - then the exception propagates.
+
+Every source reports its wall time and outcome so the runtime can attach
+per-source timings to the response.
+
+AsyncSession is not safe for concurrent use, so sources that query the
+database get their own session via source_session() when a session
+factory is available; without one they share the request session under a
+lock and run one at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+log = structlog.get_logger(__name__)
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class ContextSource:
+    """One context source of a chat turn."""
+
+    name: str
+    load: Callable[[], Awaitable[Any]]
+    default: Any = None
+    deadline_s: float | None = None
+    required: bool = False
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one context source."""
+
+    value: Any
+    elapsed_ms: float
+    status: str = STATUS_OK
+    error: str | None = None
+
+
+@dataclass
+class AssembledContext:
+    """Results of all context sources, keyed by source name."""
+
+    results: dict[str, SourceResult] = field(default_factory=dict)
+    total_ms: float = 0.0
+
+    def value(self, name: str) -> Any:
+        """Return the value (or degraded default) of a source."""
+        return self.results[name].value
+
+    @property
+    def timings_ms(self) -> dict[str, float]:
+        """Wall time per source in milliseconds."""
+        return {name: round(r.elapsed_ms, 2) for name, r in self.results.items()}
+
+    @property
+    def degraded(self) -> list[str]:
+        """Sources that timed out or failed and fell back to their default."""
+        return [name for name, r in self.results.items() if r.status != STATUS_OK]
+
+
+async def _run_source(source: ContextSource) -> SourceResult:
+    start = time.perf_counter()
+    try:
+        if source.deadline_s is not None:
+            value = await asyncio.wait_for(source.load(), timeout=source.deadline_s)
+        else:
+            value = await source.load()
+    except TimeoutError:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if source.required:
+            raise
+        log.warning(
+            "context.source_timeout",
+            source=source.name,
+            deadline_ms=int((source.deadline_s or 0) * 1000),
+        )
+        return SourceResult(source.default, elapsed_ms, STATUS_TIMEOUT)
+    except Exception as exc:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if source.required:
+            raise
+        log.warning("context.source_failed", source=source.name, error=str(exc))
+        return SourceResult(source.default, elapsed_ms, STATUS_ERROR, str(exc))
+    return SourceResult(value, (time.perf_counter() - start) * 1000)
+
+
+async def assemble_context(sources: list[ContextSource]) -> AssembledContext:
+    """Run all sources concurrently; see the module docstring for semantics.
+
+    Raises:
+        Exception: The first error of a required source (others are cancelled)
+    """
+    start = time.perf_counter()
+    tasks = [asyncio.ensure_future(_run_source(source)) for source in sources]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return AssembledContext(
+        results={source.name: result for source, result in zip(sources, results)},
+        total_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+@asynccontextmanager
+async def source_session(
+    session_factory: Callable[[], AsyncSession] | None,
+    shared_db: AsyncSession,
+    shared_lock: asyncio.Lock,
+) -> AsyncIterator[AsyncSession]:
+    """Yield a session a context source may use concurrently with others.
+
+    With a factory: a dedicated session, committed when the source
+    succeeds (memory recall records access stats) and rolled back
+    otherwise. Without one: the shared request session, held exclusively.
+    """
+    if session_factory is None:
+        async with shared_lock:
+            yield shared_db
+        return
+
+    async with session_factory() as session:
+        yield session
+        await session.commit()
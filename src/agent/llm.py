@@ -8,13 +8,20 @@ all calls through a LiteLLM proxy server to:
 
 This module:
 - Wraps litellm.completion() and litellm.aembedding()
+- Streams completions token by token (stream()), recording time to first
+  token and inter-token latency
 - Handles retries with exponential backoff via tenacity
 - Normalizes errors to our domain exceptions
 - Logs token usage for billing/monitoring
+- Borrows the app-scoped LLMTransport (shared HTTP pool, per-model
+  concurrency limits) when the application has created one
 """
 
 from __future__ import annotations
 
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any
 
 import litellm
@@ -26,7 +33,9 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.agent.llm_transport import LLMTransport, get_llm_transport
 from src.config import Settings, get_settings
+from src.middleware.prometheus import record_llm_stream
 
 log = structlog.get_logger(__name__)
 
@@ -54,11 +63,30 @@ class LLMUnavailableError(LLMError):
 class LLMClient:
     """Thin wrapper around LiteLLM with retry logic and structured logging."""
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        transport: LLMTransport | None = None,
+    ) -> None:
         self._settings = settings or get_settings()
-        # Configure LiteLLM to route through our proxy
-        litellm.api_base = self._settings.litellm_base_url
-        litellm.api_key = self._settings.litellm_api_key.get_secret_value()
+        self._transport = transport or get_llm_transport()
+        if self._transport is None:
+            # No app-scoped transport (scripts, tests): configure LiteLLM to
+            # route through our proxy globally
+            litellm.api_base = self._settings.litellm_base_url
+            litellm.api_key = self._settings.litellm_api_key.get_secret_value()
+
+    def _slot(self, model: str) -> AbstractAsyncContextManager[Any]:
+        """Per-model concurrency slot of the shared transport (no-op without one)."""
+        if self._transport is None:
+            return nullcontext()
+        return self._transport.slot(model)
+
+    def _call_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Merge per-call proxy routing from the shared transport into kwargs."""
+        if self._transport is None:
+            return kwargs
+        return {**self._transport.request_kwargs, **kwargs}
 
     @retry(
         retry=retry_if_exception_type(_RETRYABLE),
@@ -83,7 +111,7 @@ class LLMClient:
             model: Model identifier. Falls back to LITELLM_DEFAULT_MODEL.
             temperature: Sampling temperature (0.0 = deterministic)
             max_tokens: Maximum output tokens
-            stream: Whether to stream the response (not yet wired to API)
+            stream: Passed through to LiteLLM; use stream() for token streaming
             **kwargs: Additional kwargs passed to litellm.acompletion()
 
         Returns:
@@ -104,14 +132,15 @@ class LLMClient:
         )
 
         try:
-            response: litellm.ModelResponse = await litellm.acompletion(
-                model=effective_model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=stream,
-                **kwargs,
-            )
+            async with self._slot(effective_model):
+                response: litellm.ModelResponse = await litellm.acompletion(
+                    model=effective_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=stream,
+                    **self._call_kwargs(kwargs),
+                )
         except litellm.exceptions.RateLimitError as exc:
             raise LLMRateLimitError(f"Rate limit from upstream LLM: {exc}") from exc
         except litellm.exceptions.ServiceUnavailableError as exc:
@@ -131,6 +160,106 @@ class LLMClient:
 
         return response
 
+    async def stream(
+        self,
+        *,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, yielding text deltas as they arrive.
+
+        Opening the stream is retried like complete(); once the first chunk
+        has been read, errors are not retried (output was already yielded).
+        Time to first token and inter-token gaps are recorded in Prometheus.
+
+        Args:
+            messages: List of role/content dicts (OpenAI format)
+            model: Model identifier. Falls back to LITELLM_DEFAULT_MODEL.
+            temperature: Sampling temperature (0.0 = deterministic)
+            max_tokens: Maximum output tokens
+            **kwargs: Additional kwargs passed to litellm.acompletion()
+
+        Yields:
+            Non-empty content deltas
+
+        Raises:
+            LLMRateLimitError: Upstream rate limit after retries
+            LLMUnavailableError: Service unavailable after retries
+            LLMError: Any other LLM failure, including mid-stream errors
+        """
+        effective_model = model or self._settings.litellm_default_model
+
+        log.debug(
+            "llm.stream_request",
+            model=effective_model,
+            message_count=len(messages),
+            max_tokens=max_tokens,
+        )
+
+        start = time.perf_counter()
+        first_token_at: float | None = None
+        last_token_at = start
+        gaps: list[float] = []
+        chunks = 0
+        try:
+            # The slot is held until the last chunk: a streamed completion
+            # occupies the model for its whole duration
+            async with self._slot(effective_model):
+                response = await self._open_stream(
+                    model=effective_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **self._call_kwargs(kwargs),
+                )
+                try:
+                    async for chunk in response:
+                        delta = _delta_text(chunk)
+                        if not delta:
+                            continue
+                        now = time.perf_counter()
+                        if first_token_at is None:
+                            first_token_at = now
+                        else:
+                            gaps.append(now - last_token_at)
+                        last_token_at = now
+                        chunks += 1
+                        yield delta
+                except LLMError:
+                    raise
+                except Exception as exc:
+                    raise LLMError(f"LLM stream failed: {exc}") from exc
+        finally:
+            ttft = first_token_at - start if first_token_at is not None else None
+            record_llm_stream(effective_model, ttft, gaps)
+            log.info(
+                "llm.stream_done",
+                model=effective_model,
+                chunks=chunks,
+                ttft_ms=int(ttft * 1000) if ttft is not None else None,
+                duration_ms=int((time.perf_counter() - start) * 1000),
+            )
+
+    @retry(
+        retry=retry_if_exception_type(_RETRYABLE),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        reraise=True,
+    )
+    async def _open_stream(self, *, model: str, **kwargs: Any) -> Any:
+        """Open a LiteLLM streaming response (an async iterator of chunks)."""
+        try:
+            return await litellm.acompletion(model=model, stream=True, **kwargs)
+        except litellm.exceptions.RateLimitError as exc:
+            raise LLMRateLimitError(f"Rate limit from upstream LLM: {exc}") from exc
+        except litellm.exceptions.ServiceUnavailableError as exc:
+            raise LLMUnavailableError(f"LLM service unavailable: {exc}") from exc
+        except Exception as exc:
+            raise LLMError(f"LLM completion failed: {exc}") from exc
+
     @retry(
         retry=retry_if_exception_type(_RETRYABLE),
         stop=stop_after_attempt(3),
@@ -156,10 +285,12 @@ class LLMClient:
             return []
 
         try:
-            response = await litellm.aembedding(
-                model=effective_model,
-                input=texts,
-            )
+            async with self._slot(effective_model):
+                response = await litellm.aembedding(
+                    model=effective_model,
+                    input=texts,
+                    **self._call_kwargs({}),
+                )
         except Exception as exc:
             raise LLMError(f"Embedding failed: {exc}") from exc
 
@@ -185,3 +316,11 @@ class LLMClient:
             return response.model or self._settings.litellm_default_model
         except AttributeError:
             return self._settings.litellm_default_model
+
+
+def _delta_text(chunk: Any) -> str:
+    """Extract the content delta from a streaming chunk ("" if none)."""
+    try:
+        return chunk.choices[0].delta.content or ""
+    except (AttributeError, IndexError, KeyError):
+        return ""
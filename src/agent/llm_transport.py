@@ -0,0 +1,208 @@
+"""Application-scoped HTTP transport for LLM calls.
+
+Every request handler builds its own LLMClient. Without a shared transport
+each client reconfigures LiteLLM's globals and calls go out over LiteLLM's
+default HTTP clients, so under load the proxy sees repeated connection
+setup and there is no control over keep-alive, HTTP/2 or how many calls a
+single model may have in flight.
+
+LLMTransport is created once in the application lifespan (init_llm_transport)
+and borrowed by every LLMClient:
+- One tuned httpx.AsyncClient pool (max connections, keep-alive, HTTP/2 when
+  the h2 package is installed) installed as LiteLLM's async session
+- Proxy base URL and key passed per call instead of mutating litellm globals
+- Per-model concurrency semaphores (LLM_MAX_CONCURRENCY_PER_MODEL, with
+  per-model overrides in LLM_MODEL_CONCURRENCY); 0 means unlimited
+- Slot wait time, in-flight calls and pool connections exported to Prometheus
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+import litellm
+import structlog
+
+from src.config import Settings, get_settings
+from src.middleware.prometheus import record_llm_slot, update_llm_pool
+
+log = structlog.get_logger(__name__)
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class LLMTransport:
+    """Shared connection pool and per-model concurrency limits for LLM calls."""
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        api_key: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_s: float = 30.0,
+        http2: bool = True,
+        timeout_s: float = 120.0,
+        max_concurrency_per_model: int = 0,
+        model_concurrency: dict[str, int] | None = None,
+    ) -> None:
+        if http2 and not _h2_available():
+            log.warning("llm_transport.http2_unavailable", reason="h2 package not installed")
+            http2 = False
+        self._base_url = base_url
+        self._api_key = api_key
+        self._http2 = http2
+        self._max_connections = max_connections
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry_s,
+            ),
+            timeout=httpx.Timeout(timeout_s, connect=10.0),
+        )
+        self._default_limit = max_concurrency_per_model
+        self._model_limits = dict(model_concurrency or {})
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._in_flight: dict[str, int] = {}
+        self._waiting: dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> LLMTransport:
+        """Build a transport from LLM_* settings (all optional)."""
+        return cls(
+            base_url=settings.litellm_base_url,
+            api_key=settings.litellm_api_key.get_secret_value(),
+            max_connections=getattr(settings, "llm_pool_max_connections", 100),
+            max_keepalive_connections=getattr(settings, "llm_pool_max_keepalive", 20),
+            keepalive_expiry_s=getattr(settings, "llm_pool_keepalive_expiry_seconds", 30.0),
+            http2=getattr(settings, "llm_http2", True),
+            timeout_s=getattr(settings, "llm_timeout_seconds", 120.0),
+            max_concurrency_per_model=getattr(settings, "llm_max_concurrency_per_model", 0),
+            model_concurrency=getattr(settings, "llm_model_concurrency", None),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared httpx client."""
+        return self._client
+
+    @property
+    def request_kwargs(self) -> dict[str, Any]:
+        """Per-call LiteLLM kwargs that route through the proxy."""
+        return {"api_base": self._base_url, "api_key": self._api_key}
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore | None:
+        limit = self._model_limits.get(model, self._default_limit)
+        if limit <= 0:
+            return None
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            semaphore = self._semaphores[model] = asyncio.Semaphore(limit)
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, model: str) -> AsyncIterator[None]:
+        """Hold one of the model's concurrency slots for the duration of a call."""
+        semaphore = self._semaphore(model)
+        start = time.perf_counter()
+        if semaphore is not None:
+            self._waiting[model] = self._waiting.get(model, 0) + 1
+            try:
+                await semaphore.acquire()
+            finally:
+                self._waiting[model] -= 1
+        self._in_flight[model] = self._in_flight.get(model, 0) + 1
+        record_llm_slot(model, time.perf_counter() - start, self._in_flight[model])
+        try:
+            yield
+        finally:
+            self._in_flight[model] -= 1
+            if semaphore is not None:
+                semaphore.release()
+            active, idle = self._pool_connections()
+            update_llm_pool(model, self._in_flight[model], active, idle)
+
+    def _pool_connections(self) -> tuple[int | None, int | None]:
+        """Return (active, idle) connection counts of the httpx pool.
+
+        httpx does not expose pool state publicly; read it from the httpcore
+        pool when available and report unknown otherwise.
+        """
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return None, None
+        try:
+            idle = sum(1 for conn in connections if conn.is_idle())
+        except Exception:
+            return None, None
+        return len(connections) - idle, idle
+
+    def stats(self) -> dict[str, Any]:
+        """Pool configuration and current utilisation, for diagnostics."""
+        active, idle = self._pool_connections()
+        models = sorted(set(self._in_flight) | set(self._waiting))
+        return {
+            "http2": self._http2,
+            "max_connections": self._max_connections,
+            "connections": {"active": active, "idle": idle},
+            "models": {
+                model: {
+                    "in_flight": self._in_flight.get(model, 0),
+                    "waiting": self._waiting.get(model, 0),
+                    "limit": self._model_limits.get(model, self._default_limit) or None,
+                }
+                for model in models
+            },
+        }
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_transport: LLMTransport | None = None
+
+
+def init_llm_transport(settings: Settings | None = None) -> LLMTransport:
+    """Create the app-scoped transport and install it as LiteLLM's async session."""
+    global _transport
+    cfg = settings or get_settings()
+    _transport = LLMTransport.from_settings(cfg)
+    litellm.aclient_session = _transport.client
+    stats = _transport.stats()
+    log.info(
+        "llm_transport.initialized",
+        http2=stats["http2"],
+        max_connections=stats["max_connections"],
+    )
+    return _transport
+
+
+def get_llm_transport() -> LLMTransport | None:
+    """Return the app-scoped transport, or None outside the application."""
+    return _transport
+
+
+async def close_llm_transport() -> None:
+    """Close the shared pool and restore LiteLLM's default clients."""
+    global _transport
+    if _transport is not None:
+        if litellm.aclient_session is _transport.client:
+            litellm.aclient_session = None
+        await _transport.aclose()
+        log.info("llm_transport.closed")
+        _transport = None
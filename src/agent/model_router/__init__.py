@@ -1,9 +1,11 @@
 """Model routing and token economy for intelligent LLM selection.
 
 This module provides intelligent model selection based on task complexity,
-token budget management, and automatic fallback chains. It integrates with
-LiteLLM to route requests to appropriate model tiers (LIGHT/STANDARD/HEAVY)
-based on:
+token budget management, automatic fallback chains guarded by per-model
+circuit breakers, opt-in hedged requests for latency-critical calls, and a
+rule-based fast path that answers routing classification without an LLM call.
+It integrates with LiteLLM to route requests to appropriate model tiers
+(LIGHT/STANDARD/HEAVY) based on:
 - Task complexity estimation
 - Agent requirements
 - Token budget constraints
@@ -16,20 +18,56 @@ Use the Persistent* variants for durable, multi-instance deployments.
 from __future__ import annotations
 
 from src.agent.model_router.budget import BudgetManager, TokenBudget
+from src.agent.model_router.circuit_breaker import (
+    BreakerState,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+    get_circuit_breakers,
+)
 from src.agent.model_router.complexity import ComplexityEstimator, TaskComplexity
 from src.agent.model_router.fallback import FallbackChain
+from src.agent.model_router.fast_path import (
+    FastPathClassifier,
+    FastPathResult,
+    TenantRoutingModel,
+    get_fast_path_classifier,
+    init_fast_path,
+)
+from src.agent.model_router.hedging import (
+    HedgedExecutor,
+    HedgingConfig,
+    HedgingPolicy,
+    get_hedged_executor,
+    init_hedging,
+)
 from src.agent.model_router.metrics import ModelMetricsCollector, RoutingDecision
 from src.agent.model_router.router import ModelConfig, ModelRouter, ModelTier
 
 __all__ = [
+    "BreakerState",
     "BudgetManager",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitBreakerRegistry",
     "ComplexityEstimator",
     "FallbackChain",
+    "FastPathClassifier",
+    "FastPathResult",
+    "HedgedExecutor",
+    "HedgingConfig",
+    "HedgingPolicy",
     "ModelConfig",
     "ModelMetricsCollector",
     "ModelRouter",
     "ModelTier",
     "RoutingDecision",
     "TaskComplexity",
+    "TenantRoutingModel",
     "TokenBudget",
+    "get_circuit_breakers",
+    "get_fast_path_classifier",
+    "get_hedged_executor",
+    "init_fast_path",
+    "init_hedging",
 ]
@@ -440,6 +440,11 @@ class PersistentBudgetManager(BudgetManager):
             default_monthly_limit=default_monthly_limit,
         )
 
+    @property
+    def session_factory(self) -> Callable[[], AsyncSession]:
+        """Session factory for callers that check or record outside a request."""
+        return self._session_factory
+
     # ------------------------------------------------------------------
     # Async public API  (preferred — use these from async callers)
     # ------------------------------------------------------------------
@@ -0,0 +1,255 @@
+"""Per-model circuit breakers for the fallback chain.
+
+Without a breaker, a model backend that is down costs every request a full
+timeout (plus client retries) before FallbackChain moves on to the next
+tier. A CircuitBreaker watches the rolling outcome window of one model and
+short-circuits calls while the model is unhealthy.
+
+States:
+- closed: calls flow; outcomes are recorded in a rolling window
+- open: calls are rejected instantly for ``open_duration_s``
+- half_open: after the open period a limited number of probe calls are let
+  through; a success closes the breaker, a failure re-opens it
+
+The breaker opens when, over at least ``min_calls`` recent calls, the error
+rate reaches ``error_rate_threshold`` or the share of calls slower than
+``slow_call_threshold_s`` reaches ``slow_call_rate_threshold``.
+
+Breakers live in a process-wide registry (get_circuit_breakers) so state is
+shared by every FallbackChain and can be reported by the health endpoint.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+import structlog
+
+from src.middleware.prometheus import record_circuit_state
+
+log = structlog.get_logger(__name__)
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Thresholds for opening and probing a circuit.
+
+    Attributes:
+        window_size: Number of recent calls in the rolling window
+        min_calls: Calls required in the window before the breaker may open
+        error_rate_threshold: Error rate (0.0-1.0) that opens the breaker
+        slow_call_threshold_s: Latency above which a call counts as slow
+        slow_call_rate_threshold: Share of slow calls (0.0-1.0) that opens the breaker
+        open_duration_s: Seconds to reject calls before probing again
+        half_open_max_calls: Concurrent probe calls allowed while half-open
+    """
+
+    window_size: int = 20
+    min_calls: int = 5
+    error_rate_threshold: float = 0.5
+    slow_call_threshold_s: float = 30.0
+    slow_call_rate_threshold: float = 0.8
+    open_duration_s: float = 30.0
+    half_open_max_calls: int = 1
+
+    def __post_init__(self) -> None:
+        if self.window_size < 1 or self.min_calls < 1:
+            raise ValueError("window_size and min_calls must be positive")
+        if not 0.0 < self.error_rate_threshold <= 1.0:
+            raise ValueError("error_rate_threshold must be in (0, 1]")
+        if not 0.0 < self.slow_call_rate_threshold <= 1.0:
+            raise ValueError("slow_call_rate_threshold must be in (0, 1]")
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    success: bool
+    latency_s: float
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a rolling window of call outcomes."""
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._window: deque[_Outcome] = deque(maxlen=self._config.window_size)
+        self._state = BreakerState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        record_circuit_state(name, self._state, transition=False)
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state; an expired open period becomes half-open."""
+        if (
+            self._state == BreakerState.OPEN
+            and self._clock() - self._opened_at >= self._config.open_duration_s
+        ):
+            self._transition(BreakerState.HALF_OPEN)
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a call may go to this model now.
+
+        In half-open state this reserves a probe slot; the caller must report
+        the outcome with record_success/record_failure.
+        """
+        state = self.state
+        if state == BreakerState.CLOSED:
+            return True
+        if state == BreakerState.HALF_OPEN:
+            if self._probes_in_flight < self._config.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+        return False
+
+    def record_success(self, latency_s: float) -> None:
+        """Record a successful call."""
+        self._window.append(_Outcome(True, latency_s))
+        if self._state == BreakerState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            slow = latency_s >= self._config.slow_call_threshold_s
+            if slow:
+                self._open()
+            else:
+                self._window.clear()
+                self._transition(BreakerState.CLOSED)
+            return
+        self._evaluate()
+
+    def record_failure(self, latency_s: float) -> None:
+        """Record a failed call."""
+        self._window.append(_Outcome(False, latency_s))
+        if self._state == BreakerState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._open()
+            return
+        self._evaluate()
+
+    def release(self) -> None:
+        """Give back a probe slot reserved without an outcome (call cancelled)."""
+        if self._state == BreakerState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    @property
+    def error_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return sum(1 for o in self._window if not o.success) / len(self._window)
+
+    @property
+    def slow_call_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        threshold = self._config.slow_call_threshold_s
+        return sum(1 for o in self._window if o.latency_s >= threshold) / len(self._window)
+
+    @property
+    def mean_latency_s(self) -> float:
+        successes = [o.latency_s for o in self._window if o.success]
+        return sum(successes) / len(successes) if successes else 0.0
+
+    def health_score(self) -> float:
+        """Score in [0, 1] used to order fallback tiers (0 = open)."""
+        state = self.state
+        if state == BreakerState.OPEN:
+            return 0.0
+        score = (1.0 - self.error_rate) * (1.0 - 0.5 * self.slow_call_rate)
+        # Half-open tiers are unproven; prefer healthy closed tiers
+        return score * 0.5 if state == BreakerState.HALF_OPEN else score
+
+    def snapshot(self) -> dict[str, Any]:
+        """State and rolling-window statistics, for health reporting."""
+        state = self.state
+        snapshot: dict[str, Any] = {
+            "state": state.value,
+            "calls": len(self._window),
+            "error_rate": round(self.error_rate, 3),
+            "slow_call_rate": round(self.slow_call_rate, 3),
+            "mean_latency_ms": round(self.mean_latency_s * 1000, 1),
+        }
+        if state == BreakerState.OPEN:
+            remaining = self._config.open_duration_s - (self._clock() - self._opened_at)
+            snapshot["retry_in_s"] = round(max(0.0, remaining), 1)
+        return snapshot
+
+    def _evaluate(self) -> None:
+        if self._state != BreakerState.CLOSED or len(self._window) < self._config.min_calls:
+            return
+        if (
+            self.error_rate >= self._config.error_rate_threshold
+            or self.slow_call_rate >= self._config.slow_call_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._probes_in_flight = 0
+        self._transition(BreakerState.OPEN)
+
+    def _transition(self, new_state: BreakerState) -> None:
+        if new_state == self._state:
+            return
+        previous, self._state = self._state, new_state
+        record_circuit_state(self.name, new_state)
+        log.warning(
+            "circuit_breaker.transition",
+            model_id=self.name,
+            from_state=previous.value,
+            to_state=new_state.value,
+            error_rate=round(self.error_rate, 3),
+            slow_call_rate=round(self.slow_call_rate, 3),
+        )
+
+
+class CircuitBreakerRegistry:
+    """Breakers keyed by model id, created on first use."""
+
+    def __init__(self, config: CircuitBreakerConfig | None = None) -> None:
+        self._config = config or CircuitBreakerConfig()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, model_id: str) -> CircuitBreaker:
+        breaker = self._breakers.get(model_id)
+        if breaker is None:
+            breaker = self._breakers[model_id] = CircuitBreaker(model_id, self._config)
+        return breaker
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())}
+
+    def reset(self) -> None:
+        """Forget all breakers. Used for testing."""
+        self._breakers.clear()
+
+
+_registry: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Return the process-wide breaker registry."""
+    global _registry
+    if _registry is None:
+        _registry = CircuitBreakerRegistry()
+    return _registry
@@ -9,18 +9,29 @@ tiers when failures occur. This provides resilience against:
 
 Fallback strategy:
 1. Try preferred tier
-2. On failure, try next tier in chain
-3. On failure, try next tier
+2. On failure, try the remaining tiers, healthiest first
+3. Skip tiers whose circuit breaker is open (no timeout paid)
 4. If all fail, return safe error (AP.7: fail secure)
+
+Every attempt's outcome and latency feed the model's circuit breaker (see
+circuit_breaker.py). Recent fallback events are kept in a bounded ring buffer.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 import litellm
 import structlog
 
+from src.agent.model_router.circuit_breaker import (
+    CircuitBreakerRegistry,
+    get_circuit_breakers,
+)
+
 if TYPE_CHECKING:
     from src.agent.llm import LLMClient
     from src.agent.model_router.router import ModelConfig
@@ -35,17 +46,26 @@ class FallbackChain:
     Each failure is logged for metrics and observability.
     """
 
-    def __init__(self, tiers: list[ModelConfig]) -> None:
+    def __init__(
+        self,
+        tiers: list[ModelConfig],
+        *,
+        breakers: CircuitBreakerRegistry | None = None,
+        max_events: int = 100,
+    ) -> None:
         """Initialize fallback chain with ordered tiers.
 
         Args:
             tiers: List of ModelConfig in priority order (preferred first)
+            breakers: Circuit breaker registry (defaults to the process-wide one)
+            max_events: Number of recent fallback events to keep
         """
         if not tiers:
             raise ValueError("FallbackChain requires at least one tier")
 
         self._tiers = tiers
-        self._fallback_events: list[dict[str, Any]] = []
+        self._breakers = breakers or get_circuit_breakers()
+        self._fallback_events: deque[dict[str, Any]] = deque(maxlen=max_events)
 
         log.info(
             "fallback_chain.initialized",
@@ -66,9 +86,11 @@ class FallbackChain:
 
         Tries tiers in order:
         1. Preferred tier
-        2. Next tier in chain (if preferred fails)
+        2. Remaining tiers by circuit breaker health score (chain order on ties)
         3. Continue until success or exhaustion
 
+        Tiers with an open circuit are skipped without a call.
+
         Args:
             llm_client: LLMClient instance for making requests
             messages: Chat messages in OpenAI format
@@ -83,15 +105,28 @@ class FallbackChain:
         Raises:
             RuntimeError: If all tiers fail (fail-secure)
         """
-        # Build execution order: preferred first, then rest of chain
-        execution_order = [preferred_tier]
-        for tier in self._tiers:
-            if tier.model_id != preferred_tier.model_id:
-                execution_order.append(tier)
+        # Build execution order: preferred first, then healthiest of the rest
+        others = [tier for tier in self._tiers if tier.model_id != preferred_tier.model_id]
+        others.sort(key=lambda tier: -self._breakers.get(tier.model_id).health_score())
+        execution_order = [preferred_tier, *others]
 
         last_error: Exception | None = None
 
-        for tier in execution_order:
+        for position, tier in enumerate(execution_order):
+            remaining_tiers = len(execution_order) - position - 1
+            breaker = self._breakers.get(tier.model_id)
+            if not breaker.allow_request():
+                self._record_event(tier, "CircuitOpen", "circuit breaker open")
+                log.info(
+                    "fallback_chain.tier_skipped",
+                    model_id=tier.model_id,
+                    tier=tier.tier.value,
+                    circuit=breaker.state.value,
+                    remaining_tiers=remaining_tiers,
+                )
+                continue
+
+            start = time.perf_counter()
             try:
                 log.info(
                     "fallback_chain.attempting_tier",
@@ -109,30 +144,14 @@ class FallbackChain:
                     max_tokens=effective_max_tokens,
                     **kwargs,
                 )
-
-                # Success - log and return
-                log.info(
-                    "fallback_chain.tier_succeeded",
-                    model_id=tier.model_id,
-                    tier=tier.tier.value,
-                    preferred_tier=preferred_tier.tier.value,
-                    fallback_occurred=(tier.model_id != preferred_tier.model_id),
-                )
-
-                return response, tier
-
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
             except Exception as exc:
                 # Log failure and try next tier
                 last_error = exc
-
-                self._fallback_events.append(
-                    {
-                        "tier": tier.tier.value,
-                        "model_id": tier.model_id,
-                        "error_type": type(exc).__name__,
-                        "error_message": str(exc),
-                    }
-                )
+                breaker.record_failure(time.perf_counter() - start)
+                self._record_event(tier, type(exc).__name__, str(exc))
 
                 log.warning(
                     "fallback_chain.tier_failed",
@@ -140,34 +159,60 @@ class FallbackChain:
                     tier=tier.tier.value,
                     error_type=type(exc).__name__,
                     error_message=str(exc),
-                    remaining_tiers=len(execution_order)
-                    - execution_order.index(tier)
-                    - 1,
+                    remaining_tiers=remaining_tiers,
                 )
 
                 # Continue to next tier
                 continue
 
+            # Success - log and return
+            breaker.record_success(time.perf_counter() - start)
+            log.info(
+                "fallback_chain.tier_succeeded",
+                model_id=tier.model_id,
+                tier=tier.tier.value,
+                preferred_tier=preferred_tier.tier.value,
+                fallback_occurred=(tier.model_id != preferred_tier.model_id),
+            )
+
+            return response, tier
+
         # All tiers exhausted - fail secure (AP.7)
         log.error(
             "fallback_chain.all_tiers_failed",
             preferred_tier=preferred_tier.tier.value,
             attempted_tiers=[tier.tier.value for tier in execution_order],
-            fallback_events=self._fallback_events,
+            fallback_events=list(self._fallback_events),
         )
 
         raise RuntimeError(
-            f"All model tiers failed. Last error: {last_error}. "
+            f"All model tiers failed. Last error: {last_error or 'all circuits open'}. "
             "This is a system-level failure requiring investigation."
         )
 
+    def _record_event(self, tier: ModelConfig, error_type: str, error_message: str) -> None:
+        self._fallback_events.append(
+            {
+                "tier": tier.tier.value,
+                "model_id": tier.model_id,
+                "error_type": error_type,
+                "error_message": error_message,
+            }
+        )
+
     def get_fallback_events(self) -> list[dict[str, Any]]:
         """Get list of fallback events that occurred.
 
         Returns:
-            List of fallback event dicts with tier, error info
+            List of recent fallback event dicts (oldest first) with tier, error info
         """
-        return self._fallback_events.copy()
+        return list(self._fallback_events)
+
+    def circuit_states(self) -> dict[str, dict[str, Any]]:
+        """Circuit breaker snapshot for each tier of this chain."""
+        return {
+            tier.model_id: self._breakers.get(tier.model_id).snapshot() for tier in self._tiers
+        }
 
     def reset_events(self) -> None:
         """Clear fallback event history. Used for testing."""
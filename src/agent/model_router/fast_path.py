@@ -0,0 +1,420 @@
+"""Rule-based fast path for routing classification.
+
+AgentOrchestrator.route makes two serial LLM calls before any real work
+starts: intent classification and complexity assessment. Most operator
+questions are unambiguous ("open work orders for pump P-101", "LOTO
+procedure for conveyor 3"), so a local classifier can answer them without
+a model round trip.
+
+Signals:
+- Keyword/regex rules mapping phrases to the specialist capabilities
+- ComplexityEstimator's heuristic score, which must agree before a
+  lookup-style phrasing is answered as SIMPLE
+- A per-tenant token model learned from past LLM routing decisions: tokens
+  that repeatedly led the LLM to a capability vote for it next time
+
+Each answer carries a confidence. Below ``confidence_threshold`` the
+orchestrator falls back to the LLM, whose answer then trains the tenant
+model. The fast-path hit ratio and the estimated latency saved (the
+running average of the LLM calls skipped) are exported to Prometheus.
+
+The classifier is process-wide (init_fast_path/get_fast_path_classifier)
+so the tenant models and statistics are shared by every request.
+"""
+
+from __future__ import annotations
+
+import re
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from src.agent.model_router.complexity import ComplexityEstimator
+from src.middleware.prometheus import record_routing_fast_path
+
+if TYPE_CHECKING:
+    from src.config import Settings
+
+log = structlog.get_logger(__name__)
+
+# Capability -> phrases that signal it. Capabilities match the specialist
+# AgentSpecs; rules for capabilities missing from the registry are ignored.
+_CAPABILITY_RULES: dict[str, list[str]] = {
+    "conversation": [
+        r"^\s*(hi|hello|hey|thanks|thank you|good (morning|afternoon|evening))\b[\s!.?]*$",
+    ],
+    "procedure_lookup": [
+        r"\bprocedures?\b",
+        r"\bhow (do|should|can) (i|we)\b",
+        r"\binstructions?\b",
+    ],
+    "sop_guidance": [r"\bsops?\b", r"\bstandard operating\b"],
+    "safety_reference": [
+        r"\b(lockout|tagout|loto)\b",
+        r"\bppe\b",
+        r"\bhazards?\b",
+        r"\bsafety\b",
+    ],
+    "step_by_step": [r"\bstep[- ]by[- ]step\b", r"\bwalk me through\b"],
+    "work_order": [r"\bwork ?orders?\b", r"\bwo[- ]?\d+\b"],
+    "maintenance_planning": [
+        r"\bmaintenance\b",
+        r"\b(preventive|predictive) maint",
+        r"\bpm (schedule|plan)\b",
+    ],
+    "equipment_query": [
+        r"\b(pump|valve|compressor|motor|conveyor|boiler|turbine|bearing)s?\b",
+        r"\bequipment\b",
+    ],
+    "pid_interpretation": [r"\bp&ids?\b", r"\bpiping and instrumentation\b"],
+    "quality_analysis": [r"\bdefects?\b", r"\bnon-?conformance\b", r"\bncr\b", r"\bquality\b"],
+    "compliance_check": [r"\bcompliance\b", r"\bcompliant\b", r"\bregulat(ion|ory)\b"],
+    "anomaly_detection": [r"\banomal(y|ies|ous)\b", r"\boutliers?\b"],
+    "spc": [r"\bspc\b", r"\bcontrol charts?\b", r"\bcp ?k\b"],
+    "data_query": [r"\bhow many\b", r"\blist (all|the)\b", r"\bkpis?\b"],
+    "calculations": [r"\bcalculate\b", r"\bcompute\b"],
+    "trend_analysis": [r"\btrends?\b", r"\bover (the last|time)\b"],
+    "statistics": [r"\b(average|mean|median|std|standard deviation)\b"],
+    "summarization": [r"\bsummar(y|ise|ize)\b", r"\btl;?dr\b"],
+    "comparison": [r"\bcompare\b", r"\bdifferences? between\b"],
+    "document_analysis": [r"\b(document|report|manual|datasheet)s?\b"],
+}
+
+# Complexity tier (QueryComplexity value) -> phrases that signal it
+_COMPLEXITY_RULES: dict[str, list[str]] = {
+    "quality_critical": [
+        r"\b(lockout|tagout|loto)\b",
+        r"\bsafety\b",
+        r"\bhazard",
+        r"\bcompliance\b",
+        r"\baudit\b",
+        r"\bcalibrat",
+        r"\bmaint(enance|ain)\b",
+        r"\bwork ?orders?\b",
+        r"\bwo[- ]?\d+\b",
+        r"\b(repair|overhaul|replace|isolat(e|ion)|shut ?down)\b",
+    ],
+    "multi_perspective": [
+        r"\bcompare\b",
+        r"\b(versus|vs\.?)\b",
+        r"\btrade[- ]?offs?\b",
+        r"\bpros and cons\b",
+        r"\bshould (we|i)\b",
+        r"\bwhich (is|option|one) (is )?(better|best)\b",
+        r"\balternatives?\b",
+    ],
+    "deep": [
+        r"\broot cause\b",
+        r"\binvestigate\b",
+        r"\bstep[- ]by[- ]step\b",
+        r"\bwalk me through\b",
+        r"\bwhy (did|does|is)\b",
+        r"\bplan (for|to)\b",
+    ],
+    # Single lookups. Only these phrasings can make a query SIMPLE; no match
+    # is not evidence of simplicity.
+    "simple": [
+        r"^\s*(hi|hello|hey|thanks|thank you)\b",
+        r"^\s*(what|where|who|when) (is|are|was)\b",
+        r"\bstatus of\b",
+        r"\b(define|definition of|meaning of)\b",
+        r"^\s*(show|list|look ?up|find)\b",
+    ],
+}
+
+# Capabilities whose answers must be verified regardless of phrasing
+_CRITICAL_CAPABILITIES = {
+    "safety_reference",
+    "compliance_check",
+    "maintenance_planning",
+    "work_order",
+    "equipment_query",
+}
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9&]{2,}")
+_STOPWORDS = frozenset(
+    "the and for with what how does this that are was were from have has can you "
+    "please our your about when where which who there their them then than into".split()
+)
+
+
+def _compile(rules: dict[str, list[str]]) -> dict[str, list[re.Pattern[str]]]:
+    return {
+        key: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for key, patterns in rules.items()
+    }
+
+
+def _tokens(message: str) -> set[str]:
+    return {t for t in _TOKEN_RE.findall(message.lower()) if t not in _STOPWORDS}
+
+
+@dataclass
+class FastPathResult:
+    """A locally computed routing answer.
+
+    Attributes:
+        label: Capability tag (intent stage) or QueryComplexity value
+        confidence: Confidence in [0, 1]; compared to the fallback threshold
+        alternatives: Other candidate labels, best first
+        signals: Rules and model votes that produced the answer
+    """
+
+    label: str
+    confidence: float
+    alternatives: list[str] = field(default_factory=list)
+    signals: list[str] = field(default_factory=list)
+
+
+class TenantRoutingModel:
+    """Per-tenant token votes learned from past routing decisions.
+
+    For every LLM-confirmed decision the message's tokens count toward the
+    chosen capability. Tokens seen at least ``min_count`` times vote with the
+    share of their decisions that went to each capability. Memory is bounded:
+    tenants are kept in LRU order and each tenant's vocabulary is capped.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tenants: int = 1000,
+        max_tokens_per_tenant: int = 5000,
+        min_count: int = 2,
+    ) -> None:
+        self._max_tenants = max_tenants
+        self._max_tokens = max_tokens_per_tenant
+        self._min_count = min_count
+        self._tenants: OrderedDict[uuid.UUID, dict[str, Counter[str]]] = OrderedDict()
+
+    def learn(self, tenant_id: uuid.UUID, message: str, capability: str) -> None:
+        """Record that ``message`` was routed to ``capability``."""
+        votes = self._tenants.get(tenant_id)
+        if votes is None:
+            votes = self._tenants[tenant_id] = {}
+            if len(self._tenants) > self._max_tenants:
+                self._tenants.popitem(last=False)
+        self._tenants.move_to_end(tenant_id)
+        for token in _tokens(message):
+            counter = votes.get(token)
+            if counter is None:
+                if len(votes) >= self._max_tokens:
+                    continue
+                counter = votes[token] = Counter()
+            counter[capability] += 1
+
+    def predict(self, tenant_id: uuid.UUID, message: str) -> dict[str, float]:
+        """Return capability -> vote share in [0, 1] from the tenant's history."""
+        votes = self._tenants.get(tenant_id)
+        if not votes:
+            return {}
+        scores: Counter[str] = Counter()
+        voters = 0
+        for token in _tokens(message):
+            counter = votes.get(token)
+            if counter is None:
+                continue
+            total = sum(counter.values())
+            if total < self._min_count:
+                continue
+            voters += 1
+            for capability, count in counter.items():
+                scores[capability] += count / total
+        if not voters:
+            return {}
+        return {capability: score / voters for capability, score in scores.items()}
+
+
+class _StageStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.fallbacks = 0
+        self.saved_s = 0.0
+        self.llm_latency_s: float | None = None
+
+
+class FastPathClassifier:
+    """Answers intent and complexity locally, deferring to the LLM when unsure."""
+
+    def __init__(
+        self,
+        estimator: ComplexityEstimator | None = None,
+        *,
+        confidence_threshold: float = 0.75,
+        tenant_model: TenantRoutingModel | None = None,
+    ) -> None:
+        """Initialize the classifier.
+
+        Args:
+            estimator: Heuristic complexity estimator
+            confidence_threshold: Minimum confidence to skip the LLM
+            tenant_model: Learned per-tenant routing votes
+        """
+        self._estimator = estimator or ComplexityEstimator()
+        self.confidence_threshold = confidence_threshold
+        self._tenant_model = tenant_model or TenantRoutingModel()
+        self._capability_rules = _compile(_CAPABILITY_RULES)
+        self._complexity_rules = _compile(_COMPLEXITY_RULES)
+        self._stats = {"intent": _StageStats(), "complexity": _StageStats()}
+
+    def classify_intent(
+        self,
+        message: str,
+        *,
+        tenant_id: uuid.UUID | None,
+        capabilities: set[str],
+    ) -> FastPathResult | None:
+        """Pick a capability from keyword rules and the tenant's history.
+
+        Each matching rule scores 1; the tenant model adds up to 2 for a
+        capability its learned votes agree on. Confidence grows with the
+        margin between the best and second-best capability: a single
+        keyword (margin 1) gives 0.7, below the default 0.75 threshold, so
+        it needs a second rule or the tenant's history to skip the LLM.
+
+        Args:
+            message: User message
+            tenant_id: Tenant whose learned votes apply
+            capabilities: Capabilities offered by registered agents
+
+        Returns:
+            The best capability, or None if nothing matched
+        """
+        scores: Counter[str] = Counter()
+        signals: list[str] = []
+        for capability, patterns in self._capability_rules.items():
+            if capability not in capabilities:
+                continue
+            for pattern in patterns:
+                if pattern.search(message):
+                    scores[capability] += 1
+                    signals.append(f"rule:{capability}")
+        if tenant_id is not None:
+            for capability, share in self._tenant_model.predict(tenant_id, message).items():
+                if capability in capabilities:
+                    scores[capability] += 2 * share
+                    signals.append(f"tenant:{capability}={share:.2f}")
+        if not scores:
+            return None
+        ranked = scores.most_common()
+        best, top = ranked[0]
+        second = ranked[1][1] if len(ranked) > 1 else 0.0
+        return FastPathResult(
+            label=best,
+            confidence=round(min(0.95, 0.5 + 0.2 * (top - second)), 3),
+            alternatives=[capability for capability, _ in ranked[1:3]],
+            signals=signals,
+        )
+
+    async def assess_complexity(
+        self, message: str, capability: str
+    ) -> FastPathResult | None:
+        """Pick a complexity tier from phrasing rules and the heuristic score.
+
+        Every matching rule is one signal and a critical capability (safety,
+        compliance, maintenance, work orders, equipment) counts as two for
+        QUALITY_CRITICAL, which also overrides lookup phrasing. One tier with
+        a single signal scores 0.7, below the default threshold; competing
+        tiers are not confident either. SIMPLE needs a positive simple-lookup
+        rule, and ComplexityEstimator placing the query in the light band
+        counts as its second signal.
+
+        Returns:
+            The best tier, or None if no rule matched
+        """
+        hits: Counter[str] = Counter()
+        for tier, patterns in self._complexity_rules.items():
+            hits[tier] += sum(1 for pattern in patterns if pattern.search(message))
+        if capability in _CRITICAL_CAPABILITIES:
+            hits["quality_critical"] += 2
+        if hits["quality_critical"]:
+            # A lookup phrasing never exempts a critical query from the gate
+            hits["simple"] = 0
+        matched = [(tier, count) for tier, count in hits.most_common() if count]
+        if not matched:
+            return None
+        if len(matched) > 1:
+            return FastPathResult(
+                label=matched[0][0],
+                confidence=0.5,
+                alternatives=[tier for tier, _ in matched[1:]],
+                signals=[f"rule:{tier}" for tier, _ in matched],
+            )
+
+        tier, count = matched[0]
+        signals = [f"rule:{tier}"]
+        if tier == "simple":
+            estimate = await self._estimator.estimate(message, agent_capabilities=[capability])
+            signals.append(f"estimator:{estimate.score:.2f}")
+            if estimate.score >= ComplexityEstimator.LIGHT_THRESHOLD:
+                # Phrased as a lookup but heavier than one: let the LLM decide
+                return FastPathResult(label=tier, confidence=0.5, signals=signals)
+            count += 1
+        return FastPathResult(
+            label=tier,
+            confidence=round(min(0.95, 0.6 + 0.1 * count), 3),
+            signals=signals,
+        )
+
+    def accepts(self, result: FastPathResult | None) -> bool:
+        """True if the result is confident enough to skip the LLM."""
+        return result is not None and result.confidence >= self.confidence_threshold
+
+    def record_hit(self, stage: str) -> None:
+        """Count a fast-path answer and the LLM latency it saved."""
+        stats = self._stats[stage]
+        stats.hits += 1
+        saved = stats.llm_latency_s or 0.0
+        stats.saved_s += saved
+        record_routing_fast_path(stage, "hit", saved_seconds=saved)
+
+    def record_fallback(self, stage: str, llm_latency_s: float) -> None:
+        """Count an LLM fallback and update the running LLM latency."""
+        stats = self._stats[stage]
+        stats.fallbacks += 1
+        previous = stats.llm_latency_s
+        stats.llm_latency_s = (
+            llm_latency_s if previous is None else 0.8 * previous + 0.2 * llm_latency_s
+        )
+        record_routing_fast_path(stage, "fallback")
+
+    def learn(self, tenant_id: uuid.UUID, message: str, capability: str) -> None:
+        """Train the tenant model on an LLM routing decision."""
+        self._tenant_model.learn(tenant_id, message, capability)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit ratio and latency saved per stage, for diagnostics."""
+        report: dict[str, Any] = {"confidence_threshold": self.confidence_threshold}
+        for stage, stats in self._stats.items():
+            total = stats.hits + stats.fallbacks
+            report[stage] = {
+                "hits": stats.hits,
+                "fallbacks": stats.fallbacks,
+                "hit_ratio": round(stats.hits / total, 4) if total else 0.0,
+                "latency_saved_s": round(stats.saved_s, 3),
+            }
+        return report
+
+
+_classifier: FastPathClassifier | None = None
+
+
+def init_fast_path(settings: Settings) -> FastPathClassifier | None:
+    """Create the process-wide classifier unless ROUTING_FAST_PATH_ENABLED is false."""
+    global _classifier
+    if not getattr(settings, "routing_fast_path_enabled", True):
+        _classifier = None
+        return None
+    _classifier = FastPathClassifier(
+        confidence_threshold=getattr(settings, "routing_fast_path_confidence", 0.75),
+    )
+    log.info("fast_path.enabled", confidence_threshold=_classifier.confidence_threshold)
+    return _classifier
+
+
+def get_fast_path_classifier() -> FastPathClassifier | None:
+    """Return the process-wide classifier, or None when the fast path is disabled."""
+    return _classifier
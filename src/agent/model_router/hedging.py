@@ -0,0 +1,355 @@
+"""Hedged requests for latency-critical LLM calls.
+
+Short routing calls (intent classification, complexity assessment) sit on
+the critical path of every chat turn, and their latency has a long tail: a
+few percent of calls wait on a slow replica or a cold connection. Hedging
+cuts that tail by sending a duplicate request when the first one has not
+answered within the model's usual latency, then taking whichever answers
+first and cancelling the other.
+
+Policy:
+- The hedge delay is a percentile (default p95) of the model's recent
+  successful latencies; until ``min_samples`` calls have been seen a fixed
+  ``default_delay_s`` is used. Delays are clamped to [min_delay_s, max_delay_s].
+- The duplicate goes to ``hedge_model`` (an equivalent tier or replica) or,
+  if none is given, to the same model so the proxy can pick another replica.
+- Calls that fail before the delay are not hedged; fallback handles errors.
+- Budget guard: a hedge fires only if the tenant's remaining budget covers
+  both calls. The duplicate's estimated tokens are charged to the tenant.
+  With a PersistentBudgetManager (the app's, passed in from main) the check
+  and the charge read and write the token_budgets table in their own
+  sessions, so they see usage from every worker. The charge is written by a
+  background task while the calls race, so it never delays the answer.
+
+Hedging is opt-in (LLM_HEDGING_ENABLED). The executor is process-wide
+(init_hedging/get_hedged_executor/close_hedging) so latency windows are
+shared by every request. Hedge and win rates are exported to Prometheus.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from src.agent.model_router.budget import BudgetManager, PersistentBudgetManager
+from src.agent.model_router.router import ModelTier
+from src.middleware.prometheus import record_llm_hedge
+
+if TYPE_CHECKING:
+    import litellm
+
+    from src.agent.llm import LLMClient
+    from src.config import Settings
+
+log = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class HedgingConfig:
+    """Hedge delay policy.
+
+    Attributes:
+        percentile: Latency percentile (0.0-1.0) after which a hedge fires
+        window_size: Recent successful latencies kept per model
+        min_samples: Samples required before the percentile is trusted
+        default_delay_s: Delay used until min_samples latencies are known
+        min_delay_s: Lower bound on the hedge delay
+        max_delay_s: Upper bound on the hedge delay
+    """
+
+    percentile: float = 0.95
+    window_size: int = 200
+    min_samples: int = 20
+    default_delay_s: float = 1.0
+    min_delay_s: float = 0.05
+    max_delay_s: float = 10.0
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.percentile < 1.0:
+            raise ValueError("percentile must be in (0, 1)")
+        if self.window_size < 1 or self.min_samples < 1:
+            raise ValueError("window_size and min_samples must be positive")
+        if self.min_delay_s > self.max_delay_s:
+            raise ValueError("min_delay_s must not exceed max_delay_s")
+
+
+class HedgingPolicy:
+    """Tracks per-model latencies and derives the hedge delay."""
+
+    def __init__(self, config: HedgingConfig | None = None) -> None:
+        self._config = config or HedgingConfig()
+        self._latencies: dict[str, deque[float]] = {}
+
+    def record_latency(self, model: str, latency_s: float) -> None:
+        """Record the latency of a successful call."""
+        window = self._latencies.get(model)
+        if window is None:
+            window = self._latencies[model] = deque(maxlen=self._config.window_size)
+        window.append(latency_s)
+
+    def delay_for(self, model: str) -> float:
+        """Seconds to wait for the primary call before firing a hedge."""
+        config = self._config
+        window = self._latencies.get(model)
+        if window is None or len(window) < config.min_samples:
+            delay = config.default_delay_s
+        else:
+            ordered = sorted(window)
+            index = min(len(ordered) - 1, math.ceil(config.percentile * len(ordered)) - 1)
+            delay = ordered[index]
+        return min(config.max_delay_s, max(config.min_delay_s, delay))
+
+
+def estimate_tokens(messages: list[dict[str, str]], max_tokens: int | None) -> int:
+    """Rough token estimate for one call: ~4 characters per prompt token."""
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return prompt_chars // 4 + (max_tokens or 0)
+
+
+class HedgedExecutor:
+    """Runs LLM completions with an optional delayed duplicate request."""
+
+    def __init__(
+        self,
+        policy: HedgingPolicy | None = None,
+        *,
+        budget_manager: BudgetManager | None = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            policy: Hedge delay policy (defaults to HedgingConfig defaults)
+            budget_manager: Token budgets guarding hedges; None disables the guard
+        """
+        self._policy = policy or HedgingPolicy()
+        self._budget = budget_manager
+        self._calls = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._budget_denied = 0
+        # Hedge charges still being written to the budget table
+        self._charges: set[asyncio.Task[None]] = set()
+
+    @property
+    def policy(self) -> HedgingPolicy:
+        return self._policy
+
+    async def complete(
+        self,
+        llm_client: LLMClient,
+        *,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        hedge_model: str | None = None,
+        tenant_id: uuid.UUID | None = None,
+        model_tier: ModelTier = ModelTier.LIGHT,
+        estimated_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> litellm.ModelResponse:
+        """Complete a prompt, hedging if the primary call is slow.
+
+        Args:
+            llm_client: Client used for both calls
+            messages: Chat messages
+            model: Primary model (None uses the client's default model)
+            hedge_model: Equivalent model or replica for the duplicate call
+            tenant_id: Tenant whose budget must cover the duplicate call
+            model_tier: Tier charged for the duplicate call's tokens
+            estimated_tokens: Tokens per call (estimated from the prompt if None)
+            **kwargs: Passed to LLMClient.complete (temperature, max_tokens, ...)
+
+        Returns:
+            The first successful response
+
+        Raises:
+            LLMError: If every call made fails (the primary call's error)
+        """
+        primary_key = model or "default"
+        hedge_target = hedge_model or model
+        hedge_key = hedge_target or "default"
+        self._calls += 1
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(
+            llm_client.complete(messages=messages, model=model, **kwargs)
+        )
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self._policy.delay_for(primary_key))
+            if done:
+                response = primary.result()
+                self._policy.record_latency(primary_key, time.perf_counter() - start)
+                record_llm_hedge(primary_key, "not_needed")
+                return response
+
+            estimate = (
+                estimated_tokens
+                if estimated_tokens is not None
+                else estimate_tokens(messages, kwargs.get("max_tokens"))
+            )
+            if not await self._budget_allows(tenant_id, estimate):
+                self._budget_denied += 1
+                record_llm_hedge(primary_key, "budget_denied")
+                response = await primary
+                self._policy.record_latency(primary_key, time.perf_counter() - start)
+                return response
+
+            self._hedges += 1
+            record_llm_hedge(primary_key, "hedged")
+            hedge = asyncio.ensure_future(
+                llm_client.complete(messages=messages, model=hedge_target, **kwargs)
+            )
+            # A cancelled loser reports no usage, so charge the estimate
+            self._schedule_charge(tenant_id, model_tier, estimate)
+            return await self._race(primary, hedge, primary_key, hedge_key, start)
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+    async def _race(
+        self,
+        primary: asyncio.Future[Any],
+        hedge: asyncio.Future[Any],
+        primary_key: str,
+        hedge_key: str,
+        start: float,
+    ) -> litellm.ModelResponse:
+        """Return the first successful result and cancel the other call."""
+        pending: set[asyncio.Future[Any]] = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the primary if both finished in the same tick
+                for task in sorted(done, key=lambda t: t is not primary):
+                    if task.exception() is not None:
+                        continue
+                    winner = "primary" if task is primary else "hedge"
+                    if winner == "hedge":
+                        self._hedge_wins += 1
+                    self._policy.record_latency(
+                        primary_key if task is primary else hedge_key,
+                        time.perf_counter() - start,
+                    )
+                    record_llm_hedge(primary_key, "won", winner=winner)
+                    log.debug("hedging.won", model=primary_key, winner=winner)
+                    return task.result()
+            # Both calls failed; surface the primary call's error
+            log.warning("hedging.all_failed", model=primary_key, hedge_model=hedge_key)
+            raise primary.exception()  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _budget_allows(self, tenant_id: uuid.UUID | None, estimate: int) -> bool:
+        if self._budget is None or tenant_id is None:
+            return True
+        # The primary call is already in flight; both calls must fit the budget
+        if not isinstance(self._budget, PersistentBudgetManager):
+            return self._budget.check_budget(tenant_id, estimate * 2)
+        try:
+            async with self._budget.session_factory() as session:
+                return await self._budget.async_check_budget(session, tenant_id, estimate * 2)
+        except Exception as exc:
+            # A hedge is optional: skip it rather than spend unchecked
+            log.warning("hedging.budget_check_failed", tenant_id=str(tenant_id), error=str(exc))
+            return False
+
+    def _schedule_charge(
+        self, tenant_id: uuid.UUID | None, model_tier: ModelTier, estimate: int
+    ) -> None:
+        if self._budget is None or tenant_id is None:
+            return
+        if not isinstance(self._budget, PersistentBudgetManager):
+            self._budget.record_usage(tenant_id, model_tier, estimate, 0)
+            return
+        # The database write runs alongside the race instead of before it
+        task = asyncio.create_task(
+            self._charge_hedge(self._budget, tenant_id, model_tier, estimate)
+        )
+        self._charges.add(task)
+        task.add_done_callback(self._charges.discard)
+
+    async def _charge_hedge(
+        self,
+        budget: PersistentBudgetManager,
+        tenant_id: uuid.UUID,
+        model_tier: ModelTier,
+        estimate: int,
+    ) -> None:
+        try:
+            async with budget.session_factory() as session:
+                await budget.async_record_usage(session, tenant_id, model_tier, estimate, 0)
+                await session.commit()
+        except Exception as exc:
+            log.warning("hedging.budget_charge_failed", tenant_id=str(tenant_id), error=str(exc))
+
+    async def wait_for_charges(self) -> None:
+        """Wait until every scheduled hedge charge has been written."""
+        if self._charges:
+            await asyncio.gather(*self._charges, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Hedge and win rates since startup, for diagnostics."""
+        return {
+            "calls": self._calls,
+            "hedges": self._hedges,
+            "hedge_rate": round(self._hedges / self._calls, 4) if self._calls else 0.0,
+            "hedge_win_rate": (
+                round(self._hedge_wins / self._hedges, 4) if self._hedges else 0.0
+            ),
+            "budget_denied": self._budget_denied,
+        }
+
+
+_executor: HedgedExecutor | None = None
+
+
+def init_hedging(
+    settings: Settings,
+    budget_manager: BudgetManager | None = None,
+) -> HedgedExecutor | None:
+    """Create the process-wide executor if LLM_HEDGING_ENABLED is set.
+
+    Args:
+        settings: Application settings (LLM_HEDGE_* values are optional)
+        budget_manager: The application's budget manager (normally the
+            PersistentBudgetManager built in main); None disables the guard
+
+    Returns:
+        The executor, or None when hedging is disabled
+    """
+    global _executor
+    if not getattr(settings, "llm_hedging_enabled", False):
+        _executor = None
+        return None
+    config = HedgingConfig(
+        percentile=getattr(settings, "llm_hedge_percentile", 0.95),
+        min_samples=getattr(settings, "llm_hedge_min_samples", 20),
+        default_delay_s=getattr(settings, "llm_hedge_default_delay_seconds", 1.0),
+        max_delay_s=getattr(settings, "llm_hedge_max_delay_seconds", 10.0),
+    )
+    if budget_manager is None:
+        log.warning("hedging.budget_guard_disabled")
+    _executor = HedgedExecutor(HedgingPolicy(config), budget_manager=budget_manager)
+    log.info("hedging.enabled", percentile=config.percentile)
+    return _executor
+
+
+def get_hedged_executor() -> HedgedExecutor | None:
+    """Return the process-wide executor, or None when hedging is disabled."""
+    return _executor
+
+
+async def close_hedging() -> None:
+    """Let pending hedge charges reach the budget table before shutdown."""
+    global _executor
+    if _executor is not None:
+        await _executor.wait_for_charges()
+        _executor = None
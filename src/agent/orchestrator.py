@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import json
 import re
+import time
 import uuid
 import uuid as _uuid_mod
 from dataclasses import dataclass, field
@@ -26,11 +27,14 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agent.llm import LLMClient
+from src.agent.model_router.fast_path import FastPathClassifier, get_fast_path_classifier
+from src.agent.model_router.hedging import HedgedExecutor, get_hedged_executor
 from src.agent.registry import AgentSpec, get_registry
 from src.agent.specialists.base import AgentContext, AgentResponse, BaseSpecialistAgent
 from src.agent.thinking import ThinkingToolOutput
 from src.agent.thinking.red_team import RedTeam
 from src.agent.tools import ToolGateway
+from src.cache.routing_cache import CachedRoute, RoutingCache, get_routing_cache
 from src.config import Settings
 from src.core.classification import ClassificationPolicy, DataClassification
 from src.core.disclosure import DisclosureService
@@ -96,6 +100,20 @@ class IntentClassification:
     confidence: float
     secondary_capabilities: list[str] = field(default_factory=list)
     reasoning: str = ""
+    # True for the fallback answer given when classification failed
+    degraded: bool = False
+
+
+@dataclass
+class ComplexityAssessment:
+    """Result of complexity assessment.
+
+    ``degraded`` marks the SIMPLE default used when the LLM call failed or
+    its answer could not be parsed; such results must not be memoized.
+    """
+
+    complexity: QueryComplexity
+    degraded: bool = False
 
 
 @dataclass
@@ -126,6 +144,9 @@ class AgentOrchestrator:
         settings: Settings,
         llm_client: LLMClient,
         tool_gateway: ToolGateway,
+        hedger: HedgedExecutor | None = None,
+        fast_path: FastPathClassifier | None = None,
+        routing_cache: RoutingCache | None = None,
     ) -> None:
         """Initialize orchestrator with shared infrastructure.
 
@@ -134,11 +155,20 @@ class AgentOrchestrator:
             settings: Application configuration
             llm_client: LLM client for intent classification and agent calls
             tool_gateway: Tool execution gateway with access control
+            hedger: Hedged executor for routing calls (defaults to the
+                process-wide one, which is None unless hedging is enabled)
+            fast_path: Local routing classifier tried before the LLM (defaults
+                to the process-wide one, which is None when disabled)
+            routing_cache: Memoized intent/complexity decisions (defaults to
+                the process-wide one, which is None when disabled)
         """
         self._db = db
         self._settings = settings
         self._llm = llm_client
         self._tools = tool_gateway
+        self._hedger = hedger if hedger is not None else get_hedged_executor()
+        self._fast_path = fast_path if fast_path is not None else get_fast_path_classifier()
+        self._routing_cache = routing_cache if routing_cache is not None else get_routing_cache()
         self._registry = get_registry()
         self._classification_policy = ClassificationPolicy()
         self._disclosure = DisclosureService()
@@ -243,8 +273,13 @@ class AgentOrchestrator:
 
         compliance_checks["prompt_injection_check"] = injection_check
 
-        # Stage 2: Intent Classification
-        intent = await self._classify_intent(effective_message)
+        # Stage 2: Intent Classification (memoized per tenant when cached)
+        cached_route = await self._get_cached_route(user.tenant_id, effective_message)
+        if cached_route is not None:
+            intent = IntentClassification(**cached_route.intent)
+            reasoning_trace.append("Routing decision served from cache")
+        else:
+            intent = await self._classify_intent(effective_message, tenant_id=user.tenant_id)
         reasoning_trace.append(
             f"Intent: {intent.primary_capability} (confidence: {intent.confidence:.2f})"
         )
@@ -337,7 +372,15 @@ class AgentOrchestrator:
         compliance_checks["export_control"] = "not_implemented"
 
         # Stage 4.5: Complexity Assessment
-        complexity = await self._assess_complexity(effective_message, intent)
+        if cached_route is not None:
+            complexity = QueryComplexity(cached_route.complexity)
+        else:
+            assessment = await self._assess_complexity(
+                effective_message, intent, tenant_id=user.tenant_id
+            )
+            complexity = assessment.complexity
+            if not (intent.degraded or assessment.degraded):
+                await self._cache_route(user.tenant_id, effective_message, intent, complexity)
         reasoning_trace.append(f"Complexity: {complexity}")
         compliance_checks["complexity"] = complexity
         log.debug(
@@ -569,20 +612,101 @@ class AgentOrchestrator:
         )
         return highest_classification
 
-    async def _classify_intent(self, message: str) -> IntentClassification:
+    async def _get_cached_route(
+        self,
+        tenant_id: uuid.UUID,
+        message: str,
+    ) -> CachedRoute | None:
+        """Return a memoized routing decision for this message, if any."""
+        if self._routing_cache is None:
+            return None
+        return await self._routing_cache.get(
+            tenant_id, message, registry_version=self._registry.version
+        )
+
+    async def _cache_route(
+        self,
+        tenant_id: uuid.UUID,
+        message: str,
+        intent: IntentClassification,
+        complexity: QueryComplexity,
+    ) -> None:
+        """Memoize a routing decision; degraded classifications are not cached."""
+        if self._routing_cache is None or intent.degraded:
+            return
+        route = CachedRoute(
+            intent={
+                "primary_capability": intent.primary_capability,
+                "confidence": intent.confidence,
+                "secondary_capabilities": intent.secondary_capabilities,
+                "reasoning": intent.reasoning,
+            },
+            complexity=complexity.value,
+        )
+        await self._routing_cache.set(
+            tenant_id, message, route, registry_version=self._registry.version
+        )
+
+    async def _routing_complete(
+        self,
+        messages: list[dict[str, str]],
+        tenant_id: uuid.UUID | None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a latency-critical routing call, hedged when hedging is enabled."""
+        if self._hedger is None:
+            return await self._llm.complete(messages=messages, model=None, **kwargs)
+        return await self._hedger.complete(
+            self._llm,
+            messages=messages,
+            model=None,
+            hedge_model=getattr(self._settings, "llm_hedge_model", None),
+            tenant_id=tenant_id,
+            **kwargs,
+        )
+
+    async def _classify_intent(
+        self,
+        message: str,
+        *,
+        tenant_id: uuid.UUID | None = None,
+    ) -> IntentClassification:
         """Use LLM to classify user intent into agent capabilities.
 
         This is a lightweight classification task - we use a fast, cheap model
         to map the message to capability tags. The result drives agent selection.
+        When the fast-path classifier is confident the LLM call is skipped;
+        otherwise the LLM's answer trains the tenant's routing model.
 
         Args:
             message: User's message to classify
+            tenant_id: Tenant whose token budget guards hedged calls
 
         Returns:
             IntentClassification with primary/secondary capabilities and confidence
         """
         # Get all available capabilities from registry
         all_agents = self._registry.list_agents()
+        if self._fast_path is not None:
+            fast = self._fast_path.classify_intent(
+                message,
+                tenant_id=tenant_id,
+                capabilities={cap for agent in all_agents for cap in agent.capabilities},
+            )
+            if self._fast_path.accepts(fast):
+                self._fast_path.record_hit("intent")
+                log.debug(
+                    "orchestrator.intent_fast_path",
+                    primary=fast.label,
+                    confidence=fast.confidence,
+                )
+                return IntentClassification(
+                    primary_capability=fast.label,
+                    confidence=fast.confidence,
+                    secondary_capabilities=fast.alternatives,
+                    reasoning="Fast path: " + ", ".join(fast.signals),
+                )
+
         capability_descriptions = []
         for agent in all_agents:
             for cap in agent.capabilities:
@@ -615,12 +739,14 @@ If no specific capability matches, use "general_knowledge" as the primary capabi
         ]
 
         try:
-            response = await self._llm.complete(
-                messages=messages,
-                model=None,  # Use default lightweight model
+            start = time.perf_counter()
+            response = await self._routing_complete(
+                messages,
+                tenant_id,
                 temperature=0.1,  # Low temperature for consistent classification
                 max_tokens=256,
             )
+            llm_latency = time.perf_counter() - start
 
             response_text = self._llm.extract_text(response)
 
@@ -633,6 +759,10 @@ If no specific capability matches, use "general_knowledge" as the primary capabi
                 secondary_capabilities=result.get("secondary_capabilities", []),
                 reasoning=result.get("reasoning", ""),
             )
+            if self._fast_path is not None:
+                self._fast_path.record_fallback("intent", llm_latency)
+                if tenant_id is not None:
+                    self._fast_path.learn(tenant_id, message, intent.primary_capability)
 
             log.debug(
                 "orchestrator.intent_classification_success",
@@ -653,6 +783,7 @@ If no specific capability matches, use "general_knowledge" as the primary capabi
                 primary_capability="general_knowledge",
                 confidence=0.5,
                 reasoning=f"Classification failed: {exc}",
+                degraded=True,
             )
 
     def _select_agent(self, intent: IntentClassification, user_role: UserRole) -> AgentSpec:
@@ -980,19 +1111,34 @@ If no specific capability matches, use "general_knowledge" as the primary capabi
         self,
         query: str,
         intent: IntentClassification,
-    ) -> QueryComplexity:
+        *,
+        tenant_id: uuid.UUID | None = None,
+    ) -> ComplexityAssessment:
         """Classify query complexity to select the appropriate composition pattern.
 
         Uses a fast LLM call to determine whether the query needs simple routing,
-        sequential pipeline, fan-out perspectives, or a quality-gate loop.
+        sequential pipeline, fan-out perspectives, or a quality-gate loop. The
+        call is skipped when the fast-path classifier is confident.
 
         Args:
             query: User's message
             intent: Previously classified intent
+            tenant_id: Tenant whose token budget guards hedged calls
 
         Returns:
-            QueryComplexity enum value
+            The assessed complexity; degraded when SIMPLE is only a fallback
         """
+        if self._fast_path is not None:
+            fast = await self._fast_path.assess_complexity(query, intent.primary_capability)
+            if self._fast_path.accepts(fast):
+                self._fast_path.record_hit("complexity")
+                log.debug(
+                    "orchestrator.complexity_fast_path",
+                    complexity=fast.label,
+                    confidence=fast.confidence,
+                )
+                return ComplexityAssessment(QueryComplexity(fast.label))
+
         classification_prompt = f"""Classify this query's complexity for agent routing:
 Query: {query}
 Intent: {intent.primary_capability}
@@ -1014,12 +1160,15 @@ Respond with one word: SIMPLE, DEEP, MULTI_PERSPECTIVE, or QUALITY_CRITICAL"""
         ]
 
         try:
-            response = await self._llm.complete(
-                messages=messages,
-                model=None,
+            start = time.perf_counter()
+            response = await self._routing_complete(
+                messages,
+                tenant_id,
                 temperature=0.0,
                 max_tokens=16,
             )
+            if self._fast_path is not None:
+                self._fast_path.record_fallback("complexity", time.perf_counter() - start)
             raw = self._llm.extract_text(response).strip().upper()
 
             # Strip punctuation and extract just the keyword
@@ -1030,15 +1179,15 @@ Respond with one word: SIMPLE, DEEP, MULTI_PERSPECTIVE, or QUALITY_CRITICAL"""
                         complexity=complexity,
                         query_length=len(query),
                     )
-                    return complexity
+                    return ComplexityAssessment(complexity)
 
             # Default to SIMPLE when the response is ambiguous
             log.debug("orchestrator.complexity_defaulted", raw_response=raw)
-            return QueryComplexity.SIMPLE
+            return ComplexityAssessment(QueryComplexity.SIMPLE, degraded=True)
 
         except Exception as exc:
             log.warning("orchestrator.complexity_assessment_failed", error=str(exc))
-            return QueryComplexity.SIMPLE
+            return ComplexityAssessment(QueryComplexity.SIMPLE, degraded=True)
 
     async def _route_to_specialist(
         self,
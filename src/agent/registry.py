@@ -7,6 +7,7 @@ the orchestrator to discover and select the right specialist for each task.
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -66,6 +67,7 @@ class AgentRegistry:
     def __init__(self) -> None:
         self._agents: dict[str, AgentSpec] = {}
         self._default_agent_id: str | None = None
+        self._version: str | None = None
 
     def register(self, spec: AgentSpec) -> None:
         """Register an agent spec in the registry.
@@ -83,6 +85,7 @@ class AgentRegistry:
             )
 
         self._agents[spec.agent_id] = spec
+        self._version = None
         log.info(
             "registry.agent_registered",
             agent_id=spec.agent_id,
@@ -98,8 +101,26 @@ class AgentRegistry:
         """
         self.register(spec)
         self._default_agent_id = spec.agent_id
+        self._version = None
         log.info("registry.default_agent_set", agent_id=spec.agent_id)
 
+    @property
+    def version(self) -> str:
+        """Short hash of the registered agents and their capabilities.
+
+        Identical in every process that registers the same agents; changes
+        whenever an agent or capability is added or removed. Used to scope
+        cached routing decisions.
+        """
+        if self._version is None:
+            catalog = sorted(
+                f"{spec.agent_id}:{spec.required_role}:{','.join(sorted(spec.capabilities))}"
+                for spec in self._agents.values()
+            )
+            raw = "|".join(catalog) + f"|default={self._default_agent_id}"
+            self._version = hashlib.sha256(raw.encode()).hexdigest()[:12]
+        return self._version
+
     def get(self, agent_id: str) -> AgentSpec | None:
         """Get an agent spec by ID.
 
@@ -171,6 +192,7 @@ class AgentRegistry:
         """Clear all registered agents. Used for testing."""
         self._agents.clear()
         self._default_agent_id = None
+        self._version = None
         log.debug("registry.cleared")
 
 
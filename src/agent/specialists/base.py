@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -15,7 +16,7 @@ import structlog
 
 from src.agent.llm import LLMClient
 from src.agent.registry import AgentSpec
-from src.agent.tools import ToolContext, ToolGateway, ToolResult
+from src.agent.tools import ToolCall, ToolContext, ToolGateway, ToolResult
 from src.models.user import UserRole
 
 log = structlog.get_logger(__name__)
@@ -76,7 +77,8 @@ class BaseSpecialistAgent(ABC):
     Each specialist must:
     1. Provide an AgentSpec describing its capabilities
     2. Implement process() with domain logic
-    3. Use _call_llm() and _use_tool() for consistency
+    3. Use _call_llm() and _use_tool() (or _use_tools() for independent
+       calls) for consistency
     """
 
     def __init__(
@@ -157,6 +159,14 @@ class BaseSpecialistAgent(ABC):
 
         return text
 
+    @staticmethod
+    def _tool_context(context: AgentContext) -> ToolContext:
+        return ToolContext(
+            tenant_id=str(context.tenant_id),
+            user_id=str(context.user_id),
+            user_role=context.user_role,
+        )
+
     async def _use_tool(
         self,
         tool_name: str,
@@ -176,11 +186,7 @@ class BaseSpecialistAgent(ABC):
         Returns:
             ToolResult with success status and data/error
         """
-        tool_context = ToolContext(
-            tenant_id=str(context.tenant_id),
-            user_id=str(context.user_id),
-            user_role=context.user_role,
-        )
+        tool_context = self._tool_context(context)
 
         log.info(
             "specialist.tool_call",
@@ -201,6 +207,47 @@ class BaseSpecialistAgent(ABC):
 
         return result
 
+    async def _use_tools(
+        self,
+        calls: Sequence[ToolCall | Any],
+        context: AgentContext,
+        *,
+        deadline_s: float | None = None,
+    ) -> list[ToolResult]:
+        """Execute independent tools concurrently as one batch.
+
+        Accepts ToolCall objects or the LLM's parallel tool calls
+        (OpenAI format) as returned in one completion.
+
+        Args:
+            calls: Tool calls that do not depend on each other's results
+            context: Agent context (for tenant/user/role)
+            deadline_s: Batch deadline in seconds (None = gateway default)
+
+        Returns:
+            One ToolResult per call, in the order submitted
+        """
+        batch = [call if isinstance(call, ToolCall) else ToolCall.from_llm(call) for call in calls]
+        log.info(
+            "specialist.tool_batch",
+            agent_id=self.spec.agent_id,
+            tools=[call.name for call in batch],
+            tenant_id=str(context.tenant_id),
+        )
+
+        kwargs = {} if deadline_s is None else {"deadline_s": deadline_s}
+        results = await self._tools.execute_many(batch, self._tool_context(context), **kwargs)
+
+        for call, result in zip(batch, results, strict=True):
+            if not result.success:
+                log.warning(
+                    "specialist.tool_failed",
+                    agent_id=self.spec.agent_id,
+                    tool=call.name,
+                    error=result.error,
+                )
+        return results
+
     def _build_messages(
         self,
         message: str,
@@ -9,6 +9,10 @@ This specialist excels at:
 
 from __future__ import annotations
 
+import json
+import re
+from typing import Any
+
 import structlog
 
 from src.agent.registry import AgentSpec
@@ -17,10 +21,42 @@ from src.agent.specialists.base import (
     AgentResponse,
     BaseSpecialistAgent,
 )
+from src.agent.tools import ToolCall
 from src.models.user import UserRole
 
 log = structlog.get_logger(__name__)
 
+_INVENTORY_KEYWORDS = ("inventory", "stock level", "stock on hand", "on hand")
+
+# Plant codes and material numbers named in a message ("plant 1000",
+# "material MAT-0042"); a code must contain a digit so words are not taken
+_PLANT_RE = re.compile(r"\bplant\s+(?:code\s+)?([A-Za-z0-9]*\d[A-Za-z0-9]*)\b", re.IGNORECASE)
+_MATERIAL_RE = re.compile(
+    r"\bmaterial\s+(?:id\s+|number\s+|no\.?\s+)?([A-Za-z0-9_-]*\d[A-Za-z0-9_-]*)\b",
+    re.IGNORECASE,
+)
+
+
+def _inventory_params(message: str) -> dict[str, Any] | None:
+    """sap_inventory parameters for an inventory question naming a plant or material.
+
+    Returns None for other messages, so unscoped questions never stream a
+    tenant's whole stock table.
+    """
+    lowered = message.lower()
+    if not any(word in lowered for word in _INVENTORY_KEYWORDS):
+        return None
+    params: dict[str, Any] = {}
+    if plant := _PLANT_RE.search(message):
+        params["plant"] = plant.group(1)
+    if material := _MATERIAL_RE.search(message):
+        params["material_id"] = material.group(1)
+    if not params:
+        return None
+    # Totals per plant for one material, per material within a plant
+    params["aggregate_by"] = "plant" if "plant" not in params else "material"
+    return params
+
 _SYSTEM_PROMPT = """You are a Data Analyst specialist for an enterprise organization.
 
 Your expertise is in analyzing structured data, performing calculations, identifying
@@ -103,17 +139,25 @@ class DataAnalystAgent(BaseSpecialistAgent):
         tools_used = []
         citations = []
 
-        # Step 1: Search for relevant data
+        # Step 1: Search for relevant data. Inventory questions that name a
+        # plant or material also fetch live SAP stock totals in the same
+        # batch: the tool streams the matching stock records and returns
+        # per-group totals rather than a first page of rows.
         reasoning_trace.append("Searching for relevant numerical data and reports")
 
-        search_result = await self._use_tool(
-            "document_search",
-            {
-                "query": f"data metrics numbers: {message}",
-                "top_k": 8,
-            },
-            context,
-        )
+        calls = [
+            ToolCall(
+                "document_search",
+                {"query": f"data metrics numbers: {message}", "top_k": 8},
+            ),
+        ]
+        inventory_params = _inventory_params(message)
+        if inventory_params is not None and self._tools.can_use(
+            "sap_inventory", context.user_role
+        ):
+            calls.append(ToolCall("sap_inventory", inventory_params))
+
+        search_result, *inventory_results = await self._use_tools(calls, context)
 
         tools_used.append({
             "tool": "document_search",
@@ -128,6 +172,24 @@ class DataAnalystAgent(BaseSpecialistAgent):
                 f"Data search failed: {search_result.error}, using RAG context"
             )
 
+        inventory_summary = None
+        if inventory_results:
+            inventory_result = inventory_results[0]
+            tools_used.append({
+                "tool": "sap_inventory",
+                "success": inventory_result.success,
+                "query_type": "inventory_aggregate",
+            })
+            if inventory_result.success:
+                inventory_summary = inventory_result.data
+                reasoning_trace.append(
+                    f"Aggregated {inventory_summary['total_records']} SAP stock records "
+                    f"into {inventory_summary['total_groups']} groups "
+                    f"by {inventory_params['aggregate_by']}"
+                )
+            else:
+                reasoning_trace.append(f"SAP inventory unavailable: {inventory_result.error}")
+
         # Step 2: Check if calculations are needed
         # In a real implementation, we'd use NLP to detect calculation needs
         # For now, we'll attempt a calculation if numbers are mentioned
@@ -183,6 +245,13 @@ class DataAnalystAgent(BaseSpecialistAgent):
 
 Use clear headers and formatting for readability.
 """
+        if inventory_summary is not None:
+            additional_instructions += (
+                "\n**Live SAP inventory totals** (all matching stock records, largest "
+                f"{inventory_params['aggregate_by'].replace('_', ' ')} groups first; "
+                "cite as [Data: SAP inventory]):\n"
+                f"{json.dumps(inventory_summary, default=str)}\n"
+            )
 
         messages = self._build_messages(message, context, additional_instructions)
         reasoning_trace.append(
@@ -253,7 +322,7 @@ SPEC = AgentSpec(
         "trend_analysis",
         "statistics",
     ],
-    tools=["document_search", "calculator"],
+    tools=["document_search", "calculator", "sap_inventory"],
     required_role=UserRole.VIEWER,
     model_preference=None,
     max_tokens=2048,
@@ -14,21 +14,34 @@ The ToolGateway validates:
   2. User role permits this tool
   3. Tool parameters are valid
   4. Tool is within tenant's allowed tools list
+
+ToolGateway.execute_many runs a batch of independent calls (e.g. the
+parallel tool calls of one LLM turn) concurrently. Calls to the same
+connector are bounded by a per-connector limit shared by every gateway in
+the process (ConnectorLimiter, set up by init_connector_limiter), every
+call still goes through execute() for its role check and audit log,
+results come back in request order, and calls unfinished at the batch
+deadline fail with ``metadata["timed_out"]`` and are logged one by one.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import time
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
 
-from src.connectors.base import AuthType, ConnectorConfig
-from src.connectors.cache import ConnectorCache
+from src.connectors.base import AuthType, BaseConnector, ConnectorConfig, ConnectorResult
+from src.connectors.cache import ConnectorCache, ConnectorFetch, get_connector_cache
 from src.connectors.mes import MESConnector
+from src.connectors.pool import get_connector_pool
 from src.connectors.sap import SAPConnector
 from src.models.user import UserRole
 
@@ -60,6 +73,41 @@ class ToolResult:
         }
 
 
+@dataclass
+class ToolCall:
+    """One tool invocation submitted to ToolGateway.execute_many."""
+    name: str
+    params: dict[str, Any] = field(default_factory=dict)
+    # LLM tool_call id, echoed in the result metadata
+    call_id: str | None = None
+    # Set when the call could not be parsed; the call fails without running
+    error: str | None = None
+
+    @classmethod
+    def from_llm(cls, tool_call: Any) -> ToolCall:
+        """Build a call from an OpenAI-format tool call (dict or LiteLLM object)."""
+        if isinstance(tool_call, dict):
+            call_id = tool_call.get("id")
+            function = tool_call.get("function") or {}
+            name = function.get("name", "")
+            arguments = function.get("arguments")
+        else:
+            call_id = getattr(tool_call, "id", None)
+            function = getattr(tool_call, "function", None)
+            name = getattr(function, "name", "") or ""
+            arguments = getattr(function, "arguments", None)
+
+        if isinstance(arguments, dict):
+            return cls(name=name, params=arguments, call_id=call_id)
+        try:
+            params = json.loads(arguments) if arguments else {}
+        except json.JSONDecodeError as exc:
+            return cls(name=name, call_id=call_id, error=f"Invalid tool arguments: {exc}")
+        if not isinstance(params, dict):
+            return cls(name=name, call_id=call_id, error="Tool arguments must be a JSON object")
+        return cls(name=name, params=params, call_id=call_id)
+
+
 class BaseTool(ABC):
     """Abstract base class for all tools."""
 
@@ -68,6 +116,8 @@ class BaseTool(ABC):
     parameters_schema: dict[str, Any]
     # Minimum role required to use this tool
     required_role: UserRole = UserRole.OPERATOR
+    # External system the tool calls; batched calls share its concurrency limit
+    connector: str | None = None
 
     @abstractmethod
     async def execute(self, params: dict[str, Any], context: ToolContext) -> ToolResult:
@@ -186,6 +236,43 @@ class CalculatorTool(BaseTool):
 
 
 
+async def _cached_call(
+    cache: ConnectorCache,
+    context: ToolContext,
+    connector: str,
+    operation: str,
+    params: dict[str, Any],
+    fetch: ConnectorFetch,
+) -> ToolResult:
+    """Run ``fetch`` through the tool's ConnectorCache.
+
+    Identical concurrent calls share one connector request and expired
+    results are served once while they refresh in the background.
+    """
+    result = await cache.get_or_fetch(
+        tenant_id=uuid.UUID(context.tenant_id),
+        connector=connector,
+        operation=operation,
+        user_id=uuid.UUID(context.user_id),
+        params=params,
+        fetch=fetch,
+    )
+    return ToolResult(
+        success=result.success,
+        data=result.data,
+        error=result.error,
+        metadata={"cached": result.cached, "cache": result.metadata.get("cache")},
+    )
+
+
+def _connector(connector_cls: type[BaseConnector], config: ConnectorConfig) -> BaseConnector:
+    """Shared connector from the app's ConnectorPool, or a per-call one outside the app."""
+    pool = get_connector_pool()
+    if pool is not None:
+        return pool.get(connector_cls, config)
+    return connector_cls(config)
+
+
 class SAP_PurchaseOrdersTool(BaseTool):
     """Query SAP purchase orders via SAPConnector.
 
@@ -193,6 +280,7 @@ class SAP_PurchaseOrdersTool(BaseTool):
     """
 
     name = "sap_purchase_orders"
+    connector = "sap"
     description = "Query SAP purchase orders by date range, status, or vendor"
     parameters_schema = {
         "type": "object",
@@ -205,17 +293,10 @@ class SAP_PurchaseOrdersTool(BaseTool):
         "required": [],
     }
     required_role = UserRole.OPERATOR
+    cache_ttl_seconds = 300  # 5 min TTL, then served stale once while refreshing
 
     async def execute(self, params: dict[str, Any], context: ToolContext) -> ToolResult:
         try:
-            cache = ConnectorCache()
-            cache_key = f"sap_po:{context.tenant_id}:{params}"
-
-            # Check cache first
-            cached = await cache.get(cache_key)
-            if cached:
-                return ToolResult(success=True, data=cached, metadata={"cached": True})
-
             # Build ConnectorConfig from environment - H6 fix
             sap_config = ConnectorConfig(
                 name=f"sap-{context.tenant_id}",
@@ -226,53 +307,116 @@ class SAP_PurchaseOrdersTool(BaseTool):
                     "password": os.environ.get("SAP_PASSWORD", ""),
                 },
             )
-            connector = SAPConnector(sap_config)
-            async with connector:
-                result = await connector.execute(
-                    "get_purchase_orders",
-                    tenant_id=uuid.UUID(context.tenant_id),
-                    user_id=uuid.UUID(context.user_id),
-                    params=params,
-                )
-
-            # Cache result
-            await cache.set(cache_key, result.data, ttl=300)  # 5 min TTL
-
-            return ToolResult(
-                success=result.success,
-                data=result.data,
-                error=result.error,
-                metadata={"cached": False},
+            async def fetch() -> ConnectorResult:
+                connector = _connector(SAPConnector, sap_config)
+                async with connector:
+                    return await connector.execute(
+                        "get_purchase_orders",
+                        tenant_id=uuid.UUID(context.tenant_id),
+                        user_id=uuid.UUID(context.user_id),
+                        params=params,
+                    )
+
+            cache = get_connector_cache(
+                self.name,
+                ttl_seconds=self.cache_ttl_seconds,
+                stale_ttl_seconds=self.cache_ttl_seconds,
+            )
+            return await _cached_call(
+                cache, context, "sap", "get_purchase_orders", params, fetch
             )
         except Exception as exc:
             return ToolResult(success=False, error=f"SAP query failed: {exc}")
 
 
 class SAP_InventoryTool(BaseTool):
-    """Query real-time SAP inventory levels via SAPConnector."""
+    """Query real-time SAP inventory levels via SAPConnector.
+
+    With ``aggregate_by`` the full stock list is streamed page by page and
+    reduced to per-group totals, so the answer covers every row however
+    large the plant is, in memory proportional to the number of groups.
+    """
 
     name = "sap_inventory"
-    description = "Query SAP inventory levels by material, plant, or storage location"
+    connector = "sap"
+    description = (
+        "Query SAP inventory levels by material, plant, or storage location. "
+        "Set aggregate_by to get total quantity per material, plant or storage "
+        "location across all stock records instead of individual rows."
+    )
     parameters_schema = {
         "type": "object",
         "properties": {
             "material_id": {"type": "string", "description": "Material number"},
             "plant": {"type": "string", "description": "Plant code"},
             "storage_location": {"type": "string", "description": "Storage location code"},
+            "aggregate_by": {
+                "type": "string",
+                "enum": ["material", "plant", "storage_location"],
+                "description": "Sum quantities per group over all matching stock records",
+            },
         },
         "required": [],
     }
     required_role = UserRole.OPERATOR
+    cache_ttl_seconds = 60  # 1 min TTL for inventory
+
+    # Largest groups returned to the LLM when aggregating
+    _MAX_GROUPS = 50
+    _GROUP_FIELDS = {
+        "material": "material_id",
+        "plant": "plant_id",
+        "storage_location": "storage_location",
+    }
 
-    async def execute(self, params: dict[str, Any], context: ToolContext) -> ToolResult:
-        try:
-            cache = ConnectorCache()
-            cache_key = f"sap_inv:{context.tenant_id}:{params}"
+    @staticmethod
+    def _connector_params(params: dict[str, Any]) -> dict[str, Any]:
+        """Translate tool parameters to SAPConnector get_inventory params."""
+        mapped = {k: v for k, v in params.items() if k not in ("plant", "aggregate_by")}
+        if "plant" in params:
+            mapped["plant_id"] = params["plant"]
+        return mapped
+
+    async def _aggregate(
+        self,
+        connector: SAPConnector,
+        params: dict[str, Any],
+        context: ToolContext,
+    ) -> dict[str, Any]:
+        """Stream all matching stock records and sum quantities per group."""
+        group_by = params["aggregate_by"]
+        field_name = self._GROUP_FIELDS[group_by]
+        groups: dict[str, dict[str, Any]] = {}
+        records = 0
+        async for page in connector.stream(
+            "get_inventory",
+            tenant_id=uuid.UUID(context.tenant_id),
+            user_id=uuid.UUID(context.user_id),
+            params=self._connector_params(params),
+        ):
+            records += len(page)
+            for item in page:
+                key = getattr(item, field_name)
+                group = groups.setdefault(
+                    key, {"quantity": 0.0, "records": 0, "unit_of_measure": item.unit_of_measure}
+                )
+                group["quantity"] += item.quantity_on_hand
+                group["records"] += 1
+                if group["unit_of_measure"] != item.unit_of_measure:
+                    group["unit_of_measure"] = "mixed"
 
-            cached = await cache.get(cache_key)
-            if cached:
-                return ToolResult(success=True, data=cached, metadata={"cached": True})
+        largest = sorted(groups.items(), key=lambda kv: kv[1]["quantity"], reverse=True)
+        return {
+            "aggregate_by": group_by,
+            "total_records": records,
+            "total_groups": len(groups),
+            "groups": [
+                {group_by: key, **values} for key, values in largest[: self._MAX_GROUPS]
+            ],
+        }
 
+    async def execute(self, params: dict[str, Any], context: ToolContext) -> ToolResult:
+        try:
             # Build ConnectorConfig from environment - H6 fix
             sap_config = ConnectorConfig(
                 name=f"sap-{context.tenant_id}",
@@ -283,23 +427,25 @@ class SAP_InventoryTool(BaseTool):
                     "password": os.environ.get("SAP_PASSWORD", ""),
                 },
             )
-            connector = SAPConnector(sap_config)
-            async with connector:
-                result = await connector.execute(
-                    "get_inventory",
-                    tenant_id=uuid.UUID(context.tenant_id),
-                    user_id=uuid.UUID(context.user_id),
-                    params=params,
-                )
-
-            await cache.set(cache_key, result.data, ttl=60)  # 1 min TTL for inventory
-
-            return ToolResult(
-                success=result.success,
-                data=result.data,
-                error=result.error,
-                metadata={"cached": False},
+            async def fetch() -> ConnectorResult:
+                connector = _connector(SAPConnector, sap_config)
+                async with connector:
+                    if params.get("aggregate_by") in self._GROUP_FIELDS:
+                        summary = await self._aggregate(connector, params, context)
+                        return ConnectorResult(success=True, data=summary)
+                    return await connector.execute(
+                        "get_inventory",
+                        tenant_id=uuid.UUID(context.tenant_id),
+                        user_id=uuid.UUID(context.user_id),
+                        params=self._connector_params(params),
+                    )
+
+            cache = get_connector_cache(
+                self.name,
+                ttl_seconds=self.cache_ttl_seconds,
+                stale_ttl_seconds=self.cache_ttl_seconds,
             )
+            return await _cached_call(cache, context, "sap", "get_inventory", params, fetch)
         except Exception as exc:
             return ToolResult(success=False, error=f"SAP inventory query failed: {exc}")
 
@@ -308,6 +454,7 @@ class MES_ProductionOrdersTool(BaseTool):
     """Query MES production orders via MESConnector."""
 
     name = "mes_production_orders"
+    connector = "mes"
     description = "Query MES production orders by date, status, or work center"
     parameters_schema = {
         "type": "object",
@@ -320,16 +467,10 @@ class MES_ProductionOrdersTool(BaseTool):
         "required": [],
     }
     required_role = UserRole.OPERATOR
+    cache_ttl_seconds = 120  # 2 min TTL
 
     async def execute(self, params: dict[str, Any], context: ToolContext) -> ToolResult:
         try:
-            cache = ConnectorCache()
-            cache_key = f"mes_po:{context.tenant_id}:{params}"
-
-            cached = await cache.get(cache_key)
-            if cached:
-                return ToolResult(success=True, data=cached, metadata={"cached": True})
-
             # Build ConnectorConfig from environment - H6 fix
             mes_config = ConnectorConfig(
                 name=f"mes-{context.tenant_id}",
@@ -339,22 +480,23 @@ class MES_ProductionOrdersTool(BaseTool):
                     "api_key": os.environ.get("MES_API_KEY", ""),
                 },
             )
-            connector = MESConnector(mes_config)
-            async with connector:
-                result = await connector.execute(
-                    "get_production_orders",
-                    tenant_id=uuid.UUID(context.tenant_id),
-                    user_id=uuid.UUID(context.user_id),
-                    params=params,
-                )
-
-            await cache.set(cache_key, result.data, ttl=120)  # 2 min TTL
-
-            return ToolResult(
-                success=result.success,
-                data=result.data,
-                error=result.error,
-                metadata={"cached": False},
+            async def fetch() -> ConnectorResult:
+                connector = _connector(MESConnector, mes_config)
+                async with connector:
+                    return await connector.execute(
+                        "get_production_orders",
+                        tenant_id=uuid.UUID(context.tenant_id),
+                        user_id=uuid.UUID(context.user_id),
+                        params=params,
+                    )
+
+            cache = get_connector_cache(
+                self.name,
+                ttl_seconds=self.cache_ttl_seconds,
+                stale_ttl_seconds=self.cache_ttl_seconds,
+            )
+            return await _cached_call(
+                cache, context, "mes", "get_production_orders", params, fetch
             )
         except Exception as exc:
             return ToolResult(success=False, error=f"MES query failed: {exc}")
@@ -370,13 +512,83 @@ _ALL_TOOLS: list[type[BaseTool]] = [
 ]
 
 
+# Concurrent batched calls per connector across the whole process
+DEFAULT_CONNECTOR_CONCURRENCY = 4
+# Seconds a batch may run before unfinished calls are cancelled
+DEFAULT_BATCH_DEADLINE_S = 30.0
+
+
+class ConnectorLimiter:
+    """Per-connector concurrency slots for batched tool calls.
+
+    One limiter is shared by every ToolGateway in the process (the runtime
+    builds a gateway per request), so the limits bound load on SAP/MES
+    across requests rather than within a single batch.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, int] | None = None,
+        default_limit: int = DEFAULT_CONNECTOR_CONCURRENCY,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limits: Max concurrent batched calls per connector name
+                (e.g. {"sap": 2}); connectors not listed use the default
+            default_limit: Limit for connectors not in ``limits`` (0 = unlimited)
+        """
+        self._limits = dict(limits or {})
+        self._default_limit = default_limit
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    def slot(self, connector: str) -> asyncio.Semaphore | None:
+        """Return the connector's semaphore, or None if it is unlimited."""
+        limit = self._limits.get(connector, self._default_limit)
+        if limit <= 0:
+            return None
+        slot = self._slots.get(connector)
+        if slot is None:
+            slot = self._slots[connector] = asyncio.Semaphore(limit)
+        return slot
+
+
+_connector_limiter: ConnectorLimiter | None = None
+
+
+def init_connector_limiter(settings: Any) -> ConnectorLimiter:
+    """Create the process-wide limiter (TOOL_CONNECTOR_CONCURRENCY per connector)."""
+    global _connector_limiter
+    default_limit = int(
+        getattr(settings, "tool_connector_concurrency", DEFAULT_CONNECTOR_CONCURRENCY)
+    )
+    _connector_limiter = ConnectorLimiter(default_limit=default_limit)
+    log.info("tool_gateway.connector_limiter_initialized", default_limit=default_limit)
+    return _connector_limiter
+
+
+def get_connector_limiter() -> ConnectorLimiter:
+    """Return the process-wide limiter, creating one with defaults if needed."""
+    global _connector_limiter
+    if _connector_limiter is None:
+        _connector_limiter = ConnectorLimiter()
+    return _connector_limiter
+
+
 class ToolGateway:
     """Validates and executes tool calls from the agent runtime."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, connector_limiter: ConnectorLimiter | None = None) -> None:
+        """Initialize the gateway.
+
+        Args:
+            connector_limiter: Per-connector slots for execute_many; defaults
+                to the process-wide limiter shared by all gateways
+        """
         self._tools: dict[str, BaseTool] = {
             cls.name: cls() for cls in _ALL_TOOLS
         }
+        self._connector_limiter = connector_limiter or get_connector_limiter()
 
     def get_tool_schemas(self, user_role: UserRole) -> list[dict[str, Any]]:
         """Return OpenAI function-calling schemas for tools the user can access."""
@@ -393,6 +605,11 @@ class ToolGateway:
                 })
         return schemas
 
+    def can_use(self, tool_name: str, user_role: UserRole) -> bool:
+        """True if ``tool_name`` exists and ``user_role`` may call it."""
+        tool = self._tools.get(tool_name)
+        return tool is not None and self._can_use_tool(user_role, tool)
+
     def _can_use_tool(self, user_role: UserRole, tool: BaseTool) -> bool:
         from src.core.policy import _role_level
         return _role_level(user_role) >= _role_level(tool.required_role)
@@ -428,3 +645,105 @@ class ToolGateway:
             result = ToolResult(success=False, error=f"Tool execution error: {exc}")
 
         return result
+
+    def _connector_slot(self, tool: BaseTool) -> asyncio.Semaphore | None:
+        if tool.connector is None:
+            return None
+        return self._connector_limiter.slot(tool.connector)
+
+    async def _execute_call(self, call: ToolCall, context: ToolContext) -> ToolResult:
+        if call.error is not None:
+            log.warning("tool.invalid_call", tool=call.name, error=call.error)
+            return ToolResult(success=False, error=call.error)
+        tool = self._tools.get(call.name)
+        slot = None
+        if tool is not None and self._can_use_tool(context.user_role, tool):
+            slot = self._connector_slot(tool)
+        if slot is None:
+            return await self.execute(call.name, call.params, context)
+        async with slot:
+            return await self.execute(call.name, call.params, context)
+
+    async def execute_many(
+        self,
+        calls: Sequence[ToolCall],
+        context: ToolContext,
+        *,
+        deadline_s: float | None = DEFAULT_BATCH_DEADLINE_S,
+    ) -> list[ToolResult]:
+        """Execute independent tool calls concurrently.
+
+        Each call goes through execute() (role check, audit log). Calls to
+        the same connector wait for one of its slots.
+
+        Args:
+            calls: Tool calls; none may depend on another's result
+            context: Caller context shared by every call
+            deadline_s: Seconds for the whole batch (None or 0 = no deadline);
+                calls still running then are cancelled and fail
+
+        Returns:
+            One ToolResult per call, in request order. Results of calls with
+            a ``call_id`` carry it as ``metadata["tool_call_id"]``.
+        """
+        if not calls:
+            return []
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(self._execute_call(call, context)) for call in calls]
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=deadline_s or None)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            # Cancelled caller: do not leave tool calls running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if pending:
+            log.warning(
+                "tool.deadline_exceeded",
+                tenant_id=context.tenant_id,
+                timed_out=len(pending),
+                deadline_s=deadline_s,
+            )
+
+        results: list[ToolResult] = []
+        for call, task in zip(calls, tasks, strict=True):
+            if task in pending:
+                # Counterpart of execute()'s tool.executing record for this call
+                log.warning(
+                    "tool.execution_timed_out",
+                    tool=call.name,
+                    call_id=call.call_id,
+                    tenant_id=context.tenant_id,
+                    user_id=context.user_id,
+                    deadline_s=deadline_s,
+                )
+                result = ToolResult(
+                    success=False,
+                    error=f"Tool '{call.name}' did not finish within the {deadline_s}s deadline",
+                    metadata={"timed_out": True},
+                )
+            else:
+                result = task.result()
+            if call.call_id is not None:
+                result = ToolResult(
+                    success=result.success,
+                    data=result.data,
+                    error=result.error,
+                    metadata={**result.metadata, "tool_call_id": call.call_id},
+                )
+            results.append(result)
+
+        log.info(
+            "tool.batch_completed",
+            tenant_id=context.tenant_id,
+            calls=len(calls),
+            failed=sum(1 for result in results if not result.success),
+            timed_out=len(pending),
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+        )
+        return results
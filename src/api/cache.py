@@ -1,6 +1,8 @@
 """Cache management API endpoints.
 
-Admin-only endpoints for inspecting and managing the response cache.
+Admin-only endpoints for inspecting and managing the response cache, the
+semantic response cache and the routing cache (memoized intent/complexity
+decisions).
 
 GET  /api/v1/cache/stats      - Cache statistics (admin only)
 POST /api/v1/cache/invalidate - Invalidate all cache entries for the current tenant (admin only)
@@ -21,6 +23,8 @@ from pydantic import BaseModel
 from src.auth.dependencies import AuthenticatedUser, get_current_user
 from src.cache.backend import CacheBackend, get_cache_backend
 from src.cache.response_cache import ResponseCache
+from src.cache.routing_cache import get_routing_cache
+from src.cache.semantic_cache import get_semantic_cache
 from src.config import Settings, get_settings
 from src.core.policy import Permission, check_permission
 
@@ -58,6 +62,8 @@ class CacheStatsResponse(BaseModel):
     hit_rate: float
     used_memory_human: str
     extra: dict[str, Any] = {}
+    routing: dict[str, Any] = {}
+    semantic: dict[str, Any] = {}
 
 
 class InvalidateResponse(BaseModel):
@@ -87,11 +93,22 @@ async def get_cache_stats(
     """Return cache hit/miss statistics and backend info.
 
     Requires ADMIN role. Useful for monitoring cache effectiveness and
-    diagnosing whether Redis is reachable.
+    diagnosing whether Redis is reachable. ``routing`` reports this worker's
+    routing cache hit rate overall and for the caller's tenant; ``semantic``
+    reports the semantic cache hit rate and index size.
     """
     check_permission(current_user.role, Permission.ADMIN_TENANT_READ)
 
     stats = await cache.get_cache_stats()
+    routing_cache = get_routing_cache()
+    routing: dict[str, Any] = {"enabled": routing_cache is not None}
+    if routing_cache is not None:
+        routing.update(routing_cache.stats())
+        routing["tenant"] = routing_cache.stats(current_user.tenant_id)
+    semantic_cache = get_semantic_cache()
+    semantic: dict[str, Any] = {"enabled": semantic_cache is not None}
+    if semantic_cache is not None:
+        semantic.update(semantic_cache.stats())
 
     return CacheStatsResponse(
         backend=stats.get("backend", "unknown"),
@@ -102,6 +119,8 @@ async def get_cache_stats(
         hit_rate=float(stats.get("hit_rate", 0.0)),
         used_memory_human=str(stats.get("used_memory_human", "n/a")),
         extra=stats.get("extra", {}),
+        routing=routing,
+        semantic=semantic,
     )
 
 
@@ -114,7 +133,7 @@ async def invalidate_tenant_cache(
     current_user: AuthenticatedUser = Depends(get_current_user),
     cache: ResponseCache = Depends(get_response_cache),
 ) -> InvalidateResponse:
-    """Remove all cached responses for the current tenant.
+    """Remove all cached responses and routing decisions for the current tenant.
 
     Requires ADMIN role. Use this after bulk document ingestion or when
     tenant configuration changes and stale responses must be evicted.
@@ -123,6 +142,12 @@ async def invalidate_tenant_cache(
 
     tenant_id = current_user.tenant_id
     keys_deleted = await cache.invalidate_tenant(tenant_id)
+    routing_cache = get_routing_cache()
+    if routing_cache is not None:
+        await routing_cache.invalidate_tenant(tenant_id)
+    semantic_cache = get_semantic_cache()
+    if semantic_cache is not None:
+        keys_deleted += semantic_cache.invalidate_tenant(tenant_id)
 
     log.info(
         "cache.api.tenant_invalidated",
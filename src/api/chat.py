@@ -14,6 +14,7 @@ appropriate HTTP status codes and audit entries.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 
 import structlog
@@ -30,8 +31,8 @@ from src.config import Settings, get_settings
 from src.core.audit import AuditService, RequestTimer
 from src.core.policy import Permission, check_permission
 from src.core.rate_limit import RateLimiter, get_rate_limiter
-from src.database import get_db_session
-from src.infra.streaming import create_sse_generator
+from src.database import get_db_session, get_optional_session_factory
+from src.infra.streaming import AgentOutputStream, create_sse_generator
 from src.models.audit import AuditStatus
 from src.models.user import UserRole
 
@@ -113,6 +114,7 @@ async def chat(
         db=db,
         settings=settings,
         llm_client=LLMClient(settings),
+        session_factory=get_optional_session_factory(),
     )
 
     try:
@@ -230,31 +232,59 @@ async def chat_stream(
         db=db,
         settings=settings,
         llm_client=LLMClient(settings),
+        session_factory=get_optional_session_factory(),
     )
 
-    async def generate():
-        """Generator for SSE streaming."""
+    output = AgentOutputStream(
+        conversation_id=str(body.conversation_id) if body.conversation_id else None,
+    )
+    turn = runtime.chat_stream(
+        user=current_user.user,
+        request=ChatRequest(
+            message=body.message,
+            conversation_id=body.conversation_id,
+            model_override=body.model_override,
+        ),
+    )
+
+    async def produce() -> None:
+        """Forward runtime deltas to the SSE stream as they arrive."""
         try:
-            # Call runtime normally; streaming at the transport layer via SSE
-            chat_response = await runtime.chat(
-                user=current_user.user,
-                request=ChatRequest(
-                    message=body.message,
-                    conversation_id=body.conversation_id,
-                    model_override=body.model_override,
-                ),
+            async for delta in turn:
+                await output.emit_token(delta)
+            chat_response = turn.response
+            for citation in chat_response.citations:
+                await output.emit_citation(citation)
+            await output.emit_done(
+                conversation_id=str(chat_response.conversation_id),
+                model_used=chat_response.model_used,
+                ttft_ms=chat_response.ttft_ms,
             )
-
-            # Send final completion event with the full response
-            import json as _json
-            yield f"data: {_json.dumps({'type': 'done', 'conversation_id': str(chat_response.conversation_id), 'response': chat_response.response})}\n\n"
-
+        except LLMRateLimitError as exc:
+            log.warning("chat.stream_rate_limited", error=str(exc))
+            await output.emit_error(
+                "LLM service rate limit exceeded. Please try again in a moment."
+            )
+        except LLMError as exc:
+            log.error("chat.stream_llm_error", error=str(exc))
+            await output.emit_error("LLM service error. Please try again.")
         except Exception as exc:
             log.error("chat.stream_error", error=str(exc), exc_info=True)
-            yield "data: {'type': 'error', 'message': 'Stream error'}\n\n"
+            await output.emit_error("Stream error")
+
+    async def events():
+        producer = asyncio.create_task(produce())
+        try:
+            async for chunk in create_sse_generator(output):
+                yield chunk
+        finally:
+            # Client gone: stop generating; the unfinished turn is not persisted
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
 
     return StreamingResponse(
-        create_sse_generator(generate()),
+        events(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
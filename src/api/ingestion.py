@@ -2,13 +2,18 @@
 
 Provides full lifecycle management for document ingestion jobs.
 
-POST /api/v1/documents/upload         - Upload file and create ingestion job
+POST /api/v1/documents/upload         - Upload file and queue ingestion job (202)
 GET  /api/v1/documents/jobs           - List ingestion jobs
 GET  /api/v1/documents/jobs/{id}      - Get job status
 POST /api/v1/documents/jobs/{id}/cancel - Cancel a job
 GET  /api/v1/documents/jobs/{id}/chunks - Get chunks from completed job
 
 All endpoints are scoped to the authenticated user's tenant.
+
+Uploads are processed by the background IngestionWorker; poll the job for
+status and progress (chunks_total / chunks_embedded / chunk_count), and
+for how many chunks an existing embedding was reused (chunks_deduplicated,
+dedup_ratio).
 """
 
 from __future__ import annotations
@@ -18,7 +23,7 @@ from datetime import datetime
 from typing import Any
 
 import structlog
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -88,6 +93,11 @@ class IngestionJobResponse(BaseModel):
     error_message: str | None
     metadata_extracted: dict[str, Any]
     chunk_count: int
+    chunks_total: int = 0
+    chunks_embedded: int = 0
+    chunks_deduplicated: int = 0
+    dedup_ratio: float = 0.0
+    attempts: int = 0
     started_at: datetime | None
     completed_at: datetime | None
     created_at: datetime
@@ -151,6 +161,13 @@ def _job_to_response(job: IngestionJob) -> IngestionJobResponse:
         error_message=job.error_message,
         metadata_extracted=job.metadata_extracted,
         chunk_count=job.chunk_count,
+        chunks_total=job.chunks_total or 0,
+        chunks_embedded=job.chunks_embedded or 0,
+        chunks_deduplicated=job.chunks_deduplicated or 0,
+        dedup_ratio=round((job.chunks_deduplicated or 0) / job.chunk_count, 3)
+        if job.chunk_count
+        else 0.0,
+        attempts=job.attempts or 0,
         started_at=job.started_at,
         completed_at=job.completed_at,
         created_at=job.created_at,
@@ -169,6 +186,7 @@ def _job_to_response(job: IngestionJob) -> IngestionJobResponse:
     summary="Upload a document and start ingestion job",
 )
 async def upload_document(
+    request: Request,
     file: UploadFile = File(...),
     current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_session),
@@ -176,9 +194,9 @@ async def upload_document(
 ) -> IngestionJobResponse:
     """Upload a document for ingestion.
 
-    Creates an ingestion job and starts processing asynchronously.
-    Returns the job with PROCESSING or COMPLETED status depending on
-    how quickly it completes.
+    Stores the file on a new PENDING ingestion job and returns immediately
+    (202 Accepted). A background worker parses, chunks, embeds and indexes
+    it; poll GET /documents/jobs/{id} for status and progress counters.
 
     Supported file types:
     - PDF (.pdf)
@@ -210,42 +228,31 @@ async def upload_document(
     llm_client = LLMClient(settings)
     service = IngestionService(db=db, settings=settings, llm_client=llm_client)
 
-    # Create job
+    # Create job (queued with its file)
     job = await service.create_job(
         tenant_id=current_user.tenant_id,
         filename=filename,
         file_type=file_type,
         file_size=len(file_bytes),
+        file_bytes=file_bytes,
     )
 
     audit = AuditService(db)
+    await audit.log(
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="document.ingestion.queued",
+        resource_type="ingestion_job",
+        resource_id=str(job.id),
+        status=AuditStatus.SUCCESS,
+        extra={"filename": filename, "file_size_bytes": len(file_bytes)},
+    )
 
-    # Process job synchronously for now; move to background task queue for high throughput
-    try:
-        job = await service.process_job(job_id=job.id, file_bytes=file_bytes)
-
-        await audit.log(
-            tenant_id=current_user.tenant_id,
-            user_id=current_user.id,
-            action="document.ingestion.complete",
-            resource_type="ingestion_job",
-            resource_id=str(job.id),
-            status=AuditStatus.SUCCESS,
-            extra={"filename": filename, "chunk_count": job.chunk_count},
-        )
-
-    except Exception as exc:
-        await audit.log(
-            tenant_id=current_user.tenant_id,
-            user_id=current_user.id,
-            action="document.ingestion.failed",
-            resource_type="ingestion_job",
-            resource_id=str(job.id),
-            status=AuditStatus.ERROR,
-            error_detail=str(exc),
-        )
-        # Job is in FAILED state - return it (don't raise)
-        # Client can check status and retry
+    # Commit before waking the worker so the claim query can see the job
+    await db.commit()
+    ingestion_worker = getattr(request.app.state, "ingestion_worker", None)
+    if ingestion_worker is not None:
+        ingestion_worker.wake()
 
     return _job_to_response(job)
 
@@ -27,6 +27,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import AuthenticatedUser, get_current_user
+from src.cache.routing_cache import get_routing_cache
 from src.core.policy import Permission, check_permission
 from src.database import get_db_session
 from src.models.user import UserRole
@@ -128,16 +129,21 @@ async def update_tenant_settings(
     """Apply a partial settings update for the caller's tenant.
 
     Supports PATCH semantics - only fields present in the request body
-    are updated. Other settings are left unchanged.
+    are updated. Other settings are left unchanged. Cached routing
+    decisions for the tenant are invalidated.
     Requires admin role.
     """
     _require_admin(current_user)
     service = TenantAdminService(db)
-    return await service.update_tenant_settings(
+    result = await service.update_tenant_settings(
         tenant_id=current_user.tenant_id,
         update=body,
         actor_user_id=current_user.id,
     )
+    routing_cache = get_routing_cache()
+    if routing_cache is not None:
+        await routing_cache.invalidate_tenant(current_user.tenant_id)
+    return result
 
 
 @router.get(
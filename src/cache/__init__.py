@@ -6,11 +6,23 @@ Public API:
     InMemoryCacheBackend  - Dict-backed cache for dev/testing
     get_cache_backend     - Factory: selects backend from settings
 
+    Codec                 - Abstract base for cache value codecs
+    JsonCodec             - JSON (orjson when installed) for structured values
+    MsgpackCodec          - MessagePack for structured values (needs msgpack)
+    VectorCodec           - Raw float32/float16 bytes for embeddings
+
     CachedResponse        - Dataclass returned by ResponseCache
     ResponseCache         - Tenant-scoped LLM response cache
 
     EmbeddingCache        - Content-hash-keyed embedding cache
 
+    CachedRoute           - Dataclass returned by RoutingCache
+    RoutingCache          - Tenant-scoped memo of routing decisions
+    get_routing_cache     - Process-wide RoutingCache (None when disabled)
+
+    SemanticResponseCache - Embedding-similarity response cache per tenant
+    get_semantic_cache    - Process-wide SemanticResponseCache (None when disabled)
+
     CacheMiddleware       - FastAPI middleware for HTTP response caching
 """
 
@@ -20,17 +32,29 @@ from src.cache.backend import (
     RedisCacheBackend,
     get_cache_backend,
 )
+from src.cache.codecs import Codec, JsonCodec, MsgpackCodec, VectorCodec
 from src.cache.embedding_cache import EmbeddingCache
 from src.cache.middleware import CacheMiddleware
 from src.cache.response_cache import CachedResponse, ResponseCache
+from src.cache.routing_cache import CachedRoute, RoutingCache, get_routing_cache
+from src.cache.semantic_cache import SemanticResponseCache, get_semantic_cache
 
 __all__ = [
     "CacheBackend",
     "RedisCacheBackend",
     "InMemoryCacheBackend",
     "get_cache_backend",
+    "Codec",
+    "JsonCodec",
+    "MsgpackCodec",
+    "VectorCodec",
     "CachedResponse",
     "ResponseCache",
     "EmbeddingCache",
+    "CachedRoute",
+    "RoutingCache",
+    "get_routing_cache",
+    "SemanticResponseCache",
+    "get_semantic_cache",
     "CacheMiddleware",
 ]
@@ -1,9 +1,16 @@
 """Cache backend implementations.
 
 Defines the CacheBackend ABC and two concrete implementations:
-- RedisCacheBackend: Production backend using Redis with JSON serialization
+- RedisCacheBackend: Production backend using Redis; values are encoded
+  with a Codec (JSON by default)
 - InMemoryCacheBackend: Dict-based backend with TTL, for testing/dev
 
+Every read/write method takes an optional ``codec`` for values with their
+own wire format (e.g. VectorCodec for embeddings); callers must read a key
+with the codec it was written with. Values stored with the backend's own
+structured codec are tagged with it, so entries left behind by a different
+CACHE_VALUE_CODEC read as misses rather than decoding wrongly.
+
 The factory function get_cache_backend() selects the appropriate backend
 based on settings. Redis is preferred; InMemory is the safe fallback so
 the app works fine without a Redis connection.
@@ -12,13 +19,21 @@ the app works fine without a Redis connection.
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from abc import ABC, abstractmethod
 from typing import Any
 
 import structlog
 
+from src.cache.codecs import (
+    Codec,
+    CodecMismatchError,
+    JsonCodec,
+    decode_tagged,
+    encode_tagged,
+    get_codec,
+)
+
 log = structlog.get_logger(__name__)
 
 
@@ -26,17 +41,38 @@ class CacheBackend(ABC):
     """Abstract interface all cache backends must implement."""
 
     @abstractmethod
-    async def get(self, key: str) -> Any | None:
+    async def get(self, key: str, *, codec: Codec | None = None) -> Any | None:
         """Return cached value for key, or None if not found / expired."""
 
     @abstractmethod
-    async def set(self, key: str, value: Any, ttl: int) -> None:
+    async def set(self, key: str, value: Any, ttl: int, *, codec: Codec | None = None) -> None:
         """Store value under key with TTL in seconds."""
 
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete key from cache (no-op if key does not exist)."""
 
+    async def get_many(
+        self, keys: list[str], *, codec: Codec | None = None
+    ) -> list[Any | None]:
+        """Return cached values for keys in order (None for misses).
+
+        Backends should override this with a single round-trip; the default
+        falls back to one get() per key.
+        """
+        return [await self.get(key, codec=codec) for key in keys]
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int, *, codec: Codec | None = None
+    ) -> None:
+        """Store every key -> value in items with the same TTL.
+
+        Backends should override this with a single round-trip; the default
+        falls back to one set() per key.
+        """
+        for key, value in items.items():
+            await self.set(key, value, ttl, codec=codec)
+
     @abstractmethod
     async def exists(self, key: str) -> bool:
         """Return True if key exists and has not expired."""
@@ -62,13 +98,16 @@ class CacheBackend(ABC):
 class RedisCacheBackend(CacheBackend):
     """Production cache backend backed by Redis.
 
-    Uses aioredis (redis-py async) for all operations. Values are
-    JSON-serialised so they round-trip cleanly without pickle security
-    risks. Initialised lazily on first call so import never blocks.
+    Uses aioredis (redis-py async) for all operations. Values are encoded
+    with ``codec`` (JSON unless configured otherwise) so they round-trip
+    cleanly without pickle security risks; responses are read as raw bytes
+    so binary codecs work too. Initialised lazily on first call so import
+    never blocks.
     """
 
-    def __init__(self, redis_url: str) -> None:
+    def __init__(self, redis_url: str, codec: Codec | None = None) -> None:
         self._redis_url = redis_url
+        self._codec = codec or JsonCodec()
         self._client: Any = None  # redis.asyncio.Redis, set on first use
 
     async def _get_client(self) -> Any:
@@ -79,7 +118,7 @@ class RedisCacheBackend(CacheBackend):
                 self._client = aioredis.from_url(
                     self._redis_url,
                     encoding="utf-8",
-                    decode_responses=True,
+                    decode_responses=False,
                 )
             except ImportError as exc:
                 raise RuntimeError(
@@ -88,25 +127,72 @@ class RedisCacheBackend(CacheBackend):
                 ) from exc
         return self._client
 
-    async def get(self, key: str) -> Any | None:
+    def _encode(self, value: Any, codec: Codec | None) -> bytes:
+        if codec is not None:
+            return codec.encode(value)
+        return encode_tagged(self._codec, value)
+
+    def _decode(self, raw: bytes | str, codec: Codec | None) -> Any:
+        if codec is not None:
+            return codec.decode(raw)
+        return decode_tagged(self._codec, raw)
+
+    async def get(self, key: str, *, codec: Codec | None = None) -> Any | None:
         try:
             client = await self._get_client()
             raw = await client.get(key)
             if raw is None:
                 return None
-            return json.loads(raw)
+            return self._decode(raw, codec)
+        except CodecMismatchError:
+            log.debug("cache.redis.codec_mismatch", key=key)
+            return None
         except Exception as exc:
             log.warning("cache.redis.get_failed", key=key, error=str(exc))
             return None
 
-    async def set(self, key: str, value: Any, ttl: int) -> None:
+    async def set(self, key: str, value: Any, ttl: int, *, codec: Codec | None = None) -> None:
         try:
             client = await self._get_client()
-            serialised = json.dumps(value, default=str)
-            await client.setex(key, ttl, serialised)
+            await client.setex(key, ttl, self._encode(value, codec))
         except Exception as exc:
             log.warning("cache.redis.set_failed", key=key, error=str(exc))
 
+    async def get_many(
+        self, keys: list[str], *, codec: Codec | None = None
+    ) -> list[Any | None]:
+        """Fetch all keys with one MGET."""
+        if not keys:
+            return []
+        try:
+            client = await self._get_client()
+            raws = await client.mget(keys)
+            values: list[Any | None] = []
+            for raw in raws:
+                try:
+                    values.append(None if raw is None else self._decode(raw, codec))
+                except CodecMismatchError:
+                    values.append(None)
+            return values
+        except Exception as exc:
+            log.warning("cache.redis.get_many_failed", keys=len(keys), error=str(exc))
+            return [None] * len(keys)
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int, *, codec: Codec | None = None
+    ) -> None:
+        """Store all items with pipelined SETEX (one round-trip, no MULTI)."""
+        if not items:
+            return
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, self._encode(value, codec))
+            await pipe.execute()
+        except Exception as exc:
+            log.warning("cache.redis.set_many_failed", keys=len(items), error=str(exc))
+
     async def delete(self, key: str) -> None:
         try:
             client = await self._get_client()
@@ -203,6 +289,9 @@ class InMemoryCacheBackend(CacheBackend):
 
     Thread-safe via asyncio.Lock. Suitable for testing and single-process
     dev environments. Does NOT persist across process restarts.
+
+    Values are stored as Python objects; values written with an explicit
+    codec are stored encoded so reads behave exactly as with Redis.
     """
 
     def __init__(self) -> None:
@@ -212,7 +301,7 @@ class InMemoryCacheBackend(CacheBackend):
         self._hits: int = 0
         self._misses: int = 0
 
-    async def get(self, key: str) -> Any | None:
+    async def get(self, key: str, *, codec: Codec | None = None) -> Any | None:
         async with self._lock:
             entry = self._store.get(key)
             if entry is None or entry.is_expired:
@@ -221,11 +310,36 @@ class InMemoryCacheBackend(CacheBackend):
                 self._misses += 1
                 return None
             self._hits += 1
-            return entry.value
+            return entry.value if codec is None else codec.decode(entry.value)
 
-    async def set(self, key: str, value: Any, ttl: int) -> None:
+    async def set(self, key: str, value: Any, ttl: int, *, codec: Codec | None = None) -> None:
+        async with self._lock:
+            self._store[key] = _CacheEntry(value if codec is None else codec.encode(value), ttl)
+
+    async def get_many(
+        self, keys: list[str], *, codec: Codec | None = None
+    ) -> list[Any | None]:
+        async with self._lock:
+            values: list[Any | None] = []
+            for key in keys:
+                entry = self._store.get(key)
+                if entry is None or entry.is_expired:
+                    if entry is not None:
+                        del self._store[key]
+                    self._misses += 1
+                    values.append(None)
+                else:
+                    self._hits += 1
+                    values.append(entry.value if codec is None else codec.decode(entry.value))
+            return values
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int, *, codec: Codec | None = None
+    ) -> None:
         async with self._lock:
-            self._store[key] = _CacheEntry(value, ttl)
+            for key, value in items.items():
+                encoded = value if codec is None else codec.encode(value)
+                self._store[key] = _CacheEntry(encoded, ttl)
 
     async def delete(self, key: str) -> None:
         async with self._lock:
@@ -287,7 +401,9 @@ def get_cache_backend(settings: Any) -> CacheBackend:
 
     Tries to use Redis when the redis package is available and a redis_url
     is configured. Falls back to InMemoryCacheBackend so the application
-    works even without Redis installed.
+    works even without Redis installed. ``cache_value_codec`` (json or
+    msgpack) selects how Redis stores structured values; payloads are tagged
+    with their codec, so entries written with another codec are misses.
 
     Args:
         settings: Application Settings instance.
@@ -300,8 +416,9 @@ def get_cache_backend(settings: Any) -> CacheBackend:
     if redis_url:
         try:
             import redis.asyncio  # noqa: F401  - just check importability
-            log.info("cache.backend_selected", backend="redis", url=redis_url)
-            return RedisCacheBackend(redis_url)
+            codec = get_codec(getattr(settings, "cache_value_codec", "json"))
+            log.info("cache.backend_selected", backend="redis", url=redis_url, codec=codec.name)
+            return RedisCacheBackend(redis_url, codec=codec)
         except ImportError:
             log.warning(
                 "cache.redis_unavailable",
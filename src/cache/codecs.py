@@ -0,0 +1,156 @@
+"""Value codecs for cache backends.
+
+A codec turns a cached value into bytes and back. Backends use one codec
+for structured values by default (JSON) and accept a per-call codec for
+values with a better wire format:
+
+- JsonCodec: JSON text; uses orjson when installed, stdlib json otherwise
+- MsgpackCodec: MessagePack (requires the msgpack package)
+- VectorCodec: raw little-endian float32 (or float16) bytes for embeddings.
+  A 1536-dim vector is 6 KB as float32 and 3 KB as float16, versus ~30 KB
+  of JSON text. Decoding wraps the bytes in a read-only NumPy array without
+  copying or parsing.
+
+Per-call codecs (VectorCodec) put their name in the cache keys of values
+that use them. Structured values keep their keys when CACHE_VALUE_CODEC
+changes, so the backend's structured codec frames each payload with
+encode_tagged(): JSON payloads stay plain text (what older entries hold)
+and other codecs prepend a tag starting with 0xC1, a byte that neither
+UTF-8 JSON nor MessagePack ever starts with. decode_tagged() raises
+CodecMismatchError for a payload written by another codec, which the
+backend treats as a miss.
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class Codec(ABC):
+    """Encodes cache values to bytes and decodes them back."""
+
+    #: Short identifier used in cache key namespaces
+    name: str
+    #: Prefix framing this codec's payloads as structured values (see encode_tagged)
+    tag: bytes = b""
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialise a value for storage."""
+
+    @abstractmethod
+    def decode(self, data: bytes | str) -> Any:
+        """Deserialise a stored value."""
+
+
+class JsonCodec(Codec):
+    """JSON text, the format cache values have always been stored in."""
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(
+                value,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        return json.dumps(value, default=str).encode()
+
+    def decode(self, data: bytes | str) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack - smaller and faster than JSON for nested structures."""
+
+    name = "msgpack"
+    tag = b"\xc1m"
+
+    def __init__(self) -> None:
+        try:
+            import msgpack  # type: ignore[import-untyped]
+        except ImportError as exc:
+            raise RuntimeError(
+                "msgpack package is required for MsgpackCodec. "
+                "Install it with: pip install msgpack"
+            ) from exc
+        self._msgpack = msgpack
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, default=str, use_bin_type=True)
+
+    def decode(self, data: bytes | str) -> Any:
+        if isinstance(data, str):
+            data = data.encode("latin-1")
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class VectorCodec(Codec):
+    """Dense vectors as raw little-endian float bytes."""
+
+    _DTYPES = {"float32": ("f32", np.dtype("<f4")), "float16": ("f16", np.dtype("<f2"))}
+
+    def __init__(self, dtype: str = "float32") -> None:
+        if dtype not in self._DTYPES:
+            raise ValueError(f"Unsupported vector dtype {dtype!r}; use float32 or float16")
+        self.name, self._dtype = self._DTYPES[dtype]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    def encode(self, value: Sequence[float] | np.ndarray) -> bytes:
+        return np.asarray(value, dtype=self._dtype).tobytes()
+
+    def decode(self, data: bytes | str) -> np.ndarray:
+        """Return a read-only array view over ``data`` (no copy)."""
+        if isinstance(data, str):
+            raise TypeError("VectorCodec needs raw bytes, got text")
+        return np.frombuffer(data, dtype=self._dtype)
+
+
+class CodecMismatchError(ValueError):
+    """A stored payload was written with a different structured codec."""
+
+
+_TAG_MARKER = 0xC1
+
+
+def encode_tagged(codec: Codec, value: Any) -> bytes:
+    """Encode ``value`` prefixed with the codec's tag."""
+    return codec.tag + codec.encode(value)
+
+
+def decode_tagged(codec: Codec, data: bytes | str) -> Any:
+    """Decode a payload from encode_tagged(), checking it came from ``codec``."""
+    raw = data.encode() if isinstance(data, str) else data
+    tag = raw[:2] if raw[:1] == bytes([_TAG_MARKER]) else b""
+    if tag != codec.tag:
+        raise CodecMismatchError(
+            f"Payload tagged {tag!r} cannot be decoded with {codec.name} codec"
+        )
+    return codec.decode(raw[len(tag):] if tag else data)
+
+
+_STRUCTURED_CODECS: dict[str, type[Codec]] = {"json": JsonCodec, "msgpack": MsgpackCodec}
+
+
+def get_codec(name: str) -> Codec:
+    """Return the structured-value codec called ``name`` (json or msgpack)."""
+    try:
+        return _STRUCTURED_CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown cache codec {name!r}; use json or msgpack") from None
@@ -7,20 +7,32 @@ always resolves to the same key regardless of where it came from.
 
 Default TTL is 86400 s (24 hours) because embeddings don't change unless
 the underlying model changes. A longer TTL is safe because the hash key
-naturally invalidates when the text changes.
+naturally invalidates when the text changes, and the embedding model name
+is part of every key so switching models never serves vectors from the
+previous one.
+
+Vectors are stored as raw float32 bytes (float16 with
+``dtype="float16"``) rather than JSON text, a fifth of the size, and
+decoded without parsing. Keys carry a format version and the codec name
+(``emb:v2:f32:<model>:<hash>``); entries from the old JSON format, or
+written with the other dtype, live under different keys and are simply
+never read.
 """
 
 from __future__ import annotations
 
 import hashlib
 
+import numpy as np
 import structlog
 
 from src.cache.backend import CacheBackend
+from src.cache.codecs import VectorCodec
 
 log = structlog.get_logger(__name__)
 
 _EMBEDDING_NS = "emb"
+_EMBEDDING_FORMAT = "v2"  # bump when the stored representation changes
 _DEFAULT_EMBEDDING_TTL = 86400  # 24 hours
 
 
@@ -29,8 +41,8 @@ def _text_hash(text: str) -> str:
     return hashlib.sha256(text.encode()).hexdigest()
 
 
-def _embedding_key(text_hash: str) -> str:
-    return f"{_EMBEDDING_NS}:{text_hash}"
+def _embedding_prefix(codec: VectorCodec, model: str) -> str:
+    return f"{_EMBEDDING_NS}:{_EMBEDDING_FORMAT}:{codec.name}:{model}"
 
 
 class EmbeddingCache:
@@ -39,10 +51,25 @@ class EmbeddingCache:
     The caller is responsible for computing text_hash. Using the content
     hash decouples the cache from the source format: the same chunk of
     text embedded from a PDF, docx, or plain text all share one entry.
+
+    Entries are scoped to ``model`` (the embedding model name); pass the
+    model the vectors are produced with. ``dtype`` is the stored precision:
+    float16 halves memory again at ~3 significant digits, which is ample
+    for cosine ranking.
     """
 
-    def __init__(self, backend: CacheBackend) -> None:
+    def __init__(
+        self, backend: CacheBackend, model: str = "default", dtype: str = "float32"
+    ) -> None:
         self._backend = backend
+        self._model = model
+        self._codec = VectorCodec(dtype)
+        self._prefix = _embedding_prefix(self._codec, model)
+
+    @property
+    def model(self) -> str:
+        """Embedding model whose vectors this cache holds."""
+        return self._model
 
     # ------------------------------------------------------------------
     # Key helpers (public so callers can pre-compute without a get)
@@ -57,19 +84,30 @@ class EmbeddingCache:
         """
         return _text_hash(text)
 
+    def _key(self, text_hash: str) -> str:
+        return f"{self._prefix}:{text_hash}"
+
     # ------------------------------------------------------------------
     # Single-item operations
     # ------------------------------------------------------------------
 
-    async def get_embedding(self, text_hash: str) -> list[float] | None:
-        """Return cached embedding for text_hash, or None on miss."""
-        key = _embedding_key(text_hash)
-        result = await self._backend.get(key)
+    async def get_vector(self, text_hash: str) -> np.ndarray | None:
+        """Return the cached embedding as a read-only NumPy view, or None on miss.
+
+        No copy or parse is made; prefer this over get_embedding() when the
+        caller does vector math.
+        """
+        result = await self._backend.get(self._key(text_hash), codec=self._codec)
         if result is None:
             log.debug("cache.embedding.miss", text_hash=text_hash[:16])
             return None
         log.debug("cache.embedding.hit", text_hash=text_hash[:16])
-        return list(result)  # backend may return a plain list or JSON array
+        return result
+
+    async def get_embedding(self, text_hash: str) -> list[float] | None:
+        """Return cached embedding for text_hash, or None on miss."""
+        vector = await self.get_vector(text_hash)
+        return None if vector is None else vector.tolist()
 
     async def cache_embedding(
         self,
@@ -84,8 +122,7 @@ class EmbeddingCache:
             embedding: Dense vector as list[float]
             ttl: Seconds until expiry (default 24h)
         """
-        key = _embedding_key(text_hash)
-        await self._backend.set(key, embedding, ttl)
+        await self._backend.set(self._key(text_hash), embedding, ttl, codec=self._codec)
         log.debug(
             "cache.embedding.stored",
             text_hash=text_hash[:16],
@@ -100,7 +137,7 @@ class EmbeddingCache:
     async def batch_get(
         self, text_hashes: list[str]
     ) -> dict[str, list[float] | None]:
-        """Return embeddings for multiple hashes in one logical operation.
+        """Return embeddings for multiple hashes with one backend round-trip.
 
         Missing hashes map to None in the result. The dict preserves the
         input order (Python 3.7+ dict is ordered by insertion).
@@ -111,9 +148,17 @@ class EmbeddingCache:
         Returns:
             Dict mapping each text_hash to its embedding or None.
         """
-        results: dict[str, list[float] | None] = {}
-        for text_hash in text_hashes:
-            results[text_hash] = await self.get_embedding(text_hash)
+        if not text_hashes:
+            return {}
+        values = await self._backend.get_many(
+            [self._key(text_hash) for text_hash in text_hashes], codec=self._codec
+        )
+        results: dict[str, list[float] | None] = {
+            text_hash: None if value is None else value.tolist()
+            for text_hash, value in zip(text_hashes, values)
+        }
+        hits = sum(1 for value in results.values() if value is not None)
+        log.debug("cache.embedding.batch_get", requested=len(text_hashes), hits=hits)
         return results
 
     async def batch_cache(
@@ -121,14 +166,20 @@ class EmbeddingCache:
         embeddings: dict[str, list[float]],
         ttl: int = _DEFAULT_EMBEDDING_TTL,
     ) -> None:
-        """Store multiple embeddings in one logical operation.
+        """Store multiple embeddings with one backend round-trip.
 
         Args:
             embeddings: Mapping of text_hash -> embedding vector
             ttl: Seconds until expiry for all entries (default 24h)
         """
-        for text_hash, embedding in embeddings.items():
-            await self.cache_embedding(text_hash, embedding, ttl)
+        if not embeddings:
+            return
+        await self._backend.set_many(
+            {self._key(text_hash): embedding for text_hash, embedding in embeddings.items()},
+            ttl,
+            codec=self._codec,
+        )
+        log.debug("cache.embedding.batch_stored", count=len(embeddings), ttl=ttl)
 
     # ------------------------------------------------------------------
     # Utility
@@ -136,11 +187,10 @@ class EmbeddingCache:
 
     async def invalidate(self, text_hash: str) -> None:
         """Remove a single embedding from the cache."""
-        key = _embedding_key(text_hash)
-        await self._backend.delete(key)
+        await self._backend.delete(self._key(text_hash))
         log.debug("cache.embedding.invalidated", text_hash=text_hash[:16])
 
     async def flush(self) -> None:
-        """Remove all cached embeddings (pattern-based)."""
-        deleted = await self._backend.delete_pattern(f"{_EMBEDDING_NS}:*")
+        """Remove all cached embeddings for this model and dtype (pattern-based)."""
+        deleted = await self._backend.delete_pattern(f"{self._prefix}:*")
         log.info("cache.embedding.flushed", keys_deleted=deleted)
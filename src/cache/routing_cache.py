@@ -0,0 +1,244 @@
+"""Routing cache - memoized intent and complexity decisions per tenant.
+
+Operators ask the same questions over and over with only numbers or asset
+ids changing ("status of line 3", "status of line 4"). Each one costs the
+orchestrator an intent classification and a complexity assessment. This
+cache stores both decisions keyed on a normalised message fingerprint:
+lowercased, punctuation stripped, numbers masked as <n> and tokens that
+mix letters and digits (asset tags, work order ids, UUIDs) masked as <id>.
+
+Keys are scoped by tenant and by two version tokens so stale decisions are
+never served:
+- the agent registry fingerprint (agents or capabilities changed)
+- the tenant's generation, bumped by invalidate_tenant() when tenant
+  settings change or an admin invalidates the tenant's cache
+
+Entries expire after ``ttl`` seconds. Each tenant is also limited to
+``max_entries_per_tenant``; the least recently used entries written by
+this process are evicted beyond that.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import string
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from src.cache.backend import CacheBackend
+
+log = structlog.get_logger(__name__)
+
+_ROUTING_NS = "route"
+_GENERATION_NS = "route_gen"
+_DEFAULT_ROUTING_TTL = 3600  # 1 hour
+
+_PUNCTUATION = string.punctuation + "“”‘’"
+_NUMBER_RE = re.compile(r"[+-]?\d+(?:[.,:]\d+)*%?")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def fingerprint(message: str) -> str:
+    """Normalise a message so near-identical questions share one key.
+
+    >>> fingerprint("Status of Line 3?")
+    'status of line <n>'
+    >>> fingerprint("open WOs for P-101")
+    'open wos for <id>'
+    """
+    tokens: list[str] = []
+    for raw in message.lower().split():
+        token = raw.strip(_PUNCTUATION)
+        if not token:
+            continue
+        if _NUMBER_RE.fullmatch(token):
+            tokens.append("<n>")
+        elif any(ch.isdigit() for ch in token):
+            tokens.append("<id>")
+        else:
+            word = _NON_WORD_RE.sub("", token)
+            if word:
+                tokens.append(word)
+    return " ".join(tokens)
+
+
+@dataclass
+class CachedRoute:
+    """Routing decision stored in the cache.
+
+    Attributes:
+        intent: IntentClassification fields (primary_capability, confidence,
+            secondary_capabilities, reasoning)
+        complexity: QueryComplexity value
+    """
+
+    intent: dict[str, Any]
+    complexity: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"intent": self.intent, "complexity": self.complexity}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedRoute:
+        return cls(intent=data["intent"], complexity=data["complexity"])
+
+
+@dataclass
+class _RoutingStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    by_tenant: dict[str, list[int]] = field(default_factory=dict)
+
+
+class RoutingCache:
+    """Tenant-scoped cache of routing decisions on top of a CacheBackend."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        ttl: int = _DEFAULT_ROUTING_TTL,
+        max_entries_per_tenant: int = 1000,
+    ) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._max_entries = max_entries_per_tenant
+        # tenant -> cache keys written by this process, least recently used first
+        self._lru: dict[uuid.UUID, OrderedDict[str, None]] = {}
+        self._stats = _RoutingStats()
+
+    # ------------------------------------------------------------------
+    # Key helpers
+    # ------------------------------------------------------------------
+
+    def _generation_key(self, tenant_id: uuid.UUID) -> str:
+        return f"{_GENERATION_NS}:{tenant_id}"
+
+    async def _key(self, tenant_id: uuid.UUID, message: str, registry_version: str) -> str:
+        generation = await self._backend.get(self._generation_key(tenant_id)) or "0"
+        digest = hashlib.sha256(fingerprint(message).encode()).hexdigest()
+        return f"{_ROUTING_NS}:{tenant_id}:{registry_version}:{generation}:{digest}"
+
+    def _touch(self, tenant_id: uuid.UUID, key: str) -> list[str]:
+        """Mark key most recently used; return keys evicted to stay within bounds."""
+        entries = self._lru.setdefault(tenant_id, OrderedDict())
+        entries[key] = None
+        entries.move_to_end(key)
+        evicted: list[str] = []
+        while len(entries) > self._max_entries:
+            evicted.append(entries.popitem(last=False)[0])
+        return evicted
+
+    def _count(self, tenant_id: uuid.UUID, hit: bool) -> None:
+        counts = self._stats.by_tenant.setdefault(str(tenant_id), [0, 0])
+        counts[0 if hit else 1] += 1
+        if hit:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    async def get(
+        self,
+        tenant_id: uuid.UUID,
+        message: str,
+        *,
+        registry_version: str,
+    ) -> CachedRoute | None:
+        """Return the cached routing decision for a message, or None on miss."""
+        key = await self._key(tenant_id, message, registry_version)
+        data = await self._backend.get(key)
+        if data is None:
+            self._count(tenant_id, hit=False)
+            return None
+        self._count(tenant_id, hit=True)
+        self._touch(tenant_id, key)
+        log.debug("cache.routing.hit", tenant_id=str(tenant_id))
+        return CachedRoute.from_dict(data)
+
+    async def set(
+        self,
+        tenant_id: uuid.UUID,
+        message: str,
+        route: CachedRoute,
+        *,
+        registry_version: str,
+    ) -> None:
+        """Store a routing decision, evicting the tenant's LRU entries if full."""
+        key = await self._key(tenant_id, message, registry_version)
+        await self._backend.set(key, route.to_dict(), self._ttl)
+        self._stats.stores += 1
+        for evicted in self._touch(tenant_id, key):
+            await self._backend.delete(evicted)
+            self._stats.evictions += 1
+
+    async def invalidate_tenant(self, tenant_id: uuid.UUID) -> None:
+        """Drop every routing decision of a tenant by bumping its generation.
+
+        The generation outlives any entry written under the previous one, so
+        old entries can never become reachable again.
+        """
+        await self._backend.set(
+            self._generation_key(tenant_id), uuid.uuid4().hex[:12], self._ttl * 2
+        )
+        for key in self._lru.pop(tenant_id, {}):
+            await self._backend.delete(key)
+        self._stats.invalidations += 1
+        log.info("cache.routing.tenant_invalidated", tenant_id=str(tenant_id))
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def stats(self, tenant_id: uuid.UUID | None = None) -> dict[str, Any]:
+        """Hit rate and eviction counters for this process.
+
+        With ``tenant_id`` the hit/miss counts are those of that tenant.
+        """
+        hits, misses = self._stats.hits, self._stats.misses
+        if tenant_id is not None:
+            hits, misses = self._stats.by_tenant.get(str(tenant_id), [0, 0])
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "stores": self._stats.stores,
+            "evictions": self._stats.evictions,
+            "invalidations": self._stats.invalidations,
+            "ttl": self._ttl,
+            "max_entries_per_tenant": self._max_entries,
+        }
+
+
+_routing_cache: RoutingCache | None = None
+
+
+def init_routing_cache(settings: Any, backend: CacheBackend) -> RoutingCache | None:
+    """Create the process-wide routing cache unless ROUTING_CACHE_ENABLED is false."""
+    global _routing_cache
+    if not getattr(settings, "routing_cache_enabled", True):
+        _routing_cache = None
+        return None
+    _routing_cache = RoutingCache(
+        backend,
+        ttl=getattr(settings, "routing_cache_ttl_seconds", _DEFAULT_ROUTING_TTL),
+        max_entries_per_tenant=getattr(settings, "routing_cache_max_entries_per_tenant", 1000),
+    )
+    return _routing_cache
+
+
+def get_routing_cache() -> RoutingCache | None:
+    """Return the process-wide routing cache, or None when disabled."""
+    return _routing_cache
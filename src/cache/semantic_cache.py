@@ -0,0 +1,296 @@
+"""Semantic response cache - reuse answers for paraphrased questions.
+
+ResponseCache only hits when the normalised query text is identical, so
+"what is the LOTO procedure for line 2?" and "how do I lock out line 2?"
+both go to the LLM. This tier stores the query embedding alongside each
+cached response and serves a hit when a new query's embedding is close
+enough (cosine similarity at or above the tenant's threshold).
+
+A hit is only served if every document the cached answer cited still has
+the version it had when the answer was cached; otherwise the entry is
+dropped as stale. The caller supplies the current versions (a documents
+table lookup) so the cache stays storage-agnostic.
+
+The index is in-process and partitioned by tenant: one normalised
+embedding matrix per tenant, searched with a single matrix-vector product.
+Entries expire after ``ttl`` seconds and each tenant holds at most
+``max_entries_per_tenant`` (oldest evicted first). Hits, misses, stale
+entries and the best similarity of every lookup are exported to Prometheus
+so thresholds can be tuned.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+import structlog
+
+from src.cache.response_cache import CachedResponse
+from src.middleware.prometheus import record_semantic_cache
+
+log = structlog.get_logger(__name__)
+
+_DEFAULT_SEMANTIC_TTL = 3600  # 1 hour
+
+DocumentVersions = Callable[[list[str]], Awaitable[dict[str, str]]]
+
+
+@dataclass
+class _Entry:
+    content: str
+    model: str
+    scope: str
+    documents: dict[str, str]
+    cached_at: datetime
+    expires_at: float
+
+
+class _TenantIndex:
+    """Entries of one tenant plus their stacked, normalised embeddings."""
+
+    def __init__(self) -> None:
+        self.entries: list[_Entry] = []
+        self.vectors: list[np.ndarray] = []
+        self._matrix: np.ndarray | None = None
+
+    def add(self, entry: _Entry, vector: np.ndarray, max_entries: int) -> None:
+        self.entries.append(entry)
+        self.vectors.append(vector)
+        overflow = len(self.entries) - max_entries
+        if overflow > 0:
+            del self.entries[:overflow]
+            del self.vectors[:overflow]
+        self._matrix = None
+
+    def remove(self, indices: Sequence[int]) -> None:
+        for index in sorted(indices, reverse=True):
+            del self.entries[index]
+            del self.vectors[index]
+        self._matrix = None
+
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            self._matrix = np.vstack(self.vectors)
+        return self._matrix
+
+
+def _normalise(embedding: Sequence[float]) -> np.ndarray | None:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0 or vector.ndim != 1:
+        return None
+    return vector / norm
+
+
+class SemanticResponseCache:
+    """Tenant-partitioned in-process vector index of cached responses."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.95,
+        tenant_thresholds: dict[str, float] | None = None,
+        ttl: int = _DEFAULT_SEMANTIC_TTL,
+        max_entries_per_tenant: int = 500,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            threshold: Default minimum cosine similarity for a hit
+            tenant_thresholds: Per-tenant overrides keyed by tenant id string
+            ttl: Seconds until an entry expires
+            max_entries_per_tenant: Entries kept per tenant (oldest evicted)
+        """
+        self._threshold = threshold
+        self._tenant_thresholds = dict(tenant_thresholds or {})
+        self._ttl = ttl
+        self._max_entries = max_entries_per_tenant
+        self._tenants: dict[uuid.UUID, _TenantIndex] = {}
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+
+    def threshold_for(self, tenant_id: uuid.UUID) -> float:
+        return self._tenant_thresholds.get(str(tenant_id), self._threshold)
+
+    def set_threshold(self, tenant_id: uuid.UUID, threshold: float) -> None:
+        """Override the similarity threshold for one tenant."""
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self._tenant_thresholds[str(tenant_id)] = threshold
+
+    @staticmethod
+    def _scope(model: str, agent_id: uuid.UUID | None) -> str:
+        return f"{model.strip().lower()}:{agent_id or ''}"
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    async def lookup(
+        self,
+        tenant_id: uuid.UUID,
+        embedding: Sequence[float],
+        *,
+        model: str,
+        agent_id: uuid.UUID | None,
+        document_versions: DocumentVersions,
+    ) -> CachedResponse | None:
+        """Return the closest cached response above the tenant's threshold.
+
+        Args:
+            tenant_id: Tenant whose entries are searched
+            embedding: Query embedding
+            model: Model the response must have been cached for
+            agent_id: Agent scope (None for the default agent)
+            document_versions: Returns current versions of the given
+                document ids; missing ids count as changed
+
+        Returns:
+            CachedResponse on a hit, None on a miss or stale entry
+        """
+        index = self._tenants.get(tenant_id)
+        query = _normalise(embedding)
+        if index is None or query is None or not index.entries:
+            self._record("miss", None)
+            return None
+
+        now = time.monotonic()
+        expired = [i for i, entry in enumerate(index.entries) if entry.expires_at <= now]
+        if expired:
+            index.remove(expired)
+            if not index.entries:
+                self._record("miss", None)
+                return None
+
+        scope = self._scope(model, agent_id)
+        similarities = index.matrix() @ query
+        in_scope = np.array([entry.scope == scope for entry in index.entries])
+        similarities = np.where(in_scope, similarities, -1.0)
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self.threshold_for(tenant_id):
+            self._record("miss", similarity if similarity >= 0 else None)
+            return None
+
+        entry = index.entries[best]
+        if entry.documents:
+            current = await document_versions(list(entry.documents))
+            if any(current.get(doc) != version for doc, version in entry.documents.items()):
+                index.remove([best])
+                self._record("stale", similarity)
+                log.debug("cache.semantic.stale", tenant_id=str(tenant_id))
+                return None
+
+        self._record("hit", similarity)
+        log.debug(
+            "cache.semantic.hit",
+            tenant_id=str(tenant_id),
+            similarity=round(similarity, 4),
+        )
+        return CachedResponse(
+            content=entry.content,
+            model=entry.model,
+            cached_at=entry.cached_at,
+            ttl=self._ttl,
+        )
+
+    def store(
+        self,
+        tenant_id: uuid.UUID,
+        embedding: Sequence[float],
+        *,
+        model: str,
+        agent_id: uuid.UUID | None,
+        response: str,
+        documents: dict[str, str],
+    ) -> None:
+        """Cache a response with its query embedding and cited document versions.
+
+        Only store answers built from the turn's full context: an entry from
+        a degraded turn would be served to every paraphrase until it expires.
+
+        Args:
+            tenant_id: Tenant that owns the response
+            embedding: Query embedding
+            model: Model that generated the response
+            agent_id: Agent scope (None for the default agent)
+            response: Response text
+            documents: Cited document id -> version at answer time
+        """
+        vector = _normalise(embedding)
+        if vector is None:
+            return
+        index = self._tenants.setdefault(tenant_id, _TenantIndex())
+        if index.vectors and index.vectors[0].shape != vector.shape:
+            # Embedding model changed; vectors are not comparable
+            self._tenants[tenant_id] = index = _TenantIndex()
+        entry = _Entry(
+            content=response,
+            model=model,
+            scope=self._scope(model, agent_id),
+            documents=dict(documents),
+            cached_at=datetime.now(UTC),
+            expires_at=time.monotonic() + self._ttl,
+        )
+        index.add(entry, vector, self._max_entries)
+
+    def invalidate_tenant(self, tenant_id: uuid.UUID) -> int:
+        """Drop every entry of a tenant. Returns the number removed."""
+        index = self._tenants.pop(tenant_id, None)
+        return len(index.entries) if index else 0
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def _record(self, result: str, similarity: float | None) -> None:
+        if result == "hit":
+            self._hits += 1
+        elif result == "stale":
+            self._stale += 1
+        else:
+            self._misses += 1
+        record_semantic_cache(result, similarity)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit rate and index size for this process."""
+        lookups = self._hits + self._misses + self._stale
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale": self._stale,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "entries": sum(len(index.entries) for index in self._tenants.values()),
+            "tenants": len(self._tenants),
+            "threshold": self._threshold,
+        }
+
+
+_semantic_cache: SemanticResponseCache | None = None
+
+
+def init_semantic_cache(settings: Any) -> SemanticResponseCache | None:
+    """Create the process-wide semantic cache if SEMANTIC_CACHE_ENABLED is set."""
+    global _semantic_cache
+    if not getattr(settings, "semantic_cache_enabled", False):
+        _semantic_cache = None
+        return None
+    _semantic_cache = SemanticResponseCache(
+        threshold=getattr(settings, "semantic_cache_threshold", 0.95),
+        tenant_thresholds=getattr(settings, "semantic_cache_tenant_thresholds", None),
+        ttl=getattr(settings, "semantic_cache_ttl_seconds", _DEFAULT_SEMANTIC_TTL),
+        max_entries_per_tenant=getattr(settings, "semantic_cache_max_entries_per_tenant", 500),
+    )
+    return _semantic_cache
+
+
+def get_semantic_cache() -> SemanticResponseCache | None:
+    """Return the process-wide semantic cache, or None when disabled."""
+    return _semantic_cache
@@ -8,7 +8,8 @@ All connectors:
 - Are read-only by default (no writes without explicit approval)
 - Enforce tenant isolation
 - Include universal audit logging
-- Support connection pooling and health checks
+- Support connection pooling and health checks (ConnectorPool keeps one
+  long-lived client per connector configuration)
 - Have configurable caching with 5-minute TTL
 
 Production-ready connectors for enterprise system integration.
@@ -22,8 +23,9 @@ from src.connectors.base import (
     ConnectorConfig,
     ConnectorResult,
 )
-from src.connectors.cache import ConnectorCache
+from src.connectors.cache import ConnectorCache, RedisConnectorCache
 from src.connectors.mes import MESConnector
+from src.connectors.pool import ConnectorPool
 from src.connectors.sap import SAPConnector
 from src.connectors.sql_guard import SQLGuard
 
@@ -34,6 +36,8 @@ __all__ = [
     "SAPConnector",
     "MESConnector",
     "ConnectorCache",
+    "ConnectorPool",
+    "RedisConnectorCache",
     "SQLGuard",
     "ToolApprovalWorkflow",
 ]
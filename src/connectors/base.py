@@ -117,25 +117,54 @@ class BaseConnector(ABC):
     - Configuration validation
     """
 
-    def __init__(self, config: ConnectorConfig) -> None:
+    def __init__(
+        self,
+        config: ConnectorConfig,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the connector.
+
+        Args:
+            config: Connector configuration
+            http_client: Long-lived client owned by the caller (e.g. the
+                ConnectorPool). When given, ``async with connector`` neither
+                creates nor closes a client.
+        """
         config.validate()
         self.config = config
-        self._http_client: httpx.AsyncClient | None = None
+        self._http_client: httpx.AsyncClient | None = http_client
+        self._owns_http_client = http_client is None
+        # Set by ConnectorPool: ``async with`` then holds one of the pool's slots
+        self._pool_slot: Any = None
         self._status = ConnectorStatus.UNKNOWN
 
-    async def __aenter__(self) -> BaseConnector:
-        """Async context manager entry - initialize HTTP client."""
-        self._http_client = httpx.AsyncClient(
-            base_url=self.config.endpoint,
-            timeout=self.config.timeout_seconds,
+    @staticmethod
+    def create_http_client(
+        config: ConnectorConfig,
+        limits: httpx.Limits | None = None,
+    ) -> httpx.AsyncClient:
+        """Build an HTTP client for a connector configuration."""
+        return httpx.AsyncClient(
+            base_url=config.endpoint,
+            timeout=config.timeout_seconds,
             # Connection pooling for efficiency
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            limits=limits or httpx.Limits(max_keepalive_connections=20, max_connections=100),
         )
+
+    async def __aenter__(self) -> BaseConnector:
+        """Async context manager entry - initialize HTTP client."""
+        if self._pool_slot is not None:
+            await self._pool_slot.acquire()
+        elif self._owns_http_client:
+            self._http_client = self.create_http_client(self.config)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit - cleanup HTTP client."""
-        if self._http_client:
+        if self._pool_slot is not None:
+            await self._pool_slot.release()
+        elif self._owns_http_client and self._http_client:
             await self._http_client.aclose()
             self._http_client = None
 
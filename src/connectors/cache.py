@@ -6,29 +6,61 @@ ConnectorCache provides a simple in-memory LRU cache for connector results:
 - LRU eviction with max 1000 entries per tenant
 - Cache hit/miss metrics via structlog
 
-This is an in-memory LRU implementation. For distributed deployments, replace with a Redis-backed cache.
+``get_or_fetch`` wraps a connector call with the cache:
+- Single-flight: concurrent misses on the same key await one in-flight
+  fetch instead of each calling SAP/MES (counted as "coalesced")
+- Stale-while-revalidate: within ``stale_ttl_seconds`` after expiry the old
+  value is served once while a background refresh runs; callers arriving
+  during the refresh join it
+- Lookups are exported to Prometheus by result (hit, stale, miss, coalesced)
+
+RedisConnectorCache stores entries in the shared cache backend so hit rates
+survive across API replicas. Connector dataclasses, enums, datetimes and
+decimals are stored with a type tag and rebuilt on load, so a shared hit
+returns the same types as a fresh fetch. Tools obtain their cache via
+get_connector_cache(), which returns the Redis-backed variant once
+init_connector_cache() has been given a Redis backend.
 """
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import hashlib
+import importlib
 import json
 import time
 import uuid
 from collections import OrderedDict
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 from typing import Any
 
 import structlog
 
+from src.cache.backend import CacheBackend, RedisCacheBackend
+from src.connectors.base import ConnectorResult
+from src.middleware.prometheus import record_connector_cache
+
 log = structlog.get_logger(__name__)
 
+ConnectorFetch = Callable[[], Awaitable[ConnectorResult]]
+
 # Cache TTL in seconds
 DEFAULT_TTL_SECONDS = 300  # 5 minutes
 
 # Max cache entries per tenant (LRU eviction)
 MAX_ENTRIES_PER_TENANT = 1000
 
+# Key marking a tagged (non-JSON) value in shared cache payloads
+_TYPE_TAG = "__type__"
+
+# Only classes from these modules are rebuilt from shared cache payloads
+_REBUILDABLE_MODULES = ("src.connectors.",)
+
 
 @dataclass
 class CacheEntry:
@@ -55,11 +87,17 @@ class ConnectorCache:
         self,
         ttl_seconds: int = DEFAULT_TTL_SECONDS,
         max_entries_per_tenant: int = MAX_ENTRIES_PER_TENANT,
+        stale_ttl_seconds: int = 0,
     ) -> None:
         self.ttl_seconds = ttl_seconds
         self.max_entries_per_tenant = max_entries_per_tenant
+        # How long after expiry get_or_fetch may still serve an entry once
+        self.stale_ttl_seconds = stale_ttl_seconds
         # Nested dict: tenant_id -> OrderedDict[cache_key, CacheEntry]
         self._cache: dict[str, OrderedDict[str, CacheEntry]] = {}
+        # "tenant_id:cache_key" -> fetch shared by concurrent callers
+        self._in_flight: dict[str, asyncio.Task[ConnectorResult]] = {}
+        self._requests = {"hit": 0, "stale": 0, "miss": 0, "coalesced": 0}
 
     def _get_tenant_cache(self, tenant_id: uuid.UUID) -> OrderedDict[str, CacheEntry]:
         """Get or create the cache OrderedDict for a tenant."""
@@ -120,8 +158,9 @@ class ConnectorCache:
             return None
 
         if entry.is_expired():
-            # Remove expired entry
-            del tenant_cache[cache_key]
+            # Remove expired entry, unless get_or_fetch may still serve it stale
+            if time.time() > entry.expires_at + self.stale_ttl_seconds:
+                del tenant_cache[cache_key]
             log.debug(
                 "connector.cache_miss",
                 tenant_id=str(tenant_id),
@@ -156,8 +195,20 @@ class ConnectorCache:
 
         If the tenant cache exceeds max_entries_per_tenant, evict LRU entry.
         """
-        tenant_cache = self._get_tenant_cache(tenant_id)
         cache_key = self._make_cache_key(connector, operation, user_id, params)
+        self._put(tenant_id, cache_key, value)
+
+        log.debug(
+            "connector.cache_set",
+            tenant_id=str(tenant_id),
+            connector=connector,
+            operation=operation,
+            ttl_seconds=self.ttl_seconds,
+        )
+
+    def _put(self, tenant_id: uuid.UUID, cache_key: str, value: Any) -> None:
+        tenant_cache = self._get_tenant_cache(tenant_id)
+        tenant_cache.pop(cache_key, None)
 
         # LRU eviction if at capacity
         if len(tenant_cache) >= self.max_entries_per_tenant:
@@ -173,12 +224,123 @@ class ConnectorCache:
         expires_at = time.time() + self.ttl_seconds
         tenant_cache[cache_key] = CacheEntry(value=value, expires_at=expires_at)
 
-        log.debug(
-            "connector.cache_set",
-            tenant_id=str(tenant_id),
-            connector=connector,
-            operation=operation,
-            ttl_seconds=self.ttl_seconds,
+    # ------------------------------------------------------------------
+    # Single-flight / stale-while-revalidate
+    # ------------------------------------------------------------------
+
+    async def _load(self, tenant_id: uuid.UUID, cache_key: str) -> CacheEntry | None:
+        """Return the entry for ``cache_key`` if it is fresh or still servable stale."""
+        tenant_cache = self._get_tenant_cache(tenant_id)
+        entry = tenant_cache.get(cache_key)
+        if entry is None:
+            return None
+        if time.time() > entry.expires_at + self.stale_ttl_seconds:
+            del tenant_cache[cache_key]
+            return None
+        tenant_cache.move_to_end(cache_key)
+        return entry
+
+    async def _store(self, tenant_id: uuid.UUID, cache_key: str, value: Any) -> None:
+        self._put(tenant_id, cache_key, value)
+
+    async def get_or_fetch(
+        self,
+        tenant_id: uuid.UUID,
+        connector: str,
+        operation: str,
+        user_id: uuid.UUID,
+        params: dict[str, Any],
+        fetch: ConnectorFetch,
+    ) -> ConnectorResult:
+        """Return the cached result, or fetch it once for all concurrent callers.
+
+        Args:
+            tenant_id, connector, operation, user_id, params: Cache key parts
+            fetch: Calls the connector; only successful results are cached
+
+        Returns:
+            ConnectorResult with ``cached`` set unless this call performed the
+            fetch, and ``metadata["cache"]`` one of hit, stale, miss, coalesced
+        """
+        cache_key = self._make_cache_key(connector, operation, user_id, params)
+        flight_key = f"{tenant_id}:{cache_key}"
+        entry = await self._load(tenant_id, cache_key)
+
+        if entry is not None and not entry.is_expired():
+            return self._served(connector, operation, "hit", ConnectorResult(
+                success=True, data=entry.value
+            ))
+
+        in_flight = self._in_flight.get(flight_key)
+        if entry is not None and in_flight is None:
+            # Expired but inside the stale window: serve it once and refresh
+            self._start_fetch(flight_key, tenant_id, cache_key, connector, operation, fetch)
+            return self._served(connector, operation, "stale", ConnectorResult(
+                success=True, data=entry.value
+            ))
+
+        if in_flight is not None:
+            # shield: a cancelled caller must not cancel the shared fetch
+            result = await asyncio.shield(in_flight)
+            return self._served(connector, operation, "coalesced", result)
+
+        task = self._start_fetch(flight_key, tenant_id, cache_key, connector, operation, fetch)
+        result = await asyncio.shield(task)
+        return self._served(connector, operation, "miss", result)
+
+    def _start_fetch(
+        self,
+        flight_key: str,
+        tenant_id: uuid.UUID,
+        cache_key: str,
+        connector: str,
+        operation: str,
+        fetch: ConnectorFetch,
+    ) -> asyncio.Task[ConnectorResult]:
+        task = asyncio.create_task(
+            self._fetch_and_store(tenant_id, cache_key, connector, operation, fetch)
+        )
+        self._in_flight[flight_key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(flight_key, None))
+        return task
+
+    async def _fetch_and_store(
+        self,
+        tenant_id: uuid.UUID,
+        cache_key: str,
+        connector: str,
+        operation: str,
+        fetch: ConnectorFetch,
+    ) -> ConnectorResult:
+        try:
+            result = await fetch()
+        except Exception as exc:
+            log.warning(
+                "connector.cache_fetch_failed",
+                tenant_id=str(tenant_id),
+                connector=connector,
+                operation=operation,
+                error=str(exc),
+            )
+            return ConnectorResult(success=False, error=str(exc))
+        if result.success:
+            try:
+                await self._store(tenant_id, cache_key, result.data)
+            except Exception as exc:
+                # A cache outage must not fail the connector call
+                log.warning("connector.cache_store_failed", connector=connector, error=str(exc))
+        return result
+
+    def _served(
+        self, connector: str, operation: str, source: str, result: ConnectorResult
+    ) -> ConnectorResult:
+        self._requests[source] += 1
+        record_connector_cache(connector, source)
+        log.debug("connector.cache_lookup", connector=connector, operation=operation, result=source)
+        return replace(
+            result,
+            cached=source != "miss",
+            metadata={**result.metadata, "cache": source},
         )
 
     def invalidate_tenant(self, tenant_id: uuid.UUID) -> None:
@@ -228,4 +390,174 @@ class ConnectorCache:
             "tenant_count": len(self._cache),
             "total_entries": total_entries,
             "max_entries_per_tenant": self.max_entries_per_tenant,
+            "requests": dict(self._requests),
+            "in_flight": len(self._in_flight),
+        }
+
+
+def _type_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_type(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(_REBUILDABLE_MODULES):
+        raise ValueError(f"Refusing to rebuild cached type {path!r}")
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a connector result into JSON-safe data with type tags."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            _TYPE_TAG: "dataclass",
+            "cls": _type_path(type(value)),
+            "fields": {
+                f.name: _encode_value(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            },
         }
+    if isinstance(value, Enum):
+        return {_TYPE_TAG: "enum", "cls": _type_path(type(value)), "value": value.value}
+    if isinstance(value, datetime):
+        return {_TYPE_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_TAG: "date", "value": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {_TYPE_TAG: "decimal", "value": str(value)}
+    if isinstance(value, dict):
+        return {str(k): _encode_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(v) for v in value]
+    return value
+
+
+def _decode_value(data: Any) -> Any:
+    """Inverse of _encode_value."""
+    if isinstance(data, list):
+        return [_decode_value(v) for v in data]
+    if not isinstance(data, dict):
+        return data
+    tag = data.get(_TYPE_TAG)
+    if tag == "dataclass":
+        cls = _resolve_type(data["cls"])
+        return cls(**{k: _decode_value(v) for k, v in data["fields"].items()})
+    if tag == "enum":
+        return _resolve_type(data["cls"])(data["value"])
+    if tag == "datetime":
+        return datetime.fromisoformat(data["value"])
+    if tag == "date":
+        return date.fromisoformat(data["value"])
+    if tag == "decimal":
+        return Decimal(data["value"])
+    return {k: _decode_value(v) for k, v in data.items()}
+
+
+class RedisConnectorCache(ConnectorCache):
+    """ConnectorCache whose entries live in the shared cache backend (Redis).
+
+    Every API replica reads and writes the same entries, so a result fetched
+    by one replica is a hit on all of them. Keys expire in Redis after
+    ``ttl_seconds + stale_ttl_seconds``; per-tenant LRU bounds are left to
+    Redis TTLs and maxmemory policy. Single-flight coalescing is per process.
+    Values are stored through _encode_value so connector dataclasses come
+    back as dataclasses rather than their string form.
+
+    The synchronous ``get``/``set`` API stays in-process; use ``get_or_fetch``.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        namespace: str,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        stale_ttl_seconds: int = 0,
+    ) -> None:
+        super().__init__(ttl_seconds=ttl_seconds, stale_ttl_seconds=stale_ttl_seconds)
+        self._backend = backend
+        self._namespace = namespace
+
+    def _redis_key(self, tenant_id: uuid.UUID, cache_key: str) -> str:
+        return f"connector:{self._namespace}:{tenant_id}:{cache_key}"
+
+    async def _load(self, tenant_id: uuid.UUID, cache_key: str) -> CacheEntry | None:
+        try:
+            payload = await self._backend.get(self._redis_key(tenant_id, cache_key))
+        except Exception as exc:
+            log.warning("connector.cache_load_failed", error=str(exc))
+            return None
+        if not isinstance(payload, dict) or "expires_at" not in payload:
+            return None
+        try:
+            value = _decode_value(payload.get("value"))
+        except Exception as exc:
+            # Payload from an older layout or a type that no longer exists
+            log.warning("connector.cache_decode_failed", error=str(exc))
+            return None
+        entry = CacheEntry(value=value, expires_at=payload["expires_at"])
+        if time.time() > entry.expires_at + self.stale_ttl_seconds:
+            return None
+        return entry
+
+    async def _store(self, tenant_id: uuid.UUID, cache_key: str, value: Any) -> None:
+        await self._backend.set(
+            self._redis_key(tenant_id, cache_key),
+            {"value": _encode_value(value), "expires_at": time.time() + self.ttl_seconds},
+            self.ttl_seconds + self.stale_ttl_seconds,
+        )
+
+    async def clear_tenant(self, tenant_id: uuid.UUID) -> int:
+        """Delete a tenant's shared entries in this namespace. Returns keys deleted."""
+        self.invalidate_tenant(tenant_id)
+        return await self._backend.delete_pattern(f"connector:{self._namespace}:{tenant_id}:*")
+
+
+_shared_backend: CacheBackend | None = None
+_connector_caches: dict[str, ConnectorCache] = {}
+
+
+def init_connector_cache(settings: Any, backend: CacheBackend) -> CacheBackend | None:
+    """Share connector caches across replicas through ``backend``.
+
+    Enabled by CONNECTOR_CACHE_SHARED, which defaults to on when ``backend``
+    is Redis (an in-memory backend would share nothing). Caches created
+    before this call are dropped so tools pick up the new storage.
+    """
+    global _shared_backend
+    shared = getattr(
+        settings, "connector_cache_shared", isinstance(backend, RedisCacheBackend)
+    )
+    _shared_backend = backend if shared else None
+    _connector_caches.clear()
+    log.info("connector_cache.initialized", shared=_shared_backend is not None)
+    return _shared_backend
+
+
+def get_connector_cache(
+    name: str,
+    *,
+    ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    stale_ttl_seconds: int = 0,
+) -> ConnectorCache:
+    """Return the process-wide connector cache called ``name``.
+
+    Redis-backed after init_connector_cache() with a shared backend, in-memory
+    otherwise. The TTLs of the first call for a name are used.
+    """
+    cache = _connector_caches.get(name)
+    if cache is None:
+        if _shared_backend is not None:
+            cache = RedisConnectorCache(
+                _shared_backend,
+                namespace=name,
+                ttl_seconds=ttl_seconds,
+                stale_ttl_seconds=stale_ttl_seconds,
+            )
+        else:
+            cache = ConnectorCache(ttl_seconds=ttl_seconds, stale_ttl_seconds=stale_ttl_seconds)
+        _connector_caches[name] = cache
+    return cache
@@ -0,0 +1,362 @@
+"""Application-scoped connector instances with persistent HTTP pools.
+
+A connector used as ``async with SAPConnector(config)`` opens a new
+httpx client on entry and closes it on exit, so every tool call and write
+operation pays TCP/TLS setup to SAP or MES. ConnectorPool is created once
+in the application lifespan (init_connector_pool) and keeps one long-lived
+connector, with its own keep-alive HTTP pool, per connector class and
+configuration:
+
+- ``pool.get(SAPConnector, config)`` returns the shared connector for that
+  configuration; ``async with`` on it holds one of the pool's slots instead
+  of opening a client, so existing call sites keep their shape
+- Configurations are keyed by a fingerprint of endpoint, auth and timeout,
+  so a tenant-specific or rotated configuration gets its own client
+- Each entry bounds concurrent users (``max_in_use``); time spent waiting
+  for a slot is recorded
+- A maintenance task health-checks every entry and evicts unreachable or
+  long-idle ones; a client still in use or waited on is closed once its
+  last holder and waiter are gone
+- In-use, waiting, connection and wait-time stats are exported to
+  Prometheus and reported by /health/detailed
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+import structlog
+
+from src.connectors.base import BaseConnector, ConnectorConfig, ConnectorStatus
+from src.middleware.prometheus import (
+    record_connector_pool_acquire,
+    record_connector_pool_eviction,
+    update_connector_pool,
+)
+
+log = structlog.get_logger(__name__)
+
+
+def _fingerprint(connector_cls: type[BaseConnector], config: ConnectorConfig) -> str:
+    """Stable digest of everything that shapes a connector's HTTP client."""
+    material = json.dumps(
+        [
+            f"{connector_cls.__module__}.{connector_cls.__qualname__}",
+            config.name,
+            config.endpoint,
+            str(config.auth_type),
+            config.timeout_seconds,
+            config.auth_params,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _pool_connections(client: httpx.AsyncClient) -> tuple[int | None, int | None]:
+    """Return (active, idle) connection counts of an httpx client's pool.
+
+    httpx does not expose pool state publicly; read it from the httpcore
+    pool when available and report unknown otherwise.
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return None, None
+    try:
+        idle = sum(1 for conn in connections if conn.is_idle())
+    except Exception:
+        return None, None
+    return len(connections) - idle, idle
+
+
+class _PoolEntry:
+    """One shared connector and its client, plus slot accounting."""
+
+    def __init__(
+        self,
+        label: str,
+        connector: BaseConnector,
+        client: httpx.AsyncClient,
+        max_in_use: int,
+    ) -> None:
+        self.label = label
+        self.connector = connector
+        self.client = client
+        self.max_in_use = max_in_use
+        self._semaphore = asyncio.Semaphore(max_in_use) if max_in_use > 0 else None
+        self.in_use = 0
+        self.waiting = 0
+        self.acquisitions = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.retired = False
+        self.closed = False
+        connector._pool_slot = self
+
+    @property
+    def unused(self) -> bool:
+        """True when nobody holds or waits for a slot."""
+        return self.in_use == 0 and self.waiting == 0
+
+    async def acquire(self) -> None:
+        start = time.perf_counter()
+        if self._semaphore is not None:
+            self.waiting += 1
+            try:
+                await self._semaphore.acquire()
+            except BaseException:
+                self.waiting -= 1
+                # A cancelled waiter may be the last one on a retired entry
+                if self.retired and self.unused:
+                    await self.close()
+                raise
+            self.waiting -= 1
+        wait = time.perf_counter() - start
+        self.in_use += 1
+        self.acquisitions += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        record_connector_pool_acquire(self.label, wait, self.in_use)
+
+    async def release(self) -> None:
+        self.in_use -= 1
+        self.last_used = time.monotonic()
+        if self._semaphore is not None:
+            self._semaphore.release()
+        # Callers woken by the release above still count as waiting, so a
+        # retired client stays open until they are done with it too
+        if self.retired and self.unused:
+            await self.close()
+            return
+        active, idle = _pool_connections(self.client)
+        update_connector_pool(self.label, self.in_use, active, idle)
+
+    async def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        await self.client.aclose()
+        update_connector_pool(self.label, 0, 0, 0)
+
+    def stats(self) -> dict[str, Any]:
+        active, idle = _pool_connections(self.client)
+        now = time.monotonic()
+        return {
+            "connector": self.connector.config.name,
+            "status": self.connector.status,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "max_in_use": self.max_in_use or None,
+            "connections": {"active": active, "idle": idle},
+            "acquisitions": self.acquisitions,
+            "wait_ms": {
+                "avg": round(self.wait_seconds_total / self.acquisitions * 1000, 3)
+                if self.acquisitions
+                else 0.0,
+                "max": round(self.wait_seconds_max * 1000, 3),
+            },
+            "age_seconds": round(now - self.created_at, 1),
+            "idle_seconds": round(now - self.last_used, 1) if self.in_use == 0 else 0.0,
+        }
+
+
+class ConnectorPool:
+    """Long-lived connectors keyed by connector class and configuration."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_s: float = 30.0,
+        max_in_use: int = 0,
+        health_check_interval_s: float = 60.0,
+        health_check_timeout_s: float = 10.0,
+        idle_ttl_s: float = 900.0,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_connections: HTTP connections per connector client
+            max_keepalive_connections: Idle connections kept per client
+            keepalive_expiry_s: Seconds an idle connection is kept alive
+            max_in_use: Concurrent users per connector (0 = unlimited)
+            health_check_interval_s: Seconds between maintenance passes
+                (0 disables the background task)
+            health_check_timeout_s: Timeout for one connector health check
+            idle_ttl_s: Unused connectors are closed after this many seconds
+        """
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+        self._max_in_use = max_in_use
+        self._health_check_interval_s = health_check_interval_s
+        self._health_check_timeout_s = health_check_timeout_s
+        self._idle_ttl_s = idle_ttl_s
+        self._entries: dict[str, _PoolEntry] = {}
+        self._evictions: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> ConnectorPool:
+        """Build a pool from CONNECTOR_POOL_* settings (all optional)."""
+        return cls(
+            max_connections=getattr(settings, "connector_pool_max_connections", 100),
+            max_keepalive_connections=getattr(settings, "connector_pool_max_keepalive", 20),
+            keepalive_expiry_s=getattr(
+                settings, "connector_pool_keepalive_expiry_seconds", 30.0
+            ),
+            max_in_use=getattr(settings, "connector_pool_max_in_use", 0),
+            health_check_interval_s=getattr(
+                settings, "connector_pool_health_check_interval_seconds", 60.0
+            ),
+            idle_ttl_s=getattr(settings, "connector_pool_idle_ttl_seconds", 900.0),
+        )
+
+    # ------------------------------------------------------------------
+    # Connectors
+    # ------------------------------------------------------------------
+
+    def get(self, connector_cls: type[BaseConnector], config: ConnectorConfig) -> BaseConnector:
+        """Return the shared connector for ``config``, creating it on first use.
+
+        Use it as ``async with connector:`` for each call; entering holds a
+        pool slot and leaves the HTTP client open for the next caller.
+        """
+        key = _fingerprint(connector_cls, config)
+        entry = self._entries.get(key)
+        if entry is None:
+            config.validate()
+            client = BaseConnector.create_http_client(config, self._limits)
+            connector = connector_cls(config, http_client=client)
+            entry = _PoolEntry(f"{config.name}-{key[:8]}", connector, client, self._max_in_use)
+            self._entries[key] = entry
+            log.info("connector_pool.created", connector=entry.label)
+        return entry.connector
+
+    @asynccontextmanager
+    async def acquire(
+        self, connector_cls: type[BaseConnector], config: ConnectorConfig
+    ) -> AsyncIterator[BaseConnector]:
+        """Hold the shared connector for ``config`` for the duration of a call."""
+        connector = self.get(connector_cls, config)
+        async with connector:
+            yield connector
+
+    async def _evict(self, key: str, reason: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        entry.retired = True
+        self._evictions[reason] = self._evictions.get(reason, 0) + 1
+        record_connector_pool_eviction(entry.label, reason)
+        log.info(
+            "connector_pool.evicted",
+            connector=entry.label,
+            reason=reason,
+            in_use=entry.in_use,
+            waiting=entry.waiting,
+        )
+        if entry.unused:
+            await entry.close()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    async def check_health(self) -> None:
+        """Evict idle connectors and health-check the rest.
+
+        Connectors reporting UNAVAILABLE are evicted so the next call starts
+        over with a fresh client rather than reusing broken connections.
+        """
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if entry.unused and now - entry.last_used >= self._idle_ttl_s:
+                await self._evict(key, "idle")
+                continue
+            try:
+                status = await asyncio.wait_for(
+                    entry.connector.health_check(), timeout=self._health_check_timeout_s
+                )
+            except Exception as exc:
+                log.warning(
+                    "connector_pool.health_check_failed", connector=entry.label, error=str(exc)
+                )
+                status = ConnectorStatus.UNAVAILABLE
+            if status == ConnectorStatus.UNAVAILABLE:
+                await self._evict(key, "unhealthy")
+
+    async def _maintenance_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_check_interval_s)
+            try:
+                await self.check_health()
+            except Exception as exc:
+                log.error("connector_pool.maintenance_failed", error=str(exc))
+
+    def start(self) -> None:
+        """Start the background health-check task."""
+        if self._task is None and self._health_check_interval_s > 0:
+            self._task = asyncio.create_task(self._maintenance_loop())
+
+    async def aclose(self) -> None:
+        """Stop maintenance and close every client."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            await entry.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Per-connector utilisation, for /health/detailed."""
+        return {
+            "connectors": {entry.label: entry.stats() for entry in self._entries.values()},
+            "evictions": dict(self._evictions),
+            "max_connections": self._limits.max_connections,
+            "max_in_use": self._max_in_use or None,
+        }
+
+
+_pool: ConnectorPool | None = None
+
+
+def init_connector_pool(settings: Any) -> ConnectorPool:
+    """Create the app-scoped connector pool and start its health checks."""
+    global _pool
+    _pool = ConnectorPool.from_settings(settings)
+    _pool.start()
+    log.info("connector_pool.initialized", max_connections=_pool.stats()["max_connections"])
+    return _pool
+
+
+def get_connector_pool() -> ConnectorPool | None:
+    """Return the app-scoped pool, or None outside the application."""
+    return _pool
+
+
+async def close_connector_pool() -> None:
+    """Close every pooled client."""
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        log.info("connector_pool.closed")
+        _pool = None
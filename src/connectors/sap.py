@@ -12,16 +12,26 @@ All methods:
 - Include classification tagging
 - Log all access for audit
 
+Entity-set queries are paged: the connector follows server-driven paging
+links (``d.__next`` / $skiptoken in OData v2, ``@odata.nextLink`` in v4)
+and falls back to client-side $top/$skip pages when the service does not
+page itself. ``iter_pages()`` and ``stream()`` yield mapped records one
+page at a time with the next page prefetched, so callers can aggregate
+over entity sets of any size while holding at most two pages in memory.
+
 Reference deployment: SAP S/4HANA with OData v2 API.
 """
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from contextlib import aclosing
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
-from urllib.parse import unquote
+from typing import Any, TypeVar
+from urllib.parse import unquote, urlsplit
 
 import structlog
 
@@ -33,6 +43,17 @@ from src.connectors.base import (
 
 log = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+_DEFAULT_PAGE_SIZE = 500
+
+# A fetched page: raw rows, server next link, $top requested (None when following a link)
+_Page = tuple[list[dict[str, Any]], str | None, int | None]
+
+
+class SAPQueryError(Exception):
+    """An OData request failed or returned an unusable response."""
+
 
 @dataclass
 class PurchaseOrder:
@@ -119,6 +140,9 @@ class SAPConnector(BaseConnector):
         - auth_params: username/password or OAuth token
     """
 
+    #: Rows requested per page when paging client-side
+    page_size: int = _DEFAULT_PAGE_SIZE
+
     # Characters that are meaningful in OData $filter expressions and must
     # never appear verbatim in a value that is embedded via string interpolation.
     _ODATA_DANGEROUS_CHARS = frozenset("';()")
@@ -180,6 +204,223 @@ class SAPConnector(BaseConnector):
                 error=f"Unknown SAP operation: {operation}",
             )
 
+    # --------------------------------------------------------------------- #
+    # Paging
+    # --------------------------------------------------------------------- #
+
+    def _resolve_next_link(self, link: str) -> str:
+        """Validate a server next link; absolute links must stay on the endpoint's host."""
+        target = urlsplit(link)
+        if target.scheme or target.netloc:
+            endpoint = urlsplit(self.config.endpoint)
+            if (target.scheme, target.netloc) != (endpoint.scheme, endpoint.netloc):
+                raise SAPQueryError("SAP next link points outside the configured endpoint")
+        return link
+
+    async def _fetch_page(
+        self,
+        request: Awaitable[Any],
+        requested: int | None,
+    ) -> _Page:
+        response = await request
+        if response.status_code != 200:
+            raise SAPQueryError(f"SAP API error: {response.status_code}")
+        body = response.json()
+        envelope = body.get("d")
+        if isinstance(envelope, dict):
+            return envelope.get("results", []), envelope.get("__next"), requested
+        return body.get("value", []), body.get("@odata.nextLink"), requested
+
+    async def iter_pages(
+        self,
+        entity_set: str,
+        mapper: Callable[[dict[str, Any]], T],
+        *,
+        query_params: dict[str, Any] | None = None,
+        page_size: int | None = None,
+        max_records: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[list[T], None]:
+        """Yield mapped records of an entity set, one page per iteration.
+
+        Args:
+            entity_set: OData entity set (e.g. "MaterialStockSet")
+            mapper: Maps one raw OData row to a dataclass
+            query_params: $filter/$expand etc. ($top/$skip are managed here)
+            page_size: Rows per client-side page (default ``self.page_size``)
+            max_records: Stop after this many records (None = all)
+            prefetch: Fetch the next page while the caller processes this one
+
+        Raises:
+            SAPQueryError: A page request failed or a next link is off-host
+        """
+        client = self._get_http_client()
+        headers = self._prepare_auth_headers()
+        headers["Accept"] = "application/json"
+        size = page_size or self.page_size
+        base_params = dict(query_params or {})
+        fetched = 0
+        pages = 0
+
+        def client_page() -> Coroutine[Any, Any, _Page]:
+            top = size if max_records is None else min(size, max_records - fetched)
+            params = {**base_params, "$top": top}
+            if fetched:
+                params["$skip"] = fetched
+            request = client.get(f"/{entity_set}", headers=headers, params=params)
+            return self._fetch_page(request, top)
+
+        def server_page(link: str) -> Coroutine[Any, Any, _Page]:
+            request = client.get(self._resolve_next_link(link), headers=headers)
+            return self._fetch_page(request, None)
+
+        pending: Coroutine[Any, Any, _Page] | asyncio.Task[_Page] | None = client_page()
+        try:
+            while pending is not None:
+                rows, next_link, requested = await pending
+                pending = None
+                if max_records is not None:
+                    rows = rows[: max_records - fetched]
+                fetched += len(rows)
+                pages += 1
+
+                if max_records is None or fetched < max_records:
+                    if next_link:
+                        pending = server_page(next_link)
+                    elif requested is not None and rows and len(rows) == requested:
+                        pending = client_page()
+                if pending is not None and prefetch:
+                    pending = asyncio.create_task(pending)
+
+                log.debug("sap.page_fetched", entity_set=entity_set, page=pages, rows=len(rows))
+                if rows:
+                    yield [mapper(row) for row in rows]
+        finally:
+            if isinstance(pending, asyncio.Task):
+                pending.cancel()
+            elif pending is not None:
+                pending.close()  # never awaited
+
+    async def _collect(
+        self,
+        entity_set: str,
+        mapper: Callable[[dict[str, Any]], T],
+        query_params: dict[str, Any],
+        limit: Any,
+    ) -> tuple[list[T], int]:
+        """Gather up to ``limit`` records across pages; returns (records, pages)."""
+        records: list[T] = []
+        pages = 0
+        async for page in self.iter_pages(
+            entity_set,
+            mapper,
+            query_params=query_params,
+            page_size=int(limit),
+            max_records=int(limit),
+            prefetch=False,
+        ):
+            records.extend(page)
+            pages += 1
+        return records, pages
+
+    def _list_operation(
+        self,
+        operation: str,
+        params: dict[str, Any],
+    ) -> tuple[str, Callable[[dict[str, Any]], Any], dict[str, Any], str]:
+        """Return (entity set, mapper, query params, classification) for a list operation."""
+        if operation == "get_purchase_orders":
+            return (
+                "PurchaseOrderSet",
+                self._map_purchase_order,
+                self._purchase_order_query(params),
+                "class_iii",
+            )
+        if operation == "get_inventory":
+            return (
+                "MaterialStockSet",
+                self._map_inventory_item,
+                self._inventory_query(params),
+                "class_ii",
+            )
+        if operation == "get_cost_centers":
+            return (
+                "CostCenterSet",
+                self._map_cost_center,
+                self._cost_center_query(params),
+                "class_iii",
+            )
+        if operation == "get_material_master":
+            return (
+                "MaterialSet",
+                self._map_material_master,
+                self._material_query(params),
+                "class_ii",
+            )
+        raise ValueError(f"Unknown SAP operation: {operation}")
+
+    async def stream(
+        self,
+        operation: str,
+        tenant_id: uuid.UUID,
+        user_id: uuid.UUID,
+        params: dict[str, Any],
+        *,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[list[Any], None]:
+        """Stream every record of a list operation page by page.
+
+        Same operations, filters and audit trail as execute(), but without a
+        $top cap: pages are yielded as they arrive so the caller can
+        aggregate in constant memory. ``params["max_records"]`` optionally
+        bounds the total.
+
+        Raises:
+            ValueError: Unknown operation
+            SAPQueryError: A page request failed
+        """
+        entity_set, mapper, query_params, classification = self._list_operation(operation, params)
+        start_time = datetime.now(UTC)
+        count = 0
+        error: str | None = None
+        log.info(
+            "connector.stream_start",
+            connector=self.config.name,
+            operation=operation,
+            tenant_id=str(tenant_id),
+            user_id=str(user_id),
+        )
+        pages = self.iter_pages(
+            entity_set,
+            mapper,
+            query_params=query_params,
+            page_size=page_size,
+            max_records=params.get("max_records"),
+        )
+        try:
+            async with aclosing(pages):
+                async for page in pages:
+                    count += len(page)
+                    yield page
+        except Exception as exc:
+            error = str(exc)
+            log.error("sap.stream_failed", operation=operation, error=error)
+            raise
+        finally:
+            await self._audit_log(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                operation=operation,
+                params=params,
+                result=ConnectorResult(
+                    success=error is None,
+                    error=error,
+                    metadata={"count": count, "streamed": True},
+                    classification=classification,
+                ),
+                duration_ms=(datetime.now(UTC) - start_time).total_seconds() * 1000,
+            )
+
     async def health_check(self) -> ConnectorStatus:
         """Check SAP system availability via service metadata endpoint."""
         try:
@@ -222,54 +463,20 @@ class SAPConnector(BaseConnector):
             ConnectorResult with list[PurchaseOrder]
         """
         try:
-            client = self._get_http_client()
-            headers = self._prepare_auth_headers()
-            headers["Accept"] = "application/json"
-
-            # Build OData query - sanitize all user-supplied values (C6)
-            filters = []
-            if "vendor_id" in params:
-                filters.append(f"Vendor eq '{self._sanitize_odata_value(str(params['vendor_id']))}'")
-            if "status" in params:
-                filters.append(f"Status eq '{self._sanitize_odata_value(str(params['status']))}'")
-            if "from_date" in params:
-                filters.append(
-                    f"CreatedDate ge datetime'{self._sanitize_odata_value(str(params['from_date']))}'"
-                )
-
-            query_params = {
-                "$top": params.get("top", 50),
-                "$expand": "Items",
-            }
-            if filters:
-                query_params["$filter"] = " and ".join(filters)
-
-            # Example: /PurchaseOrderSet
-            response = await client.get(
-                "/PurchaseOrderSet",
-                headers=headers,
-                params=query_params,
+            # Example: /PurchaseOrderSet (follows server paging up to $top)
+            purchase_orders, pages = await self._collect(
+                "PurchaseOrderSet",
+                self._map_purchase_order,
+                self._purchase_order_query(params),
+                params.get("top", 50),
             )
 
-            if response.status_code != 200:
-                return ConnectorResult(
-                    success=False,
-                    error=f"SAP API error: {response.status_code} - {response.text}",
-                )
-
-            data = response.json()
-            results = data.get("d", {}).get("results", [])
-
-            # Map to normalized dataclass
-            purchase_orders = [
-                self._map_purchase_order(po_data) for po_data in results
-            ]
-
             return ConnectorResult(
                 success=True,
                 data=purchase_orders,
                 metadata={
                     "count": len(purchase_orders),
+                    "pages": pages,
                     "tenant_id": str(tenant_id),
                 },
                 classification="class_iii",  # Business sensitive
@@ -279,6 +486,23 @@ class SAPConnector(BaseConnector):
             log.error("sap.get_purchase_orders_failed", error=str(exc))
             return ConnectorResult(success=False, error=str(exc))
 
+    def _purchase_order_query(self, params: dict[str, Any]) -> dict[str, Any]:
+        # Build OData query - sanitize all user-supplied values (C6)
+        filters = []
+        if "vendor_id" in params:
+            filters.append(f"Vendor eq '{self._sanitize_odata_value(str(params['vendor_id']))}'")
+        if "status" in params:
+            filters.append(f"Status eq '{self._sanitize_odata_value(str(params['status']))}'")
+        if "from_date" in params:
+            filters.append(
+                f"CreatedDate ge datetime'{self._sanitize_odata_value(str(params['from_date']))}'"
+            )
+
+        query_params: dict[str, Any] = {"$expand": "Items"}
+        if filters:
+            query_params["$filter"] = " and ".join(filters)
+        return query_params
+
     async def _get_inventory(
         self,
         tenant_id: uuid.UUID,
@@ -289,53 +513,26 @@ class SAPConnector(BaseConnector):
         Params:
             - plant_id (optional): Filter by plant
             - material_id (optional): Filter by material
+            - storage_location (optional): Filter by storage location
             - top (optional): Max results (default 100)
 
         Returns:
             ConnectorResult with list[InventoryItem]
         """
         try:
-            client = self._get_http_client()
-            headers = self._prepare_auth_headers()
-            headers["Accept"] = "application/json"
-
-            # Sanitize user-supplied filter values (C6)
-            filters = []
-            if "plant_id" in params:
-                filters.append(f"Plant eq '{self._sanitize_odata_value(str(params['plant_id']))}'")
-            if "material_id" in params:
-                filters.append(
-                    f"Material eq '{self._sanitize_odata_value(str(params['material_id']))}'"
-                )
-
-            query_params = {"$top": params.get("top", 100)}
-            if filters:
-                query_params["$filter"] = " and ".join(filters)
-
-            response = await client.get(
-                "/MaterialStockSet",
-                headers=headers,
-                params=query_params,
+            inventory_items, pages = await self._collect(
+                "MaterialStockSet",
+                self._map_inventory_item,
+                self._inventory_query(params),
+                params.get("top", 100),
             )
 
-            if response.status_code != 200:
-                return ConnectorResult(
-                    success=False,
-                    error=f"SAP API error: {response.status_code}",
-                )
-
-            data = response.json()
-            results = data.get("d", {}).get("results", [])
-
-            inventory_items = [
-                self._map_inventory_item(item_data) for item_data in results
-            ]
-
             return ConnectorResult(
                 success=True,
                 data=inventory_items,
                 metadata={
                     "count": len(inventory_items),
+                    "pages": pages,
                     "tenant_id": str(tenant_id),
                 },
                 classification="class_ii",  # Internal use
@@ -345,6 +542,26 @@ class SAPConnector(BaseConnector):
             log.error("sap.get_inventory_failed", error=str(exc))
             return ConnectorResult(success=False, error=str(exc))
 
+    def _inventory_query(self, params: dict[str, Any]) -> dict[str, Any]:
+        # Sanitize user-supplied filter values (C6)
+        filters = []
+        if "plant_id" in params:
+            filters.append(f"Plant eq '{self._sanitize_odata_value(str(params['plant_id']))}'")
+        if "material_id" in params:
+            filters.append(
+                f"Material eq '{self._sanitize_odata_value(str(params['material_id']))}'"
+            )
+        if "storage_location" in params:
+            filters.append(
+                "StorageLocation eq "
+                f"'{self._sanitize_odata_value(str(params['storage_location']))}'"
+            )
+
+        query_params: dict[str, Any] = {}
+        if filters:
+            query_params["$filter"] = " and ".join(filters)
+        return query_params
+
     async def _get_cost_centers(
         self,
         tenant_id: uuid.UUID,
@@ -360,45 +577,19 @@ class SAPConnector(BaseConnector):
             ConnectorResult with list[CostCenter]
         """
         try:
-            client = self._get_http_client()
-            headers = self._prepare_auth_headers()
-            headers["Accept"] = "application/json"
-
-            # Sanitize user-supplied filter values (C6)
-            filters = []
-            if "department" in params:
-                filters.append(
-                    f"Department eq '{self._sanitize_odata_value(str(params['department']))}'"
-                )
-
-            query_params = {"$top": params.get("top", 50)}
-            if filters:
-                query_params["$filter"] = " and ".join(filters)
-
-            response = await client.get(
-                "/CostCenterSet",
-                headers=headers,
-                params=query_params,
+            cost_centers, pages = await self._collect(
+                "CostCenterSet",
+                self._map_cost_center,
+                self._cost_center_query(params),
+                params.get("top", 50),
             )
 
-            if response.status_code != 200:
-                return ConnectorResult(
-                    success=False,
-                    error=f"SAP API error: {response.status_code}",
-                )
-
-            data = response.json()
-            results = data.get("d", {}).get("results", [])
-
-            cost_centers = [
-                self._map_cost_center(cc_data) for cc_data in results
-            ]
-
             return ConnectorResult(
                 success=True,
                 data=cost_centers,
                 metadata={
                     "count": len(cost_centers),
+                    "pages": pages,
                     "tenant_id": str(tenant_id),
                 },
                 classification="class_iii",  # Business sensitive
@@ -408,6 +599,19 @@ class SAPConnector(BaseConnector):
             log.error("sap.get_cost_centers_failed", error=str(exc))
             return ConnectorResult(success=False, error=str(exc))
 
+    def _cost_center_query(self, params: dict[str, Any]) -> dict[str, Any]:
+        # Sanitize user-supplied filter values (C6)
+        filters = []
+        if "department" in params:
+            filters.append(
+                f"Department eq '{self._sanitize_odata_value(str(params['department']))}'"
+            )
+
+        query_params: dict[str, Any] = {}
+        if filters:
+            query_params["$filter"] = " and ".join(filters)
+        return query_params
+
     async def _get_material_master(
         self,
         tenant_id: uuid.UUID,
@@ -423,34 +627,35 @@ class SAPConnector(BaseConnector):
             ConnectorResult with MaterialMaster or list[MaterialMaster]
         """
         try:
+            if "material_id" not in params:
+                # List materials across pages
+                materials, pages = await self._collect(
+                    "MaterialSet",
+                    self._map_material_master,
+                    self._material_query(params),
+                    params.get("top", 100),
+                )
+                return ConnectorResult(
+                    success=True,
+                    data=materials,
+                    metadata={
+                        "count": len(materials),
+                        "pages": pages,
+                        "tenant_id": str(tenant_id),
+                    },
+                    classification="class_ii",
+                )
+
             client = self._get_http_client()
             headers = self._prepare_auth_headers()
             headers["Accept"] = "application/json"
 
-            if "material_id" in params:
-                # Single material lookup - sanitize key used in URL (C6)
-                safe_material_id = self._sanitize_odata_value(str(params["material_id"]))
-                response = await client.get(
-                    f"/MaterialSet('{safe_material_id}')",
-                    headers=headers,
-                )
-            else:
-                # List materials - sanitize user-supplied filter values (C6)
-                filters = []
-                if "material_group" in params:
-                    filters.append(
-                        f"MaterialGroup eq '{self._sanitize_odata_value(str(params['material_group']))}'"
-                    )
-
-                query_params = {"$top": params.get("top", 100)}
-                if filters:
-                    query_params["$filter"] = " and ".join(filters)
-
-                response = await client.get(
-                    "/MaterialSet",
-                    headers=headers,
-                    params=query_params,
-                )
+            # Single material lookup - sanitize key used in URL (C6)
+            safe_material_id = self._sanitize_odata_value(str(params["material_id"]))
+            response = await client.get(
+                f"/MaterialSet('{safe_material_id}')",
+                headers=headers,
+            )
 
             if response.status_code != 200:
                 return ConnectorResult(
@@ -459,36 +664,32 @@ class SAPConnector(BaseConnector):
                 )
 
             data = response.json()
-
-            if "material_id" in params:
-                # Single result
-                material = self._map_material_master(data.get("d", {}))
-                return ConnectorResult(
-                    success=True,
-                    data=material,
-                    metadata={"tenant_id": str(tenant_id)},
-                    classification="class_ii",
-                )
-            else:
-                # Multiple results
-                results = data.get("d", {}).get("results", [])
-                materials = [
-                    self._map_material_master(mat_data) for mat_data in results
-                ]
-                return ConnectorResult(
-                    success=True,
-                    data=materials,
-                    metadata={
-                        "count": len(materials),
-                        "tenant_id": str(tenant_id),
-                    },
-                    classification="class_ii",
-                )
+            material = self._map_material_master(data.get("d", {}))
+            return ConnectorResult(
+                success=True,
+                data=material,
+                metadata={"tenant_id": str(tenant_id)},
+                classification="class_ii",
+            )
 
         except Exception as exc:
             log.error("sap.get_material_master_failed", error=str(exc))
             return ConnectorResult(success=False, error=str(exc))
 
+    def _material_query(self, params: dict[str, Any]) -> dict[str, Any]:
+        # List materials - sanitize user-supplied filter values (C6)
+        filters = []
+        if "material_group" in params:
+            filters.append(
+                "MaterialGroup eq "
+                f"'{self._sanitize_odata_value(str(params['material_group']))}'"
+            )
+
+        query_params: dict[str, Any] = {}
+        if filters:
+            query_params["$filter"] = " and ".join(filters)
+        return query_params
+
     # --------------------------------------------------------------------- #
     # Mapping functions: SAP OData responses -> normalized dataclasses
     # --------------------------------------------------------------------- #
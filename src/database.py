@@ -105,6 +105,27 @@ def get_engine() -> AsyncEngine:
     return _engine
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the initialized session factory (raises if not initialized).
+
+    Use this when a single request needs several independent sessions, e.g.
+    to run queries concurrently on separate pooled connections (an
+    AsyncSession must never be shared between concurrent tasks).
+    """
+    if _session_factory is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _session_factory
+
+
+def get_optional_session_factory() -> async_sessionmaker[AsyncSession] | None:
+    """Return the session factory, or None if init_db() has not run.
+
+    For optional fan-out (e.g. concurrent context loading) that can fall back
+    to the request session when no factory is available.
+    """
+    return _session_factory
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that yields a database session.
 
@@ -14,7 +14,13 @@ All components are designed for multi-tenant, on-premise deployment.
 
 from __future__ import annotations
 
-from src.infra.background_worker import BackgroundWorkerPool, Task, TaskStatus, TaskType
+from src.infra.background_worker import (
+    BackgroundWorkerPool,
+    IngestionWorker,
+    Task,
+    TaskStatus,
+    TaskType,
+)
 from src.infra.health import (
     ComponentHealth,
     ComponentStatus,
@@ -46,6 +52,7 @@ from src.infra.telemetry import (
 __all__ = [
     # Background worker
     "BackgroundWorkerPool",
+    "IngestionWorker",
     "Task",
     "TaskStatus",
     "TaskType",
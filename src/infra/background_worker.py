@@ -17,19 +17,41 @@ Design:
 - Each worker is a long-running coroutine
 - Task state is stored in-memory (replace with Redis for multi-instance)
 - Provides submit_task(), get_task_status(), cancel_task() API
+
+IngestionWorker is the durable counterpart used for document uploads: the
+queue is the ingestion_jobs table itself, so jobs survive restarts and can
+be processed by any API instance.
+- Jobs are claimed with FOR UPDATE SKIP LOCKED, respecting a per-tenant
+  concurrency limit (TenantSettings.ingestion_concurrency)
+- Each slot runs two stages connected by a one-item hand-off: the parser
+  claims, parses and chunks the next job while the embedder embeds and
+  stores the current one
+- Claimed jobs carry a lease (locked_by / locked_at) refreshed by a
+  heartbeat; jobs whose lease expires are returned to the queue
+- Shutdown drains claimed jobs for at most drain_timeout_s; jobs still
+  running are then cancelled and their leases left to expire
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
+import socket
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.config import Settings
+    from src.ingestion.chunker import Chunk
+
 log = structlog.get_logger(__name__)
 
 
@@ -382,3 +404,308 @@ class BackgroundWorkerPool:
             )
 
             await session.commit()
+
+
+@dataclass
+class _ParsedJob:
+    """A claimed job whose chunks are ready for the embedding stage."""
+
+    job_id: uuid.UUID
+    chunks: list[Chunk]
+
+
+class IngestionWorker:
+    """
+    Durable, pipelined ingestion worker backed by the ingestion_jobs table.
+
+    Each of the ``concurrency`` slots runs a parse stage and an embed stage.
+    The parse stage claims the next job and parses/chunks it while the embed
+    stage is still embedding and storing the previous job; the hand-off
+    queue holds at most one parsed job per slot.
+
+    Example usage:
+        worker = IngestionWorker(session_factory=get_session_factory(), settings=settings)
+        await worker.start()
+        worker.wake()  # after committing a new job
+        await worker.shutdown()
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        settings: Settings,
+        concurrency: int = 2,
+        default_tenant_concurrency: int = 2,
+        poll_interval_s: float = 2.0,
+        lease_timeout_s: float = 600.0,
+        max_attempts: int = 3,
+        drain_timeout_s: float = 30.0,
+        llm_client: Any | None = None,
+        embedding_cache: Any | None = None,
+    ) -> None:
+        """
+        Initialize the worker.
+
+        Args:
+            session_factory: Creates one AsyncSession per stage/transaction
+            settings: Application settings (chunking, embedding model)
+            concurrency: Number of pipelined slots in this process
+            default_tenant_concurrency: Jobs a tenant may run in parallel
+                when TenantSettings.ingestion_concurrency is not set
+            poll_interval_s: Idle poll interval when the queue is empty
+            lease_timeout_s: A job whose lease is older than this is requeued
+            max_attempts: Claims per job before it is marked FAILED
+            drain_timeout_s: Longest shutdown(drain=True) waits for claimed jobs
+            llm_client: LLM client for embeddings (created from settings if None)
+            embedding_cache: Shared EmbeddingCache used to skip re-embedding
+                known chunk text (optional)
+        """
+        self._session_factory = session_factory
+        self._settings = settings
+        self._concurrency = max(1, concurrency)
+        self._default_tenant_concurrency = max(1, default_tenant_concurrency)
+        self._poll_interval_s = poll_interval_s
+        self._lease_timeout_s = lease_timeout_s
+        self._max_attempts = max_attempts
+        self._drain_timeout_s = drain_timeout_s
+        self._llm = llm_client
+        self._embedding_cache = embedding_cache
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._wake_event = asyncio.Event()
+        self._running = False
+        self._parsers: list[asyncio.Task[None]] = []
+        self._embedders: list[asyncio.Task[None]] = []
+        self._handoffs: list[asyncio.Queue[_ParsedJob]] = []
+        self._lease_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Start the parse/embed stages and the lease maintenance loop."""
+        if self._running:
+            log.warning("ingestion_worker.already_running")
+            return
+
+        if self._llm is None:
+            from src.agent.llm import LLMClient
+
+            self._llm = LLMClient(self._settings)
+
+        self._running = True
+        for slot in range(self._concurrency):
+            handoff: asyncio.Queue[_ParsedJob] = asyncio.Queue(maxsize=1)
+            self._handoffs.append(handoff)
+            self._parsers.append(asyncio.create_task(self._parse_loop(slot, handoff)))
+            self._embedders.append(asyncio.create_task(self._embed_loop(slot, handoff)))
+        self._lease_task = asyncio.create_task(self._lease_loop())
+
+        log.info(
+            "ingestion_worker.started",
+            worker_id=self.worker_id,
+            slots=self._concurrency,
+            default_tenant_concurrency=self._default_tenant_concurrency,
+        )
+
+    async def shutdown(self, *, drain: bool = True) -> None:
+        """
+        Stop claiming new jobs and shut down.
+
+        Args:
+            drain: If True, finish jobs already claimed by this worker, for
+                   up to drain_timeout_s. Jobs still running then (and all
+                   jobs if False) are cancelled; their leases expire and
+                   another worker picks them up.
+        """
+        if not self._running:
+            return
+
+        log.info("ingestion_worker.shutdown_initiated", drain=drain)
+        self._running = False
+        self._wake_event.set()
+
+        if drain:
+            try:
+                await asyncio.wait_for(self._drain(), timeout=self._drain_timeout_s)
+            except TimeoutError:
+                log.warning(
+                    "ingestion_worker.drain_timeout",
+                    worker_id=self.worker_id,
+                    timeout_s=self._drain_timeout_s,
+                )
+
+        tasks = [*self._parsers, *self._embedders]
+        if self._lease_task is not None:
+            tasks.append(self._lease_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._parsers.clear()
+        self._embedders.clear()
+        self._handoffs.clear()
+        self._lease_task = None
+        log.info("ingestion_worker.shutdown_complete", worker_id=self.worker_id)
+
+    async def _drain(self) -> None:
+        await asyncio.gather(*self._parsers, return_exceptions=True)
+        for handoff in self._handoffs:
+            await handoff.join()
+
+    def wake(self) -> None:
+        """Poll the queue now instead of waiting for the next poll interval."""
+        self._wake_event.set()
+
+    def _service(self, session: AsyncSession) -> Any:
+        from src.services.ingestion import IngestionService
+
+        return IngestionService(
+            db=session,
+            settings=self._settings,
+            llm_client=self._llm,
+            embedding_cache=self._embedding_cache,
+        )
+
+    async def _wait_for_work(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=self._poll_interval_s)
+        except TimeoutError:
+            pass
+        self._wake_event.clear()
+
+    async def _parse_loop(self, slot: int, handoff: asyncio.Queue[_ParsedJob]) -> None:
+        """Claim jobs and run parse + chunk, handing results to the embedder."""
+        while self._running:
+            try:
+                async with self._session_factory() as session:
+                    job_id = await self._service(session).claim_next_job(
+                        worker_id=self.worker_id,
+                        default_tenant_concurrency=self._default_tenant_concurrency,
+                    )
+                    await session.commit()
+            except Exception as exc:
+                log.error("ingestion_worker.claim_failed", slot=slot, error=str(exc))
+                await self._wait_for_work()
+                continue
+
+            if job_id is None:
+                await self._wait_for_work()
+                continue
+
+            # Another job may be claimable as well: let idle slots look too
+            self._wake_event.set()
+
+            try:
+                async with self._session_factory() as session:
+                    service = self._service(session)
+                    job, file_bytes = await service.load_claimed_job(job_id)
+                    chunks = await service.parse_and_chunk(job, file_bytes)
+                    await session.commit()
+            except Exception as exc:
+                await self._fail(job_id, exc)
+                continue
+
+            # Blocks while the embedder is still busy with the previous job
+            await handoff.put(_ParsedJob(job_id=job_id, chunks=chunks))
+
+    async def _embed_loop(self, slot: int, handoff: asyncio.Queue[_ParsedJob]) -> None:
+        """Embed and store parsed jobs, committing progress per batch."""
+        from src.models.ingestion import IngestionJob, IngestionStatus
+        from src.services.ingestion import IngestionCancelledError
+
+        while True:
+            parsed = await handoff.get()
+            try:
+                async with self._session_factory() as session:
+                    service = self._service(session)
+                    job = await session.get(IngestionJob, parsed.job_id)
+                    if job is None or job.status == IngestionStatus.FAILED:
+                        raise IngestionCancelledError(f"Job {parsed.job_id} was cancelled")
+
+                    job.status = IngestionStatus.EMBEDDING
+                    await session.commit()
+
+                    async def _commit_progress(current: IngestionJob) -> None:
+                        # Publish counters, extend the lease, honour cancellation
+                        current.locked_at = datetime.now(UTC)
+                        await session.commit()
+                        await session.refresh(current, ["status"])
+                        if current.status == IngestionStatus.FAILED:
+                            raise IngestionCancelledError(f"Job {current.id} was cancelled")
+
+                    await service.embed_and_store_chunks(
+                        job, parsed.chunks, on_batch_stored=_commit_progress
+                    )
+                    await service.complete_job(job)
+                    await self._audit(session, job, success=True)
+                    await session.commit()
+            except Exception as exc:
+                await self._fail(parsed.job_id, exc)
+            finally:
+                handoff.task_done()
+
+    async def _fail(self, job_id: uuid.UUID, exc: Exception) -> None:
+        """Requeue or fail a job after an error in either stage."""
+        from src.models.ingestion import IngestionStatus
+        from src.services.ingestion import IngestionCancelledError
+
+        cancelled = isinstance(exc, IngestionCancelledError)
+        if cancelled:
+            log.info("ingestion_worker.job_cancelled", job_id=str(job_id))
+        else:
+            log.error(
+                "ingestion_worker.job_failed",
+                job_id=str(job_id),
+                error=str(exc),
+                exc_info=True,
+            )
+        try:
+            async with self._session_factory() as session:
+                job = await self._service(session).fail_claimed_job(
+                    job_id, str(exc) or type(exc).__name__, max_attempts=self._max_attempts
+                )
+                if job is not None and job.status == IngestionStatus.FAILED and not cancelled:
+                    await self._audit(session, job, success=False)
+                await session.commit()
+        except Exception as release_exc:
+            # The lease will expire and the job will be picked up again
+            log.error(
+                "ingestion_worker.release_failed",
+                job_id=str(job_id),
+                error=str(release_exc),
+            )
+
+    async def _audit(self, session: AsyncSession, job: Any, *, success: bool) -> None:
+        from src.core.audit import AuditService
+        from src.models.audit import AuditStatus
+
+        await AuditService(session).log(
+            tenant_id=job.tenant_id,
+            action="document.ingestion.complete" if success else "document.ingestion.failed",
+            resource_type="ingestion_job",
+            resource_id=str(job.id),
+            status=AuditStatus.SUCCESS if success else AuditStatus.ERROR,
+            error_detail=None if success else job.error_message,
+            extra={"filename": job.filename, "chunk_count": job.chunk_count},
+        )
+
+    async def _lease_loop(self) -> None:
+        """Heartbeat this worker's leases and requeue jobs of dead workers."""
+        interval = max(1.0, self._lease_timeout_s / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with self._session_factory() as session:
+                    service = self._service(session)
+                    await service.heartbeat(worker_id=self.worker_id)
+                    released = await service.requeue_stale_jobs(
+                        lease_timeout_s=self._lease_timeout_s,
+                        max_attempts=self._max_attempts,
+                    )
+                    await session.commit()
+                if released:
+                    self._wake_event.set()
+            except Exception as exc:
+                log.error("ingestion_worker.lease_maintenance_failed", error=str(exc))
@@ -9,12 +9,15 @@ Implements Kubernetes-compatible endpoints for liveness and readiness probes.
 Endpoints:
 - /healthz: Liveness probe (is the process running?)
 - /readyz: Readiness probe (can the service handle requests?)
+- /health, /health/detailed: Component-level status
 
 Components checked:
 - database: PostgreSQL connection and query execution
 - redis: Redis connection (if configured)
 - llm_proxy: LiteLLM proxy availability
 - disk_space: Available disk space for temp files
+- model_circuits: Per-model circuit breaker state (open circuits degrade)
+- connector_pools: Pooled SAP/MES connectors (in-use, idle, slot wait time)
 
 Design:
 - Each component check has timeout and error handling
@@ -57,7 +60,10 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agent.model_router.circuit_breaker import BreakerState, get_circuit_breakers
 from src.config import Settings, get_settings
+from src.connectors.base import ConnectorStatus
+from src.connectors.pool import get_connector_pool
 from src.database import get_engine
 
 log = structlog.get_logger(__name__)
@@ -153,6 +159,8 @@ class HealthCheck:
             self._check_redis(),
             self._check_llm_proxy(),
             self._check_disk_space(),
+            self._check_model_circuits(),
+            self._check_connector_pools(),
             return_exceptions=True,
         )
 
@@ -161,12 +169,16 @@ class HealthCheck:
         redis_health = results[1] if not isinstance(results[1], Exception) else self._error_health(results[1])
         llm_health = results[2] if not isinstance(results[2], Exception) else self._error_health(results[2])
         disk_health = results[3] if not isinstance(results[3], Exception) else self._error_health(results[3])
+        circuits_health = results[4] if not isinstance(results[4], Exception) else self._error_health(results[4])
+        pools_health = results[5] if not isinstance(results[5], Exception) else self._error_health(results[5])
 
         components = {
             "database": db_health,
             "redis": redis_health,
             "llm_proxy": llm_health,
             "disk_space": disk_health,
+            "model_circuits": circuits_health,
+            "connector_pools": pools_health,
         }
 
         # Determine overall status
@@ -382,6 +394,45 @@ class HealthCheck:
                 error=str(exc),
             )
 
+    async def _check_model_circuits(self) -> ComponentHealth:
+        """Report per-model circuit breaker state.
+
+        Open circuits mean a model tier is being skipped by the fallback
+        chain; the service still answers from other tiers, so this degrades
+        rather than fails the overall status.
+        """
+        circuits = get_circuit_breakers().snapshot()
+        open_models = [
+            model for model, snapshot in circuits.items()
+            if snapshot["state"] == BreakerState.OPEN
+        ]
+        return ComponentHealth(
+            status=ComponentStatus.DEGRADED if open_models else ComponentStatus.HEALTHY,
+            details={"circuits": circuits, "open": open_models},
+        )
+
+    async def _check_connector_pools(self) -> ComponentHealth:
+        """Report pooled connector utilisation.
+
+        Connectors whose last health check was not healthy degrade the
+        status; unreachable ones are evicted by the pool itself.
+        """
+        pool = get_connector_pool()
+        if pool is None:
+            return ComponentHealth(
+                status=ComponentStatus.UNKNOWN,
+                details={"message": "Connector pool not initialized"},
+            )
+        stats = pool.stats()
+        degraded = [
+            label for label, entry in stats["connectors"].items()
+            if entry["status"] in (ConnectorStatus.DEGRADED, ConnectorStatus.UNAVAILABLE)
+        ]
+        return ComponentHealth(
+            status=ComponentStatus.DEGRADED if degraded else ComponentStatus.HEALTHY,
+            details={**stats, "degraded": degraded},
+        )
+
     def _error_health(self, exception: Exception) -> ComponentHealth:
         """Convert exception to unhealthy component health."""
         return ComponentHealth(
@@ -468,6 +519,7 @@ def HealthCheckRouter(settings: Settings | None = None) -> APIRouter:
             )
 
     @router.get("/health", status_code=200)
+    @router.get("/health/detailed", status_code=200)
     async def detailed_health() -> JSONResponse:
         """Detailed health check with component status.
 
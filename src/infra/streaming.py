@@ -235,8 +235,14 @@ class AgentOutputStream:
         await self._buffer.put(event)
         self._disconnected = True
 
-    async def emit_done(self) -> None:
-        """Emit stream completion event."""
+    async def emit_done(self, **metadata: Any) -> None:
+        """
+        Emit stream completion event.
+
+        Args:
+            **metadata: Extra metadata known only at the end of the stream
+                (e.g. conversation_id of a newly created conversation)
+        """
         if self._disconnected:
             return
 
@@ -247,6 +253,7 @@ class AgentOutputStream:
             metadata=self._make_metadata(
                 token_count=len(self._full_response),
                 citation_count=len(self._citations),
+                **metadata,
             ),
         )
         await self._buffer.put(event)
@@ -5,11 +5,15 @@ Chunks documents into overlapping token windows while respecting:
 - Sentence boundaries (soft preference)
 - Section boundaries (soft preference)
 - Context continuity via overlap
+
+Each sentence is tokenized once; chunk and overlap token counts are summed
+from the per-sentence counts. iter_chunks streams chunks as they are built.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -20,6 +24,9 @@ log = structlog.get_logger(__name__)
 
 _TOKENIZER_NAME = "cl100k_base"  # OpenAI tokenizer compatible with most models
 
+# Loaded lazily on first use and shared across calls (see _get_encoder)
+_encoder: tiktoken.Encoding | None = None
+
 
 @dataclass
 class Chunk:
@@ -54,120 +61,118 @@ def chunk_document(
     Returns:
         List of Chunk objects with content, index, and metadata
     """
-    if not text or not text.strip():
-        return []
+    return list(iter_chunks(text, chunk_size=chunk_size, overlap=overlap))
 
-    enc = tiktoken.get_encoding(_TOKENIZER_NAME)
 
-    # Split text into sentences
-    sentences = _split_into_sentences(text)
+def iter_chunks(
+    text: str,
+    chunk_size: int = 512,
+    overlap: int = 50,
+) -> Iterator[Chunk]:
+    """Streaming variant of chunk_document: yield each Chunk as it is built.
+
+    Produces exactly the chunks chunk_document returns, in order, so a
+    consumer can start on the first chunks of a very large document before
+    the rest has been tokenized. (The ingestion service takes the full list,
+    see IngestionService.parse_and_chunk.)
+
+    Every sentence is encoded once; its token count is carried with it into
+    the chunk total and the overlap window. A chunk's token_count is the sum
+    of its sentences' counts, i.e. the same figure the chunk_size check uses.
+    It can be a few tokens below a fresh encode of the joined content, since
+    a joining space is sometimes its own token (e.g. before a digit).
+    """
+    if not text or not text.strip():
+        return
 
-    if not sentences:
-        return []
+    enc = _get_encoder()
 
     # Build chunks respecting sentence boundaries
-    chunks: list[Chunk] = []
-    current_sentences: list[str] = []
+    current: list[tuple[str, int]] = []  # (sentence, token_count)
     current_token_count = 0
     chunk_index = 0
 
-    for sentence in sentences:
-        sentence_tokens = len(enc.encode(sentence))
+    for sentence in _split_into_sentences(text):
+        sentence_token_ids = enc.encode(sentence)
+        sentence_tokens = len(sentence_token_ids)
 
         # If single sentence exceeds chunk_size, split it by tokens
         if sentence_tokens > chunk_size:
             # First, flush any accumulated sentences
-            if current_sentences:
-                chunk_text = " ".join(current_sentences)
-                token_count = len(enc.encode(chunk_text))
-                chunks.append(
-                    Chunk(
-                        content=chunk_text,
-                        index=chunk_index,
-                        token_count=token_count,
-                        metadata={
-                            "sentence_count": len(current_sentences),
-                            "index": chunk_index,
-                            "token_count": token_count,
-                        },
-                    )
-                )
+            if current:
+                yield _sentence_chunk(current, current_token_count, chunk_index)
                 chunk_index += 1
-                current_sentences = []
+                current = []
                 current_token_count = 0
 
             # Hard-split the long sentence by tokens with overlap
-            sub_chunks = _hard_split_by_tokens(
-                text=sentence,
+            for sub_chunk in _hard_split_by_tokens(
+                tokens=sentence_token_ids,
                 enc=enc,
                 chunk_size=chunk_size,
                 overlap=overlap,
                 start_index=chunk_index,
-            )
-            chunks.extend(sub_chunks)
-            chunk_index += len(sub_chunks)
+            ):
+                yield sub_chunk
+                chunk_index += 1
             continue
 
         # Check if adding this sentence would exceed chunk size
-        if current_token_count + sentence_tokens > chunk_size and current_sentences:
+        if current_token_count + sentence_tokens > chunk_size and current:
             # Finalize current chunk
-            chunk_text = " ".join(current_sentences)
-            token_count = len(enc.encode(chunk_text))
-            chunks.append(
-                Chunk(
-                    content=chunk_text,
-                    index=chunk_index,
-                    token_count=token_count,
-                    metadata={
-                        "sentence_count": len(current_sentences),
-                        "index": chunk_index,
-                        "token_count": token_count,
-                    },
-                )
-            )
+            yield _sentence_chunk(current, current_token_count, chunk_index)
             chunk_index += 1
 
             # Start new chunk with overlap sentences from the end of the current chunk
-            overlap_sentences = _get_overlap_sentences(current_sentences, overlap, enc)
-            current_sentences = overlap_sentences
-            current_token_count = sum(len(enc.encode(s)) for s in current_sentences)
+            current = _get_overlap_sentences(current, overlap)
+            current_token_count = sum(tokens for _, tokens in current)
 
         # Add sentence to current chunk
-        current_sentences.append(sentence)
+        current.append((sentence, sentence_tokens))
         current_token_count += sentence_tokens
 
     # Add final chunk
-    if current_sentences:
-        chunk_text = " ".join(current_sentences)
-        token_count = len(enc.encode(chunk_text))
-        chunks.append(
-            Chunk(
-                content=chunk_text,
-                index=chunk_index,
-                token_count=token_count,
-                metadata={
-                    "sentence_count": len(current_sentences),
-                    "index": chunk_index,
-                    "token_count": token_count,
-                },
-            )
-        )
-
-    return chunks
+    if current:
+        yield _sentence_chunk(current, current_token_count, chunk_index)
+
+
+def _get_encoder() -> tiktoken.Encoding:
+    """Return the module-wide tokenizer, loading it on first use."""
+    global _encoder
+    if _encoder is None:
+        _encoder = tiktoken.get_encoding(_TOKENIZER_NAME)
+    return _encoder
+
+
+def _sentence_chunk(
+    sentences: list[tuple[str, int]],
+    token_count: int,
+    chunk_index: int,
+) -> Chunk:
+    """Build a Chunk from (sentence, token_count) pairs."""
+    return Chunk(
+        content=" ".join(sentence for sentence, _ in sentences),
+        index=chunk_index,
+        token_count=token_count,
+        metadata={
+            "sentence_count": len(sentences),
+            "index": chunk_index,
+            "token_count": token_count,
+        },
+    )
 
 
 def _hard_split_by_tokens(
-    text: str,
+    tokens: list[int],
     enc: tiktoken.Encoding,
     chunk_size: int,
     overlap: int,
     start_index: int,
 ) -> list[Chunk]:
-    """Hard split text by token count, ignoring sentence boundaries.
+    """Hard split already-encoded text by token count, ignoring sentence boundaries.
 
     Used when a single sentence exceeds the chunk_size.
     """
-    tokens = enc.encode(text)
     total_tokens = len(tokens)
     chunks: list[Chunk] = []
     chunk_index = start_index
@@ -257,30 +262,27 @@ def _split_into_sentences(text: str) -> list[str]:
 
 
 def _get_overlap_sentences(
-    sentences: list[str],
+    sentences: list[tuple[str, int]],
     target_overlap_tokens: int,
-    encoder: tiktoken.Encoding,
-) -> list[str]:
+) -> list[tuple[str, int]]:
     """Get sentences from the end of a chunk to use as overlap for the next chunk.
 
-    Goes backwards through sentences until we have approximately
-    target_overlap_tokens worth of content.
+    Goes backwards through (sentence, token_count) pairs until we have
+    approximately target_overlap_tokens worth of content.
     """
     if target_overlap_tokens <= 0:
         return []
 
-    overlap_sentences = []
+    overlap_sentences: list[tuple[str, int]] = []
     overlap_tokens = 0
 
     # Go backwards through sentences to fill overlap
-    for sentence in reversed(sentences):
-        sentence_tokens = len(encoder.encode(sentence))
-
+    for sentence, sentence_tokens in reversed(sentences):
         if overlap_tokens + sentence_tokens > target_overlap_tokens and overlap_sentences:
             # Already have enough overlap
             break
 
-        overlap_sentences.insert(0, sentence)
+        overlap_sentences.insert(0, (sentence, sentence_tokens))
         overlap_tokens += sentence_tokens
 
     return overlap_sentences
@@ -8,7 +8,9 @@ Application startup order:
 5. Include all routers
 
 Shutdown order:
-1. Close DB connection pool
+1. Drain background workers (ingestion queue, worker pool)
+2. Close shared HTTP pools (LLM transport, connector pool)
+3. Close DB connection pool
 """
 
 from __future__ import annotations
@@ -22,21 +24,33 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.agent.llm_transport import close_llm_transport, init_llm_transport
+from src.agent.model_router.budget import PersistentBudgetManager
+from src.agent.model_router.fast_path import init_fast_path
+from src.agent.model_router.hedging import close_hedging, init_hedging
+from src.agent.tools import init_connector_limiter
 from src.api.router import api_v1_router, public_router
 from src.auth.middleware import AuthMiddleware
+from src.cache.backend import get_cache_backend
+from src.cache.embedding_cache import EmbeddingCache
+from src.cache.routing_cache import init_routing_cache
+from src.cache.semantic_cache import init_semantic_cache
 from src.config import get_settings
+from src.connectors.cache import init_connector_cache
+from src.connectors.pool import close_connector_pool, init_connector_pool
 from src.core.rate_limit import init_rate_limiter
 from src.core.security import (
     RequestIdMiddleware,
     RequestSizeLimitMiddleware,
     SecurityHeadersMiddleware,
 )
-from src.database import close_db, init_db
-from src.infra.background_worker import BackgroundWorkerPool
+from src.database import close_db, get_session_factory, init_db
+from src.infra.background_worker import BackgroundWorkerPool, IngestionWorker
 from src.infra.health import HealthCheckRouter
 from src.infra.telemetry import TracingMiddleware, instrument_fastapi, setup_telemetry
 from src.middleware.metrics import MetricsMiddleware
 from src.middleware.prometheus import PrometheusMiddleware, get_metrics
+from src.services.analytics_rollup import AnalyticsRollupJob
 from src.telemetry.logging import configure_logging
 from src.websocket.chat import ws_router as websocket_router
 from src.websocket.manager import get_connection_manager
@@ -64,15 +78,58 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize infrastructure
     init_db(settings)
     init_rate_limiter(settings)
+    # Shared LLM HTTP pool + per-model concurrency limits, borrowed by every LLMClient
+    app.state.llm_transport = init_llm_transport(settings)
+    # Tenant token budgets in token_budgets, shared by every worker
+    app.state.budget_manager = PersistentBudgetManager(
+        get_session_factory(),
+        default_daily_limit=getattr(settings, "token_budget_daily", 1_000_000),
+        default_monthly_limit=getattr(settings, "token_budget_monthly", 20_000_000),
+    )
+    # Opt-in hedging of latency-critical routing calls (LLM_HEDGING_ENABLED);
+    # hedges only fire while the tenant's persistent budget covers them
+    init_hedging(settings, app.state.budget_manager)
+    # Rule-based routing fast path; the LLM is asked only when it is unsure
+    init_fast_path(settings)
+    # Long-lived SAP/MES connectors with keep-alive pools, shared by tools and write ops
+    app.state.connector_pool = init_connector_pool(settings)
+    # Per-connector slots for batched tool calls, shared by every request's ToolGateway
+    init_connector_limiter(settings)
 
     # Initialize telemetry and observability
     setup_telemetry(settings)
     instrument_fastapi(app)  # Instrument FastAPI with OpenTelemetry
 
     # Initialize background workers
-    worker_pool = BackgroundWorkerPool(pool_size=4)
+    worker_pool = BackgroundWorkerPool(max_workers=settings.background_worker_concurrency)
     await worker_pool.start()
 
+    # Durable ingestion queue (ingestion_jobs table); uploads return 202.
+    # Chunk embeddings are cached per model so repeated text is embedded once.
+    cache_backend = get_cache_backend(settings)
+    embedding_cache = EmbeddingCache(
+        cache_backend,
+        model=settings.litellm_embedding_model,
+        dtype=getattr(settings, "embedding_cache_dtype", "float32"),
+    )
+    app.state.embedding_cache = embedding_cache
+    # SAP/MES tool results shared across replicas when the backend is Redis
+    init_connector_cache(settings, cache_backend)
+    # Memoized intent/complexity decisions keyed on normalised message fingerprints
+    init_routing_cache(settings, cache_backend)
+    # Opt-in paraphrase-tolerant response cache (SEMANTIC_CACHE_ENABLED)
+    init_semantic_cache(settings)
+    ingestion_worker = IngestionWorker(
+        session_factory=get_session_factory(),
+        settings=settings,
+        concurrency=getattr(settings, "ingestion_worker_concurrency", 2),
+        default_tenant_concurrency=getattr(settings, "ingestion_tenant_concurrency", 2),
+        lease_timeout_s=getattr(settings, "ingestion_lease_timeout_seconds", 600),
+        drain_timeout_s=getattr(settings, "ingestion_drain_timeout_seconds", 30),
+        embedding_cache=embedding_cache,
+    )
+    await ingestion_worker.start()
+
     # Initialize metrics collector with DB session
     from src.database import get_db_session
     from src.services.metrics import MetricsCollector
@@ -85,8 +142,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Store collector in app state so shutdown can reference the same instance
     app.state.metrics_collector = collector
 
+    # Hourly/daily usage rollups behind the analytics API
+    rollup_job = AnalyticsRollupJob.from_settings(get_session_factory(), settings)
+    await rollup_job.start()
+    app.state.analytics_rollup_job = rollup_job
+
     # Store worker pool in app state for access in endpoints
     app.state.worker_pool = worker_pool
+    app.state.ingestion_worker = ingestion_worker
 
     # Initialize WebSocket ConnectionManager
     ws_manager = get_connection_manager()
@@ -103,8 +166,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown: cleanup background workers, telemetry, and metrics collector
     # Use the same collector instance stored during startup (not a new singleton)
     await app.state.metrics_collector.shutdown()
+    await rollup_job.shutdown()
 
-    await worker_pool.stop()
+    await ingestion_worker.shutdown()
+    await worker_pool.shutdown()
+    await close_llm_transport()
+    await close_connector_pool()
+    await close_hedging()
     await close_db()
     log.info("app.shutdown")
 
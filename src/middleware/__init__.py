@@ -12,9 +12,22 @@ from src.middleware.prometheus import (
     PrometheusMiddleware,
     get_metrics,
     record_agent_run,
+    record_analytics_rollup,
+    record_circuit_state,
+    record_connector_cache,
+    record_connector_pool_acquire,
+    record_connector_pool_eviction,
     record_http_request,
+    record_llm_hedge,
     record_llm_request,
+    record_llm_slot,
+    record_llm_stream,
+    record_routing_fast_path,
+    record_search_leg,
+    record_semantic_cache,
     record_tool_call,
+    update_connector_pool,
+    update_llm_pool,
     update_token_budget,
 )
 
@@ -23,8 +36,21 @@ __all__ = [
     "PrometheusMiddleware",
     "get_metrics",
     "record_agent_run",
+    "record_analytics_rollup",
+    "record_circuit_state",
+    "record_connector_cache",
+    "record_connector_pool_acquire",
+    "record_connector_pool_eviction",
     "record_http_request",
+    "record_llm_hedge",
     "record_llm_request",
+    "record_llm_slot",
+    "record_llm_stream",
+    "record_routing_fast_path",
+    "record_search_leg",
+    "record_semantic_cache",
     "record_tool_call",
+    "update_connector_pool",
+    "update_llm_pool",
     "update_token_budget",
 ]
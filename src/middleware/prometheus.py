@@ -8,9 +8,30 @@ Metrics exported:
 - http_request_duration_seconds: Histogram of HTTP request latencies
 - llm_requests_total: Counter of LLM requests by model, status
 - llm_request_duration_seconds: Histogram of LLM request latencies
+- llm_time_to_first_token_seconds: Histogram of streaming time-to-first-token
+- llm_inter_token_latency_seconds: Histogram of gaps between streamed tokens
+- llm_in_flight_requests: Gauge of LLM calls holding a per-model slot
+- llm_slot_wait_seconds: Histogram of time spent waiting for a per-model slot
+- llm_pool_connections: Gauge of shared LLM HTTP pool connections by state
+- model_circuit_state: Gauge of per-model circuit breaker state
+  (0 closed, 1 half-open, 2 open)
+- model_circuit_transitions_total: Counter of breaker state transitions
+- llm_hedge_decisions_total: Counter of hedging decisions (hedge rate)
+- llm_hedge_wins_total: Counter of hedged calls won by primary or hedge (win rate)
+- routing_fast_path_total: Counter of routing classifications by stage and outcome
+- routing_fast_path_saved_seconds_total: Counter of LLM latency saved by the fast path
+- semantic_cache_lookups_total: Counter of semantic cache lookups by result
+- semantic_cache_similarity: Histogram of best-match similarity per lookup
+- connector_pool_in_use: Gauge of pooled connectors held by callers
+- connector_pool_connections: Gauge of pooled connector HTTP connections by state
+- connector_pool_wait_seconds: Histogram of time spent waiting for a connector slot
+- connector_pool_evictions_total: Counter of pooled connectors evicted by reason
+- connector_cache_requests_total: Counter of connector cache lookups by result
+  (hit, stale, miss, coalesced)
 - active_connections: Gauge of current HTTP connections
 - active_agent_runs: Gauge of concurrent agent executions
 - token_budget_remaining: Gauge of remaining token budget per tenant
+- rag_search_leg_duration_seconds: Histogram of hybrid search leg latencies
 
 Design:
 - Uses prometheus_client library for metrics collection
@@ -96,6 +117,101 @@ llm_tokens_total = Counter(
     registry=REGISTRY,
 )
 
+llm_time_to_first_token_seconds = Histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from streaming request to first content token in seconds",
+    ["model"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0],
+    registry=REGISTRY,
+)
+
+llm_inter_token_latency_seconds = Histogram(
+    "llm_inter_token_latency_seconds",
+    "Gap between consecutive streamed content chunks in seconds",
+    ["model"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+    registry=REGISTRY,
+)
+
+llm_in_flight_requests = Gauge(
+    "llm_in_flight_requests",
+    "LLM calls currently holding a per-model concurrency slot",
+    ["model"],
+    registry=REGISTRY,
+)
+
+llm_slot_wait_seconds = Histogram(
+    "llm_slot_wait_seconds",
+    "Time spent waiting for a per-model LLM concurrency slot in seconds",
+    ["model"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+    registry=REGISTRY,
+)
+
+llm_pool_connections = Gauge(
+    "llm_pool_connections",
+    "Connections in the shared LLM HTTP pool",
+    ["state"],
+    registry=REGISTRY,
+)
+
+model_circuit_state = Gauge(
+    "model_circuit_state",
+    "Circuit breaker state per model (0 closed, 1 half-open, 2 open)",
+    ["model"],
+    registry=REGISTRY,
+)
+
+model_circuit_transitions_total = Counter(
+    "model_circuit_transitions_total",
+    "Circuit breaker state transitions",
+    ["model", "state"],
+    registry=REGISTRY,
+)
+
+llm_hedge_decisions_total = Counter(
+    "llm_hedge_decisions_total",
+    "Hedging decisions for latency-critical LLM calls",
+    ["model", "decision"],  # not_needed, hedged, budget_denied
+    registry=REGISTRY,
+)
+
+llm_hedge_wins_total = Counter(
+    "llm_hedge_wins_total",
+    "Hedged LLM calls by which request answered first",
+    ["model", "winner"],  # primary, hedge
+    registry=REGISTRY,
+)
+
+routing_fast_path_total = Counter(
+    "routing_fast_path_total",
+    "Routing classifications answered locally (hit) or by the LLM (fallback)",
+    ["stage", "outcome"],  # stage: intent, complexity
+    registry=REGISTRY,
+)
+
+routing_fast_path_saved_seconds_total = Counter(
+    "routing_fast_path_saved_seconds_total",
+    "Estimated LLM latency saved by fast-path routing classifications",
+    ["stage"],
+    registry=REGISTRY,
+)
+
+semantic_cache_lookups_total = Counter(
+    "semantic_cache_lookups_total",
+    "Semantic response cache lookups",
+    ["result"],  # hit, miss, stale
+    registry=REGISTRY,
+)
+
+semantic_cache_similarity = Histogram(
+    "semantic_cache_similarity",
+    "Cosine similarity of the closest cached query, by lookup result",
+    ["result"],
+    buckets=(0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.92, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0),
+    registry=REGISTRY,
+)
+
 
 # ------------------------------------------------------------------ #
 # Agent Metrics
@@ -162,6 +278,80 @@ tool_duration_seconds = Histogram(
 )
 
 
+# ------------------------------------------------------------------ #
+# Connector Metrics
+# ------------------------------------------------------------------ #
+
+connector_pool_in_use = Gauge(
+    "connector_pool_in_use",
+    "Callers currently holding a pooled connector",
+    ["connector"],
+    registry=REGISTRY,
+)
+
+connector_pool_connections = Gauge(
+    "connector_pool_connections",
+    "HTTP connections of a pooled connector client",
+    ["connector", "state"],
+    registry=REGISTRY,
+)
+
+connector_pool_wait_seconds = Histogram(
+    "connector_pool_wait_seconds",
+    "Time spent waiting for a pooled connector slot in seconds",
+    ["connector"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+    registry=REGISTRY,
+)
+
+connector_pool_evictions_total = Counter(
+    "connector_pool_evictions_total",
+    "Pooled connectors evicted",
+    ["connector", "reason"],  # idle, unhealthy
+    registry=REGISTRY,
+)
+
+connector_cache_requests_total = Counter(
+    "connector_cache_requests_total",
+    "Connector cache lookups",
+    ["connector", "result"],  # hit, stale, miss, coalesced
+    registry=REGISTRY,
+)
+
+
+# ------------------------------------------------------------------ #
+# RAG Metrics
+# ------------------------------------------------------------------ #
+
+rag_search_leg_duration_seconds = Histogram(
+    "rag_search_leg_duration_seconds",
+    "Hybrid search leg latency in seconds",
+    ["leg"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+    registry=REGISTRY,
+)
+
+
+# ------------------------------------------------------------------ #
+# Analytics Metrics
+# ------------------------------------------------------------------ #
+
+analytics_rollup_duration_seconds = Histogram(
+    "analytics_rollup_duration_seconds",
+    "Time to materialize one chunk of usage rollups in seconds",
+    ["granularity"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+    registry=REGISTRY,
+)
+
+analytics_rollup_lag_seconds = Gauge(
+    "analytics_rollup_lag_seconds",
+    "Age of the usage rollup watermark in seconds",
+    ["granularity"],
+    registry=REGISTRY,
+)
+
+
 # ------------------------------------------------------------------ #
 # Instrumentation Functions
 # ------------------------------------------------------------------ #
@@ -229,6 +419,108 @@ def record_llm_request(
     ).inc(completion_tokens)
 
 
+def record_llm_stream(
+    model: str,
+    ttft_seconds: float | None,
+    inter_token_seconds: list[float],
+) -> None:
+    """Record streaming latency metrics for one completion.
+
+    Args:
+        model: LLM model identifier
+        ttft_seconds: Time to first content token (None if none arrived)
+        inter_token_seconds: Gaps between consecutive content chunks
+    """
+    if ttft_seconds is not None:
+        llm_time_to_first_token_seconds.labels(model=model).observe(ttft_seconds)
+    histogram = llm_inter_token_latency_seconds.labels(model=model)
+    for gap in inter_token_seconds:
+        histogram.observe(gap)
+
+
+def record_llm_slot(model: str, wait_seconds: float, in_flight: int) -> None:
+    """Record acquisition of a per-model LLM concurrency slot.
+
+    Args:
+        model: LLM model identifier
+        wait_seconds: Time spent waiting for the slot
+        in_flight: Calls holding a slot for this model after acquisition
+    """
+    llm_slot_wait_seconds.labels(model=model).observe(wait_seconds)
+    llm_in_flight_requests.labels(model=model).set(in_flight)
+
+
+def update_llm_pool(model: str, in_flight: int, active: int | None, idle: int | None) -> None:
+    """Update LLM transport utilisation gauges after a call completes.
+
+    Args:
+        model: LLM model identifier
+        in_flight: Calls still holding a slot for this model
+        active: Pool connections serving a request (None if unknown)
+        idle: Pool connections kept alive for reuse (None if unknown)
+    """
+    llm_in_flight_requests.labels(model=model).set(in_flight)
+    if active is not None:
+        llm_pool_connections.labels(state="active").set(active)
+    if idle is not None:
+        llm_pool_connections.labels(state="idle").set(idle)
+
+
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def record_circuit_state(model: str, state: str, *, transition: bool = True) -> None:
+    """Record the state of a circuit breaker.
+
+    Args:
+        model: LLM model identifier the breaker guards
+        state: Current state (closed, half_open, open)
+        transition: Count a state transition (False for the initial state)
+    """
+    model_circuit_state.labels(model=model).set(_CIRCUIT_STATE_VALUES[state])
+    if transition:
+        model_circuit_transitions_total.labels(model=model, state=state).inc()
+
+
+def record_llm_hedge(model: str, decision: str, *, winner: str | None = None) -> None:
+    """Record a hedging decision or the winner of a hedged call.
+
+    Args:
+        model: Primary LLM model identifier
+        decision: not_needed, hedged, budget_denied, or won (with winner)
+        winner: Which request answered first (primary, hedge)
+    """
+    if winner is not None:
+        llm_hedge_wins_total.labels(model=model, winner=winner).inc()
+        return
+    llm_hedge_decisions_total.labels(model=model, decision=decision).inc()
+
+
+def record_routing_fast_path(stage: str, outcome: str, *, saved_seconds: float = 0.0) -> None:
+    """Record a routing classification answered by the fast path or the LLM.
+
+    Args:
+        stage: Classification stage (intent, complexity)
+        outcome: hit (answered locally) or fallback (LLM call made)
+        saved_seconds: Estimated LLM latency avoided by a hit
+    """
+    routing_fast_path_total.labels(stage=stage, outcome=outcome).inc()
+    if saved_seconds > 0:
+        routing_fast_path_saved_seconds_total.labels(stage=stage).inc(saved_seconds)
+
+
+def record_semantic_cache(result: str, similarity: float | None) -> None:
+    """Record a semantic cache lookup.
+
+    Args:
+        result: hit, miss, or stale (matched but cited documents changed)
+        similarity: Best-match cosine similarity (None if nothing to compare)
+    """
+    semantic_cache_lookups_total.labels(result=result).inc()
+    if similarity is not None:
+        semantic_cache_similarity.labels(result=result).observe(similarity)
+
+
 def record_agent_run(
     agent_type: str,
     status: str,
@@ -275,6 +567,81 @@ def record_tool_call(
     ).observe(duration_seconds)
 
 
+def record_connector_pool_acquire(connector: str, wait_seconds: float, in_use: int) -> None:
+    """Record acquisition of a pooled connector slot.
+
+    Args:
+        connector: Pool entry label (connector name and config fingerprint)
+        wait_seconds: Time spent waiting for the slot
+        in_use: Callers holding the connector after acquisition
+    """
+    connector_pool_wait_seconds.labels(connector=connector).observe(wait_seconds)
+    connector_pool_in_use.labels(connector=connector).set(in_use)
+
+
+def update_connector_pool(
+    connector: str, in_use: int, active: int | None, idle: int | None
+) -> None:
+    """Update pooled connector utilisation gauges after a call completes.
+
+    Args:
+        connector: Pool entry label
+        in_use: Callers still holding the connector
+        active: Client connections serving a request (None if unknown)
+        idle: Client connections kept alive for reuse (None if unknown)
+    """
+    connector_pool_in_use.labels(connector=connector).set(in_use)
+    if active is not None:
+        connector_pool_connections.labels(connector=connector, state="active").set(active)
+    if idle is not None:
+        connector_pool_connections.labels(connector=connector, state="idle").set(idle)
+
+
+def record_connector_pool_eviction(connector: str, reason: str) -> None:
+    """Record a pooled connector being evicted.
+
+    Args:
+        connector: Pool entry label
+        reason: idle or unhealthy
+    """
+    connector_pool_evictions_total.labels(connector=connector, reason=reason).inc()
+
+
+def record_connector_cache(connector: str, result: str) -> None:
+    """Record a connector cache lookup.
+
+    Args:
+        connector: Connector name (sap, mes)
+        result: hit, stale (served while refreshing), miss (fetched), or
+            coalesced (joined another caller's in-flight fetch)
+    """
+    connector_cache_requests_total.labels(connector=connector, result=result).inc()
+
+
+def record_analytics_rollup(
+    granularity: str, duration_seconds: float, lag_seconds: float
+) -> None:
+    """Record one usage rollup chunk.
+
+    Args:
+        granularity: Rollup granularity (hour, day)
+        duration_seconds: Time to materialize the chunk
+        lag_seconds: Age of the watermark after the chunk
+    """
+    analytics_rollup_duration_seconds.labels(granularity=granularity).observe(duration_seconds)
+    analytics_rollup_lag_seconds.labels(granularity=granularity).set(lag_seconds)
+
+
+def record_search_leg(leg: str, duration_seconds: float) -> None:
+    """Record the latency of one hybrid search leg.
+
+    Args:
+        leg: Leg identifier (semantic, lexical, fusion)
+        duration_seconds: Leg duration in seconds
+    """
+    rag_search_leg_duration_seconds.labels(leg=leg).observe(duration_seconds)
+
+
 def update_token_budget(
     tenant_id: str,
     period: str,
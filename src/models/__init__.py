@@ -5,7 +5,14 @@ when Alembic runs autogenerate. The order of imports matters for foreign
 key resolution.
 """
 
-from src.models.analytics import DailySummary, MetricType, UsageMetric
+from src.models.analytics import (
+    DailySummary,
+    MetricType,
+    RollupGranularity,
+    RollupWatermark,
+    UsageMetric,
+    UsageRollup,
+)
 from src.models.api_key import APIKey
 from src.models.audit import AuditLog
 from src.models.conversation import Conversation, Message
@@ -65,6 +72,9 @@ __all__ = [
     "UsageMetric",
     "DailySummary",
     "MetricType",
+    "RollupGranularity",
+    "RollupWatermark",
+    "UsageRollup",
     "PluginRegistration",
     "IngestionJob",
     "FileType",
@@ -3,6 +3,9 @@
 Design principles:
 - UsageMetric: Raw metric events (API calls, token usage, agent runs, etc.)
 - DailySummary: Pre-aggregated daily rollups for fast dashboard queries
+- UsageRollup: Hourly and daily aggregates per tenant, model, agent and user,
+  maintained incrementally by AnalyticsRollupJob
+- RollupWatermark: How far each rollup granularity has been materialized
 - All queries scoped by tenant_id for multi-tenancy
 - Proper indexes for time-range queries
 - JSONB dimensions for flexible metric attributes
@@ -16,6 +19,7 @@ from enum import StrEnum
 from typing import Any
 
 from sqlalchemy import (
+    BigInteger,
     Date,
     DateTime,
     Enum,
@@ -23,6 +27,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    String,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -40,6 +45,13 @@ class MetricType(StrEnum):
     DOCUMENT_QUERY = "document_query"
 
 
+class RollupGranularity(StrEnum):
+    """Bucket sizes of the usage rollups."""
+
+    HOUR = "hour"
+    DAY = "day"
+
+
 class UsageMetric(Base):
     """Raw usage metric event.
 
@@ -156,3 +168,96 @@ class DailySummary(Base):
 
     def __repr__(self) -> str:
         return f"<DailySummary tenant={self.tenant_id} date={self.date}>"
+
+
+class UsageRollup(Base):
+    """Aggregated usage metrics for one time bucket.
+
+    One row per (tenant, granularity, bucket, metric type, model, agent,
+    user). Dimensions that do not apply to a metric type are stored as an
+    empty string so the grain stays unique. Measures are plain sums, so any
+    set of buckets can be re-aggregated with SUM; averages are derived from
+    a sum and its count at query time.
+    """
+
+    __tablename__ = "usage_rollups"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    granularity: Mapped[str] = mapped_column(String(8), nullable=False)
+    # Start of the UTC hour or day the row aggregates
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    metric_type: Mapped[MetricType] = mapped_column(
+        Enum(MetricType, name="metric_type"),
+        nullable=False,
+    )
+    model: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    agent_id: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    user_id: Mapped[str] = mapped_column(String(64), nullable=False, default="")
+
+    # Measures
+    event_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    value_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    prompt_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    completion_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cost: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    error_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    success_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    response_time_ms_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    response_time_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    duration_ms_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    steps_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    __table_args__ = (
+        # Upsert target: one row per grain
+        Index(
+            "ix_usage_rollups_grain",
+            "tenant_id",
+            "granularity",
+            "bucket_start",
+            "metric_type",
+            "model",
+            "agent_id",
+            "user_id",
+            unique=True,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<UsageRollup tenant={self.tenant_id} {self.granularity}={self.bucket_start} "
+            f"type={self.metric_type}>"
+        )
+
+
+class RollupWatermark(Base):
+    """Exclusive upper bound of materialized rollups for a granularity.
+
+    Every bucket starting before ``rolled_up_to`` is complete in
+    usage_rollups; analytics queries read raw usage_metrics only from the
+    hourly watermark onwards.
+    """
+
+    __tablename__ = "usage_rollup_watermarks"
+
+    granularity: Mapped[str] = mapped_column(String(8), primary_key=True)
+    rolled_up_to: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    def __repr__(self) -> str:
+        return f"<RollupWatermark {self.granularity}={self.rolled_up_to}>"
@@ -6,6 +6,11 @@ chunks are stored with their pgvector embedding for similarity search.
 The embedding column uses pgvector's Vector type. The dimension (1536) must
 match the embedding model output dimension. If switching models, a migration
 is required.
+
+Lexical search reads the stored content_tsv column (GIN-indexed) instead of
+re-tokenizing content on every query. content_tsv is maintained by a
+BEFORE INSERT/UPDATE trigger, so application code never writes it; see
+alembic revision 019 for the migration and batched backfill.
 """
 
 from __future__ import annotations
@@ -17,16 +22,20 @@ from typing import Any
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    DDL,
     BigInteger,
     DateTime,
     Enum,
+    FetchedValue,
     ForeignKey,
     Index,
     Integer,
     String,
     Text,
+    event,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import Base
@@ -144,6 +153,38 @@ class DocumentChunk(Base):
         comment="Dense vector embedding of the chunk content",
     )
 
+    # Dedup key for ingestion: identical content embedded with the same model
+    # reuses the stored vector instead of calling the embedding API again.
+    content_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 hex digest of content",
+    )
+    embedding_model: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="Embedding model that produced the embedding",
+    )
+
+    # Job that wrote the chunk, so a failed or requeued job's partial chunks
+    # can be deleted through ix_chunks_ingestion_job_id.
+    ingestion_job_id: Mapped[uuid.UUID | None] = mapped_column(
+        nullable=True,
+        comment="IngestionJob that wrote this chunk",
+    )
+
+    # Pre-computed full-text vector of content, maintained by the
+    # document_chunks_content_tsv_update trigger. Deferred so ordinary chunk
+    # loads don't pull it over the wire.
+    content_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        nullable=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        deferred=True,
+        comment="to_tsvector('english', content); trigger-maintained",
+    )
+
     # Source metadata for citation generation
     chunk_metadata: Mapped[dict[str, Any]] = mapped_column(
         JSONB,
@@ -165,9 +206,50 @@ class DocumentChunk(Base):
     __table_args__ = (
         Index("ix_chunks_tenant_document", "tenant_id", "document_id"),
         Index("ix_chunks_document_idx", "document_id", "chunk_index"),
+        Index("ix_chunks_content_tsv", "content_tsv", postgresql_using="gin"),
+        Index("ix_chunks_tenant_content_hash", "tenant_id", "content_hash"),
+        Index(
+            "ix_chunks_ingestion_job_id",
+            "ingestion_job_id",
+            postgresql_where=text("ingestion_job_id IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
         return (
             f"<DocumentChunk id={self.id} doc={self.document_id} idx={self.chunk_index}>"
         )
+
+
+# Text-search configuration used for content_tsv and lexical queries.
+# Changing it requires rebuilding content_tsv (see alembic revision 019).
+CONTENT_TSV_CONFIG = "english"
+
+# Tables created via Base.metadata.create_all (src.scripts.init_db, tests)
+# get the same trigger that alembic revision 019 installs.
+event.listen(
+    DocumentChunk.__table__,
+    "after_create",
+    DDL(
+        f"""
+        CREATE OR REPLACE FUNCTION document_chunks_content_tsv_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.content_tsv := to_tsvector('{CONTENT_TSV_CONFIG}', NEW.content);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    DocumentChunk.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE TRIGGER document_chunks_content_tsv_update
+        BEFORE INSERT OR UPDATE OF content ON document_chunks
+        FOR EACH ROW EXECUTE FUNCTION document_chunks_content_tsv_trigger()
+        """
+    ).execute_if(dialect="postgresql"),
+)
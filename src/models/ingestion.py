@@ -3,6 +3,11 @@
 IngestionJob tracks the complete lifecycle of document ingestion:
 PENDING → PROCESSING → CHUNKING → EMBEDDING → INDEXING → COMPLETED/FAILED
 
+The ingestion_jobs table doubles as a durable work queue: uploads are stored
+with the job (file_content) in PENDING status and claimed by background
+workers (src/infra/background_worker.IngestionWorker) with a lease
+(locked_by / locked_at). Progress counters are updated as batches land.
+
 DocumentChunk is already defined in document.py and will be reused.
 """
 
@@ -20,6 +25,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
 )
@@ -29,6 +35,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.database import Base
 
 
+def _enum_values(enum_cls: type[StrEnum]) -> list[str]:
+    """Store enum values ('pending'), matching the labels migration 008 created."""
+    return [member.value for member in enum_cls]
+
+
 class FileType(StrEnum):
     """Supported file types for ingestion."""
 
@@ -78,14 +89,14 @@ class IngestionJob(Base):
     # File information
     filename: Mapped[str] = mapped_column(String(512), nullable=False)
     file_type: Mapped[FileType] = mapped_column(
-        Enum(FileType, name="file_type"),
+        Enum(FileType, name="file_type", values_callable=_enum_values),
         nullable=False,
     )
     file_size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
     # Job status
     status: Mapped[IngestionStatus] = mapped_column(
-        Enum(IngestionStatus, name="ingestion_status"),
+        Enum(IngestionStatus, name="ingestion_status", values_callable=_enum_values),
         nullable=False,
         default=IngestionStatus.PENDING,
     )
@@ -108,6 +119,56 @@ class IngestionJob(Base):
         comment="Number of chunks created from this document",
     )
 
+    # Progress counters (updated as the pipeline advances)
+    chunks_total: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Chunks produced by the chunker; known once chunking finishes",
+    )
+    chunks_embedded: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Chunks embedded so far (chunk_count counts chunks stored)",
+    )
+    chunks_deduplicated: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Chunks whose embedding was reused (cache or existing chunk)",
+    )
+
+    # Durable queue state
+    # Uploaded bytes live with the job until it finishes so any worker
+    # process can pick it up; deferred so listing jobs never loads them.
+    file_content: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        deferred=True,
+        comment="Uploaded file awaiting processing; cleared when the job finishes",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Number of times a worker has claimed this job",
+    )
+    locked_by: Mapped[str | None] = mapped_column(
+        String(128),
+        nullable=True,
+        comment="Worker currently holding the job lease",
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Lease heartbeat; stale leases are returned to the queue",
+    )
+
     # Timing information
     started_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -134,3 +195,11 @@ class IngestionJob(Base):
 
     def __repr__(self) -> str:
         return f"<IngestionJob id={self.id} filename={self.filename!r} status={self.status}>"
+
+
+# Claim query: oldest pending job first
+Index(
+    "ix_ingestion_jobs_pending_created",
+    IngestionJob.created_at,
+    postgresql_where=IngestionJob.status == IngestionStatus.PENDING,
+)
@@ -49,6 +49,7 @@ class TenantSettings(Base):
 
     # ----- Model routing -----
     # JSONB blob, e.g. {"default_model": "openai/gpt-4o", "allow_models": ["gpt-4o-mini"]}
+    # "reranker_backend": "llm" | "local" selects the enhanced-retrieval reranker
     custom_model_config: Mapped[dict[str, Any] | None] = mapped_column(
         JSONB,
         nullable=True,
@@ -74,6 +75,11 @@ class TenantSettings(Base):
         nullable=True,
         comment="Storage quota in GiB; NULL = unlimited",
     )
+    ingestion_concurrency: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Max ingestion jobs processed in parallel; NULL = use platform default",
+    )
     token_budget_daily: Mapped[int | None] = mapped_column(
         BigInteger,
         nullable=True,
@@ -17,8 +17,9 @@ Risk-based approval requirements:
 All operations are tenant-isolated and fully audited.
 
 execute() routes to real SAP/MES connectors via a ConnectorRegistry.
-Connectors are instantiated with their configs and used as async context
-managers for each execution. For persistent multi-instance deployments,
+Connectors come from the app-scoped ConnectorPool (or are instantiated
+with their configs outside the app) and used as async context managers
+for each execution. For persistent multi-instance deployments,
 use PersistentWriteOperationExecutor instead of WriteOperationExecutor.
 """
 
@@ -34,6 +35,7 @@ import structlog
 
 from src.connectors.base import BaseConnector, ConnectorConfig, ConnectorResult
 from src.connectors.mes import MESConnector
+from src.connectors.pool import ConnectorPool, get_connector_pool
 from src.connectors.sap import SAPConnector
 
 log = structlog.get_logger(__name__)
@@ -134,8 +136,10 @@ class ConnectorRegistry:
     """Registry that holds per-connector configurations and creates instances.
 
     Connectors are identified by name string (e.g. ``"sap"``, ``"mes"``).
-    The registry stores ``ConnectorConfig`` objects; actual ``BaseConnector``
-    instances are created on-demand so each execution gets a fresh connection.
+    The registry stores ``ConnectorConfig`` objects. Inside the application
+    ``create`` returns the long-lived connector from the ConnectorPool, so
+    executions reuse its keep-alive connections; without a pool a fresh
+    connector is instantiated per execution.
 
     Usage::
 
@@ -144,8 +148,11 @@ class ConnectorRegistry:
         registry.register("mes", MESConnector, mes_config)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, pool: ConnectorPool | None = None) -> None:
         self._entries: dict[str, tuple[type[BaseConnector], ConnectorConfig]] = {}
+        # Resolved per call: registries are often built before the lifespan
+        # has created the app-scoped pool
+        self._pool = pool
 
     def register(
         self,
@@ -157,7 +164,7 @@ class ConnectorRegistry:
         self._entries[name] = (connector_class, config)
 
     def create(self, name: str) -> BaseConnector:
-        """Instantiate and return a connector for *name*.
+        """Return a connector for *name*, use it as ``async with connector:``.
 
         Raises:
             KeyError: If no connector is registered under *name*.
@@ -165,6 +172,9 @@ class ConnectorRegistry:
         if name not in self._entries:
             raise KeyError(f"No connector registered for '{name}'")
         cls, config = self._entries[name]
+        pool = self._pool or get_connector_pool()
+        if pool is not None:
+            return pool.get(cls, config)
         return cls(config)
 
     def known_connectors(self) -> list[str]:
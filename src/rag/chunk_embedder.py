@@ -0,0 +1,162 @@
+"""Deduplicating embedder for ingestion.
+
+Re-uploads (new versions via src/rag/versioning.py) and boilerplate pages
+that repeat across manuals produce chunks whose text was already embedded.
+ChunkEmbedder hashes every chunk and only sends text it has never seen to
+the embedding API:
+
+1. preload() resolves the job's hashes up front - first from the
+   EmbeddingCache, then from existing document_chunks rows of the same
+   tenant with the same content_hash and embedding_model.
+2. embed() returns vectors for a batch, embedding only the unique texts
+   that are still unknown; identical text later in the same job reuses the
+   vector embedded earlier.
+
+Newly embedded vectors and vectors found in the database are written back
+to the cache. Cache errors never fail ingestion - they count as misses.
+
+Only preload() touches the database session, so embed() is safe to run
+concurrently with the bulk writer on the same session (the ingestion
+pipeline overlaps the two).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.agent.llm import LLMClient
+from src.cache.embedding_cache import EmbeddingCache
+from src.models.document import DocumentChunk
+
+log = structlog.get_logger(__name__)
+
+_DB_LOOKUP_BATCH = 1000
+
+
+@dataclass
+class DedupStats:
+    """Per-job embedding reuse counters."""
+
+    chunks: int = 0
+    embedded: int = 0  # texts sent to the embedding API
+    cache_hits: int = 0  # unique hashes served by EmbeddingCache
+    db_hits: int = 0  # unique hashes served by existing document_chunks
+
+    @property
+    def reused(self) -> int:
+        """Chunks that did not need an embedding API call."""
+        return self.chunks - self.embedded
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of chunks whose embedding was reused (0.0-1.0)."""
+        return self.reused / self.chunks if self.chunks else 0.0
+
+
+class ChunkEmbedder:
+    """Embed chunk texts, reusing vectors for content already embedded."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        llm_client: LLMClient,
+        *,
+        model: str,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
+        """Initialize embedder for one ingestion job.
+
+        Args:
+            db: Session used by preload() for the document_chunks lookup
+            llm_client: Client whose embed() produces vectors for ``model``
+            model: Embedding model name (stored on chunks, scopes reuse)
+            embedding_cache: Optional shared cache (keys include the model)
+        """
+        self._db = db
+        self._llm = llm_client
+        self._model = model
+        self._cache = embedding_cache
+        self._known: dict[str, list[float]] = {}
+        self.stats = DedupStats()
+
+    @property
+    def model(self) -> str:
+        """Embedding model name."""
+        return self._model
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the content hash stored in document_chunks.content_hash."""
+        return EmbeddingCache.hash_text(text)
+
+    async def preload(self, texts: Sequence[str], tenant_id: Any) -> None:
+        """Resolve already-embedded texts from the cache and existing chunks."""
+        pending = list(dict.fromkeys(self.hash_text(t) for t in texts))
+        pending = [h for h in pending if h not in self._known]
+
+        if pending and self._cache is not None:
+            try:
+                cached = await self._cache.batch_get(pending)
+            except Exception as exc:
+                log.warning("chunk_embedder.cache_lookup_failed", error=str(exc))
+                cached = {}
+            hits = {h: v for h, v in cached.items() if v is not None}
+            self._known.update(hits)
+            self.stats.cache_hits += len(hits)
+            pending = [h for h in pending if h not in hits]
+
+        if not pending:
+            return
+
+        found: dict[str, list[float]] = {}
+        for start in range(0, len(pending), _DB_LOOKUP_BATCH):
+            hashes = pending[start : start + _DB_LOOKUP_BATCH]
+            result = await self._db.execute(
+                select(DocumentChunk.content_hash, DocumentChunk.embedding)
+                .where(
+                    DocumentChunk.tenant_id == tenant_id,
+                    DocumentChunk.embedding_model == self._model,
+                    DocumentChunk.content_hash.in_(hashes),
+                    DocumentChunk.embedding.is_not(None),
+                )
+                .distinct(DocumentChunk.content_hash)
+            )
+            for content_hash, embedding in result.all():
+                found[content_hash] = [float(x) for x in embedding]
+
+        self._known.update(found)
+        self.stats.db_hits += len(found)
+        if found:
+            await self._cache_store(found)
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Return one vector per text, embedding only unseen content."""
+        hashes = [self.hash_text(t) for t in texts]
+        missing: dict[str, str] = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in self._known and text_hash not in missing:
+                missing[text_hash] = text
+
+        if missing:
+            vectors = await self._llm.embed(list(missing.values()))
+            new = dict(zip(missing, vectors))
+            self._known.update(new)
+            await self._cache_store(new)
+
+        self.stats.chunks += len(texts)
+        self.stats.embedded += len(missing)
+        return [self._known[h] for h in hashes]
+
+    async def _cache_store(self, embeddings: dict[str, list[float]]) -> None:
+        if self._cache is None:
+            return
+        try:
+            await self._cache.batch_cache(embeddings)
+        except Exception as exc:
+            log.warning("chunk_embedder.cache_store_failed", error=str(exc))
@@ -0,0 +1,205 @@
+"""Bulk insertion of document chunks.
+
+Ingestion used to add one ORM DocumentChunk per chunk and flush per batch,
+which issues one INSERT per row and converts every embedding to its text
+form in Python. BulkChunkWriter writes a whole batch in one round trip:
+
+1. COPY (asyncpg): rows are encoded straight into PostgreSQL's binary COPY
+   format - embeddings use pgvector's binary representation - and streamed
+   with ``copy_to_table(format="binary")``.
+2. Multi-row INSERT: used when the session is not backed by asyncpg (e.g.
+   SQLite in tests) or when COPY is disabled.
+
+Both run on the session's own connection, so rows are part of the caller's
+transaction exactly as ORM inserts were. SQLAlchemy's asyncpg adapter only
+issues BEGIN when a statement runs through it, so COPY first opens the
+session transaction if nothing has yet (otherwise it would autocommit).
+BEFORE INSERT triggers (content_tsv) fire for COPY as well.
+
+The binary encoding is done here rather than through copy_records_to_table
+because that would require registering a connection-wide vector codec,
+which changes how every later query on the pooled connection decodes
+embeddings.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.document import DocumentChunk
+
+log = structlog.get_logger(__name__)
+
+_TABLE = DocumentChunk.__table__
+_COLUMNS = (
+    _TABLE.c.id.name,
+    _TABLE.c.document_id.name,
+    _TABLE.c.tenant_id.name,
+    _TABLE.c.content.name,
+    _TABLE.c.chunk_index.name,
+    _TABLE.c.embedding.name,
+    _TABLE.c.chunk_metadata.name,
+    _TABLE.c.created_at.name,
+    _TABLE.c.content_hash.name,
+    _TABLE.c.embedding_model.name,
+    _TABLE.c.ingestion_job_id.name,
+)
+
+# PGCOPY binary format: signature, flags, header extension length
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+_NULL_FIELD = struct.pack(">i", -1)
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=UTC)
+_JSONB_VERSION = b"\x01"
+
+
+@dataclass
+class ChunkRow:
+    """One document_chunks row ready to be written."""
+
+    document_id: uuid.UUID
+    tenant_id: uuid.UUID
+    content: str
+    chunk_index: int
+    embedding: Sequence[float] | None
+    metadata: dict[str, Any] = field(default_factory=dict)
+    content_hash: str | None = None
+    embedding_model: str | None = None
+    ingestion_job_id: uuid.UUID | None = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+def _field(payload: bytes) -> bytes:
+    return struct.pack(">i", len(payload)) + payload
+
+
+def _encode_uuid(value: uuid.UUID | str) -> bytes:
+    return (value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))).bytes
+
+
+def _encode_vector(values: Sequence[float]) -> bytes:
+    """pgvector binary format: int16 dim, int16 unused, float4[dim] big-endian."""
+    return struct.pack(f">HH{len(values)}f", len(values), 0, *values)
+
+
+def _encode_text(value: str | None) -> bytes:
+    return _NULL_FIELD if value is None else _field(value.encode("utf-8"))
+
+
+def _encode_timestamptz(value: datetime) -> bytes:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    delta = value - _PG_EPOCH
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack(">q", micros)
+
+
+def encode_copy_binary(rows: Iterable[ChunkRow]) -> bytes:
+    """Encode rows as a PostgreSQL binary COPY stream (columns in _COLUMNS order)."""
+    parts = [_COPY_HEADER]
+    field_count = struct.pack(">h", len(_COLUMNS))
+    for row in rows:
+        parts.append(field_count)
+        parts.append(_field(_encode_uuid(row.id)))
+        parts.append(_field(_encode_uuid(row.document_id)))
+        parts.append(_field(_encode_uuid(row.tenant_id)))
+        parts.append(_encode_text(row.content))
+        parts.append(_field(struct.pack(">i", row.chunk_index)))
+        parts.append(
+            _NULL_FIELD if row.embedding is None else _field(_encode_vector(row.embedding))
+        )
+        parts.append(
+            _field(_JSONB_VERSION + json.dumps(row.metadata, default=str).encode("utf-8"))
+        )
+        parts.append(_field(_encode_timestamptz(row.created_at)))
+        parts.append(_encode_text(row.content_hash))
+        parts.append(_encode_text(row.embedding_model))
+        parts.append(
+            _NULL_FIELD
+            if row.ingestion_job_id is None
+            else _field(_encode_uuid(row.ingestion_job_id))
+        )
+    parts.append(_COPY_TRAILER)
+    return b"".join(parts)
+
+
+class BulkChunkWriter:
+    """Write batches of chunks with COPY, falling back to multi-row INSERT."""
+
+    def __init__(self, db: AsyncSession, *, use_copy: bool = True) -> None:
+        """Initialize writer.
+
+        Args:
+            db: Session whose connection (and transaction) receives the rows
+            use_copy: Try binary COPY first; False always uses INSERT
+        """
+        self._db = db
+        self._use_copy = use_copy
+
+    async def write(self, rows: Sequence[ChunkRow]) -> int:
+        """Insert rows into document_chunks.
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        if self._use_copy:
+            driver_conn = await self._asyncpg_connection()
+            if driver_conn is not None:
+                if not driver_conn.is_in_transaction():
+                    # e.g. first batch after a commit: BEGIN via the session
+                    await self._db.execute(text("SELECT 1"))
+                await driver_conn.copy_to_table(
+                    _TABLE.name,
+                    source=encode_copy_binary(rows),
+                    columns=list(_COLUMNS),
+                    format="binary",
+                )
+                log.debug("chunk_writer.copied", rows=len(rows))
+                return len(rows)
+            # Not asyncpg: remember so later batches skip the lookup
+            self._use_copy = False
+
+        await self._db.execute(
+            insert(DocumentChunk),
+            [
+                {
+                    "id": row.id,
+                    "document_id": row.document_id,
+                    "tenant_id": row.tenant_id,
+                    "content": row.content,
+                    "chunk_index": row.chunk_index,
+                    "embedding": list(row.embedding) if row.embedding is not None else None,
+                    "chunk_metadata": row.metadata,
+                    "created_at": row.created_at,
+                    "content_hash": row.content_hash,
+                    "embedding_model": row.embedding_model,
+                    "ingestion_job_id": row.ingestion_job_id,
+                }
+                for row in rows
+            ],
+        )
+        log.debug("chunk_writer.inserted", rows=len(rows))
+        return len(rows)
+
+    async def _asyncpg_connection(self) -> Any | None:
+        """Return the session's underlying asyncpg connection, or None."""
+        connection = await self._db.connection()
+        raw = await connection.get_raw_connection()
+        driver_conn = getattr(raw, "driver_connection", None)
+        if driver_conn is None or not hasattr(driver_conn, "copy_to_table"):
+            return None
+        return driver_conn
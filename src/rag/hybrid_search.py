@@ -3,6 +3,7 @@
 Architecture:
 1. Semantic search: pgvector cosine similarity on embeddings
 2. Lexical search: PostgreSQL tsvector/tsquery for BM25-style ranking
+   (against the persisted, GIN-indexed document_chunks.content_tsv column)
 3. Fusion: Reciprocal Rank Fusion (RRF) to merge both result sets
 4. Tenant isolation: ALL queries scoped by tenant_id
 
@@ -12,13 +13,25 @@ The RRF algorithm:
 
 This gives higher scores to documents appearing in both result sets,
 while still surfacing unique results from each method.
+
+Concurrency:
+  When a session factory is supplied, the semantic and lexical legs run
+  concurrently, each on its own pooled connection (an AsyncSession must
+  never be shared between tasks). Without one, the legs run sequentially
+  on the request session. Callers that already hold the query embedding
+  (e.g. RetrievalService after its cache lookup) pass it in so the query
+  is embedded at most once per turn.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
 import structlog
 from sqlalchemy import select, text
@@ -26,12 +39,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agent.llm import LLMClient
 from src.config import Settings
-from src.models.document import Document, DocumentChunk
+from src.middleware.prometheus import record_search_leg
+from src.models.document import CONTENT_TSV_CONFIG, Document, DocumentChunk
+from src.rag.vector_index import execute_ann_query
 
 log = structlog.get_logger(__name__)
 
 _RRF_K = 60  # Standard RRF constant
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class SearchResult:
@@ -47,6 +64,33 @@ class SearchResult:
     document_version: str
 
 
+@dataclass
+class SearchTimings:
+    """Wall-clock timings (milliseconds) of one hybrid search call.
+
+    semantic_ms includes the query embedding call when no embedding was
+    passed in. In concurrent mode total_ms is roughly
+    max(semantic_ms, lexical_ms) + fusion_ms rather than the sum.
+    """
+
+    semantic_ms: float = 0.0
+    lexical_ms: float = 0.0
+    fusion_ms: float = 0.0
+    total_ms: float = 0.0
+    concurrent: bool = False
+    embedding_reused: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "semantic_ms": round(self.semantic_ms, 2),
+            "lexical_ms": round(self.lexical_ms, 2),
+            "fusion_ms": round(self.fusion_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+            "concurrent": self.concurrent,
+            "embedding_reused": self.embedding_reused,
+        }
+
+
 class HybridSearchEngine:
     """Combines semantic and lexical search with Reciprocal Rank Fusion."""
 
@@ -58,6 +102,7 @@ class HybridSearchEngine:
         *,
         semantic_weight: float = 0.5,
         lexical_weight: float = 0.5,
+        session_factory: Callable[[], AsyncSession] | None = None,
     ) -> None:
         """Initialize hybrid search.
 
@@ -67,12 +112,24 @@ class HybridSearchEngine:
             llm_client: LLM client for embeddings
             semantic_weight: Weight for semantic results (0.0 - 1.0)
             lexical_weight: Weight for lexical results (0.0 - 1.0)
+            session_factory: Optional callable returning a fresh AsyncSession
+                (typically src.database.get_session_factory()). When set, the
+                semantic and lexical legs run concurrently on separate
+                pooled connections; when None they run sequentially on db.
         """
         self._db = db
         self._settings = settings
         self._llm = llm_client
         self._semantic_weight = semantic_weight
         self._lexical_weight = lexical_weight
+        self._session_factory = session_factory
+        # Timings of the most recent search() call, for observability
+        self.last_timings = SearchTimings()
+
+    @property
+    def concurrent(self) -> bool:
+        """True when the two search legs run concurrently."""
+        return self._session_factory is not None
 
     async def search(
         self,
@@ -81,6 +138,7 @@ class HybridSearchEngine:
         tenant_id: uuid.UUID,
         top_k: int | None = None,
         document_ids: list[uuid.UUID] | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[SearchResult]:
         """Perform hybrid search combining semantic and lexical retrieval.
 
@@ -89,6 +147,8 @@ class HybridSearchEngine:
             tenant_id: MANDATORY - scopes all results to this tenant
             top_k: Number of final results to return (default: settings.vector_top_k)
             document_ids: Optional filter to specific documents
+            query_embedding: Pre-computed query embedding. When provided the
+                semantic leg skips its own LLMClient.embed call.
 
         Returns:
             List of SearchResult objects, sorted by fused score (highest first)
@@ -103,29 +163,53 @@ class HybridSearchEngine:
             query_preview=query[:50],
             tenant_id=str(tenant_id),
             top_k=effective_top_k,
+            concurrent=self.concurrent,
+        )
+
+        timings = SearchTimings(
+            concurrent=self.concurrent,
+            embedding_reused=query_embedding is not None,
         )
+        start = time.perf_counter()
 
-        # Execute both searches in parallel (could be optimized to run concurrently)
-        semantic_results = await self._semantic_search(
+        semantic_leg = self._semantic_search(
             query=query,
             tenant_id=tenant_id,
             top_k=effective_top_k * 2,  # Fetch more for fusion
             document_ids=document_ids,
+            query_embedding=query_embedding,
         )
-
-        lexical_results = await self._lexical_search(
+        lexical_leg = self._lexical_search(
             query=query,
             tenant_id=tenant_id,
             top_k=effective_top_k * 2,
             document_ids=document_ids,
         )
 
+        if self.concurrent:
+            # Each leg checks out its own connection, so total latency is
+            # bounded by the slower leg instead of the sum of both.
+            (semantic_results, timings.semantic_ms), (lexical_results, timings.lexical_ms) = (
+                await asyncio.gather(_timed(semantic_leg), _timed(lexical_leg))
+            )
+        else:
+            semantic_results, timings.semantic_ms = await _timed(semantic_leg)
+            lexical_results, timings.lexical_ms = await _timed(lexical_leg)
+
         # Fuse results using RRF
+        fusion_start = time.perf_counter()
         fused = await self._reciprocal_rank_fusion(
             semantic_results=semantic_results,
             lexical_results=lexical_results,
             tenant_id=tenant_id,
         )
+        timings.fusion_ms = (time.perf_counter() - fusion_start) * 1000
+        timings.total_ms = (time.perf_counter() - start) * 1000
+        self.last_timings = timings
+
+        record_search_leg("semantic", timings.semantic_ms / 1000)
+        record_search_leg("lexical", timings.lexical_ms / 1000)
+        record_search_leg("fusion", timings.fusion_ms / 1000)
 
         # Return top-K after fusion
         results = fused[:effective_top_k]
@@ -137,10 +221,24 @@ class HybridSearchEngine:
             lexical_count=len(lexical_results),
             fused_count=len(fused),
             final_count=len(results),
+            **timings.to_dict(),
         )
 
         return results
 
+    @asynccontextmanager
+    async def _leg_session(self) -> AsyncIterator[AsyncSession]:
+        """Yield the session a single search leg should use.
+
+        A fresh session from the factory in concurrent mode; otherwise the
+        request session shared by both (sequential) legs.
+        """
+        if self._session_factory is None:
+            yield self._db
+            return
+        async with self._session_factory() as session:
+            yield session
+
     async def _semantic_search(
         self,
         *,
@@ -148,18 +246,23 @@ class HybridSearchEngine:
         tenant_id: uuid.UUID,
         top_k: int,
         document_ids: list[uuid.UUID] | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[tuple[uuid.UUID, float]]:
         """Perform pgvector semantic similarity search.
 
+        Args:
+            query_embedding: Pre-computed embedding; embeds ``query`` if None.
+
         Returns:
             List of (chunk_id, score) tuples
         """
-        try:
-            embeddings = await self._llm.embed([query])
-            query_embedding = embeddings[0]
-        except Exception as exc:
-            log.warning("semantic_search.embed_failed", error=str(exc))
-            return []
+        if query_embedding is None:
+            try:
+                embeddings = await self._llm.embed([query])
+                query_embedding = embeddings[0]
+            except Exception as exc:
+                log.warning("semantic_search.embed_failed", error=str(exc))
+                return []
 
         embedding_str = f"[{','.join(str(x) for x in query_embedding)}]"
 
@@ -174,10 +277,7 @@ class HybridSearchEngine:
             doc_filter = "AND dc.document_id = ANY(:doc_ids)"
             params["doc_ids"] = [str(did) for did in document_ids]
 
-        sql = text(f"""
-            SELECT
-                dc.id AS chunk_id,
-                1 - (dc.embedding <=> CAST(:embedding AS vector)) AS score
+        filtered = f"""
             FROM document_chunks dc
             JOIN documents d ON d.id = dc.document_id
             WHERE
@@ -186,13 +286,28 @@ class HybridSearchEngine:
                 AND d.status = 'ready'
                 AND dc.embedding IS NOT NULL
                 {doc_filter}
+        """
+        sql = text(f"""
+            SELECT
+                dc.id AS chunk_id,
+                1 - (dc.embedding <=> CAST(:embedding AS vector)) AS score
+            {filtered}
             ORDER BY dc.embedding <=> CAST(:embedding AS vector)
             LIMIT :top_k
         """)
+        # Cheap (btree) check of how many rows the filter can return at all
+        count_sql = text(f"SELECT count(*) FROM (SELECT 1 {filtered} LIMIT :top_k) AS f")
 
         try:
-            result = await self._db.execute(sql, params)
-            rows = result.all()
+            async with self._leg_session() as db:
+                rows = await execute_ann_query(
+                    db,
+                    sql,
+                    params,
+                    settings=self._settings,
+                    top_k=top_k,
+                    count_sql=count_sql,
+                )
         except Exception as exc:
             log.error("semantic_search.query_failed", error=str(exc))
             return []
@@ -224,29 +339,30 @@ class HybridSearchEngine:
             doc_filter = "AND dc.document_id = ANY(:doc_ids)"
             params["doc_ids"] = [str(did) for did in document_ids]
 
-        # Use ts_rank_cd for BM25-style ranking (considers cover density)
+        # Use ts_rank_cd for BM25-style ranking (considers cover density).
+        # Match and rank against the stored, GIN-indexed content_tsv column so
+        # Postgres can use an index lookup instead of re-tokenizing every chunk.
         sql = text(f"""
             SELECT
                 dc.id AS chunk_id,
-                ts_rank_cd(
-                    to_tsvector('english', dc.content),
-                    plainto_tsquery('english', :query)
-                ) AS score
+                ts_rank_cd(dc.content_tsv, q.query) AS score
             FROM document_chunks dc
             JOIN documents d ON d.id = dc.document_id
+            CROSS JOIN plainto_tsquery('{CONTENT_TSV_CONFIG}', :query) AS q(query)
             WHERE
                 dc.tenant_id = :tenant_id
                 AND d.tenant_id = :tenant_id
                 AND d.status = 'ready'
-                AND to_tsvector('english', dc.content) @@ plainto_tsquery('english', :query)
+                AND dc.content_tsv @@ q.query
                 {doc_filter}
             ORDER BY score DESC
             LIMIT :top_k
         """)
 
         try:
-            result = await self._db.execute(sql, params)
-            rows = result.all()
+            async with self._leg_session() as db:
+                result = await db.execute(sql, params)
+                rows = result.all()
         except Exception as exc:
             log.error("lexical_search.query_failed", error=str(exc))
             return []
@@ -358,10 +474,23 @@ class HybridSearchEngine:
         return [chunk_map[cid] for cid in chunk_ids if cid in chunk_map]
 
 
+async def _timed(awaitable: Awaitable[_T]) -> tuple[_T, float]:
+    """Await and return (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = await awaitable
+    return result, (time.perf_counter() - start) * 1000
+
+
 async def hybrid_search_from_context(
     db: AsyncSession,
     settings: Settings,
     llm_client: LLMClient,
+    session_factory: Callable[[], AsyncSession] | None = None,
 ) -> HybridSearchEngine:
     """Factory for HybridSearchEngine - used by tool gateway."""
-    return HybridSearchEngine(db=db, settings=settings, llm_client=llm_client)
+    return HybridSearchEngine(
+        db=db,
+        settings=settings,
+        llm_client=llm_client,
+        session_factory=session_factory,
+    )
@@ -5,7 +5,7 @@ Flow:
 2. Extract text (PDF via pypdf, plain text as-is)
 3. Chunk into overlapping token windows (512 tokens, 50 overlap)
 4. Embed each chunk via LiteLLM embedding endpoint
-5. Store DocumentChunk records with embeddings in pgvector
+5. Store DocumentChunk records with embeddings in pgvector (bulk COPY per batch)
 6. Update Document.status and Document.chunk_count
 
 Design decisions:
@@ -26,13 +26,17 @@ import tiktoken
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agent.llm import LLMClient
+from src.cache.embedding_cache import EmbeddingCache
 from src.config import Settings
-from src.models.document import Document, DocumentChunk, DocumentStatus
+from src.models.document import Document, DocumentStatus
+from src.rag.chunk_embedder import ChunkEmbedder
+from src.rag.chunk_writer import BulkChunkWriter, ChunkRow
 
 log = structlog.get_logger(__name__)
 
 _EMBED_BATCH_SIZE = 32
 _TOKENIZER_NAME = "cl100k_base"  # Works for most OpenAI-compatible models
+_UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
 
 
 @dataclass
@@ -55,6 +59,24 @@ def _extract_text_from_pdf(file_bytes: bytes) -> list[tuple[str, int]]:
     return pages
 
 
+def _token_char_offsets(enc: tiktoken.Encoding, tokens: list[int]) -> list[int]:
+    """Character offset of every token boundary, computed in one pass.
+
+    offsets[i] is the number of characters in the text covered by
+    tokens[:i] (offsets[len(tokens)] is the full length). A token may end
+    in the middle of a multi-byte UTF-8 character; such a partial character
+    is counted where its lead byte is, which matches
+    ``len(enc.decode(tokens[:i]))`` (one replacement character).
+    """
+    offsets = [0] * (len(tokens) + 1)
+    chars = 0
+    for i, token_bytes in enumerate(enc.decode_tokens_bytes(tokens), start=1):
+        # Every UTF-8 character has exactly one non-continuation byte
+        chars += len(token_bytes.translate(None, _UTF8_CONTINUATION_BYTES))
+        offsets[i] = chars
+    return offsets
+
+
 def _chunk_text(
     text: str,
     *,
@@ -67,6 +89,9 @@ def _chunk_text(
 
     Uses tiktoken for accurate token counting. Returns chunks with
     their character offsets for precise citation location.
+
+    Offsets come from per-token character counts accumulated once up front,
+    so chunking is linear in the number of tokens.
     """
     enc = tiktoken.get_encoding(_TOKENIZER_NAME)
     tokens = enc.encode(text)
@@ -75,6 +100,7 @@ def _chunk_text(
     if total_tokens == 0:
         return []
 
+    char_offsets = _token_char_offsets(enc, tokens)
     chunks: list[ChunkResult] = []
     start = 0
     chunk_idx = chunk_index_offset
@@ -84,14 +110,10 @@ def _chunk_text(
         chunk_tokens = tokens[start:end]
         chunk_text = enc.decode(chunk_tokens)
 
-        # Calculate approximate character offsets
-        prefix_tokens = tokens[:start]
-        char_start = len(enc.decode(prefix_tokens))
-
         chunk_meta = dict(metadata or {})
         chunk_meta.update({
-            "char_start": char_start,
-            "char_end": char_start + len(chunk_text),
+            "char_start": char_offsets[start],
+            "char_end": char_offsets[end],
             "token_count": len(chunk_tokens),
         })
 
@@ -117,10 +139,15 @@ class IngestionPipeline:
         db: AsyncSession,
         settings: Settings,
         llm_client: LLMClient,
+        embedding_cache: EmbeddingCache | None = None,
     ) -> None:
         self._db = db
         self._settings = settings
         self._llm = llm_client
+        self._embedding_cache = embedding_cache
+        self._chunk_writer = BulkChunkWriter(
+            db, use_copy=bool(getattr(settings, "ingestion_bulk_copy", True))
+        )
 
     async def ingest_document(
         self,
@@ -222,28 +249,53 @@ class IngestionPipeline:
         chunks: list[ChunkResult],
         document: Document,
     ) -> None:
-        """Embed chunks in batches and store in pgvector."""
+        """Embed chunks in batches and store in pgvector.
+
+        Text already embedded with the same model (cache, this tenant's
+        stored chunks, or earlier in this document) is not re-embedded.
+        """
+        embedder = ChunkEmbedder(
+            self._db,
+            self._llm,
+            model=str(self._settings.litellm_embedding_model),
+            embedding_cache=self._embedding_cache,
+        )
+        await embedder.preload([c.content for c in chunks], document.tenant_id)
+
         for batch_start in range(0, len(chunks), _EMBED_BATCH_SIZE):
             batch = chunks[batch_start : batch_start + _EMBED_BATCH_SIZE]
             texts = [c.content for c in batch]
 
-            embeddings = await self._llm.embed(texts)
-
-            for chunk_result, embedding in zip(batch, embeddings):
-                db_chunk = DocumentChunk(
-                    document_id=document.id,
-                    tenant_id=document.tenant_id,
-                    content=chunk_result.content,
-                    chunk_index=chunk_result.chunk_index,
-                    embedding=embedding,
-                    chunk_metadata=chunk_result.metadata,
-                )
-                self._db.add(db_chunk)
-
-            await self._db.flush()
+            embeddings = await embedder.embed(texts)
+
+            await self._chunk_writer.write(
+                [
+                    ChunkRow(
+                        document_id=document.id,
+                        tenant_id=document.tenant_id,
+                        content=chunk_result.content,
+                        chunk_index=chunk_result.chunk_index,
+                        embedding=embedding,
+                        content_hash=embedder.hash_text(chunk_result.content),
+                        embedding_model=embedder.model,
+                        metadata=chunk_result.metadata,
+                    )
+                    for chunk_result, embedding in zip(batch, embeddings)
+                ]
+            )
             log.debug(
                 "ingest.batch_embedded",
                 document_id=str(document.id),
                 batch_start=batch_start,
                 batch_size=len(batch),
             )
+
+        log.info(
+            "ingest.embeddings_deduplicated",
+            document_id=str(document.id),
+            chunks=embedder.stats.chunks,
+            embedded=embedder.stats.embedded,
+            cache_hits=embedder.stats.cache_hits,
+            db_hits=embedder.stats.db_hits,
+            dedup_ratio=round(embedder.stats.dedup_ratio, 3),
+        )
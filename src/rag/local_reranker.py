@@ -0,0 +1,219 @@
+"""Local CPU-only reranking: BM25 term overlap fused with embedding cosine.
+
+An alternative to the LLM reranker (src/rag/reranker.py) for deployments
+where spending a completion per batch of candidates is too slow or where no
+hosted model is reachable. Scoring is deterministic and makes no network call.
+
+Scoring (over the candidate set only):
+1. Lexical: Okapi BM25 of the query terms against each candidate, with IDF
+   computed over the candidates themselves, normalized to 0-1 by the best
+   candidate
+2. Semantic: cosine similarity between the query embedding and each
+   candidate's stored chunk embedding, clipped to 0-1
+3. relevance = lexical_weight * lexical + semantic_weight * semantic
+
+When no query embedding is supplied (or a candidate has no stored embedding)
+the semantic term is dropped and the lexical score is used on its own, so
+the backend always produces a ranking. Ties keep the retrieval order.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from typing import Any, ClassVar
+
+import numpy as np
+import structlog
+
+from src.rag.reranker import RankedResult
+
+log = structlog.get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Okapi BM25 parameters (standard defaults)
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_DEFAULT_LEXICAL_WEIGHT = 0.4
+_DEFAULT_SEMANTIC_WEIGHT = 0.6
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def bm25_scores(query: str, documents: Sequence[str]) -> list[float]:
+    """Okapi BM25 score of ``query`` against each document.
+
+    IDF is computed over ``documents`` only, which is what makes this usable
+    as a reranker over a small candidate set.
+    """
+    if not documents:
+        return []
+
+    doc_tokens = [_tokenize(doc) for doc in documents]
+    query_terms = set(_tokenize(query))
+    if not query_terms:
+        return [0.0] * len(documents)
+
+    n_docs = len(documents)
+    avg_len = sum(len(tokens) for tokens in doc_tokens) / n_docs or 1.0
+    doc_freq = Counter(term for tokens in doc_tokens for term in set(tokens) & query_terms)
+    idf = {
+        term: math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+        for term, df in doc_freq.items()
+    }
+
+    scores: list[float] = []
+    for tokens in doc_tokens:
+        term_freq = Counter(tokens)
+        length_norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * len(tokens) / avg_len)
+        score = 0.0
+        for term, term_idf in idf.items():
+            tf = term_freq.get(term, 0)
+            if tf:
+                score += term_idf * tf * (_BM25_K1 + 1.0) / (tf + length_norm)
+        scores.append(score)
+    return scores
+
+
+def cosine_scores(
+    query_embedding: Sequence[float],
+    embeddings: Sequence[Sequence[float] | None],
+) -> list[float | None]:
+    """Cosine similarity of the query against each embedding, clipped to 0-1.
+
+    Entries with no embedding (None) or a dimension mismatch yield None.
+    """
+    query_vec = np.asarray(query_embedding, dtype=np.float32)
+    query_norm = float(np.linalg.norm(query_vec))
+    present = [
+        i
+        for i, emb in enumerate(embeddings)
+        if emb is not None and len(emb) == query_vec.shape[0]
+    ]
+    scores: list[float | None] = [None] * len(embeddings)
+    if not present or query_norm == 0.0:
+        return scores
+
+    matrix = np.asarray([embeddings[i] for i in present], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    norms[norms == 0.0] = 1.0
+    sims = (matrix @ query_vec) / (norms * query_norm)
+    for i, sim in zip(present, np.clip(sims, 0.0, 1.0).tolist()):
+        scores[i] = float(sim)
+    return scores
+
+
+class LocalReranker:
+    """Rerank search results with BM25 + embedding cosine on the local CPU."""
+
+    uses_embeddings: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        *,
+        lexical_weight: float = _DEFAULT_LEXICAL_WEIGHT,
+        semantic_weight: float = _DEFAULT_SEMANTIC_WEIGHT,
+    ) -> None:
+        """Initialize reranker.
+
+        Args:
+            lexical_weight: Weight of the normalized BM25 score
+            semantic_weight: Weight of the query/chunk cosine similarity
+        """
+        if lexical_weight < 0 or semantic_weight < 0 or lexical_weight + semantic_weight == 0:
+            raise ValueError("Reranker weights must be non-negative and not both zero")
+        self._lexical_weight = lexical_weight
+        self._semantic_weight = semantic_weight
+
+    async def rerank(
+        self,
+        *,
+        query: str,
+        results: list[Any],  # List of SearchResult-like objects
+        top_k: int | None = None,
+        query_embedding: Sequence[float] | None = None,
+        result_embeddings: Mapping[Any, Sequence[float]] | None = None,
+    ) -> list[RankedResult]:
+        """Rerank search results by fused lexical and embedding similarity.
+
+        Args:
+            query: Original user query
+            results: List of SearchResult objects from retrieval
+            top_k: Number of results to return after reranking (default: all)
+            query_embedding: Query embedding (same model as ingestion)
+            result_embeddings: Stored chunk embeddings keyed by chunk_id
+
+        Returns:
+            List of RankedResult objects sorted by relevance_score (highest first)
+        """
+        if not results:
+            return []
+
+        effective_top_k = top_k or len(results)
+        scores = self.score(
+            query=query,
+            results=results,
+            query_embedding=query_embedding,
+            result_embeddings=result_embeddings,
+        )
+
+        scored_results = [
+            RankedResult(
+                chunk_id=result.chunk_id,
+                document_id=result.document_id,
+                relevance_score=score,
+                original_score=result.score,
+                content=result.content,
+                chunk_index=result.chunk_index,
+                metadata=result.metadata,
+                source=result.source,
+                document_version=result.document_version,
+            )
+            for result, score in zip(results, scores)
+        ]
+        # Stable sort: ties keep retrieval order
+        scored_results.sort(key=lambda x: x.relevance_score, reverse=True)
+        final_results = scored_results[:effective_top_k]
+
+        log.debug(
+            "local_reranker.complete",
+            input_count=len(results),
+            output_count=len(final_results),
+            semantic=query_embedding is not None and bool(result_embeddings),
+        )
+        return final_results
+
+    def score(
+        self,
+        *,
+        query: str,
+        results: list[Any],
+        query_embedding: Sequence[float] | None = None,
+        result_embeddings: Mapping[Any, Sequence[float]] | None = None,
+    ) -> list[float]:
+        """Compute the fused 0-1 relevance score of each result, in input order."""
+        lexical = bm25_scores(query, [result.content for result in results])
+        best = max(lexical, default=0.0)
+        lexical = [score / best if best > 0 else 0.0 for score in lexical]
+
+        semantic: list[float | None] = [None] * len(results)
+        if query_embedding is not None and result_embeddings:
+            semantic = cosine_scores(
+                query_embedding,
+                [result_embeddings.get(result.chunk_id) for result in results],
+            )
+
+        fused: list[float] = []
+        for lex, sem in zip(lexical, semantic):
+            if sem is None or self._semantic_weight == 0:
+                fused.append(lex if self._lexical_weight else 0.0)
+            else:
+                total = self._lexical_weight + self._semantic_weight
+                fused.append((self._lexical_weight * lex + self._semantic_weight * sem) / total)
+        return fused
@@ -5,11 +5,29 @@ the result order by scoring each chunk's relevance to the query using an LLM.
 
 Architecture:
 1. Take initial search results (top-K from retrieval)
-2. Use LLM to score each chunk's relevance (0-10 scale)
-3. Batch scoring for efficiency (32 chunks per LLM call)
+2. Split them into batches and score each batch with the LLM (0-10 scale)
+3. Fan batches out concurrently, bounded by max_concurrency
 4. Re-sort by LLM relevance scores
 5. Return top-N after reranking
 
+Scoring modes:
+- POINTWISE: one completion per chunk (original behaviour, most robust)
+- LISTWISE:  one completion scores a whole batch of numbered passages,
+             parsed by a tolerant parser (JSON or "[n] score" lines); any
+             passage the model omits gets the neutral score
+
+Latency budget:
+- With latency_budget_s set, rerank() waits at most that long for batch
+  scores. Batches still in flight are cancelled and their chunks keep the
+  neutral score in their original retrieval order (marked reranked=False),
+  so a slow LLM degrades ranking quality instead of blocking the turn.
+
+Backends:
+- RerankerBackend is the interface RetrievalService depends on. This module
+  provides the LLM backend; src/rag/local_reranker.py provides a local,
+  CPU-only lexical + embedding scorer. The backend is chosen per tenant
+  (TenantSettings.custom_model_config["reranker_backend"]).
+
 Design decisions:
 - Use structured prompting for consistent scoring
 - Batch processing to reduce LLM calls
@@ -19,8 +37,14 @@ Design decisions:
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
+import time
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any
+from enum import StrEnum
+from typing import Any, ClassVar, Protocol
 
 import structlog
 
@@ -28,7 +52,21 @@ from src.agent.llm import LLMClient
 
 log = structlog.get_logger(__name__)
 
-_RERANK_BATCH_SIZE = 32  # Process this many chunks per LLM call
+_RERANK_BATCH_SIZE = 32  # Process this many chunks per batch (pointwise)
+_LISTWISE_BATCH_SIZE = 10  # Passages per listwise completion (prompt size bound)
+_LISTWISE_CHUNK_CHARS = 1500  # Per-passage truncation inside a listwise prompt
+_DEFAULT_MAX_CONCURRENCY = 4  # Batches scored in parallel
+_NEUTRAL_SCORE = 0.5  # Assigned on errors, parse gaps and budget timeouts
+
+
+class RerankMode(StrEnum):
+    POINTWISE = "pointwise"
+    LISTWISE = "listwise"
+
+
+class RerankBackend(StrEnum):
+    LLM = "llm"
+    LOCAL = "local"
 
 
 @dataclass
@@ -44,9 +82,33 @@ class RankedResult:
     metadata: dict[str, Any]
     source: str
     document_version: str
+    reranked: bool = True  # False if the latency budget expired before scoring
+
+
+class RerankerBackend(Protocol):
+    """Interface shared by every reranker backend.
 
+    Backends that set ``uses_embeddings`` score with the query embedding and
+    the candidates' stored embeddings; callers pass them in so the backend
+    never has to embed anything itself.
+    """
+
+    uses_embeddings: ClassVar[bool]
+
+    async def rerank(
+        self,
+        *,
+        query: str,
+        results: list[Any],
+        top_k: int | None = None,
+        query_embedding: Sequence[float] | None = None,
+        result_embeddings: Mapping[Any, Sequence[float]] | None = None,
+    ) -> list[RankedResult]: ...
 
-_RERANK_PROMPT_TEMPLATE = """You are a relevance scoring system. Given a user query and a document chunk, rate how relevant the chunk is to the query on a scale of 0-10.
+
+_RERANK_PROMPT_TEMPLATE = """You are a relevance scoring system. \
+Given a user query and a document chunk, rate how relevant the chunk is to the query \
+on a scale of 0-10.
 
 Query: {query}
 
@@ -61,23 +123,119 @@ Respond with ONLY a single number between 0 and 10, where:
 Score:"""
 
 
+_LISTWISE_PROMPT_TEMPLATE = """You are a relevance scoring system. \
+Given a user query and {count} numbered passages, rate how relevant EACH passage is \
+to the query on a scale of 0-10.
+
+Query: {query}
+
+Passages:
+{passages}
+
+Scale:
+- 0 = completely irrelevant
+- 5 = somewhat relevant
+- 10 = extremely relevant and directly answers the query
+
+Respond with ONLY a JSON object mapping every passage number to its score, for example:
+{{"1": 7, "2": 0, "3": 10}}
+
+Scores:"""
+
+# "[3] 7", "3: 7", "Passage 3 - 7.5", "#3 = 7"
+_LISTWISE_LINE_RE = re.compile(
+    r"(?:passage\s*|\[|#)?(\d+)\]?(?:\s*[:=\-\)]\s*|\s+)(-?\d+(?:\.\d+)?)",
+    re.IGNORECASE,
+)
+
+
+def _normalize_score(raw: float) -> float:
+    """Clamp a 0-10 score and scale it to 0-1."""
+    return max(0.0, min(10.0, raw)) / 10.0
+
+
+def parse_listwise_scores(text: str, count: int) -> list[float | None]:
+    """Parse a listwise scoring response into per-passage 0-1 scores.
+
+    Accepts, in order of preference:
+    - a JSON object {"1": 7, ...} (optionally wrapped in prose or a code fence)
+    - a JSON array of numbers [7, 0, 10] in passage order
+    - a JSON array of objects [{"id": 1, "score": 7}, ...]
+    - free-form lines such as "[1] 7" or "Passage 2: 4"
+
+    Args:
+        text: Raw model output
+        count: Number of passages in the prompt (1-based ids)
+
+    Returns:
+        One entry per passage: the normalized score, or None if the model
+        did not score that passage.
+    """
+    scores: list[float | None] = [None] * count
+
+    def _assign(passage_id: Any, value: Any) -> None:
+        try:
+            idx = int(passage_id) - 1
+            score = float(value)
+        except (TypeError, ValueError):
+            return
+        if 0 <= idx < count:
+            scores[idx] = _normalize_score(score)
+
+    for start_char, end_char in (("{", "}"), ("[", "]")):
+        start, end = text.find(start_char), text.rfind(end_char)
+        if start == -1 or end <= start:
+            continue
+        try:
+            parsed = json.loads(text[start : end + 1])
+        except ValueError:
+            continue
+        if isinstance(parsed, dict):
+            for key, value in parsed.items():
+                _assign(key, value)
+        elif isinstance(parsed, list):
+            for position, item in enumerate(parsed, start=1):
+                if isinstance(item, dict):
+                    _assign(item.get("id", item.get("passage", position)), item.get("score"))
+                else:
+                    _assign(position, item)
+        if any(score is not None for score in scores):
+            return scores
+
+    for match in _LISTWISE_LINE_RE.finditer(text):
+        _assign(match.group(1), match.group(2))
+    return scores
+
+
 class CrossEncoderReranker:
     """Rerank search results using LLM-based relevance scoring."""
 
+    uses_embeddings: ClassVar[bool] = False
+
     def __init__(
         self,
         llm_client: LLMClient,
         *,
         model: str | None = None,
+        mode: RerankMode = RerankMode.POINTWISE,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        latency_budget_s: float | None = None,
     ) -> None:
         """Initialize reranker.
 
         Args:
             llm_client: LLM client for scoring
             model: Optional model override (defaults to LLMClient's default)
+            mode: POINTWISE (one call per chunk) or LISTWISE (one call per batch)
+            max_concurrency: Maximum number of batches scored in parallel
+            latency_budget_s: Upper bound on scoring time per rerank() call;
+                None waits for every batch
         """
         self._llm = llm_client
         self._model = model
+        self._mode = RerankMode(mode)
+        self._max_concurrency = max(1, max_concurrency)
+        self._latency_budget_s = latency_budget_s
 
     async def rerank(
         self,
@@ -85,6 +243,8 @@ class CrossEncoderReranker:
         query: str,
         results: list[Any],  # List of SearchResult-like objects
         top_k: int | None = None,
+        query_embedding: Sequence[float] | None = None,
+        result_embeddings: Mapping[Any, Sequence[float]] | None = None,
     ) -> list[RankedResult]:
         """Rerank search results by LLM relevance scoring.
 
@@ -92,6 +252,8 @@ class CrossEncoderReranker:
             query: Original user query
             results: List of SearchResult objects from retrieval
             top_k: Number of results to return after reranking (default: all)
+            query_embedding: Unused (RerankerBackend interface)
+            result_embeddings: Unused (RerankerBackend interface)
 
         Returns:
             List of RankedResult objects sorted by relevance_score (highest first)
@@ -108,34 +270,34 @@ class CrossEncoderReranker:
             top_k=effective_top_k,
         )
 
-        # Score all results in batches
-        scored_results: list[RankedResult] = []
-
-        for batch_start in range(0, len(results), _RERANK_BATCH_SIZE):
-            batch = results[batch_start : batch_start + _RERANK_BATCH_SIZE]
-            batch_scores = await self._score_batch(query=query, results=batch)
+        # Score all batches concurrently (bounded), within the latency budget
+        batch_size = (
+            _LISTWISE_BATCH_SIZE if self._mode == RerankMode.LISTWISE else _RERANK_BATCH_SIZE
+        )
+        batches = [
+            results[batch_start : batch_start + batch_size]
+            for batch_start in range(0, len(results), batch_size)
+        ]
+        batch_scores = await self._score_batches(query=query, batches=batches)
 
-            for result, score in zip(batch, batch_scores):
+        scored_results: list[RankedResult] = []
+        for batch, scores in zip(batches, batch_scores):
+            for result, score in zip(batch, scores or [None] * len(batch)):
                 scored_results.append(
                     RankedResult(
                         chunk_id=result.chunk_id,
                         document_id=result.document_id,
-                        relevance_score=score,
+                        relevance_score=_NEUTRAL_SCORE if score is None else score,
                         original_score=result.score,
                         content=result.content,
                         chunk_index=result.chunk_index,
                         metadata=result.metadata,
                         source=result.source,
                         document_version=result.document_version,
+                        reranked=score is not None,
                     )
                 )
 
-            log.debug(
-                "reranker.batch_complete",
-                batch_start=batch_start,
-                batch_size=len(batch),
-            )
-
         # Sort by LLM relevance score (descending)
         scored_results.sort(key=lambda x: x.relevance_score, reverse=True)
 
@@ -146,10 +308,66 @@ class CrossEncoderReranker:
             "reranker.complete",
             input_count=len(results),
             output_count=len(final_results),
+            mode=self._mode,
+            batches=len(batches),
+            unscored=sum(1 for r in scored_results if not r.reranked),
         )
 
         return final_results
 
+    async def _score_batches(
+        self,
+        *,
+        query: str,
+        batches: list[list[Any]],
+    ) -> list[list[float] | None]:
+        """Score batches concurrently under a semaphore and the latency budget.
+
+        Returns:
+            One entry per batch: its scores, or None if the batch did not
+            finish within the latency budget.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _run(batch: list[Any]) -> list[float]:
+            async with semaphore:
+                start = time.perf_counter()
+                if self._mode == RerankMode.LISTWISE:
+                    scores = await self._score_batch_listwise(query=query, results=batch)
+                else:
+                    scores = await self._score_batch(query=query, results=batch)
+                log.debug(
+                    "reranker.batch_complete",
+                    batch_size=len(batch),
+                    latency_ms=round((time.perf_counter() - start) * 1000, 1),
+                )
+                return scores
+
+        tasks = [asyncio.create_task(_run(batch)) for batch in batches]
+        _, pending = await asyncio.wait(tasks, timeout=self._latency_budget_s)
+
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            log.warning(
+                "reranker.latency_budget_exceeded",
+                budget_s=self._latency_budget_s,
+                pending_batches=len(pending),
+                total_batches=len(tasks),
+            )
+
+        batch_scores: list[list[float] | None] = []
+        for task in tasks:
+            if task in pending:
+                batch_scores.append(None)
+            elif task.exception() is not None:
+                log.warning("reranker.batch_failed", error=str(task.exception()))
+                batch_scores.append(None)
+            else:
+                batch_scores.append(task.result())
+        return batch_scores
+
     async def _score_batch(
         self,
         *,
@@ -204,6 +422,54 @@ class CrossEncoderReranker:
 
         return scores
 
+    async def _score_batch_listwise(
+        self,
+        *,
+        query: str,
+        results: list[Any],
+    ) -> list[float]:
+        """Score a batch of results with a single listwise LLM completion.
+
+        Args:
+            query: User query
+            results: Batch of SearchResult objects
+
+        Returns:
+            List of scores (0.0 - 1.0), one per result
+        """
+        passages = "\n\n".join(
+            f"[{position}] {result.content[:_LISTWISE_CHUNK_CHARS]}"
+            for position, result in enumerate(results, start=1)
+        )
+        prompt = _LISTWISE_PROMPT_TEMPLATE.format(
+            count=len(results),
+            query=query,
+            passages=passages,
+        )
+
+        try:
+            response = await self._llm.complete(
+                messages=[{"role": "user", "content": prompt}],
+                model=self._model,
+                temperature=0.0,  # Deterministic scoring
+                max_tokens=16 + 8 * len(results),  # ~'"12": 10, ' per passage
+            )
+            text = self._llm.extract_text(response)
+        except Exception as exc:
+            log.warning("reranker.listwise_score_failed", error=str(exc))
+            return [_NEUTRAL_SCORE] * len(results)
+
+        parsed = parse_listwise_scores(text, len(results))
+        missing = sum(1 for score in parsed if score is None)
+        if missing:
+            log.warning(
+                "reranker.listwise_parse_incomplete",
+                missing=missing,
+                batch_size=len(results),
+                text=text[:200],
+            )
+        return [_NEUTRAL_SCORE if score is None else score for score in parsed]
+
 
 async def reranker_from_context(llm_client: LLMClient) -> CrossEncoderReranker:
     """Factory for CrossEncoderReranker - used by tool gateway."""
@@ -4,8 +4,13 @@ Given a user query:
 1. Embed the query using the same model as ingestion
    (checks embedding cache first to avoid redundant LLM calls)
 2. Perform pgvector cosine similarity search, filtered by tenant_id
+   (ANN index with tenant-aware over-fetch, see src/rag/vector_index.py)
 3. Return top-K chunks with their source document metadata
 
+Enhanced retrieval reranks hybrid-search candidates with the tenant's
+reranker backend: the LLM reranker (default) or the local CPU scorer,
+selected by TenantSettings.custom_model_config["reranker_backend"].
+
 Tenant isolation is enforced at the database level: every similarity search
 includes WHERE tenant_id = :tenant_id. It is impossible to retrieve chunks
 belonging to another tenant through this interface.
@@ -13,20 +18,35 @@ belonging to another tenant through this interface.
 
 from __future__ import annotations
 
+import time
 import uuid
-from typing import Any
+from collections.abc import Callable, Sequence
+from enum import StrEnum
+from typing import Any, TypeVar
 
 import structlog
-from sqlalchemy import text
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agent.llm import LLMClient
 from src.config import Settings
+from src.models.document import DocumentChunk
+from src.models.tenant_settings import TenantSettings
 from src.rag.hybrid_search import HybridSearchEngine
-from src.rag.reranker import CrossEncoderReranker
+from src.rag.local_reranker import LocalReranker
+from src.rag.reranker import (
+    CrossEncoderReranker,
+    RankedResult,
+    RerankBackend,
+    RerankerBackend,
+    RerankMode,
+)
+from src.rag.vector_index import execute_ann_query
 
 log = structlog.get_logger(__name__)
 
+_E = TypeVar("_E", bound=StrEnum)
+
 # Lazy import to avoid circular dependencies; EmbeddingCache is injected at
 # runtime, not imported at module level.
 try:
@@ -34,6 +54,11 @@ try:
 except ImportError:
     _EmbeddingCache = None  # type: ignore[assignment,misc]
 
+# Per-tenant reranker backend choice, cached briefly so enhanced retrieval
+# does not read tenant_settings on every query.
+_BACKEND_CACHE_TTL_S = 60.0
+_tenant_backend_cache: dict[uuid.UUID, tuple[float, RerankBackend]] = {}
+
 
 class RetrievalService:
     """Semantic retrieval with mandatory tenant isolation."""
@@ -44,15 +69,40 @@ class RetrievalService:
         settings: Settings,
         llm_client: LLMClient,
         embedding_cache: Any | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
     ) -> None:
         self._db = db
         self._settings = settings
         self._llm = llm_client
         # Optional embedding cache to avoid re-computing query embeddings
         self._embedding_cache = embedding_cache
-        # Enhanced retrieval with hybrid search + reranking
-        self._hybrid_search = HybridSearchEngine(db=db, settings=settings, llm_client=llm_client)
-        self._reranker = CrossEncoderReranker()
+        # Vector of the last query embedded, for callers that reuse it
+        # (e.g. the runtime's semantic response cache)
+        self.query_embedding: list[float] | None = None
+        # Enhanced retrieval with hybrid search + reranking.
+        # A session factory lets the hybrid legs run concurrently.
+        self._hybrid_search = HybridSearchEngine(
+            db=db,
+            settings=settings,
+            llm_client=llm_client,
+            session_factory=session_factory,
+        )
+        latency_budget_ms = getattr(settings, "rerank_latency_budget_ms", None)
+        self._rerankers: dict[RerankBackend, RerankerBackend] = {
+            RerankBackend.LLM: CrossEncoderReranker(
+                llm_client=llm_client,
+                mode=_enum_setting(settings, "rerank_mode", RerankMode.LISTWISE),
+                max_concurrency=int(getattr(settings, "rerank_max_concurrency", 4)),
+                latency_budget_s=latency_budget_ms / 1000 if latency_budget_ms else None,
+            ),
+            RerankBackend.LOCAL: LocalReranker(
+                lexical_weight=float(getattr(settings, "local_rerank_lexical_weight", 0.4)),
+                semantic_weight=float(getattr(settings, "local_rerank_semantic_weight", 0.6)),
+            ),
+        }
+        self._default_rerank_backend = _enum_setting(
+            settings, "reranker_backend", RerankBackend.LLM
+        )
 
     async def retrieve(
         self,
@@ -82,27 +132,7 @@ class RetrievalService:
 
         # 1. Embed the query (check embedding cache first to avoid redundant LLM calls)
         try:
-            query_embedding: list[float] | None = None
-
-            if self._embedding_cache is not None:
-                from src.cache.embedding_cache import EmbeddingCache
-                text_hash = EmbeddingCache.hash_text(query)
-                query_embedding = await self._embedding_cache.get_embedding(text_hash)
-                if query_embedding is not None:
-                    log.debug("retrieve.embedding_cache_hit", query_preview=query[:40])
-
-            if query_embedding is None:
-                embeddings = await self._llm.embed([query])
-                query_embedding = embeddings[0]
-                # Store in cache for future calls (best-effort)
-                if self._embedding_cache is not None:
-                    try:
-                        from src.cache.embedding_cache import EmbeddingCache
-                        text_hash = EmbeddingCache.hash_text(query)
-                        await self._embedding_cache.cache_embedding(text_hash, query_embedding)
-                    except Exception as cache_exc:
-                        log.debug("retrieve.embedding_cache_store_failed", error=str(cache_exc))
-
+            query_embedding = await self.embed_query(query)
         except Exception as exc:
             log.warning("retrieve.embed_failed", error=str(exc))
             return []
@@ -126,6 +156,16 @@ class RetrievalService:
             doc_filter = "AND dc.document_id = ANY(:doc_ids)"
             params["doc_ids"] = [str(did) for did in document_ids]
 
+        filtered = f"""
+            FROM document_chunks dc
+            JOIN documents d ON d.id = dc.document_id
+            WHERE
+                dc.tenant_id = :tenant_id
+                AND d.tenant_id = :tenant_id
+                AND d.status = 'ready'
+                AND dc.embedding IS NOT NULL
+                {doc_filter}
+        """
         sql = text(f"""
             SELECT
                 dc.id              AS chunk_id,
@@ -137,21 +177,25 @@ class RetrievalService:
                 d.filename         AS document_name,
                 d.version          AS document_version,
                 1 - (dc.embedding <=> CAST(:embedding AS vector)) AS similarity_score
-            FROM document_chunks dc
-            JOIN documents d ON d.id = dc.document_id
-            WHERE
-                dc.tenant_id = :tenant_id
-                AND d.tenant_id = :tenant_id
-                AND d.status = 'ready'
-                AND dc.embedding IS NOT NULL
-                {doc_filter}
+            {filtered}
             ORDER BY dc.embedding <=> CAST(:embedding AS vector)
             LIMIT :top_k
         """)
+        # Cheap (btree) check of how many rows the filter can return at all
+        count_sql = text(f"SELECT count(*) FROM (SELECT 1 {filtered} LIMIT :top_k) AS f")
 
         try:
-            result = await self._db.execute(sql, params)
-            rows = result.mappings().all()
+            # ANN index scan with tuned ef_search/probes; exact fallback when
+            # the tenant filter prunes the candidate list below top_k.
+            rows = await execute_ann_query(
+                self._db,
+                sql,
+                params,
+                settings=self._settings,
+                top_k=effective_top_k,
+                count_sql=count_sql,
+                as_mappings=True,
+            )
         except Exception as exc:
             log.error("retrieve.query_failed", error=str(exc))
             return []
@@ -190,6 +234,42 @@ class RetrievalService:
 
         return chunks
 
+    async def embed_query(self, query: str) -> list[float]:
+        """Embed a query, consulting the embedding cache first.
+
+        Computed once per turn and shared by the dense and hybrid retrieval
+        paths so the same query is never embedded twice.
+
+        The result is also kept in ``query_embedding``.
+
+        Raises:
+            Whatever LLMClient.embed raises on a cache miss.
+        """
+        query_embedding: list[float] | None = None
+
+        if self._embedding_cache is not None:
+            from src.cache.embedding_cache import EmbeddingCache
+            text_hash = EmbeddingCache.hash_text(query)
+            query_embedding = await self._embedding_cache.get_embedding(text_hash)
+            if query_embedding is not None:
+                log.debug("retrieve.embedding_cache_hit", query_preview=query[:40])
+                self.query_embedding = query_embedding
+                return query_embedding
+
+        embeddings = await self._llm.embed([query])
+        query_embedding = embeddings[0]
+        self.query_embedding = query_embedding
+        # Store in cache for future calls (best-effort)
+        if self._embedding_cache is not None:
+            try:
+                from src.cache.embedding_cache import EmbeddingCache
+                text_hash = EmbeddingCache.hash_text(query)
+                await self._embedding_cache.cache_embedding(text_hash, query_embedding)
+            except Exception as cache_exc:
+                log.debug("retrieve.embedding_cache_store_failed", error=str(cache_exc))
+
+        return query_embedding
+
     async def _apply_feedback_weights(
         self,
         *,
@@ -266,6 +346,14 @@ class RetrievalService:
             )
 
         try:
+            # Embed once (cache-aware) and hand the vector to the semantic leg.
+            # On failure the semantic leg embeds on its own as a last resort.
+            query_embedding: list[float] | None = None
+            try:
+                query_embedding = await self.embed_query(query)
+            except Exception as exc:
+                log.warning("retrieve.enhanced_embed_failed", error=str(exc))
+
             # Stage 1: Hybrid search (semantic + BM25)
             # Retrieve more candidates than needed for reranking
             candidate_multiplier = 3
@@ -274,17 +362,32 @@ class RetrievalService:
                 tenant_id=tenant_id,
                 top_k=effective_top_k * candidate_multiplier,
                 document_ids=document_ids,
+                query_embedding=query_embedding,
             )
 
             if not hybrid_results:
                 return []
 
-            # Stage 2: Cross-encoder reranking
-            reranked_results = await self._reranker.rerank(
+            # Stage 2: Rerank with the tenant's backend (LLM: batched, partial
+            # scores if the latency budget expires; local: CPU only)
+            backend = await self._rerank_backend_for(tenant_id)
+            reranker = self._rerankers[backend]
+            result_embeddings: dict[Any, Sequence[float]] | None = None
+            if reranker.uses_embeddings and query_embedding is not None:
+                result_embeddings = await self._load_chunk_embeddings(
+                    chunk_ids=[r.chunk_id for r in hybrid_results],
+                    tenant_id=tenant_id,
+                )
+            rerank_start = time.perf_counter()
+            ranked = await reranker.rerank(
                 query=query,
-                chunks=hybrid_results,
+                results=hybrid_results,
                 top_k=effective_top_k,
+                query_embedding=query_embedding,
+                result_embeddings=result_embeddings,
             )
+            rerank_ms = (time.perf_counter() - rerank_start) * 1000
+            reranked_results = [_ranked_to_chunk(r) for r in ranked]
 
             log.debug(
                 "retrieve.enhanced_complete",
@@ -292,6 +395,9 @@ class RetrievalService:
                 tenant_id=str(tenant_id),
                 candidates=len(hybrid_results),
                 final_count=len(reranked_results),
+                rerank_backend=backend,
+                rerank_ms=round(rerank_ms, 2),
+                search_timings=self._hybrid_search.last_timings.to_dict(),
             )
 
             return reranked_results
@@ -310,11 +416,110 @@ class RetrievalService:
                 document_ids=document_ids,
             )
 
+    async def _rerank_backend_for(self, tenant_id: uuid.UUID) -> RerankBackend:
+        """Resolve the tenant's reranker backend (fail-open to the default).
+
+        Read from TenantSettings.custom_model_config["reranker_backend"];
+        tenants without an override use settings.reranker_backend. The lookup
+        runs in a savepoint so a failure does not abort the request's
+        transaction.
+        """
+        now = time.monotonic()
+        cached = _tenant_backend_cache.get(tenant_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        backend = self._default_rerank_backend
+        try:
+            async with self._db.begin_nested():
+                result = await self._db.execute(
+                    select(TenantSettings.custom_model_config).where(
+                        TenantSettings.tenant_id == tenant_id
+                    )
+                )
+            config = result.scalar_one_or_none()
+            override = config.get("reranker_backend") if isinstance(config, dict) else None
+            if override:
+                backend = RerankBackend(override)
+        except ValueError:
+            log.warning(
+                "retrieve.invalid_reranker_backend",
+                tenant_id=str(tenant_id),
+                default=self._default_rerank_backend,
+            )
+        except Exception as exc:
+            log.warning(
+                "retrieve.reranker_backend_lookup_failed",
+                tenant_id=str(tenant_id),
+                error=str(exc),
+            )
+            return backend
+
+        _tenant_backend_cache[tenant_id] = (now + _BACKEND_CACHE_TTL_S, backend)
+        return backend
+
+    async def _load_chunk_embeddings(
+        self,
+        *,
+        chunk_ids: list[uuid.UUID],
+        tenant_id: uuid.UUID,
+    ) -> dict[Any, Sequence[float]]:
+        """Load stored embeddings for reranking candidates (tenant-scoped).
+
+        Returns an empty mapping on failure; the local reranker then scores
+        lexically only.
+        """
+        try:
+            result = await self._db.execute(
+                select(DocumentChunk.id, DocumentChunk.embedding).where(
+                    DocumentChunk.tenant_id == tenant_id,
+                    DocumentChunk.id.in_(chunk_ids),
+                )
+            )
+            return {
+                chunk_id: embedding
+                for chunk_id, embedding in result.all()
+                if embedding is not None
+            }
+        except Exception as exc:
+            log.warning("retrieve.chunk_embeddings_failed", error=str(exc))
+            return {}
+
+
+def _enum_setting(settings: Settings, name: str, default: _E) -> _E:
+    """Read an enum-valued setting, falling back to ``default`` if invalid."""
+    value = getattr(settings, name, default)
+    try:
+        return type(default)(value)
+    except ValueError:
+        log.warning("retrieve.invalid_setting", setting=name, value=str(value))
+        return default
+
+
+def _ranked_to_chunk(result: RankedResult) -> dict[str, Any]:
+    """Convert a RankedResult to the chunk dict shape returned by retrieve()."""
+    return {
+        "chunk_id": str(result.chunk_id),
+        "document_id": str(result.document_id),
+        "document_name": result.source,
+        "document_version": result.document_version,
+        "chunk_index": result.chunk_index,
+        "content": result.content,
+        "similarity_score": float(result.relevance_score),
+        "metadata": dict(result.metadata) if result.metadata else {},
+    }
+
 
 async def retrieval_service_from_context(
     db: AsyncSession,
     settings: Settings,
     llm_client: LLMClient,
+    session_factory: Callable[[], AsyncSession] | None = None,
 ) -> RetrievalService:
     """Factory for RetrievalService - used by tool gateway."""
-    return RetrievalService(db=db, settings=settings, llm_client=llm_client)
+    return RetrievalService(
+        db=db,
+        settings=settings,
+        llm_client=llm_client,
+        session_factory=session_factory,
+    )
@@ -0,0 +1,445 @@
+"""Approximate-nearest-neighbour (ANN) index management for document_chunks.
+
+Without a vector index every similarity query is an exact scan over all of
+the tenant's chunks. This module owns the pgvector ANN index on
+document_chunks.embedding:
+
+1. Index build: HNSW (preferred) or IVFFlat (fallback for pgvector builds
+   without HNSW), always CREATE INDEX CONCURRENTLY so ingestion keeps
+   running while the index is built.
+2. Query tuning: per-query hnsw.ef_search / ivfflat.probes via SET LOCAL
+   (set_config(..., true)), driven by settings.
+3. Tenant-filtered search: the index is shared by all tenants and pgvector
+   applies the tenant_id WHERE clause *after* collecting ef_search
+   candidates, so a small tenant can get back fewer than top_k rows. The
+   candidate list is over-fetched (top_k * overfetch_factor) and, if the
+   filter still prunes below top_k, the query is re-run as an exact scan
+   inside a savepoint, so disabling index scans never outlives it.
+4. Quality: recall@k of the ANN path against exact search on a sample of
+   the tenant's own chunk embeddings.
+
+Settings (all optional, read with getattr so defaults apply when unset):
+    VECTOR_INDEX_METHOD      hnsw | ivfflat              (default: hnsw)
+    HNSW_M                   graph degree                (default: 16)
+    HNSW_EF_CONSTRUCTION     build-time candidate list   (default: 64)
+    HNSW_EF_SEARCH           query-time candidate list   (default: 40)
+    IVFFLAT_LISTS            0 = derive from row count   (default: 0)
+    IVFFLAT_PROBES           lists probed per query      (default: 10)
+    VECTOR_OVERFETCH_FACTOR  candidates per result       (default: 4)
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+import structlog
+from sqlalchemy import TextClause, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+log = structlog.get_logger(__name__)
+
+_TABLE = "document_chunks"
+_HNSW_INDEX = "ix_chunks_embedding_hnsw"
+_IVFFLAT_INDEX = "ix_chunks_embedding_ivfflat"
+_HNSW_MAX_EF_SEARCH = 1000  # pgvector upper bound for hnsw.ef_search
+_IVFFLAT_MIN_LISTS = 10
+_IVFFLAT_MAX_LISTS = 4000
+
+
+class IndexMethod(StrEnum):
+    HNSW = "hnsw"
+    IVFFLAT = "ivfflat"
+
+
+@dataclass(frozen=True)
+class VectorSearchTuning:
+    """Index build and query-time parameters, resolved from settings."""
+
+    method: IndexMethod = IndexMethod.HNSW
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    hnsw_ef_search: int = 40
+    ivfflat_lists: int = 0
+    ivfflat_probes: int = 10
+    overfetch_factor: int = 4
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> VectorSearchTuning:
+        defaults = cls()
+        return cls(
+            method=IndexMethod(getattr(settings, "vector_index_method", defaults.method)),
+            hnsw_m=int(getattr(settings, "hnsw_m", defaults.hnsw_m)),
+            hnsw_ef_construction=int(
+                getattr(settings, "hnsw_ef_construction", defaults.hnsw_ef_construction)
+            ),
+            hnsw_ef_search=int(getattr(settings, "hnsw_ef_search", defaults.hnsw_ef_search)),
+            ivfflat_lists=int(getattr(settings, "ivfflat_lists", defaults.ivfflat_lists)),
+            ivfflat_probes=int(getattr(settings, "ivfflat_probes", defaults.ivfflat_probes)),
+            overfetch_factor=max(
+                1, int(getattr(settings, "vector_overfetch_factor", defaults.overfetch_factor))
+            ),
+        )
+
+    def ef_search_for(self, top_k: int) -> int:
+        """Candidate-list size for a tenant-filtered query returning top_k rows."""
+        return min(_HNSW_MAX_EF_SEARCH, max(self.hnsw_ef_search, top_k * self.overfetch_factor))
+
+
+@dataclass
+class IndexStatus:
+    """State of one ANN index on document_chunks."""
+
+    name: str
+    method: str
+    is_valid: bool
+    size_bytes: int
+    definition: str
+
+
+@dataclass
+class RecallReport:
+    """recall@k of ANN search against exact search for one tenant."""
+
+    tenant_id: uuid.UUID
+    k: int
+    sample_size: int
+    recall_at_k: float
+    ann_latency_ms: float
+    exact_latency_ms: float
+    per_query_recall: list[float] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tenant_id": str(self.tenant_id),
+            "k": self.k,
+            "sample_size": self.sample_size,
+            "recall_at_k": round(self.recall_at_k, 4),
+            "ann_latency_ms": round(self.ann_latency_ms, 2),
+            "exact_latency_ms": round(self.exact_latency_ms, 2),
+        }
+
+
+# ------------------------------------------------------------------ #
+# Query-time helpers
+# ------------------------------------------------------------------ #
+
+
+async def apply_search_params(
+    db: AsyncSession | AsyncConnection,
+    tuning: VectorSearchTuning,
+    *,
+    top_k: int,
+) -> None:
+    """Set transaction-local ANN parameters for the next vector query.
+
+    set_config(..., is_local => true) is the bind-parameter-friendly form of
+    SET LOCAL; the value reverts when the surrounding transaction ends, so
+    pooled connections never leak tuning into other requests.
+    """
+    if tuning.method == IndexMethod.HNSW:
+        await db.execute(
+            text("SELECT set_config('hnsw.ef_search', :value, true)"),
+            {"value": str(tuning.ef_search_for(top_k))},
+        )
+    else:
+        await db.execute(
+            text("SELECT set_config('ivfflat.probes', :value, true)"),
+            {"value": str(tuning.ivfflat_probes)},
+        )
+
+
+async def _disable_index_scans(db: AsyncSession | AsyncConnection) -> None:
+    """Force the planner off the ANN index for the rest of the transaction.
+
+    Only call this inside a savepoint that is rolled back afterwards.
+
+    Bitmap scans stay enabled, so the tenant_id btree index is still used to
+    narrow the exact scan to the tenant's own rows.
+    """
+    await db.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+
+
+async def execute_ann_query(
+    db: AsyncSession,
+    sql: TextClause,
+    params: dict[str, Any],
+    *,
+    settings: Any,
+    top_k: int,
+    count_sql: TextClause | None = None,
+    as_mappings: bool = False,
+) -> Sequence[Any]:
+    """Run a tenant-filtered vector query through the ANN index.
+
+    The query must ORDER BY the pgvector distance and LIMIT to top_k. When
+    the tenant filter leaves fewer than top_k rows out of the over-fetched
+    candidate list, the query is repeated as an exact scan so callers never
+    silently receive a truncated result.
+
+    The exact scan runs inside a SAVEPOINT that is rolled back afterwards:
+    ROLLBACK TO SAVEPOINT reverts the SET LOCAL of enable_indexscan, so the
+    rest of the caller's transaction keeps using the ANN index.
+
+    Args:
+        count_sql: Optional ``SELECT count(*)`` over the same filter (capped
+            at top_k). When the filter matches no more rows than the ANN
+            query returned, nothing was pruned and the exact scan is skipped.
+        as_mappings: Return dict-like RowMappings instead of Row tuples.
+
+    Returns:
+        The result rows.
+    """
+
+    def _rows(result: Any) -> Sequence[Any]:
+        return result.mappings().all() if as_mappings else result.all()
+
+    tuning = VectorSearchTuning.from_settings(settings)
+    await apply_search_params(db, tuning, top_k=top_k)
+    rows = _rows(await db.execute(sql, params))
+
+    if len(rows) >= top_k:
+        return rows
+
+    if count_sql is not None:
+        available = (await db.execute(count_sql, params)).scalar() or 0
+        if available <= len(rows):
+            # The tenant simply has fewer than top_k matching chunks
+            return rows
+
+    # The filter pruned the candidate list: fall back to exact.
+    log.debug(
+        "vector_index.exact_fallback",
+        returned=len(rows),
+        top_k=top_k,
+        method=tuning.method,
+        ef_search=tuning.ef_search_for(top_k),
+    )
+    async with db.begin_nested() as savepoint:
+        await _disable_index_scans(db)
+        rows = _rows(await db.execute(sql, params))
+        await savepoint.rollback()
+    return rows
+
+
+# ------------------------------------------------------------------ #
+# Index management
+# ------------------------------------------------------------------ #
+
+
+class VectorIndexManager:
+    """Build, inspect and evaluate the ANN index on document_chunks.embedding.
+
+    DDL runs on an AUTOCOMMIT connection because CREATE/DROP INDEX
+    CONCURRENTLY cannot run inside a transaction block.
+    """
+
+    def __init__(self, engine: AsyncEngine, settings: Any) -> None:
+        self._engine = engine
+        self._settings = settings
+        self._tuning = VectorSearchTuning.from_settings(settings)
+
+    @property
+    def tuning(self) -> VectorSearchTuning:
+        return self._tuning
+
+    async def ensure_index(self, method: IndexMethod | None = None) -> IndexStatus | None:
+        """Create the ANN index if no valid one exists.
+
+        Tries the configured method first (HNSW by default); if that fails
+        (e.g. pgvector < 0.5.0 has no HNSW) it falls back to IVFFlat. An
+        INVALID index left behind by an interrupted concurrent build is
+        dropped and rebuilt.
+
+        Returns:
+            Status of the valid index, or None if no index could be built.
+        """
+        for existing in await self.index_status():
+            if existing.is_valid:
+                log.info("vector_index.exists", name=existing.name, method=existing.method)
+                return existing
+            log.warning("vector_index.invalid_dropping", name=existing.name)
+            await self.drop_index(existing.name)
+
+        preferred = method or self._tuning.method
+        order = [preferred] + [m for m in IndexMethod if m != preferred]
+        for candidate in order:
+            try:
+                await self._create_index(candidate)
+            except Exception as exc:
+                log.warning("vector_index.create_failed", method=candidate, error=str(exc))
+                await self.drop_index(_index_name(candidate))
+                continue
+            for status in await self.index_status():
+                if status.is_valid:
+                    return status
+
+        log.error("vector_index.unavailable")
+        return None
+
+    async def _create_index(self, method: IndexMethod) -> None:
+        if method == IndexMethod.HNSW:
+            ddl = (
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {_HNSW_INDEX} "
+                f"ON {_TABLE} USING hnsw (embedding vector_cosine_ops) "
+                f"WITH (m = {int(self._tuning.hnsw_m)}, "
+                f"ef_construction = {int(self._tuning.hnsw_ef_construction)})"
+            )
+        else:
+            lists = self._tuning.ivfflat_lists or await self._derive_ivfflat_lists()
+            ddl = (
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {_IVFFLAT_INDEX} "
+                f"ON {_TABLE} USING ivfflat (embedding vector_cosine_ops) "
+                f"WITH (lists = {int(lists)})"
+            )
+
+        start = time.perf_counter()
+        log.info("vector_index.create_start", method=method)
+        async with self._autocommit() as conn:
+            await conn.execute(text(ddl))
+        log.info(
+            "vector_index.create_complete",
+            method=method,
+            duration_s=round(time.perf_counter() - start, 1),
+        )
+
+    async def _derive_ivfflat_lists(self) -> int:
+        """pgvector guidance: rows / 1000 up to 1M rows, sqrt(rows) beyond."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                text(f"SELECT count(*) FROM {_TABLE} WHERE embedding IS NOT NULL")
+            )
+            rows = int(result.scalar() or 0)
+        lists = rows // 1000 if rows <= 1_000_000 else int(math.sqrt(rows))
+        return max(_IVFFLAT_MIN_LISTS, min(_IVFFLAT_MAX_LISTS, lists))
+
+    async def drop_index(self, name: str) -> None:
+        """Drop an ANN index (concurrently) if it exists."""
+        if name not in (_HNSW_INDEX, _IVFFLAT_INDEX):
+            raise ValueError(f"Not a managed vector index: {name}")
+        async with self._autocommit() as conn:
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+    async def index_status(self) -> list[IndexStatus]:
+        """Return the managed ANN indexes on document_chunks and their validity."""
+        sql = text(
+            """
+            SELECT
+                c.relname                       AS name,
+                am.amname                       AS method,
+                i.indisvalid                    AS is_valid,
+                pg_relation_size(c.oid)         AS size_bytes,
+                pg_get_indexdef(c.oid)          AS definition
+            FROM pg_index i
+            JOIN pg_class c  ON c.oid = i.indexrelid
+            JOIN pg_class t  ON t.oid = i.indrelid
+            JOIN pg_am am    ON am.oid = c.relam
+            WHERE t.relname = :table
+              AND c.relname IN (:hnsw, :ivfflat)
+            """
+        )
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                sql, {"table": _TABLE, "hnsw": _HNSW_INDEX, "ivfflat": _IVFFLAT_INDEX}
+            )
+            rows = result.all()
+        return [
+            IndexStatus(
+                name=row.name,
+                method=row.method,
+                is_valid=bool(row.is_valid),
+                size_bytes=int(row.size_bytes),
+                definition=row.definition,
+            )
+            for row in rows
+        ]
+
+    async def measure_recall(
+        self,
+        *,
+        tenant_id: uuid.UUID,
+        k: int = 10,
+        sample_size: int = 50,
+    ) -> RecallReport:
+        """Estimate recall@k of tenant-filtered ANN search against exact search.
+
+        Query vectors are a random sample of the tenant's own chunk
+        embeddings, which mirrors the real query distribution closely enough
+        to tune ef_search/probes and the over-fetch factor.
+        """
+        search_sql = text(
+            f"""
+            SELECT dc.id
+            FROM {_TABLE} dc
+            WHERE dc.tenant_id = :tenant_id AND dc.embedding IS NOT NULL
+            ORDER BY dc.embedding <=> CAST(:embedding AS vector)
+            LIMIT :k
+            """
+        )
+
+        async with self._engine.connect() as conn:
+            sample = await conn.execute(
+                text(
+                    f"""
+                    SELECT embedding::text AS embedding
+                    FROM {_TABLE}
+                    WHERE tenant_id = :tenant_id AND embedding IS NOT NULL
+                    ORDER BY random()
+                    LIMIT :n
+                    """
+                ),
+                {"tenant_id": tenant_id, "n": sample_size},
+            )
+            query_vectors = [row.embedding for row in sample.all()]
+
+        per_query: list[float] = []
+        ann_ms = 0.0
+        exact_ms = 0.0
+        for vector in query_vectors:
+            params = {"tenant_id": tenant_id, "embedding": vector, "k": k}
+
+            async with self._engine.connect() as conn, conn.begin():
+                await apply_search_params(conn, self._tuning, top_k=k)
+                start = time.perf_counter()
+                ann_ids = {row.id for row in (await conn.execute(search_sql, params)).all()}
+                ann_ms += (time.perf_counter() - start) * 1000
+
+            async with self._engine.connect() as conn, conn.begin():
+                await _disable_index_scans(conn)
+                start = time.perf_counter()
+                exact_ids = {row.id for row in (await conn.execute(search_sql, params)).all()}
+                exact_ms += (time.perf_counter() - start) * 1000
+
+            per_query.append(recall_at_k(ann_ids, exact_ids))
+
+        n = len(per_query)
+        report = RecallReport(
+            tenant_id=tenant_id,
+            k=k,
+            sample_size=n,
+            recall_at_k=sum(per_query) / n if n else 1.0,
+            ann_latency_ms=ann_ms / n if n else 0.0,
+            exact_latency_ms=exact_ms / n if n else 0.0,
+            per_query_recall=per_query,
+        )
+        log.info("vector_index.recall_measured", **report.to_dict())
+        return report
+
+    def _autocommit(self) -> Any:
+        return self._engine.execution_options(isolation_level="AUTOCOMMIT").connect()
+
+
+def recall_at_k(ann_ids: set[Any], exact_ids: set[Any]) -> float:
+    """Fraction of the exact top-k that the ANN search also returned."""
+    if not exact_ids:
+        return 1.0
+    return len(ann_ids & exact_ids) / len(exact_ids)
+
+
+def _index_name(method: IndexMethod) -> str:
+    return _HNSW_INDEX if method == IndexMethod.HNSW else _IVFFLAT_INDEX
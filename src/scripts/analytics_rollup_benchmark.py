@@ -0,0 +1,286 @@
+"""Benchmark dashboard analytics queries: raw metrics vs usage rollups.
+
+Creates throwaway tenants, generates ``--rows`` synthetic usage_metrics rows
+server-side (generate_series, committed in batches) spread over ``--days``
+days up to the current hour, builds the hourly/daily rollups with
+AnalyticsRollupJob and times every AnalyticsService dashboard query for one
+tenant three ways:
+
+- ``raw``: AnalyticsService(use_rollups=False), aggregating raw rows in SQL
+- ``rollup``: AnalyticsService() reading rollups plus raw rows past the
+  hourly watermark
+- ``python`` (``--python-baseline``): the previous implementation of
+  get_token_usage_by_model, loading every row and aggregating in Python
+
+The synthetic tenants (and, by cascade, their metrics and rollups) are
+deleted afterwards unless ``--keep``.
+
+Usage:
+    python -m src.scripts.analytics_rollup_benchmark [--rows 10000000] [--tenants 10]
+        [--days 30] [--users 500] [--batch-size 1000000] [--repeat 3]
+        [--python-baseline] [--keep]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+import structlog
+from sqlalchemy import bindparam, delete, func, select, text
+from sqlalchemy.dialects import postgresql
+
+from src.services.analytics_rollup import AnalyticsRollupJob, floor_hour
+
+log = structlog.get_logger(__name__)
+
+# Half API calls, 30% token usage, 10% agent runs, 10% tool calls
+_INSERT_METRICS = text(
+    """
+    INSERT INTO usage_metrics (id, tenant_id, metric_type, value, dimensions, timestamp, created_at)
+    SELECT
+        gen_random_uuid(),
+        (CAST(:tenant_ids AS uuid[]))[1 + i % cardinality(CAST(:tenant_ids AS uuid[]))],
+        kind::metric_type,
+        CASE WHEN kind = 'token_usage' THEN 100 + i % 2000 ELSE 1 END,
+        CASE kind
+            WHEN 'api_call' THEN jsonb_build_object(
+                'endpoint', '/api/v1/chat',
+                'method', 'POST',
+                'status_code', CASE WHEN i % 50 = 0 THEN 500 ELSE 200 END,
+                'response_time_ms', 50 + i % 900,
+                'user_id', user_id)
+            WHEN 'token_usage' THEN jsonb_build_object(
+                'model', (ARRAY['gpt-4o', 'gpt-4o-mini', 'qwen2.5:7b', 'qwen2.5:32b'])[1 + i % 4],
+                'prompt_tokens', 60 + i % 1500,
+                'completion_tokens', 40 + i % 500,
+                'cost', (100 + i % 2000) * 0.000002,
+                'user_id', user_id)
+            WHEN 'agent_run' THEN jsonb_build_object(
+                'agent_id', 'agent-' || i % 8,
+                'duration_ms', 200 + i % 5000,
+                'steps', 1 + i % 6,
+                'status', CASE WHEN i % 7 = 0 THEN 'error' ELSE 'success' END,
+                'user_id', user_id)
+            ELSE jsonb_build_object(
+                'tool_name', 'sap_inventory',
+                'duration_ms', 20 + i % 300,
+                'success', i % 11 <> 0)
+        END,
+        ts,
+        ts
+    FROM (
+        SELECT
+            i,
+            CASE
+                WHEN i % 10 < 5 THEN 'api_call'
+                WHEN i % 10 < 8 THEN 'token_usage'
+                WHEN i % 10 = 8 THEN 'agent_run'
+                ELSE 'tool_call'
+            END AS kind,
+            '00000000-0000-4000-8000-' || lpad((i % :users)::text, 12, '0') AS user_id,
+            CAST(:end_at AS timestamptz)
+                - make_interval(secs => (i + 1) * CAST(:span_seconds AS float8) / :rows) AS ts
+        FROM generate_series(CAST(:offset AS bigint), CAST(:offset AS bigint) + :batch - 1) AS i
+    ) AS synthetic
+    """
+).bindparams(bindparam("tenant_ids", type_=postgresql.ARRAY(postgresql.UUID(as_uuid=True))))
+
+
+async def _generate(
+    factory: Callable[[], Any],
+    tenant_ids: list[uuid.UUID],
+    args: argparse.Namespace,
+    end_at: datetime,
+) -> float:
+    """Insert the synthetic metrics; return seconds taken."""
+    start = time.perf_counter()
+    for offset in range(0, args.rows, args.batch_size):
+        batch = min(args.batch_size, args.rows - offset)
+        async with factory() as db:
+            await db.execute(
+                _INSERT_METRICS,
+                {
+                    "tenant_ids": tenant_ids,
+                    "users": args.users,
+                    "end_at": end_at,
+                    "span_seconds": args.days * 86400,
+                    "rows": args.rows,
+                    "offset": offset,
+                    "batch": batch,
+                },
+            )
+            await db.commit()
+        log.info("analytics_rollup_benchmark.generated", rows=offset + batch)
+    return time.perf_counter() - start
+
+
+async def _python_token_usage_by_model(
+    db: Any, tenant_id: uuid.UUID, date_from: date, date_to: date
+) -> list[dict[str, Any]]:
+    """The pre-rollup get_token_usage_by_model: load every row, aggregate in Python."""
+    from src.models.analytics import MetricType, UsageMetric
+
+    start_dt = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
+    end_dt = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=UTC)
+    result = await db.execute(
+        select(UsageMetric).where(
+            UsageMetric.tenant_id == tenant_id,
+            UsageMetric.metric_type == MetricType.TOKEN_USAGE,
+            UsageMetric.timestamp >= start_dt,
+            UsageMetric.timestamp <= end_dt,
+        )
+    )
+    by_model: dict[str, dict[str, Any]] = {}
+    for metric in result.scalars().all():
+        stats = by_model.setdefault(
+            metric.dimensions.get("model", "unknown"),
+            {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "api_calls": 0},
+        )
+        stats["total_tokens"] += int(metric.value)
+        stats["prompt_tokens"] += metric.dimensions.get("prompt_tokens", 0)
+        stats["completion_tokens"] += metric.dimensions.get("completion_tokens", 0)
+        stats["api_calls"] += 1
+    return [{"model": model, **stats} for model, stats in by_model.items()]
+
+
+async def _time(
+    factory: Callable[[], Any], query: Callable[[Any], Awaitable[Any]], repeat: int
+) -> float:
+    """Median seconds of ``query`` over ``repeat`` runs, each in a fresh session."""
+    timings = []
+    for _ in range(repeat):
+        async with factory() as db:
+            start = time.perf_counter()
+            await query(db)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def main(args: argparse.Namespace) -> None:
+    from src.config import get_settings
+    from src.database import close_db, get_session_factory
+    from src.database import init_db as _init_engine
+    from src.models.analytics import UsageRollup
+    from src.models.tenant import Tenant
+    from src.services.analytics import AnalyticsService
+
+    _init_engine(get_settings())
+    factory = get_session_factory()
+    suffix = uuid.uuid4().hex[:8]
+    end_at = floor_hour(datetime.now(UTC))
+    date_from = (end_at - timedelta(days=args.days)).date()
+    date_to = end_at.date()
+
+    async with factory() as db:
+        tenants = [
+            Tenant(name=f"analytics-benchmark-{suffix}-{i}", slug=f"analytics-bench-{suffix}-{i}")
+            for i in range(args.tenants)
+        ]
+        db.add_all(tenants)
+        await db.flush()
+        tenant_ids = [tenant.id for tenant in tenants]
+        await db.commit()
+
+    try:
+        generate_s = await _generate(factory, tenant_ids, args, end_at)
+
+        # Roll up everything up to the current hour; if a watermark already
+        # exists the synthetic range lies behind it and is rebuilt instead.
+        job = AnalyticsRollupJob(session_factory=factory, grace_s=0, max_hours_per_pass=24)
+        start = time.perf_counter()
+        async with factory() as db:
+            marks = await AnalyticsRollupJob.get_watermarks(db)
+        if marks:
+            await job.rebuild(end_at - timedelta(days=args.days + 1), end_at)
+        await job.run_once()
+        rollup_s = time.perf_counter() - start
+
+        async with factory() as db:
+            rollup_rows = (
+                await db.execute(
+                    select(func.count()).where(UsageRollup.tenant_id.in_(tenant_ids))
+                )
+            ).scalar()
+
+        tenant_id = tenant_ids[0]
+        queries: dict[str, Callable[[AnalyticsService], Awaitable[Any]]] = {
+            "usage_summary": lambda s: s.get_usage_summary(tenant_id, date_from, date_to),
+            "token_usage_by_model": lambda s: s.get_token_usage_by_model(
+                tenant_id, date_from, date_to
+            ),
+            "agent_performance": lambda s: s.get_agent_performance(
+                tenant_id, date_from, date_to
+            ),
+            "top_users": lambda s: s.get_top_users(tenant_id, date_from, date_to),
+            "cost_breakdown": lambda s: s.get_cost_breakdown(tenant_id, date_from, date_to),
+            "error_rate": lambda s: s.get_error_rate(tenant_id, date_from, date_to),
+        }
+        results = []
+        for name, query in queries.items():
+            raw = await _time(
+                factory,
+                lambda db, q=query: q(AnalyticsService(db, use_rollups=False)),
+                args.repeat,
+            )
+            rollup = await _time(
+                factory, lambda db, q=query: q(AnalyticsService(db)), args.repeat
+            )
+            entry: dict[str, Any] = {
+                "query": name,
+                "ms": {"raw": round(raw * 1000, 1), "rollup": round(rollup * 1000, 1)},
+                "speedup": round(raw / rollup, 1) if rollup else None,
+            }
+            if args.python_baseline and name == "token_usage_by_model":
+                python = await _time(
+                    factory,
+                    lambda db: _python_token_usage_by_model(db, tenant_id, date_from, date_to),
+                    1,
+                )
+                entry["ms"]["python"] = round(python * 1000, 1)
+            results.append(entry)
+            log.info("analytics_rollup_benchmark.query", **entry)
+    finally:
+        if not args.keep:
+            async with factory() as db:
+                await db.execute(delete(Tenant).where(Tenant.id.in_(tenant_ids)))
+                await db.commit()
+        await close_db()
+
+    report = {
+        "rows": args.rows,
+        "tenants": args.tenants,
+        "days": args.days,
+        "users": args.users,
+        "rows_per_tenant": args.rows // args.tenants,
+        "generate_seconds": round(generate_s, 1),
+        "rollup_build_seconds": round(rollup_s, 1),
+        "rollup_rows": rollup_rows,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--python-baseline", action="store_true")
+    parser.add_argument("--keep", action="store_true")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
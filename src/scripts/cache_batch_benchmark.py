@@ -0,0 +1,188 @@
+"""Benchmark EmbeddingCache batch reads/writes: per-key calls vs get_many/set_many.
+
+For each batch size, stores and fetches the same synthetic embeddings once
+with one backend call per hash (the old batch_get/batch_cache loop) and
+once through the pipelined batch API, counting backend round-trips and
+timing both.
+
+By default runs against an in-memory backend that sleeps ``--rtt-ms`` per
+call, which models the network round-trip a Redis deployment pays. Pass
+``--redis-url`` to measure a real Redis instead (keys live under a
+throwaway model namespace and are flushed afterwards).
+
+Usage:
+    python -m src.scripts.cache_batch_benchmark [--batch-sizes 1,8,32,128] [--rtt-ms 0.5]
+        [--redis-url redis://localhost:6379/0] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import uuid
+from typing import Any
+
+import structlog
+
+from src.cache.backend import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from src.cache.codecs import Codec
+from src.cache.embedding_cache import EmbeddingCache
+
+log = structlog.get_logger(__name__)
+
+_EMBEDDING_DIM = 1536
+
+
+class _CountingBackend(CacheBackend):
+    """Wraps a backend, counting calls and adding a simulated round-trip to each."""
+
+    def __init__(self, inner: CacheBackend, rtt_s: float) -> None:
+        self._inner = inner
+        self._rtt_s = rtt_s
+        self.round_trips = 0
+
+    async def _trip(self) -> None:
+        self.round_trips += 1
+        if self._rtt_s:
+            await asyncio.sleep(self._rtt_s)
+
+    async def get(self, key: str, *, codec: Codec | None = None) -> Any | None:
+        await self._trip()
+        return await self._inner.get(key, codec=codec)
+
+    async def set(self, key: str, value: Any, ttl: int, *, codec: Codec | None = None) -> None:
+        await self._trip()
+        await self._inner.set(key, value, ttl, codec=codec)
+
+    async def get_many(
+        self, keys: list[str], *, codec: Codec | None = None
+    ) -> list[Any | None]:
+        await self._trip()
+        return await self._inner.get_many(keys, codec=codec)
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int, *, codec: Codec | None = None
+    ) -> None:
+        await self._trip()
+        await self._inner.set_many(items, ttl, codec=codec)
+
+    async def delete(self, key: str) -> None:
+        await self._trip()
+        await self._inner.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        await self._trip()
+        return await self._inner.exists(key)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        return await self._inner.delete_pattern(pattern)
+
+    async def flush_all(self) -> None:
+        await self._inner.flush_all()
+
+    async def info(self) -> dict[str, Any]:
+        return await self._inner.info()
+
+
+def _make_embeddings(count: int) -> dict[str, list[float]]:
+    rng = random.Random(42)
+    return {
+        EmbeddingCache.hash_text(f"benchmark chunk {i}"): [
+            rng.uniform(-1.0, 1.0) for _ in range(_EMBEDDING_DIM)
+        ]
+        for i in range(count)
+    }
+
+
+async def _run(
+    cache: EmbeddingCache,
+    backend: _CountingBackend,
+    embeddings: dict[str, list[float]],
+    *,
+    batched: bool,
+) -> tuple[int, float]:
+    """Write then read all embeddings; return (round-trips, seconds)."""
+    hashes = list(embeddings)
+    backend.round_trips = 0
+    start = time.perf_counter()
+    if batched:
+        await cache.batch_cache(embeddings)
+        await cache.batch_get(hashes)
+    else:
+        for text_hash, embedding in embeddings.items():
+            await cache.cache_embedding(text_hash, embedding)
+        for text_hash in hashes:
+            await cache.get_embedding(text_hash)
+    return backend.round_trips, time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.redis_url:
+        inner: CacheBackend = RedisCacheBackend(args.redis_url)
+        rtt_s = 0.0
+    else:
+        inner = InMemoryCacheBackend()
+        rtt_s = args.rtt_ms / 1000
+    backend = _CountingBackend(inner, rtt_s)
+    cache = EmbeddingCache(backend, model=f"benchmark-{uuid.uuid4().hex[:8]}")
+
+    results = []
+    try:
+        for batch_size in args.batch_sizes:
+            embeddings = _make_embeddings(batch_size)
+            timings: dict[str, list[float]] = {"per_key": [], "batched": []}
+            trips: dict[str, int] = {}
+            for _ in range(args.repeat):
+                for name in timings:
+                    round_trips, elapsed = await _run(
+                        cache, backend, embeddings, batched=name == "batched"
+                    )
+                    trips[name] = round_trips
+                    timings[name].append(elapsed)
+            per_key = statistics.median(timings["per_key"])
+            batched = statistics.median(timings["batched"])
+            results.append(
+                {
+                    "batch_size": batch_size,
+                    "round_trips": trips,
+                    "ms": {
+                        "per_key": round(per_key * 1000, 2),
+                        "batched": round(batched * 1000, 2),
+                    },
+                    "speedup": round(per_key / batched, 2) if batched else None,
+                }
+            )
+            log.info("cache_batch_benchmark.run", batch_size=batch_size, trips=trips)
+    finally:
+        await cache.flush()
+        if isinstance(inner, RedisCacheBackend):
+            await inner.close()
+
+    report = {
+        "backend": "redis" if args.redis_url else "memory",
+        "simulated_rtt_ms": None if args.redis_url else args.rtt_ms,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--batch-sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[1, 8, 32, 128],
+    )
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-url", default="")
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,137 @@
+"""Benchmark chunk insertion: ORM add+flush vs bulk COPY vs multi-row INSERT.
+
+Creates a throwaway tenant and document inside a transaction, inserts the
+same synthetic chunks (random 1536-dim embeddings) with each strategy in
+batches, reports rows/sec and rolls everything back - nothing is persisted.
+
+Usage:
+    python -m src.scripts.chunk_insert_benchmark [--rows 2000] [--batch-size 32] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+from src.rag.chunk_writer import BulkChunkWriter, ChunkRow
+
+log = structlog.get_logger(__name__)
+
+_EMBEDDING_DIM = 1536
+
+
+def _make_rows(document_id: uuid.UUID, tenant_id: uuid.UUID, count: int) -> list[ChunkRow]:
+    rng = random.Random(42)
+    return [
+        ChunkRow(
+            document_id=document_id,
+            tenant_id=tenant_id,
+            content=f"Benchmark chunk {i}. " + "lorem ipsum dolor sit amet " * 40,
+            chunk_index=i,
+            embedding=[rng.uniform(-1.0, 1.0) for _ in range(_EMBEDDING_DIM)],
+            metadata={"benchmark": True, "token_count": 200},
+        )
+        for i in range(count)
+    ]
+
+
+async def main(args: argparse.Namespace) -> None:
+    from src.config import get_settings
+    from src.database import close_db, get_session_factory
+    from src.database import init_db as _init_engine
+    from src.models.document import Document, DocumentChunk, DocumentStatus
+    from src.models.tenant import Tenant
+
+    settings = get_settings()
+    _init_engine(settings)
+    throughput: dict[str, list[float]] = {"orm": [], "copy": [], "insert": []}
+
+    try:
+        async with get_session_factory()() as db:
+            try:
+                suffix = uuid.uuid4().hex[:8]
+                tenant = Tenant(name=f"chunk-benchmark-{suffix}", slug=f"chunk-bench-{suffix}")
+                db.add(tenant)
+                await db.flush()
+                document = Document(
+                    tenant_id=tenant.id,
+                    filename="benchmark.txt",
+                    content_type="text/plain",
+                    status=DocumentStatus.READY,
+                )
+                db.add(document)
+                await db.flush()
+
+                async def orm_batch(batch: list[ChunkRow]) -> None:
+                    for row in batch:
+                        db.add(
+                            DocumentChunk(
+                                document_id=row.document_id,
+                                tenant_id=row.tenant_id,
+                                content=row.content,
+                                chunk_index=row.chunk_index,
+                                embedding=row.embedding,
+                                chunk_metadata=row.metadata,
+                            )
+                        )
+                    await db.flush()
+                    db.expunge_all()
+
+                strategies: dict[str, Callable[[list[ChunkRow]], Awaitable[object]]] = {
+                    "orm": orm_batch,
+                    "copy": BulkChunkWriter(db, use_copy=True).write,
+                    "insert": BulkChunkWriter(db, use_copy=False).write,
+                }
+
+                for _ in range(args.repeat):
+                    for name, write_batch in strategies.items():
+                        rows = _make_rows(document.id, tenant.id, args.rows)
+                        start = time.perf_counter()
+                        for batch_start in range(0, len(rows), args.batch_size):
+                            await write_batch(rows[batch_start : batch_start + args.batch_size])
+                        elapsed = time.perf_counter() - start
+                        throughput[name].append(len(rows) / elapsed)
+                        log.info(
+                            "chunk_insert_benchmark.run",
+                            strategy=name,
+                            rows_per_sec=round(len(rows) / elapsed, 1),
+                        )
+            finally:
+                await db.rollback()
+    finally:
+        await close_db()
+
+    orm_median = statistics.median(throughput["orm"])
+    report = {
+        "rows": args.rows,
+        "batch_size": args.batch_size,
+        "repeat": args.repeat,
+        "rows_per_sec": {
+            name: round(statistics.median(samples), 1) for name, samples in throughput.items()
+        },
+        "speedup_vs_orm": {
+            name: round(statistics.median(samples) / orm_median, 2)
+            for name, samples in throughput.items()
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,154 @@
+"""Benchmark the local reranker against the LLM reranker on the same candidates.
+
+For every query: run hybrid search once for the tenant, then rerank the same
+candidate set with each backend and report per-backend latency (p50/p95/mean)
+and how closely the local ordering agrees with the LLM ordering (Kendall tau
+over all candidates, overlap of the top-k).
+
+Usage:
+    python -m src.scripts.rerank_benchmark --tenant-id <uuid> --query "..." [--query "..."]
+    python -m src.scripts.rerank_benchmark --tenant-id <uuid> --queries-file queries.txt \\
+        [--candidates 30] [--top-k 10] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+
+def kendall_tau(order_a: Sequence[Any], order_b: Sequence[Any]) -> float:
+    """Kendall rank correlation of two orderings of the same items (-1..1)."""
+    position = {item: i for i, item in enumerate(order_b)}
+    items = [item for item in order_a if item in position]
+    n = len(items)
+    if n < 2:
+        return 1.0
+    concordant = discordant = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if position[items[i]] < position[items[j]]:
+                concordant += 1
+            else:
+                discordant += 1
+    return (concordant - discordant) / (n * (n - 1) / 2)
+
+
+def top_k_overlap(order_a: Sequence[Any], order_b: Sequence[Any], k: int) -> float:
+    """Fraction of the top-k of ``order_a`` that is also in the top-k of ``order_b``."""
+    top_a, top_b = set(order_a[:k]), set(order_b[:k])
+    return len(top_a & top_b) / len(top_a) if top_a else 1.0
+
+
+def _latency_summary(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms)
+    return {
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "mean_ms": round(statistics.fmean(ordered), 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    from src.agent.llm import LLMClient
+    from src.config import get_settings
+    from src.database import close_db, get_session_factory
+    from src.database import init_db as _init_engine
+    from src.rag.reranker import RerankBackend
+    from src.rag.retrieve import RetrievalService
+
+    queries = list(args.query or [])
+    if args.queries_file:
+        with open(args.queries_file, encoding="utf-8") as fh:
+            queries.extend(line.strip() for line in fh if line.strip())
+    if not queries:
+        raise SystemExit("No queries given (use --query or --queries-file)")
+
+    settings = get_settings()
+    _init_engine(settings)
+    tenant_id = uuid.UUID(args.tenant_id)
+    llm = LLMClient(settings)
+    latencies: dict[str, list[float]] = {backend.value: [] for backend in RerankBackend}
+    taus: list[float] = []
+    overlaps: list[float] = []
+
+    try:
+        async with get_session_factory()() as db:
+            service = RetrievalService(db=db, settings=settings, llm_client=llm)
+            for query in queries:
+                query_embedding = await service.embed_query(query)
+                candidates = await service._hybrid_search.search(
+                    query=query,
+                    tenant_id=tenant_id,
+                    top_k=args.candidates,
+                    query_embedding=query_embedding,
+                )
+                if not candidates:
+                    log.warning("rerank_benchmark.no_candidates", query=query[:50])
+                    continue
+                embeddings = await service._load_chunk_embeddings(
+                    chunk_ids=[c.chunk_id for c in candidates],
+                    tenant_id=tenant_id,
+                )
+
+                orders: dict[str, list[Any]] = {}
+                for backend, reranker in service._rerankers.items():
+                    for _ in range(args.repeat):
+                        start = time.perf_counter()
+                        ranked = await reranker.rerank(
+                            query=query,
+                            results=candidates,
+                            query_embedding=query_embedding,
+                            result_embeddings=embeddings,
+                        )
+                        latencies[backend.value].append((time.perf_counter() - start) * 1000)
+                    orders[backend.value] = [r.chunk_id for r in ranked]
+
+                llm_order = orders[RerankBackend.LLM.value]
+                local_order = orders[RerankBackend.LOCAL.value]
+                taus.append(kendall_tau(llm_order, local_order))
+                overlaps.append(top_k_overlap(llm_order, local_order, args.top_k))
+    finally:
+        await close_db()
+
+    report = {
+        "queries": len(taus),
+        "candidates_per_query": args.candidates,
+        "latency": {
+            backend: _latency_summary(samples)
+            for backend, samples in latencies.items()
+            if samples
+        },
+        "agreement": {
+            "kendall_tau_mean": round(statistics.fmean(taus), 3) if taus else None,
+            f"top_{args.top_k}_overlap_mean": (
+                round(statistics.fmean(overlaps), 3) if overlaps else None
+            ),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenant-id", required=True)
+    parser.add_argument("--query", action="append")
+    parser.add_argument("--queries-file")
+    parser.add_argument("--candidates", type=int, default=30)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
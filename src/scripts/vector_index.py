@@ -0,0 +1,67 @@
+"""Manage the ANN index on document_chunks.embedding.
+
+Commands:
+    ensure   Create the HNSW index (IVFFlat fallback) concurrently if missing
+    status   Print the managed vector indexes and whether they are valid
+    recall   Measure recall@k of ANN vs exact search for one tenant
+
+Usage:
+    python -m src.scripts.vector_index ensure
+    python -m src.scripts.vector_index status
+    python -m src.scripts.vector_index recall --tenant-id <uuid> [--k 10] [--sample 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import uuid
+from dataclasses import asdict
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+
+async def main(args: argparse.Namespace) -> None:
+    from src.config import get_settings
+    from src.database import close_db, get_engine
+    from src.database import init_db as _init_engine
+    from src.rag.vector_index import VectorIndexManager
+
+    settings = get_settings()
+    _init_engine(settings)
+    manager = VectorIndexManager(get_engine(), settings)
+
+    try:
+        if args.command == "ensure":
+            status = await manager.ensure_index()
+            print(json.dumps(asdict(status) if status else None, indent=2))
+        elif args.command == "status":
+            print(json.dumps([asdict(s) for s in await manager.index_status()], indent=2))
+        elif args.command == "recall":
+            report = await manager.measure_recall(
+                tenant_id=uuid.UUID(args.tenant_id),
+                k=args.k,
+                sample_size=args.sample,
+            )
+            print(json.dumps(report.to_dict(), indent=2))
+    finally:
+        await close_db()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ensure")
+    sub.add_parser("status")
+    recall = sub.add_parser("recall")
+    recall.add_argument("--tenant-id", required=True)
+    recall.add_argument("--k", type=int, default=10)
+    recall.add_argument("--sample", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
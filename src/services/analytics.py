@@ -9,7 +9,10 @@ Provides high-level analytics queries that power the dashboard:
 - Error rates
 - Daily trends
 
-All queries are tenant-scoped for multi-tenancy.
+All queries are tenant-scoped for multi-tenancy. They are answered from the
+hourly/daily usage rollups maintained by AnalyticsRollupJob
+(src/services/analytics_rollup.py); raw metrics are read only for the range
+past the rollup watermark.
 """
 
 from __future__ import annotations
@@ -20,10 +23,16 @@ from typing import Any
 
 import structlog
 from pydantic import BaseModel
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, case, desc, func, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.analytics import DailySummary, MetricType, UsageMetric
+from src.models.analytics import DailySummary, MetricType, RollupGranularity
+from src.services.analytics_rollup import (
+    AnalyticsRollupJob,
+    metric_facts,
+    rollup_facts,
+    split_range,
+)
 
 log = structlog.get_logger(__name__)
 
@@ -106,16 +115,71 @@ class DailyTrend(BaseModel):
     cost_estimate: float
 
 
+def _day_range(date_from: date, date_to: date) -> tuple[datetime, datetime]:
+    """UTC ``[start, end)`` covering ``date_from`` through ``date_to`` inclusive."""
+    start = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
+    end = datetime.combine(date_to, datetime.min.time()).replace(tzinfo=UTC)
+    return start, end + timedelta(days=1)
+
+
+def _sum(column: Any, where: Any = None) -> Any:
+    """SUM of ``column`` (optionally only where ``where`` holds), 0 when empty."""
+    if where is not None:
+        column = case((where, column), else_=0)
+    return func.coalesce(func.sum(column), 0)
+
+
 class AnalyticsService:
-    """Service for analytics queries and aggregations."""
+    """Service for analytics queries and aggregations.
+
+    Queries aggregate over "facts" in the usage rollup shape: daily and
+    hourly rollups for the range AnalyticsRollupJob has materialized, plus
+    raw metrics (aggregated in SQL) for the rest, normally only the current
+    partial hour.
+    """
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, *, use_rollups: bool = True) -> None:
         """Initialize analytics service.
 
         Args:
             db: Database session
+            use_rollups: Read materialized rollups; if False every query
+                aggregates raw metrics for the whole range
         """
         self.db = db
+        self.use_rollups = use_rollups
+
+    async def _facts(
+        self, tenant_id: uuid.UUID, date_from: date, date_to: date, *, by_day: bool = False
+    ) -> Any:
+        """Rollup-shaped rows of one tenant covering ``date_from``..``date_to``.
+
+        Columns are ROLLUP_DIMENSIONS and ROLLUP_MEASURES, preceded by the UTC
+        ``day`` with ``by_day``; a grain can occur more than once (from
+        different buckets or sources), so callers SUM.
+        """
+        start, end = _day_range(date_from, date_to)
+        day_end = hour_end = start
+        if self.use_rollups:
+            marks = await AnalyticsRollupJob.get_watermarks(self.db)
+            day_end, hour_end = split_range(
+                start,
+                end,
+                marks.get(RollupGranularity.DAY.value),
+                marks.get(RollupGranularity.HOUR.value),
+            )
+
+        parts = []
+        if start < hour_end:
+            parts.append(
+                rollup_facts(
+                    tenant_id, days=(start, day_end), hours=(day_end, hour_end), by_day=by_day
+                )
+            )
+        if hour_end < end or not parts:
+            parts.append(metric_facts(hour_end, end, tenant_id, by_day=by_day))
+        facts = union_all(*parts) if len(parts) > 1 else parts[0]
+        return facts.subquery("facts")
 
     async def get_usage_summary(
         self,
@@ -133,122 +197,47 @@ class AnalyticsService:
         Returns:
             Usage summary
         """
-        start_dt = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
-        end_dt = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=UTC)
-
-        # Count API calls
-        api_call_stmt = select(func.count()).select_from(UsageMetric).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.API_CALL,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
-        )
-        api_calls_result = await self.db.execute(api_call_stmt)
-        total_api_calls = api_calls_result.scalar() or 0
-
-        # Sum tokens
-        token_stmt = select(func.sum(UsageMetric.value)).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.TOKEN_USAGE,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
-        )
-        tokens_result = await self.db.execute(token_stmt)
-        total_tokens = int(tokens_result.scalar() or 0)
-
-        # Count agent runs
-        agent_stmt = select(func.count()).select_from(UsageMetric).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.AGENT_RUN,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
+        facts = await self._facts(tenant_id, date_from, date_to)
+        api_call = facts.c.metric_type == MetricType.API_CALL
+        token_usage = facts.c.metric_type == MetricType.TOKEN_USAGE
+
+        stmt = select(
+            _sum(facts.c.event_count, api_call),
+            _sum(facts.c.value_sum, token_usage),
+            _sum(facts.c.event_count, facts.c.metric_type == MetricType.AGENT_RUN),
+            # Users seen on API calls; user_id is part of the rollup grain
+            func.count(
+                func.distinct(case((and_(api_call, facts.c.user_id != ""), facts.c.user_id)))
+            ),
+            _sum(facts.c.response_time_ms_sum, api_call),
+            _sum(facts.c.response_time_count, api_call),
+            _sum(facts.c.error_count, api_call),
+            _sum(facts.c.cost, token_usage),
         )
-        agent_result = await self.db.execute(agent_stmt)
-        total_agent_runs = agent_result.scalar() or 0
-
-        # Count unique users (from dimensions)
-        unique_users = 0
-        # This is a simplified version; in production, you'd extract user_id from dimensions
-        # For now, we'll estimate from agent runs with user_id
-        user_stmt = select(UsageMetric.dimensions).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.API_CALL,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
-        )
-        user_result = await self.db.execute(user_stmt)
-        user_ids = set()
-        for (dims,) in user_result:
-            if "user_id" in dims:
-                user_ids.add(dims["user_id"])
-        unique_users = len(user_ids)
-
-        # Average response time
-        avg_response_time_ms = 0.0
-        response_time_stmt = select(UsageMetric.dimensions).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.API_CALL,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
-        )
-        response_times = []
-        rt_result = await self.db.execute(response_time_stmt)
-        for (dims,) in rt_result:
-            if "response_time_ms" in dims:
-                response_times.append(dims["response_time_ms"])
-        if response_times:
-            avg_response_time_ms = sum(response_times) / len(response_times)
-
-        # Count errors (status_code >= 400)
-        error_count = 0
-        error_stmt = select(UsageMetric.dimensions).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.API_CALL,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
-        )
-        error_result = await self.db.execute(error_stmt)
-        for (dims,) in error_result:
-            if "status_code" in dims and dims["status_code"] >= 400:
-                error_count += 1
-
-        # Sum costs
-        cost_stmt = select(UsageMetric.dimensions).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.TOKEN_USAGE,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
-        )
-        cost_result = await self.db.execute(cost_stmt)
-        total_cost = 0.0
-        for (dims,) in cost_result:
-            if "cost" in dims:
-                total_cost += dims["cost"]
+        row = (await self.db.execute(stmt)).one()
+        (
+            api_calls,
+            tokens,
+            agent_runs,
+            unique_users,
+            response_time_sum,
+            response_time_count,
+            errors,
+            cost,
+        ) = row
 
         return UsageSummary(
             date_from=date_from,
             date_to=date_to,
-            total_api_calls=total_api_calls,
-            total_tokens=total_tokens,
-            total_agent_runs=total_agent_runs,
-            unique_users=unique_users,
-            avg_response_time_ms=avg_response_time_ms,
-            error_count=error_count,
-            cost_estimate=total_cost,
+            total_api_calls=int(api_calls),
+            total_tokens=int(tokens),
+            total_agent_runs=int(agent_runs),
+            unique_users=int(unique_users),
+            avg_response_time_ms=(
+                float(response_time_sum) / response_time_count if response_time_count else 0.0
+            ),
+            error_count=int(errors),
+            cost_estimate=float(cost),
         )
 
     async def get_token_usage_by_model(
@@ -267,42 +256,32 @@ class AnalyticsService:
         Returns:
             List of model usage stats
         """
-        start_dt = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
-        end_dt = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=UTC)
-
-        stmt = select(UsageMetric).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.TOKEN_USAGE,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
+        facts = await self._facts(tenant_id, date_from, date_to)
+        stmt = (
+            select(
+                facts.c.model,
+                _sum(facts.c.value_sum),
+                _sum(facts.c.prompt_tokens),
+                _sum(facts.c.completion_tokens),
+                _sum(facts.c.event_count),
+                _sum(facts.c.cost),
             )
+            .where(facts.c.metric_type == MetricType.TOKEN_USAGE)
+            .group_by(facts.c.model)
+            .order_by(facts.c.model)
         )
         result = await self.db.execute(stmt)
-        metrics = result.scalars().all()
-
-        # Aggregate by model
-        by_model: dict[str, dict[str, Any]] = {}
-        for metric in metrics:
-            model = metric.dimensions.get("model", "unknown")
-            if model not in by_model:
-                by_model[model] = {
-                    "total_tokens": 0,
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "api_calls": 0,
-                    "cost": 0.0,
-                }
-
-            by_model[model]["total_tokens"] += int(metric.value)
-            by_model[model]["prompt_tokens"] += metric.dimensions.get("prompt_tokens", 0)
-            by_model[model]["completion_tokens"] += metric.dimensions.get("completion_tokens", 0)
-            by_model[model]["api_calls"] += 1
-            by_model[model]["cost"] += metric.dimensions.get("cost", 0.0)
 
         return [
-            ModelUsage(model=model, **stats)
-            for model, stats in by_model.items()
+            ModelUsage(
+                model=model,
+                total_tokens=int(total_tokens),
+                prompt_tokens=int(prompt_tokens),
+                completion_tokens=int(completion_tokens),
+                api_calls=int(api_calls),
+                cost=float(cost),
+            )
+            for model, total_tokens, prompt_tokens, completion_tokens, api_calls, cost in result
         ]
 
     async def get_agent_performance(
@@ -321,48 +300,33 @@ class AnalyticsService:
         Returns:
             List of agent performance stats
         """
-        start_dt = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
-        end_dt = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=UTC)
-
-        stmt = select(UsageMetric).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.AGENT_RUN,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
+        facts = await self._facts(tenant_id, date_from, date_to)
+        stmt = (
+            select(
+                facts.c.agent_id,
+                _sum(facts.c.event_count),
+                _sum(facts.c.success_count),
+                _sum(facts.c.duration_ms_sum),
+                _sum(facts.c.steps_sum),
             )
+            .where(facts.c.metric_type == MetricType.AGENT_RUN)
+            .group_by(facts.c.agent_id)
+            .order_by(facts.c.agent_id)
         )
         result = await self.db.execute(stmt)
-        metrics = result.scalars().all()
-
-        # Aggregate by agent_id
-        by_agent: dict[str, dict[str, Any]] = {}
-        for metric in metrics:
-            agent_id = metric.dimensions.get("agent_id", "unknown")
-            if agent_id not in by_agent:
-                by_agent[agent_id] = {
-                    "total_runs": 0,
-                    "successes": 0,
-                    "durations": [],
-                    "steps": [],
-                }
-
-            by_agent[agent_id]["total_runs"] += 1
-            if metric.dimensions.get("status") == "success":
-                by_agent[agent_id]["successes"] += 1
-            by_agent[agent_id]["durations"].append(metric.dimensions.get("duration_ms", 0))
-            by_agent[agent_id]["steps"].append(metric.dimensions.get("steps", 0))
 
-        return [
-            AgentPerformance(
-                agent_id=agent_id,
-                total_runs=stats["total_runs"],
-                success_rate=(stats["successes"] / stats["total_runs"] * 100) if stats["total_runs"] > 0 else 0.0,
-                avg_duration_ms=sum(stats["durations"]) / len(stats["durations"]) if stats["durations"] else 0.0,
-                avg_steps=sum(stats["steps"]) / len(stats["steps"]) if stats["steps"] else 0.0,
+        performance = []
+        for agent_id, runs, successes, duration_ms, steps in result:
+            performance.append(
+                AgentPerformance(
+                    agent_id=agent_id,
+                    total_runs=int(runs),
+                    success_rate=successes / runs * 100 if runs else 0.0,
+                    avg_duration_ms=float(duration_ms) / runs if runs else 0.0,
+                    avg_steps=float(steps) / runs if runs else 0.0,
+                )
             )
-            for agent_id, stats in by_agent.items()
-        ]
+        return performance
 
     async def get_top_users(
         self,
@@ -382,46 +346,30 @@ class AnalyticsService:
         Returns:
             List of user usage stats, ordered by activity
         """
-        start_dt = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
-        end_dt = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=UTC)
-
-        stmt = select(UsageMetric).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
+        facts = await self._facts(tenant_id, date_from, date_to)
+        api_calls = _sum(facts.c.event_count, facts.c.metric_type == MetricType.API_CALL)
+        stmt = (
+            select(
+                facts.c.user_id,
+                api_calls.label("api_calls"),
+                _sum(facts.c.value_sum, facts.c.metric_type == MetricType.TOKEN_USAGE),
+                _sum(facts.c.event_count, facts.c.metric_type == MetricType.AGENT_RUN),
             )
+            .where(facts.c.user_id != "")
+            .group_by(facts.c.user_id)
+            .order_by(desc("api_calls"), facts.c.user_id)
+            .limit(limit)
         )
         result = await self.db.execute(stmt)
-        metrics = result.scalars().all()
-
-        # Aggregate by user_id
-        by_user: dict[str, dict[str, int]] = {}
-        for metric in metrics:
-            user_id = metric.dimensions.get("user_id")
-            if not user_id:
-                continue
-
-            if user_id not in by_user:
-                by_user[user_id] = {"api_calls": 0, "tokens": 0, "agent_runs": 0}
-
-            if metric.metric_type == MetricType.API_CALL:
-                by_user[user_id]["api_calls"] += 1
-            elif metric.metric_type == MetricType.TOKEN_USAGE:
-                by_user[user_id]["tokens"] += int(metric.value)
-            elif metric.metric_type == MetricType.AGENT_RUN:
-                by_user[user_id]["agent_runs"] += 1
-
-        # Sort by API calls and limit
-        sorted_users = sorted(
-            by_user.items(),
-            key=lambda x: x[1]["api_calls"],
-            reverse=True,
-        )[:limit]
 
         return [
-            UserUsage(user_id=user_id, **stats)
-            for user_id, stats in sorted_users
+            UserUsage(
+                user_id=user_id,
+                api_calls=int(calls),
+                tokens=int(tokens),
+                agent_runs=int(agent_runs),
+            )
+            for user_id, calls, tokens, agent_runs in result
         ]
 
     async def get_cost_breakdown(
@@ -440,36 +388,19 @@ class AnalyticsService:
         Returns:
             Cost breakdown
         """
-        start_dt = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
-        end_dt = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=UTC)
-
-        stmt = select(UsageMetric).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.TOKEN_USAGE,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
+        facts = await self._facts(tenant_id, date_from, date_to)
+        stmt = (
+            select(facts.c.model, _sum(facts.c.cost))
+            .where(facts.c.metric_type == MetricType.TOKEN_USAGE)
+            .group_by(facts.c.model)
+            .order_by(facts.c.model)
         )
         result = await self.db.execute(stmt)
-        metrics = result.scalars().all()
-
-        # Aggregate costs by model
-        by_model: dict[str, float] = {}
-        total_cost = 0.0
-
-        for metric in metrics:
-            model = metric.dimensions.get("model", "unknown")
-            cost = metric.dimensions.get("cost", 0.0)
-            by_model[model] = by_model.get(model, 0.0) + cost
-            total_cost += cost
+        by_model = [ModelCost(model=model, cost=float(cost)) for model, cost in result]
 
         return CostBreakdown(
-            total_cost=total_cost,
-            by_model=[
-                ModelCost(model=model, cost=cost)
-                for model, cost in by_model.items()
-            ],
+            total_cost=sum(item.cost for item in by_model),
+            by_model=by_model,
         )
 
     async def get_error_rate(
@@ -488,27 +419,12 @@ class AnalyticsService:
         Returns:
             Error rate stats
         """
-        start_dt = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=UTC)
-        end_dt = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=UTC)
-
-        stmt = select(UsageMetric).where(
-            and_(
-                UsageMetric.tenant_id == tenant_id,
-                UsageMetric.metric_type == MetricType.API_CALL,
-                UsageMetric.timestamp >= start_dt,
-                UsageMetric.timestamp <= end_dt,
-            )
+        facts = await self._facts(tenant_id, date_from, date_to)
+        stmt = select(_sum(facts.c.event_count), _sum(facts.c.error_count)).where(
+            facts.c.metric_type == MetricType.API_CALL
         )
-        result = await self.db.execute(stmt)
-        metrics = result.scalars().all()
-
-        total_requests = len(metrics)
-        error_count = 0
-
-        for metric in metrics:
-            status_code = metric.dimensions.get("status_code", 0)
-            if status_code >= 400:
-                error_count += 1
+        total, errors = (await self.db.execute(stmt)).one()
+        total_requests, error_count = int(total), int(errors)
 
         error_rate = (error_count / total_requests * 100) if total_requests > 0 else 0.0
 
@@ -523,7 +439,11 @@ class AnalyticsService:
         tenant_id: uuid.UUID,
         days: int = 30,
     ) -> list[DailyTrend]:
-        """Get daily trend data from pre-aggregated summaries.
+        """Get daily trend data for the last ``days`` UTC days, including today.
+
+        Closed days come from daily rollups; today (and any day not rolled up
+        yet) from hourly rollups and raw metrics. Days without metrics are
+        omitted.
 
         Args:
             tenant_id: Tenant ID
@@ -532,28 +452,39 @@ class AnalyticsService:
         Returns:
             List of daily trends, ordered by date
         """
-        start_date = date.today() - timedelta(days=days - 1)
-
-        stmt = select(DailySummary).where(
-            and_(
-                DailySummary.tenant_id == tenant_id,
-                DailySummary.date >= start_date,
+        today = datetime.now(UTC).date()
+        facts = await self._facts(
+            tenant_id, today - timedelta(days=days - 1), today, by_day=True
+        )
+        api_call = facts.c.metric_type == MetricType.API_CALL
+        token_usage = facts.c.metric_type == MetricType.TOKEN_USAGE
+
+        stmt = (
+            select(
+                facts.c.day,
+                _sum(facts.c.event_count, api_call),
+                _sum(facts.c.value_sum, token_usage),
+                _sum(facts.c.event_count, facts.c.metric_type == MetricType.AGENT_RUN),
+                func.count(
+                    func.distinct(case((and_(api_call, facts.c.user_id != ""), facts.c.user_id)))
+                ),
+                _sum(facts.c.cost, token_usage),
             )
-        ).order_by(DailySummary.date)
-
+            .group_by(facts.c.day)
+            .order_by(facts.c.day)
+        )
         result = await self.db.execute(stmt)
-        summaries = result.scalars().all()
 
         return [
             DailyTrend(
-                date=summary.date,
-                total_api_calls=summary.total_api_calls,
-                total_tokens=summary.total_tokens,
-                total_agent_runs=summary.total_agent_runs,
-                unique_users=summary.unique_users,
-                cost_estimate=summary.cost_estimate,
+                date=day.astimezone(UTC).date(),
+                total_api_calls=int(api_calls),
+                total_tokens=int(tokens),
+                total_agent_runs=int(agent_runs),
+                unique_users=int(unique_users),
+                cost_estimate=float(cost),
             )
-            for summary in summaries
+            for day, api_calls, tokens, agent_runs, unique_users, cost in result
         ]
 
     async def generate_daily_summary(
@@ -0,0 +1,468 @@
+"""Incremental hourly/daily rollups of usage metrics.
+
+AnalyticsService used to select every raw UsageMetric row (or its JSONB
+dimensions) in the requested range and aggregate in Python. Rollups keep
+those sums in usage_rollups instead, one row per (tenant, bucket, metric
+type, model, agent, user):
+
+- AnalyticsRollupJob materializes closed UTC hours from usage_metrics and
+  closed days from the hourly rows, in bounded chunks, and advances a
+  per-granularity watermark (usage_rollup_watermarks)
+- Each chunk recomputes its buckets in SQL and upserts them, so re-running
+  a chunk (or ``rebuild`` after late writes) is idempotent
+- Hours are only closed ``grace_s`` after they end, which covers the
+  MetricsCollector flush interval
+- A transaction-scoped advisory lock lets one replica roll up at a time
+
+Readers use ``split_range`` to serve whole days from daily rows, the rest
+of the rolled-up range from hourly rows and only the tail past the hourly
+watermark (normally the current partial hour) from raw rows, aggregated by
+``metric_facts`` in the same shape as a rollup row.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import structlog
+from sqlalchemy import Select, and_, case, false, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.middleware.prometheus import record_analytics_rollup
+from src.models.analytics import (
+    MetricType,
+    RollupGranularity,
+    RollupWatermark,
+    UsageMetric,
+    UsageRollup,
+)
+
+log = structlog.get_logger(__name__)
+
+# Rollup grain (besides tenant and bucket) and summed measures, in column order
+ROLLUP_DIMENSIONS = ("metric_type", "model", "agent_id", "user_id")
+ROLLUP_MEASURES = (
+    "event_count",
+    "value_sum",
+    "prompt_tokens",
+    "completion_tokens",
+    "cost",
+    "error_count",
+    "success_count",
+    "response_time_ms_sum",
+    "response_time_count",
+    "duration_ms_sum",
+    "steps_sum",
+)
+
+# pg_try_advisory_xact_lock key shared by every replica's job
+_LOCK_KEY = 0x0A11_7C5A
+
+
+def floor_hour(moment: datetime) -> datetime:
+    """Start of the UTC hour containing ``moment``."""
+    return moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(moment: datetime) -> datetime:
+    """Start of the UTC day containing ``moment``."""
+    return floor_hour(moment).replace(hour=0)
+
+
+def split_range(
+    start: datetime,
+    end: datetime,
+    day_mark: datetime | None,
+    hour_mark: datetime | None,
+) -> tuple[datetime, datetime]:
+    """Split ``[start, end)`` by source.
+
+    Returns ``(day_end, hour_end)``: ``[start, day_end)`` is read from daily
+    rollups, ``[day_end, hour_end)`` from hourly rollups and
+    ``[hour_end, end)`` from raw metrics. ``start`` must be a UTC midnight
+    for daily rows to line up; missing watermarks mean nothing is rolled up.
+    """
+    day_end = min(max(day_mark or start, start), end)
+    hour_end = min(max(hour_mark or start, day_end), end)
+    return day_end, hour_end
+
+
+def _utc_trunc(field: str, column: Any) -> Any:
+    """date_trunc in UTC regardless of the session time zone."""
+    return func.timezone("UTC", func.date_trunc(field, func.timezone("UTC", column)))
+
+
+def _dimension(key: str, length: int, owner: MetricType | None = None) -> Any:
+    """A string dimension; missing values are "unknown" for ``owner`` rows, else ""."""
+    value = UsageMetric.dimensions[key].as_string()
+    if owner is None:
+        return func.left(func.coalesce(value, ""), length)
+    return func.left(
+        case(
+            (UsageMetric.metric_type == owner, func.coalesce(value, "unknown")),
+            else_=func.coalesce(value, ""),
+        ),
+        length,
+    )
+
+
+def _metric_rows(
+    start: datetime, end: datetime, tenant_id: uuid.UUID | None = None
+) -> Any:
+    """Per-row grain and measure inputs for raw metrics in ``[start, end)``."""
+    dims = UsageMetric.dimensions
+    conditions = [UsageMetric.timestamp >= start, UsageMetric.timestamp < end]
+    if tenant_id is not None:
+        conditions.append(UsageMetric.tenant_id == tenant_id)
+    return (
+        select(
+            UsageMetric.tenant_id,
+            _utc_trunc("hour", UsageMetric.timestamp).label("bucket_start"),
+            UsageMetric.metric_type,
+            _dimension("model", 255, MetricType.TOKEN_USAGE).label("model"),
+            _dimension("agent_id", 255, MetricType.AGENT_RUN).label("agent_id"),
+            _dimension("user_id", 64).label("user_id"),
+            UsageMetric.value,
+            func.coalesce(dims["prompt_tokens"].as_float(), 0).label("prompt_tokens"),
+            func.coalesce(dims["completion_tokens"].as_float(), 0).label("completion_tokens"),
+            func.coalesce(dims["cost"].as_float(), 0).label("cost"),
+            case((dims["status_code"].as_float() >= 400, 1), else_=0).label("is_error"),
+            case((dims["status"].as_string() == "success", 1), else_=0).label("is_success"),
+            # NULL when absent, so count() only counts rows that report it
+            dims["response_time_ms"].as_float().label("response_time_ms"),
+            func.coalesce(dims["duration_ms"].as_float(), 0).label("duration_ms"),
+            func.coalesce(dims["steps"].as_float(), 0).label("steps"),
+        )
+        .where(and_(*conditions))
+        .subquery("metric_rows")
+    )
+
+
+def _raw_measures(rows: Any) -> list[Any]:
+    return [
+        func.count().label("event_count"),
+        func.sum(rows.c.value).label("value_sum"),
+        func.sum(rows.c.prompt_tokens).label("prompt_tokens"),
+        func.sum(rows.c.completion_tokens).label("completion_tokens"),
+        func.sum(rows.c.cost).label("cost"),
+        func.sum(rows.c.is_error).label("error_count"),
+        func.sum(rows.c.is_success).label("success_count"),
+        func.coalesce(func.sum(rows.c.response_time_ms), 0).label("response_time_ms_sum"),
+        func.count(rows.c.response_time_ms).label("response_time_count"),
+        func.sum(rows.c.duration_ms).label("duration_ms_sum"),
+        func.sum(rows.c.steps).label("steps_sum"),
+    ]
+
+
+def metric_facts(
+    start: datetime, end: datetime, tenant_id: uuid.UUID, *, by_day: bool = False
+) -> Select[Any]:
+    """Raw metrics of one tenant in ``[start, end)`` aggregated to the rollup grain.
+
+    Columns are ROLLUP_DIMENSIONS followed by ROLLUP_MEASURES, the same as
+    ``rollup_facts``, so the two can be combined with UNION ALL. With
+    ``by_day`` a leading ``day`` column (UTC midnight) is part of the grain.
+    """
+    rows = _metric_rows(start, end, tenant_id)
+    grain = [rows.c[name] for name in ROLLUP_DIMENSIONS]
+    if by_day:
+        grain.insert(0, _utc_trunc("day", rows.c.bucket_start).label("day"))
+    return select(*grain, *_raw_measures(rows)).group_by(*grain)
+
+
+def rollup_facts(
+    tenant_id: uuid.UUID,
+    *,
+    days: tuple[datetime, datetime] | None = None,
+    hours: tuple[datetime, datetime] | None = None,
+    by_day: bool = False,
+) -> Select[Any]:
+    """Rollup rows of one tenant for the given daily and hourly bucket ranges.
+
+    With ``by_day`` a leading ``day`` column holds the UTC day of the bucket,
+    matching ``metric_facts``.
+    """
+    ranges = []
+    for granularity, bounds in ((RollupGranularity.DAY, days), (RollupGranularity.HOUR, hours)):
+        if bounds is not None and bounds[0] < bounds[1]:
+            ranges.append(
+                and_(
+                    UsageRollup.granularity == granularity.value,
+                    UsageRollup.bucket_start >= bounds[0],
+                    UsageRollup.bucket_start < bounds[1],
+                )
+            )
+    columns = [getattr(UsageRollup, name) for name in (*ROLLUP_DIMENSIONS, *ROLLUP_MEASURES)]
+    if by_day:
+        columns.insert(0, _utc_trunc("day", UsageRollup.bucket_start).label("day"))
+    return select(*columns).where(
+        UsageRollup.tenant_id == tenant_id, or_(*ranges) if ranges else false()
+    )
+
+
+def _hourly_source(start: datetime, end: datetime) -> Select[Any]:
+    """Hourly rollup rows for every tenant, computed from raw metrics."""
+    rows = _metric_rows(start, end)
+    grain = [rows.c.tenant_id, rows.c.bucket_start, *(rows.c[n] for n in ROLLUP_DIMENSIONS)]
+    return select(*grain, *_raw_measures(rows)).group_by(*grain)
+
+
+def _daily_source(start: datetime, end: datetime) -> Select[Any]:
+    """Daily rollup rows for every tenant, summed from hourly rollups."""
+    hourly = (
+        select(
+            UsageRollup.tenant_id,
+            _utc_trunc("day", UsageRollup.bucket_start).label("bucket_start"),
+            *(getattr(UsageRollup, name) for name in (*ROLLUP_DIMENSIONS, *ROLLUP_MEASURES)),
+        )
+        .where(
+            UsageRollup.granularity == RollupGranularity.HOUR.value,
+            UsageRollup.bucket_start >= start,
+            UsageRollup.bucket_start < end,
+        )
+        .subquery("hourly")
+    )
+    grain = [hourly.c.tenant_id, hourly.c.bucket_start, *(hourly.c[n] for n in ROLLUP_DIMENSIONS)]
+    measures = [func.sum(hourly.c[name]).label(name) for name in ROLLUP_MEASURES]
+    return select(*grain, *measures).group_by(*grain)
+
+
+def upsert_rollups(granularity: RollupGranularity, source: Select[Any]) -> Any:
+    """INSERT ... SELECT ``source`` into usage_rollups, replacing existing buckets.
+
+    ``source`` yields tenant_id, bucket_start, the dimensions and measures.
+    Buckets are always recomputed whole, so conflicting rows are replaced
+    rather than added to.
+    """
+    src = source.subquery("source")
+    names = ["tenant_id", "bucket_start", *ROLLUP_DIMENSIONS, *ROLLUP_MEASURES]
+    stmt = pg_insert(UsageRollup).from_select(
+        ["id", "granularity", "updated_at", *names],
+        select(
+            func.gen_random_uuid(),
+            literal(granularity.value),
+            func.now(),
+            *(src.c[name] for name in names),
+        ),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["tenant_id", "granularity", "bucket_start", *ROLLUP_DIMENSIONS],
+        set_={
+            **{name: stmt.excluded[name] for name in ROLLUP_MEASURES},
+            "updated_at": func.now(),
+        },
+    )
+
+
+class AnalyticsRollupJob:
+    """Scheduled job that keeps usage_rollups up to date."""
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        interval_s: float = 300.0,
+        grace_s: float = 120.0,
+        max_hours_per_pass: int = 24,
+    ) -> None:
+        """Initialize the job.
+
+        Args:
+            session_factory: Creates one AsyncSession per chunk/transaction
+            interval_s: Seconds between passes of the background task
+            grace_s: An hour is rolled up only this long after it ends, so
+                buffered metrics have been flushed
+            max_hours_per_pass: Hours of raw metrics aggregated per transaction
+        """
+        self._session_factory = session_factory
+        self._interval_s = interval_s
+        self._grace = timedelta(seconds=grace_s)
+        self._chunk = timedelta(hours=max(1, max_hours_per_pass))
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(
+        cls, session_factory: Callable[[], AsyncSession], settings: Any
+    ) -> AnalyticsRollupJob:
+        """Build a job from ANALYTICS_ROLLUP_* settings (all optional)."""
+        return cls(
+            session_factory=session_factory,
+            interval_s=getattr(settings, "analytics_rollup_interval_seconds", 300.0),
+            grace_s=getattr(settings, "analytics_rollup_grace_seconds", 120.0),
+            max_hours_per_pass=getattr(settings, "analytics_rollup_max_hours_per_pass", 24),
+        )
+
+    # ------------------------------------------------------------------
+    # Watermarks
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    async def get_watermarks(db: AsyncSession) -> dict[str, datetime]:
+        """Return ``{granularity: rolled_up_to}`` for materialized granularities."""
+        result = await db.execute(
+            select(RollupWatermark.granularity, RollupWatermark.rolled_up_to)
+        )
+        return {granularity: mark for granularity, mark in result.all()}
+
+    @staticmethod
+    async def _set_watermark(
+        db: AsyncSession, granularity: RollupGranularity, mark: datetime
+    ) -> None:
+        stmt = pg_insert(RollupWatermark).values(
+            granularity=granularity.value, rolled_up_to=mark, updated_at=func.now()
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["granularity"],
+                set_={
+                    "rolled_up_to": func.greatest(
+                        RollupWatermark.rolled_up_to, stmt.excluded.rolled_up_to
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    @staticmethod
+    async def _try_lock(db: AsyncSession) -> bool:
+        result = await db.execute(select(func.pg_try_advisory_xact_lock(_LOCK_KEY)))
+        return bool(result.scalar())
+
+    # ------------------------------------------------------------------
+    # Passes
+    # ------------------------------------------------------------------
+
+    async def _step(self, cutoff: datetime) -> dict[str, Any] | None:
+        """Roll up one chunk in its own transaction; None when caught up or locked."""
+        async with self._session_factory() as db:
+            if not await self._try_lock(db):
+                log.debug("analytics_rollup.locked")
+                return None
+
+            marks = await self.get_watermarks(db)
+            hour_mark = marks.get(RollupGranularity.HOUR.value)
+            day_mark = marks.get(RollupGranularity.DAY.value)
+            if hour_mark is None:
+                first = (await db.execute(select(func.min(UsageMetric.timestamp)))).scalar()
+                hour_mark = floor_hour(first) if first is not None else cutoff
+                day_mark = floor_day(hour_mark)
+
+            step: dict[str, Any] = {}
+            if hour_mark < cutoff:
+                end = min(hour_mark + self._chunk, cutoff)
+                start_time = time.perf_counter()
+                result = await db.execute(
+                    upsert_rollups(RollupGranularity.HOUR, _hourly_source(hour_mark, end))
+                )
+                elapsed = time.perf_counter() - start_time
+                step["hour"] = (hour_mark, end, result.rowcount, elapsed)
+                hour_mark = end
+
+            day_end = floor_day(hour_mark)
+            if day_mark is None:
+                day_mark = day_end
+            if day_mark < day_end:
+                start_time = time.perf_counter()
+                result = await db.execute(
+                    upsert_rollups(RollupGranularity.DAY, _daily_source(day_mark, day_end))
+                )
+                elapsed = time.perf_counter() - start_time
+                step["day"] = (day_mark, day_end, result.rowcount, elapsed)
+                day_mark = day_end
+
+            await self._set_watermark(db, RollupGranularity.HOUR, hour_mark)
+            await self._set_watermark(db, RollupGranularity.DAY, day_mark)
+            await db.commit()
+
+        now = datetime.now(UTC)
+        for granularity, (start, end, rows, seconds) in step.items():
+            record_analytics_rollup(granularity, seconds, (now - end).total_seconds())
+            log.info(
+                "analytics_rollup.chunk",
+                granularity=granularity,
+                start=start.isoformat(),
+                end=end.isoformat(),
+                rows=rows,
+                duration_ms=round(seconds * 1000, 1),
+            )
+        return step or None
+
+    async def run_once(self, now: datetime | None = None) -> dict[str, int]:
+        """Roll up every closed hour and day not yet materialized.
+
+        Returns the number of chunks processed per granularity.
+        """
+        cutoff = floor_hour((now or datetime.now(UTC)) - self._grace)
+        chunks = {RollupGranularity.HOUR.value: 0, RollupGranularity.DAY.value: 0}
+        while (step := await self._step(cutoff)) is not None:
+            for granularity in step:
+                chunks[granularity] += 1
+        return chunks
+
+    async def rebuild(self, start: datetime, end: datetime) -> None:
+        """Recompute already rolled-up buckets in ``[start, end)``.
+
+        For metrics written after their hour was closed (imports, replays).
+        Watermarks do not move; buckets past them are left to ``run_once``.
+        """
+        async with self._session_factory() as db:
+            marks = await self.get_watermarks(db)
+        hour_mark = marks.get(RollupGranularity.HOUR.value)
+        if hour_mark is None:
+            return
+        hour = floor_hour(start)
+        end = min(end, hour_mark)
+        while hour < end:
+            chunk_end = min(hour + self._chunk, end)
+            async with self._session_factory() as db:
+                await db.execute(
+                    upsert_rollups(RollupGranularity.HOUR, _hourly_source(hour, chunk_end))
+                )
+                await db.commit()
+            hour = chunk_end
+        # Every day touched by the range, up to the daily watermark
+        day_start = floor_day(start)
+        day_end = floor_day(end)
+        if day_end < end:
+            day_end += timedelta(days=1)
+        day_end = min(day_end, marks.get(RollupGranularity.DAY.value, day_start))
+        if day_start < day_end:
+            async with self._session_factory() as db:
+                await db.execute(
+                    upsert_rollups(RollupGranularity.DAY, _daily_source(day_start, day_end))
+                )
+                await db.commit()
+        log.info("analytics_rollup.rebuilt", start=start.isoformat(), end=end.isoformat())
+
+    # ------------------------------------------------------------------
+    # Background task
+    # ------------------------------------------------------------------
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as exc:
+                log.error("analytics_rollup.pass_failed", error=str(exc), exc_info=True)
+            await asyncio.sleep(self._interval_s)
+
+    async def start(self) -> None:
+        """Start the periodic rollup task."""
+        if self._task is None and self._interval_s > 0:
+            self._task = asyncio.create_task(self._loop())
+            log.info("analytics_rollup.started", interval_s=self._interval_s)
+
+    async def shutdown(self) -> None:
+        """Stop the periodic rollup task."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
@@ -7,40 +7,116 @@ This service orchestrates the complete document ingestion workflow:
 4. Generate embeddings for chunks
 5. Store chunks in vector database
 6. Update job status throughout
+
+Uploads are queued rather than processed in the request: create_job stores
+the file on a PENDING job, and IngestionWorker (src/infra/background_worker.py)
+claims jobs with claim_next_job and runs the stages below. Embedding and
+storage are pipelined: batch N+1 is embedded while batch N is inserted.
+process_job runs the same stages inline for callers that want to wait.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import tempfile
 import uuid
-from datetime import UTC, datetime
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import delete, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from src.agent.llm import LLMClient
+from src.cache.embedding_cache import EmbeddingCache
 from src.config import Settings
 from src.core.policy import apply_tenant_filter
-from src.ingestion.chunker import chunk_document
+from src.ingestion.chunker import Chunk, chunk_document
 from src.ingestion.parsers import get_parser
 from src.models.document import DocumentChunk
 from src.models.ingestion import FileType, IngestionJob, IngestionStatus
+from src.rag.chunk_embedder import ChunkEmbedder
+from src.rag.chunk_writer import BulkChunkWriter, ChunkRow
 
 log = structlog.get_logger(__name__)
 
 _EMBED_BATCH_SIZE = 32
+_DEFAULT_TENANT_CONCURRENCY = 2
+
+# Statuses that occupy one of a tenant's ingestion slots
+_ACTIVE_STATUSES = (
+    IngestionStatus.PROCESSING,
+    IngestionStatus.CHUNKING,
+    IngestionStatus.EMBEDDING,
+    IngestionStatus.INDEXING,
+)
+
+# Claims are serialized with a transaction-scoped advisory lock so two
+# workers cannot both see a free slot for the same tenant.
+_CLAIM_SQL = text(
+    """
+    UPDATE ingestion_jobs
+    SET status = 'processing',
+        attempts = attempts + 1,
+        locked_by = :worker_id,
+        locked_at = now(),
+        started_at = COALESCE(started_at, now()),
+        error_message = NULL,
+        chunk_count = 0,
+        chunks_total = 0,
+        chunks_embedded = 0,
+        chunks_deduplicated = 0
+    WHERE id = (
+        SELECT j.id
+        FROM ingestion_jobs j
+        WHERE j.status = 'pending'
+          AND (
+              SELECT count(*)
+              FROM ingestion_jobs a
+              WHERE a.tenant_id = j.tenant_id
+                AND a.status IN ('processing', 'chunking', 'embedding', 'indexing')
+          ) < COALESCE(
+              (
+                  SELECT ts.ingestion_concurrency
+                  FROM tenant_settings ts
+                  WHERE ts.tenant_id = j.tenant_id
+              ),
+              :default_tenant_concurrency
+          )
+        ORDER BY j.created_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id
+    """
+)
+
+
+class IngestionCancelledError(Exception):
+    """Raised inside the pipeline when the job was cancelled while running."""
 
 
 class IngestionService:
     """Service for document ingestion operations."""
 
-    def __init__(self, db: AsyncSession, settings: Settings, llm_client: LLMClient) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        settings: Settings,
+        llm_client: LLMClient,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
         self._db = db
         self._settings = settings
         self._llm = llm_client
+        self._embedding_cache = embedding_cache
+        self._chunk_writer = BulkChunkWriter(
+            db, use_copy=bool(getattr(settings, "ingestion_bulk_copy", True))
+        )
 
     async def create_job(
         self,
@@ -49,6 +125,7 @@ class IngestionService:
         filename: str,
         file_type: FileType,
         file_size: int,
+        file_bytes: bytes | None = None,
     ) -> IngestionJob:
         """Create a new ingestion job.
 
@@ -57,6 +134,8 @@ class IngestionService:
             filename: Original filename
             file_type: Type of file (PDF, MARKDOWN, etc.)
             file_size: File size in bytes
+            file_bytes: Uploaded file; when given the job is queued for the
+                background workers
 
         Returns:
             Created IngestionJob instance in PENDING status
@@ -67,6 +146,7 @@ class IngestionService:
             file_type=file_type,
             file_size_bytes=file_size,
             status=IngestionStatus.PENDING,
+            file_content=file_bytes,
         )
         self._db.add(job)
         await self._db.flush()
@@ -77,6 +157,7 @@ class IngestionService:
             tenant_id=str(tenant_id),
             filename=filename,
             file_type=file_type.value,
+            queued=file_bytes is not None,
         )
 
         return job
@@ -92,9 +173,12 @@ class IngestionService:
         Flow:
         1. PROCESSING - Parse file, extract text and metadata
         2. CHUNKING - Split text into chunks
-        3. EMBEDDING - Generate embeddings for chunks
-        4. INDEXING - Store chunks in database
-        5. COMPLETED - Mark job as complete
+        3. EMBEDDING - Generate embeddings and store chunks (pipelined:
+           batch N+1 is embedded while batch N is inserted)
+        4. COMPLETED - Mark job as complete
+
+        Uploads normally go through the background queue instead; this runs
+        the same stages inline.
 
         Args:
             job_id: ID of the ingestion job to process
@@ -121,51 +205,22 @@ class IngestionService:
         # Update status to PROCESSING
         job.status = IngestionStatus.PROCESSING
         job.started_at = datetime.now(UTC)
+        job.chunk_count = 0
+        job.chunks_embedded = 0
+        job.chunks_deduplicated = 0
         await self._db.flush()
 
         try:
-            # Step 1: Parse file
-            parsed = await self._parse_file(job, file_bytes)
-            job.metadata_extracted = parsed["metadata"]
-
-            # Step 2: Chunk text
-            job.status = IngestionStatus.CHUNKING
-            await self._db.flush()
-
-            chunks = chunk_document(
-                parsed["text"],
-                chunk_size=self._settings.chunk_size_tokens,
-                overlap=self._settings.chunk_overlap_tokens,
-            )
-
-            log.info(
-                "ingestion.chunked",
-                job_id=str(job.id),
-                chunk_count=len(chunks),
-            )
+            chunks = await self.parse_and_chunk(job, file_bytes)
 
-            # Step 3: Generate embeddings
+            # Steps 3-4: Embed and store (pipelined)
             job.status = IngestionStatus.EMBEDDING
             await self._db.flush()
 
-            # Step 4: Store chunks with embeddings
-            job.status = IngestionStatus.INDEXING
-            await self._db.flush()
-
-            await self._embed_and_store_chunks(job, chunks)
+            await self.embed_and_store_chunks(job, chunks)
 
             # Step 5: Mark complete
-            job.status = IngestionStatus.COMPLETED
-            job.chunk_count = len(chunks)
-            job.completed_at = datetime.now(UTC)
-            await self._db.flush()
-
-            log.info(
-                "ingestion.completed",
-                job_id=str(job.id),
-                chunk_count=len(chunks),
-            )
-
+            await self.complete_job(job)
             return job
 
         except Exception as exc:
@@ -184,6 +239,81 @@ class IngestionService:
 
             raise
 
+    async def parse_and_chunk(self, job: IngestionJob, file_bytes: bytes) -> list[Chunk]:
+        """Run the parse (PROCESSING) and chunk (CHUNKING) stages of a job.
+
+        Chunking is CPU-bound and runs in a worker thread so other jobs on
+        the event loop keep moving. The chunks are materialised rather than
+        streamed from iter_chunks: job.chunks_total is published up front,
+        the embedder resolves known chunk text for the whole job in one
+        preload, and the worker already overlaps this stage with embedding
+        the previous job.
+
+        Returns:
+            The document's chunks; job.chunks_total is set accordingly
+        """
+        # Step 1: Parse file
+        parsed = await self._parse_file(job, file_bytes)
+        job.metadata_extracted = parsed["metadata"]
+
+        # Step 2: Chunk text
+        job.status = IngestionStatus.CHUNKING
+        await self._db.flush()
+
+        chunks = await asyncio.to_thread(
+            chunk_document,
+            parsed["text"],
+            chunk_size=self._settings.chunk_size_tokens,
+            overlap=self._settings.chunk_overlap_tokens,
+        )
+        job.chunks_total = len(chunks)
+        await self._db.flush()
+
+        log.info(
+            "ingestion.chunked",
+            job_id=str(job.id),
+            chunk_count=len(chunks),
+        )
+        return chunks
+
+    async def complete_job(self, job: IngestionJob) -> None:
+        """Mark a job COMPLETED and release its queue state.
+
+        The status check is part of the UPDATE, so a cancel that lands after
+        the last progress commit is not overwritten.
+
+        Raises:
+            IngestionCancelledError: If the job was cancelled (FAILED) meanwhile
+        """
+        await self._db.flush()
+        result = await self._db.execute(
+            update(IngestionJob)
+            .where(
+                IngestionJob.id == job.id,
+                IngestionJob.status != IngestionStatus.FAILED,
+            )
+            .values(
+                status=IngestionStatus.COMPLETED,
+                completed_at=datetime.now(UTC),
+                file_content=None,
+                locked_by=None,
+                locked_at=None,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        if result.rowcount == 0:
+            raise IngestionCancelledError(f"Job {job.id} was cancelled")
+
+        log.info(
+            "ingestion.completed",
+            job_id=str(job.id),
+            chunk_count=job.chunk_count,
+            chunks_deduplicated=job.chunks_deduplicated,
+            dedup_ratio=round(job.chunks_deduplicated / job.chunk_count, 3)
+            if job.chunk_count
+            else 0.0,
+        )
+
     async def get_job(self, job_id: uuid.UUID, tenant_id: uuid.UUID) -> IngestionJob | None:
         """Get an ingestion job by ID (tenant-scoped).
 
@@ -258,6 +388,7 @@ class IngestionService:
         job.status = IngestionStatus.FAILED
         job.error_message = "Cancelled by user"
         job.completed_at = datetime.now(UTC)
+        job.file_content = None
         await self._db.flush()
 
         log.info("ingestion.cancelled", job_id=str(job.id))
@@ -304,8 +435,230 @@ class IngestionService:
         result = await self._db.execute(stmt)
         return list(result.scalars().all())
 
+    async def embed_and_store_chunks(
+        self,
+        job: IngestionJob,
+        chunks: list[Chunk],
+        *,
+        on_batch_stored: Callable[[IngestionJob], Awaitable[None]] | None = None,
+    ) -> None:
+        """Generate embeddings and store chunks, overlapping the two stages.
+
+        While batch N is inserted, batch N+1 is already being embedded, so
+        the embedding endpoint and the database are busy at the same time.
+        job.chunks_embedded and job.chunk_count advance per batch.
+
+        Chunk text that was already embedded with the same model (found in
+        the embedding cache or in this tenant's stored chunks, or repeated
+        within the job) is not re-embedded; job.chunks_deduplicated counts
+        those chunks.
+
+        Args:
+            job: Job being processed
+            chunks: Chunks from the chunker
+            on_batch_stored: Awaited after each batch is flushed (the worker
+                commits progress and checks for cancellation here)
+        """
+        batches = [
+            chunks[batch_start : batch_start + _EMBED_BATCH_SIZE]
+            for batch_start in range(0, len(chunks), _EMBED_BATCH_SIZE)
+        ]
+        if not batches:
+            return
+
+        embedder = ChunkEmbedder(
+            self._db,
+            self._llm,
+            model=str(self._settings.litellm_embedding_model),
+            embedding_cache=self._embedding_cache,
+        )
+        # Resolve known content before the pipeline starts: the lookup uses
+        # the session, which the bulk writer holds once batches are stored.
+        await embedder.preload([c.content for c in chunks], job.tenant_id)
+
+        next_embedding = asyncio.ensure_future(self._embed_batch(embedder, batches[0]))
+        try:
+            for batch_number, batch in enumerate(batches):
+                embeddings = await next_embedding
+                job.chunks_embedded += len(batch)
+                job.chunks_deduplicated = embedder.stats.reused
+
+                # Embed the next batch while this one is inserted
+                if batch_number + 1 < len(batches):
+                    next_embedding = asyncio.ensure_future(
+                        self._embed_batch(embedder, batches[batch_number + 1])
+                    )
+
+                await self._store_batch(job, batch, embeddings, embedder)
+                job.chunk_count += len(batch)
+
+                log.debug(
+                    "ingestion.batch_stored",
+                    job_id=str(job.id),
+                    batch_start=batch_number * _EMBED_BATCH_SIZE,
+                    batch_size=len(batch),
+                )
+
+                if on_batch_stored is not None:
+                    await on_batch_stored(job)
+        finally:
+            if not next_embedding.done():
+                next_embedding.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_embedding
+
+        log.info(
+            "ingestion.embeddings_deduplicated",
+            job_id=str(job.id),
+            chunks=embedder.stats.chunks,
+            embedded=embedder.stats.embedded,
+            cache_hits=embedder.stats.cache_hits,
+            db_hits=embedder.stats.db_hits,
+            dedup_ratio=round(embedder.stats.dedup_ratio, 3),
+        )
+
+    # ---------------------------------------------------------------- #
+    # Durable queue
+    # ---------------------------------------------------------------- #
+
+    async def claim_next_job(
+        self,
+        *,
+        worker_id: str,
+        default_tenant_concurrency: int = _DEFAULT_TENANT_CONCURRENCY,
+    ) -> uuid.UUID | None:
+        """Claim the oldest PENDING job whose tenant has a free ingestion slot.
+
+        The tenant's slot count is TenantSettings.ingestion_concurrency,
+        falling back to default_tenant_concurrency. The claimed job moves to
+        PROCESSING with a fresh lease and reset progress counters. The
+        caller commits.
+
+        Returns:
+            The claimed job ID, or None if nothing is claimable
+        """
+        await self._db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext('ingestion_jobs.claim'))")
+        )
+        result = await self._db.execute(
+            _CLAIM_SQL,
+            {
+                "worker_id": worker_id,
+                "default_tenant_concurrency": default_tenant_concurrency,
+            },
+        )
+        job_id = result.scalar_one_or_none()
+        if job_id is not None:
+            log.info("ingestion.job.claimed", job_id=str(job_id), worker_id=worker_id)
+        return job_id
+
+    async def load_claimed_job(self, job_id: uuid.UUID) -> tuple[IngestionJob, bytes]:
+        """Load a claimed job with its queued file, clearing partial output.
+
+        A job that was claimed before (retry or expired lease) may have
+        stored some chunks already; they are deleted so the rerun does not
+        duplicate them.
+
+        Raises:
+            ValueError: If the job does not exist or has no queued file
+        """
+        result = await self._db.execute(
+            select(IngestionJob)
+            .where(IngestionJob.id == job_id)
+            .options(undefer(IngestionJob.file_content))
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            raise ValueError(f"Ingestion job {job_id} not found")
+        if not job.file_content:
+            raise ValueError(f"Ingestion job {job_id} has no queued file")
+
+        if job.attempts > 1:
+            await self._delete_job_chunks(job)
+        return job, job.file_content
+
+    async def heartbeat(self, *, worker_id: str) -> None:
+        """Extend the lease on every active job held by worker_id."""
+        await self._db.execute(
+            update(IngestionJob)
+            .where(
+                IngestionJob.locked_by == worker_id,
+                IngestionJob.status.in_(_ACTIVE_STATUSES),
+            )
+            .values(locked_at=datetime.now(UTC))
+        )
+
+    async def requeue_stale_jobs(self, *, lease_timeout_s: float, max_attempts: int) -> int:
+        """Return jobs whose lease expired (worker died) to the queue.
+
+        Jobs that already used max_attempts are failed instead.
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        cutoff = datetime.now(UTC) - timedelta(seconds=lease_timeout_s)
+        result = await self._db.execute(
+            select(IngestionJob).where(
+                IngestionJob.status.in_(_ACTIVE_STATUSES),
+                IngestionJob.locked_at < cutoff,
+            )
+        )
+        stale = list(result.scalars().all())
+        for job in stale:
+            await self._release_job(job, "Worker lease expired", max_attempts=max_attempts)
+        if stale:
+            log.warning("ingestion.stale_jobs_released", count=len(stale))
+        return len(stale)
+
+    async def fail_claimed_job(
+        self,
+        job_id: uuid.UUID,
+        error: str,
+        *,
+        max_attempts: int,
+    ) -> IngestionJob | None:
+        """Record a failed attempt: requeue the job, or fail it for good.
+
+        Partial chunks are deleted either way. Cancelled jobs stay FAILED.
+        """
+        result = await self._db.execute(select(IngestionJob).where(IngestionJob.id == job_id))
+        job = result.scalar_one_or_none()
+        if job is None:
+            return None
+        if job.status == IngestionStatus.FAILED:
+            await self._delete_job_chunks(job)
+            return job
+        await self._release_job(job, error, max_attempts=max_attempts)
+        return job
+
     # Private helper methods
 
+    async def _release_job(self, job: IngestionJob, error: str, *, max_attempts: int) -> None:
+        await self._delete_job_chunks(job)
+        job.error_message = error[:1000]
+        job.locked_by = None
+        job.locked_at = None
+        job.chunk_count = 0
+        job.chunks_embedded = 0
+        job.chunks_deduplicated = 0
+        if job.attempts < max_attempts:
+            job.status = IngestionStatus.PENDING
+            log.warning("ingestion.job.requeued", job_id=str(job.id), attempts=job.attempts)
+        else:
+            job.status = IngestionStatus.FAILED
+            job.completed_at = datetime.now(UTC)
+            job.file_content = None
+            log.error("ingestion.failed", job_id=str(job.id), error=error, attempts=job.attempts)
+        await self._db.flush()
+
+    async def _delete_job_chunks(self, job: IngestionJob) -> None:
+        await self._db.execute(
+            delete(DocumentChunk).where(
+                DocumentChunk.tenant_id == job.tenant_id,
+                DocumentChunk.ingestion_job_id == job.id,
+            )
+        )
+
     async def _parse_file(self, job: IngestionJob, file_bytes: bytes) -> dict[str, Any]:
         """Parse file and extract text and metadata."""
         # Write file to temporary location for parsing
@@ -329,42 +682,36 @@ class IngestionService:
             # Clean up temp file
             Path(tmp_path).unlink(missing_ok=True)
 
-    async def _embed_and_store_chunks(
+    async def _embed_batch(
+        self, embedder: ChunkEmbedder, batch: list[Chunk]
+    ) -> list[list[float]]:
+        return await embedder.embed([c.content for c in batch])
+
+    async def _store_batch(
         self,
         job: IngestionJob,
-        chunks: list,  # List of Chunk objects from chunker
+        batch: list[Chunk],
+        embeddings: list[list[float]],
+        embedder: ChunkEmbedder,
     ) -> None:
-        """Generate embeddings and store chunks in database."""
-        # Process chunks in batches
-        for batch_start in range(0, len(chunks), _EMBED_BATCH_SIZE):
-            batch = chunks[batch_start : batch_start + _EMBED_BATCH_SIZE]
-            texts = [c.content for c in batch]
-
-            # Generate embeddings
-            embeddings = await self._llm.embed(texts)
-
-            # Store chunks
-            for chunk, embedding in zip(batch, embeddings):
-                db_chunk = DocumentChunk(
+        await self._chunk_writer.write(
+            [
+                ChunkRow(
                     document_id=uuid.uuid4(),  # Chunk-level ID; IngestionJob has no document FK yet
                     tenant_id=job.tenant_id,
                     content=chunk.content,
                     chunk_index=chunk.index,
                     embedding=embedding,
-                    chunk_metadata={
+                    content_hash=embedder.hash_text(chunk.content),
+                    embedding_model=embedder.model,
+                    ingestion_job_id=job.id,
+                    metadata={
                         "ingestion_job_id": str(job.id),
                         "token_count": chunk.token_count,
                         **chunk.metadata,
                         **job.metadata_extracted,
                     },
                 )
-                self._db.add(db_chunk)
-
-            await self._db.flush()
-
-            log.debug(
-                "ingestion.batch_stored",
-                job_id=str(job.id),
-                batch_start=batch_start,
-                batch_size=len(batch),
-            )
+                for chunk, embedding in zip(batch, embeddings)
+            ]
+        )
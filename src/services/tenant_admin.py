@@ -16,7 +16,7 @@ from datetime import UTC, date, datetime
 from typing import Any
 
 import structlog
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -115,6 +115,7 @@ class TenantSettingsUpdate(BaseModel):
     enabled_features: list[str] | None = None
     max_users: int | None = None
     max_storage_gb: int | None = None
+    ingestion_concurrency: int | None = Field(default=None, ge=1, le=64)
     token_budget_daily: int | None = None
     token_budget_monthly: int | None = None
     custom_system_prompt: str | None = None
@@ -130,6 +131,7 @@ class TenantSettingsResponse(BaseModel):
     enabled_features: list[str] | None
     max_users: int | None
     max_storage_gb: int | None
+    ingestion_concurrency: int | None = None
     token_budget_daily: int | None
     token_budget_monthly: int | None
     custom_system_prompt: str | None
@@ -272,6 +274,7 @@ class TenantAdminService:
             enabled_features=settings.enabled_features,
             max_users=settings.max_users,
             max_storage_gb=settings.max_storage_gb,
+            ingestion_concurrency=settings.ingestion_concurrency,
             token_budget_daily=settings.token_budget_daily,
             token_budget_monthly=settings.token_budget_monthly,
             custom_system_prompt=settings.custom_system_prompt,
@@ -335,6 +338,7 @@ class TenantAdminService:
             enabled_features=settings.enabled_features,
             max_users=settings.max_users,
             max_storage_gb=settings.max_storage_gb,
+            ingestion_concurrency=settings.ingestion_concurrency,
             token_budget_daily=settings.token_budget_daily,
             token_budget_monthly=settings.token_budget_monthly,
             custom_system_prompt=settings.custom_system_prompt,
@@ -24,10 +24,9 @@ Server -> Client message types:
     {"type": "pong"}     - response to ping
 
 Streaming strategy:
-    The current AgentRuntime.chat() is non-streaming (returns full response).
-    The emitter sends status events, then the complete response as done=True.
-    When the runtime is upgraded to support token streaming, emit_response_chunk()
-    can be called per token; the protocol is already designed for it.
+    AgentRuntime.chat_stream() yields LLM tokens as they arrive; each delta is
+    sent as a done=False response chunk. Once the stream completes and the turn
+    is persisted, the full response is sent as done=True with citations.
 
 Security:
     - Auth is enforced on every connection before entering the message loop.
@@ -49,7 +48,7 @@ from src.agent.runtime import AgentRuntime, ChatRequest
 from src.config import Settings, get_settings
 from src.core.policy import Permission, check_permission
 from src.core.rate_limit import RateLimiter, get_rate_limiter
-from src.database import get_db_session
+from src.database import get_db_session, get_optional_session_factory
 from src.websocket.auth import authenticate_websocket
 from src.websocket.events import AgentEventEmitter
 from src.websocket.manager import ConnectionManager, get_connection_manager
@@ -251,12 +250,13 @@ async def _handle_chat_message(
         db=db,
         settings=settings,
         llm_client=LLMClient(settings),
+        session_factory=get_optional_session_factory(),
     )
 
     try:
         await emitter.emit_thinking("Retrieving context and preparing response")
 
-        chat_response = await runtime.chat(
+        turn = runtime.chat_stream(
             user=current_user.user,
             request=ChatRequest(
                 message=content,
@@ -264,7 +264,13 @@ async def _handle_chat_message(
             ),
         )
 
-        await emitter.emit_generating()
+        generating = False
+        async for delta in turn:
+            if not generating:
+                await emitter.emit_generating()
+                generating = True
+            await emitter.emit_response_chunk(delta)
+        chat_response = turn.response
 
         # Send the completed response
         await emitter.emit_agent_completed(
@@ -278,6 +284,7 @@ async def _handle_chat_message(
             user_id=str(current_user.id),
             conversation_id=str(chat_response.conversation_id),
             latency_ms=chat_response.latency_ms,
+            ttft_ms=chat_response.ttft_ms,
         )
 
     except LLMRateLimitError as exc:
@@ -0,0 +1,213 @@
+"""Tests for per-model circuit breakers and their use in FallbackChain.
+
+Covers:
+- closed -> open on error rate or slow-call rate over the rolling window
+- open -> half-open after the open period; probe success closes, failure re-opens
+- FallbackChain skips open tiers without calling them
+- Remaining tiers are ordered by health
+- Fallback events are kept in a bounded ring buffer
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.agent.llm import LLMClient
+from src.agent.model_router.circuit_breaker import (
+    BreakerState,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+)
+from src.agent.model_router.fallback import FallbackChain
+from src.agent.model_router.router import ModelConfig, ModelTier
+from src.middleware.prometheus import REGISTRY
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+_CONFIG = CircuitBreakerConfig(
+    window_size=10,
+    min_calls=4,
+    error_rate_threshold=0.5,
+    slow_call_threshold_s=2.0,
+    slow_call_rate_threshold=0.75,
+    open_duration_s=30.0,
+)
+
+
+def _breaker(clock: _Clock | None = None, name: str = "m") -> CircuitBreaker:
+    return CircuitBreaker(name, _CONFIG, clock=clock or _Clock())
+
+
+class TestCircuitBreaker:
+    def test_opens_on_error_rate(self):
+        breaker = _breaker()
+        breaker.record_success(0.1)
+        breaker.record_failure(0.1)
+        breaker.record_failure(0.1)
+        assert breaker.state == BreakerState.CLOSED  # below min_calls
+        breaker.record_success(0.1)
+
+        assert breaker.state == BreakerState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.health_score() == 0.0
+
+    def test_opens_on_slow_calls(self):
+        breaker = _breaker()
+        for _ in range(3):
+            breaker.record_success(5.0)
+        breaker.record_success(0.1)
+        assert breaker.state == BreakerState.OPEN
+
+    def test_half_open_probe_success_closes(self):
+        clock = _Clock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record_failure(0.1)
+        clock.now = 31.0
+
+        assert breaker.state == BreakerState.HALF_OPEN
+        assert breaker.allow_request()
+        # Only one probe at a time
+        assert not breaker.allow_request()
+        breaker.record_success(0.2)
+
+        assert breaker.state == BreakerState.CLOSED
+        assert breaker.error_rate == 0.0
+
+    def test_half_open_probe_failure_reopens(self):
+        clock = _Clock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record_failure(0.1)
+        clock.now = 31.0
+        assert breaker.allow_request()
+        breaker.record_failure(0.1)
+
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.snapshot()["retry_in_s"] == 30.0
+
+    def test_release_frees_probe(self):
+        clock = _Clock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record_failure(0.1)
+        clock.now = 31.0
+        assert breaker.allow_request()
+        breaker.release()
+        assert breaker.allow_request()
+
+    def test_state_exported_to_prometheus(self):
+        breaker = _breaker(name="prom-model")
+        for _ in range(4):
+            breaker.record_failure(0.1)
+        assert REGISTRY.get_sample_value("model_circuit_state", {"model": "prom-model"}) == 2
+        assert (
+            REGISTRY.get_sample_value(
+                "model_circuit_transitions_total", {"model": "prom-model", "state": "open"}
+            )
+            == 1
+        )
+
+
+def _tiers() -> list[ModelConfig]:
+    return [
+        ModelConfig(ModelTier.HEAVY, "heavy-model", 8192, 10.0, 72.0),
+        ModelConfig(ModelTier.STANDARD, "standard-model", 4096, 3.0, 32.0),
+        ModelConfig(ModelTier.LIGHT, "light-model", 2048, 1.0, 8.0),
+    ]
+
+
+def _llm() -> Mock:
+    client = Mock(spec=LLMClient)
+    client.complete = AsyncMock()
+    return client
+
+
+class TestFallbackChainCircuits:
+    @pytest.mark.asyncio
+    async def test_open_tier_is_skipped_without_a_call(self):
+        registry = CircuitBreakerRegistry(_CONFIG)
+        for _ in range(4):
+            registry.get("heavy-model").record_failure(10.0)
+        chain = FallbackChain(_tiers(), breakers=registry)
+        llm = _llm()
+        llm.complete.return_value = Mock()
+        tiers = _tiers()
+
+        _, tier_used = await chain.execute_with_fallback(
+            llm_client=llm, messages=[], preferred_tier=tiers[0]
+        )
+
+        assert tier_used.model_id == "standard-model"
+        assert [c.kwargs["model"] for c in llm.complete.await_args_list] == ["standard-model"]
+        assert chain.get_fallback_events()[0]["error_type"] == "CircuitOpen"
+        assert chain.circuit_states()["heavy-model"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_remaining_tiers_ordered_by_health(self):
+        registry = CircuitBreakerRegistry(_CONFIG)
+        # standard is erroring (but still closed); light is healthy
+        registry.get("standard-model").record_failure(0.1)
+        registry.get("light-model").record_success(0.1)
+        chain = FallbackChain(_tiers(), breakers=registry)
+        llm = _llm()
+        llm.complete.side_effect = [Exception("heavy down"), Mock()]
+
+        _, tier_used = await chain.execute_with_fallback(
+            llm_client=llm, messages=[], preferred_tier=_tiers()[0]
+        )
+
+        assert tier_used.model_id == "light-model"
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_open_circuit(self):
+        registry = CircuitBreakerRegistry(_CONFIG)
+        chain = FallbackChain(_tiers(), breakers=registry)
+        llm = _llm()
+
+        async def complete(*, model, **kwargs):
+            if model == "heavy-model":
+                raise Exception("timeout")
+            return Mock()
+
+        llm.complete.side_effect = complete
+        for _ in range(6):
+            await chain.execute_with_fallback(
+                llm_client=llm, messages=[], preferred_tier=_tiers()[0]
+            )
+
+        heavy_calls = [c for c in llm.complete.await_args_list if c.kwargs["model"] == "heavy-model"]
+        assert len(heavy_calls) == 4  # min_calls, then the circuit opens
+        assert registry.get("heavy-model").state == BreakerState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_all_circuits_open_fails_fast(self):
+        registry = CircuitBreakerRegistry(_CONFIG)
+        for tier in _tiers():
+            for _ in range(4):
+                registry.get(tier.model_id).record_failure(0.1)
+        chain = FallbackChain(_tiers(), breakers=registry)
+        llm = _llm()
+
+        with pytest.raises(RuntimeError, match="All model tiers failed"):
+            await chain.execute_with_fallback(
+                llm_client=llm, messages=[], preferred_tier=_tiers()[0]
+            )
+        llm.complete.assert_not_awaited()
+
+    def test_events_are_bounded(self):
+        chain = FallbackChain(_tiers(), breakers=CircuitBreakerRegistry(), max_events=3)
+        for i in range(5):
+            chain._record_event(_tiers()[0], "Error", str(i))
+
+        assert [e["error_message"] for e in chain.get_fallback_events()] == ["2", "3", "4"]
@@ -0,0 +1,294 @@
+"""Tests for concurrent context assembly in AgentRuntime.chat.
+
+Covers:
+- Sources run concurrently (wall time ~ slowest source, not the sum)
+- A source past its deadline degrades to its default
+- A failing optional source degrades; a failing required source raises
+- Dedicated sessions per source when a session factory is given
+- Per-source timings on ChatResponse
+- Degraded turns are not written to the response caches
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from src.agent.context_assembly import (
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+    ContextSource,
+    assemble_context,
+    source_session,
+)
+from src.agent.runtime import AgentRuntime, ChatRequest
+
+
+def _after(delay: float, value):
+    async def load():
+        await asyncio.sleep(delay)
+        return value
+
+    return load
+
+
+class TestAssembleContext:
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently(self):
+        start = time.perf_counter()
+        context = await assemble_context(
+            [ContextSource(name=f"s{i}", load=_after(0.05, i)) for i in range(4)]
+        )
+        elapsed = time.perf_counter() - start
+
+        assert [context.value(f"s{i}") for i in range(4)] == [0, 1, 2, 3]
+        assert elapsed < 0.15
+        assert set(context.timings_ms) == {"s0", "s1", "s2", "s3"}
+        assert context.degraded == []
+
+    @pytest.mark.asyncio
+    async def test_deadline_degrades_to_default(self):
+        context = await assemble_context(
+            [
+                ContextSource(name="fast", load=_after(0, "ok")),
+                ContextSource(name="slow", load=_after(1.0, "late"), default="", deadline_s=0.02),
+            ]
+        )
+
+        assert context.value("slow") == ""
+        assert context.results["slow"].status == STATUS_TIMEOUT
+        assert context.results["fast"].status == STATUS_OK
+        assert context.degraded == ["slow"]
+        assert context.total_ms < 500
+
+    @pytest.mark.asyncio
+    async def test_optional_error_degrades(self):
+        async def boom():
+            raise RuntimeError("db down")
+
+        context = await assemble_context([ContextSource(name="goals", load=boom, default=[])])
+
+        assert context.value("goals") == []
+        assert context.results["goals"].status == STATUS_ERROR
+        assert context.results["goals"].error == "db down"
+
+    @pytest.mark.asyncio
+    async def test_required_error_propagates_and_cancels_others(self):
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def boom():
+            raise LookupError("conversation not found")
+
+        with pytest.raises(LookupError):
+            await assemble_context(
+                [
+                    ContextSource(name="conversation", load=boom, required=True),
+                    ContextSource(name="retrieval", load=slow),
+                ]
+            )
+        assert cancelled.is_set()
+
+
+class _Session:
+    def __init__(self):
+        self.commit = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestSourceSession:
+    @pytest.mark.asyncio
+    async def test_factory_gives_dedicated_committed_session(self):
+        sessions: list[_Session] = []
+
+        def factory():
+            sessions.append(_Session())
+            return sessions[-1]
+
+        shared = MagicMock()
+        async with source_session(factory, shared, asyncio.Lock()) as db:
+            assert db is sessions[0]
+        sessions[0].commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_without_factory_shares_request_session_exclusively(self):
+        shared = MagicMock()
+        lock = asyncio.Lock()
+        async with source_session(None, shared, lock) as db:
+            assert db is shared
+            assert lock.locked()
+        assert not lock.locked()
+
+
+class TestRuntimeContextAssembly:
+    def _runtime(self, session_factory=None):
+        settings = SimpleNamespace(
+            vector_top_k=5,
+            litellm_default_model="test-model",
+            model_heavy="heavy-model",
+            context_memory_deadline_ms=30,
+        )
+        llm = Mock()
+        llm.complete = AsyncMock(return_value=Mock())
+        llm.extract_text = Mock(return_value="answer")
+        runtime = AgentRuntime(
+            db=MagicMock(add=Mock(), flush=AsyncMock()),
+            settings=settings,
+            llm_client=llm,
+            session_factory=session_factory,
+        )
+        conversation = SimpleNamespace(id=uuid.uuid4(), updated_at=None)
+        runtime._load_conversation_context = AsyncMock(return_value=(conversation, []))
+        runtime._retrieve_rag_context = AsyncMock(return_value=([], "", None))
+        runtime._load_goals_context = AsyncMock(return_value=([], ""))
+        runtime._store_turn_memory = AsyncMock()
+        return runtime
+
+    def _user(self):
+        return SimpleNamespace(id=uuid.uuid4(), tenant_id=uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_slow_memory_recall_degrades_to_no_memories(self, monkeypatch):
+        import src.agent.runtime as runtime_module
+
+        monkeypatch.setattr(
+            runtime_module, "_call_with_escalation", AsyncMock(return_value=(Mock(), "m"))
+        )
+        runtime = self._runtime(session_factory=lambda: _Session())
+
+        async def slow_recall(**kwargs):
+            await asyncio.sleep(1.0)
+            return "memories"
+
+        runtime._recall_memory_context = slow_recall
+
+        start = time.perf_counter()
+        response = await runtime.chat(
+            user=self._user(), request=ChatRequest(message="hi"), agent_id=uuid.uuid4()
+        )
+
+        assert time.perf_counter() - start < 0.5
+        assert response.degraded_context == ["memory"]
+        assert set(response.context_timings_ms) == {
+            "conversation",
+            "retrieval",
+            "goals",
+            "memory",
+        }
+        messages = runtime_module._call_with_escalation.await_args.kwargs["messages"]
+        assert not any("memories" in m["content"] for m in messages)
+
+    @pytest.mark.asyncio
+    async def test_degraded_turn_is_not_cached(self, monkeypatch):
+        import src.agent.runtime as runtime_module
+
+        monkeypatch.setattr(
+            runtime_module, "_call_with_escalation", AsyncMock(return_value=(Mock(), "m"))
+        )
+        runtime = self._runtime()
+        runtime._response_cache = Mock(
+            get_cached_response=AsyncMock(return_value=None), cache_response=AsyncMock()
+        )
+        runtime._load_goals_context = AsyncMock(side_effect=RuntimeError("goals down"))
+
+        response = await runtime.chat(user=self._user(), request=ChatRequest(message="hi"))
+
+        assert response.degraded_context == ["goals"]
+        runtime._response_cache.cache_response.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_complete_turn_is_cached(self, monkeypatch):
+        import src.agent.runtime as runtime_module
+
+        monkeypatch.setattr(
+            runtime_module, "_call_with_escalation", AsyncMock(return_value=(Mock(), "m"))
+        )
+        runtime = self._runtime()
+        runtime._response_cache = Mock(
+            get_cached_response=AsyncMock(return_value=None), cache_response=AsyncMock()
+        )
+
+        response = await runtime.chat(user=self._user(), request=ChatRequest(message="hi"))
+
+        assert response.degraded_context == []
+        runtime._response_cache.cache_response.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_deadlines_without_session_factory(self):
+        runtime = self._runtime(session_factory=None)
+        assert runtime._source_deadline_s("memory") is None
+        runtime = self._runtime(session_factory=lambda: _Session())
+        assert runtime._source_deadline_s("memory") == pytest.approx(0.03)
+        assert runtime._source_deadline_s("retrieval") == pytest.approx(5.0)
+
+    @pytest.mark.asyncio
+    async def test_hybrid_retrieval_runs_both_legs_concurrently(self):
+        in_flight = 0
+        max_in_flight = 0
+        sessions: list[AsyncMock] = []
+
+        async def slow_execute(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(all=MagicMock(return_value=[]))
+
+        @asynccontextmanager
+        async def session_factory():
+            session = AsyncMock()
+            session.execute = AsyncMock(side_effect=slow_execute)
+            sessions.append(session)
+            yield session
+
+        llm = Mock()
+        llm.embed = AsyncMock(return_value=[[0.1] * 3])
+        runtime = AgentRuntime(
+            db=MagicMock(),
+            settings=SimpleNamespace(vector_top_k=5, chat_hybrid_retrieval=True),
+            llm_client=llm,
+            session_factory=session_factory,
+        )
+
+        citations, _, embedding = await runtime._retrieve_rag_context(
+            user=self._user(), query="torque spec for pump P-100"
+        )
+
+        assert citations == []
+        assert embedding == [0.1] * 3
+        # One session for the retrieval source, one per search leg
+        assert len(sessions) == 3
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_new_conversation_skips_history_query(self):
+        runtime = AgentRuntime(db=MagicMock(), settings=MagicMock(), llm_client=Mock())
+        conversation = SimpleNamespace(id=uuid.uuid4())
+        runtime._get_or_create_conversation = AsyncMock(return_value=conversation)
+        runtime._load_history = AsyncMock()
+
+        result = await runtime._load_conversation_context(
+            user=self._user(), request=ChatRequest(message="hi")
+        )
+
+        assert result == (conversation, [])
+        runtime._load_history.assert_not_awaited()
@@ -0,0 +1,249 @@
+"""Tests for the rule-based routing fast path.
+
+Covers:
+- Keyword rules pick a capability offered by the registry
+- A single keyword or competing rules stay below the threshold
+- The per-tenant model learns from LLM decisions and stays tenant-scoped
+- Complexity rules; maintenance is quality-critical and SIMPLE needs a
+  lookup rule corroborated by ComplexityEstimator
+- The orchestrator skips the LLM on confident answers and learns from fallbacks
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agent.model_router.fast_path import FastPathClassifier, TenantRoutingModel
+from src.middleware.prometheus import REGISTRY
+
+_CAPABILITIES = {
+    "conversation",
+    "procedure_lookup",
+    "safety_reference",
+    "work_order",
+    "equipment_query",
+    "comparison",
+    "trend_analysis",
+    "general_qa",
+}
+
+
+class TestIntent:
+    def test_corroborating_rules_are_confident(self):
+        classifier = FastPathClassifier()
+        result = classifier.classify_intent(
+            "Show open work orders like WO-1234", tenant_id=None, capabilities=_CAPABILITIES
+        )
+        assert result.label == "work_order"
+        assert classifier.accepts(result)
+
+    def test_single_rule_defers_to_llm(self):
+        classifier = FastPathClassifier()
+        result = classifier.classify_intent(
+            "Show open work orders", tenant_id=None, capabilities=_CAPABILITIES
+        )
+        assert result.label == "work_order"
+        assert result.confidence < classifier.confidence_threshold
+        assert not classifier.accepts(result)
+
+    def test_unregistered_capabilities_are_ignored(self):
+        classifier = FastPathClassifier()
+        result = classifier.classify_intent(
+            "Show open work orders", tenant_id=None, capabilities={"general_qa"}
+        )
+        assert result is None
+        assert not classifier.accepts(result)
+
+    def test_competing_rules_fall_back(self):
+        classifier = FastPathClassifier()
+        result = classifier.classify_intent(
+            "Work order for the pump", tenant_id=None, capabilities=_CAPABILITIES
+        )
+        assert result.confidence == 0.5
+        assert not classifier.accepts(result)
+
+    def test_tenant_model_breaks_ties(self):
+        classifier = FastPathClassifier()
+        tenant = uuid.uuid4()
+        for _ in range(2):
+            classifier.learn(tenant, "work order backlog for the pump", "work_order")
+
+        result = classifier.classify_intent(
+            "Work order for the pump", tenant_id=tenant, capabilities=_CAPABILITIES
+        )
+        other = classifier.classify_intent(
+            "Work order for the pump", tenant_id=uuid.uuid4(), capabilities=_CAPABILITIES
+        )
+
+        assert result.label == "work_order"
+        assert classifier.accepts(result)
+        assert not classifier.accepts(other)
+
+
+class TestTenantRoutingModel:
+    def test_requires_min_count(self):
+        model = TenantRoutingModel(min_count=2)
+        tenant = uuid.uuid4()
+        model.learn(tenant, "torque values", "procedure_lookup")
+        assert model.predict(tenant, "torque values") == {}
+        model.learn(tenant, "torque values", "procedure_lookup")
+        assert model.predict(tenant, "torque values") == {"procedure_lookup": 1.0}
+
+    def test_tenants_are_bounded(self):
+        model = TenantRoutingModel(max_tenants=2, min_count=1)
+        tenants = [uuid.uuid4() for _ in range(3)]
+        for tenant in tenants:
+            model.learn(tenant, "torque", "procedure_lookup")
+        assert model.predict(tenants[0], "torque") == {}
+        assert model.predict(tenants[2], "torque") == {"procedure_lookup": 1.0}
+
+
+class TestComplexity:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("message", "capability", "expected"),
+        [
+            ("Compare pump A versus pump B", "comparison", "multi_perspective"),
+            ("Investigate the root cause of the outage", "general_qa", "deep"),
+            ("Where is the torque table", "safety_reference", "quality_critical"),
+            ("Maintenance schedule for pump P-101", "maintenance_planning", "quality_critical"),
+            ("Status of line 3", "general_qa", "simple"),
+        ],
+    )
+    async def test_confident_tiers(self, message, capability, expected):
+        classifier = FastPathClassifier()
+        result = await classifier.assess_complexity(message, capability)
+        assert result.label == expected
+        assert classifier.accepts(result)
+
+    @pytest.mark.asyncio
+    async def test_single_rule_defers_to_llm(self):
+        classifier = FastPathClassifier()
+        result = await classifier.assess_complexity(
+            "Find the root cause of the outage", "general_qa"
+        )
+        assert result.label == "deep"
+        assert not classifier.accepts(result)
+
+    @pytest.mark.asyncio
+    async def test_no_rule_is_not_simple(self):
+        classifier = FastPathClassifier()
+        assert await classifier.assess_complexity("Pump P-101 readings", "general_qa") is None
+        assert not classifier.accepts(None)
+
+    @pytest.mark.asyncio
+    async def test_lookup_on_maintenance_capability_is_not_simple(self):
+        classifier = FastPathClassifier()
+        result = await classifier.assess_complexity("Status of pump P-101", "equipment_query")
+        assert result.label == "quality_critical"
+
+    @pytest.mark.asyncio
+    async def test_maintenance_phrase_is_never_simple(self):
+        classifier = FastPathClassifier()
+        result = await classifier.assess_complexity(
+            "What is the maintenance schedule for pump P-101", "general_qa"
+        )
+        assert result.label != "simple"
+        assert not classifier.accepts(result)
+
+    @pytest.mark.asyncio
+    async def test_competing_tiers_fall_back(self):
+        classifier = FastPathClassifier()
+        result = await classifier.assess_complexity(
+            "Compare the safety procedures", "comparison"
+        )
+        assert not classifier.accepts(result)
+
+
+def _orchestrator(fast_path: FastPathClassifier, llm: MagicMock):
+    from src.agent.orchestrator import AgentOrchestrator
+    from src.agent.registry import AgentSpec
+    from src.models.user import UserRole
+
+    spec = AgentSpec(
+        agent_id="maintenance",
+        name="Maintenance",
+        description="Maintenance",
+        system_prompt="",
+        capabilities=["work_order", "equipment_query"],
+        tools=[],
+        required_role=UserRole.VIEWER,
+    )
+    with patch("src.agent.orchestrator.get_registry") as registry, patch(
+        "src.agent.orchestrator.get_skill_registry"
+    ), patch("src.agent.orchestrator.RedTeam"):
+        registry.return_value.list_agents.return_value = [spec]
+        return AgentOrchestrator(
+            db=AsyncMock(),
+            settings=MagicMock(),
+            llm_client=llm,
+            tool_gateway=MagicMock(),
+            fast_path=fast_path,
+        )
+
+
+class TestOrchestratorFastPath:
+    @pytest.mark.asyncio
+    async def test_confident_intent_skips_llm(self):
+        llm = MagicMock()
+        llm.complete = AsyncMock()
+        classifier = FastPathClassifier()
+        orch = _orchestrator(classifier, llm)
+        before = REGISTRY.get_sample_value(
+            "routing_fast_path_total", {"stage": "intent", "outcome": "hit"}
+        ) or 0
+
+        intent = await orch._classify_intent(
+            "List open work orders like WO-1001", tenant_id=uuid.uuid4()
+        )
+
+        assert intent.primary_capability == "work_order"
+        assert intent.reasoning.startswith("Fast path")
+        llm.complete.assert_not_awaited()
+        assert classifier.stats()["intent"]["hits"] == 1
+        after = REGISTRY.get_sample_value(
+            "routing_fast_path_total", {"stage": "intent", "outcome": "hit"}
+        )
+        assert after == before + 1
+
+    @pytest.mark.asyncio
+    async def test_uncertain_intent_uses_llm_and_learns(self):
+        llm = MagicMock()
+        llm.complete = AsyncMock(return_value=MagicMock())
+        llm.extract_text.return_value = (
+            '{"primary_capability": "work_order", "confidence": 0.9}'
+        )
+        classifier = FastPathClassifier()
+        orch = _orchestrator(classifier, llm)
+        tenant = uuid.uuid4()
+
+        for _ in range(2):
+            intent = await orch._classify_intent("Backlog for P-101", tenant_id=tenant)
+            assert intent.primary_capability == "work_order"
+        assert llm.complete.await_count == 2
+        assert classifier.stats()["intent"]["fallbacks"] == 2
+
+        # No rule matches, but the tenant model has learned the phrasing
+        intent = await orch._classify_intent("Backlog for P-101", tenant_id=tenant)
+        assert intent.reasoning.startswith("Fast path")
+        assert llm.complete.await_count == 2
+        assert classifier.stats()["intent"]["latency_saved_s"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_confident_complexity_skips_llm(self):
+        from src.agent.orchestrator import IntentClassification, QueryComplexity
+
+        llm = MagicMock()
+        llm.complete = AsyncMock()
+        orch = _orchestrator(FastPathClassifier(), llm)
+
+        result = await orch._assess_complexity(
+            "Compare pump A versus pump B",
+            IntentClassification(primary_capability="comparison", confidence=0.9),
+        )
+
+        assert result.complexity == QueryComplexity.MULTI_PERSPECTIVE
+        llm.complete.assert_not_awaited()
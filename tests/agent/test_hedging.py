@@ -0,0 +1,331 @@
+"""Tests for hedged LLM requests.
+
+Covers:
+- Hedge delay follows the latency percentile once enough samples exist
+- Fast primaries are not hedged; slow ones are, and the first success wins
+- The losing call is cancelled
+- A failed hedge falls back to the primary (and vice versa)
+- The tenant budget guard blocks hedges that would exceed BudgetManager limits
+- With a PersistentBudgetManager the guard checks and charges the database,
+  and the charge does not hold up the winning response
+- The orchestrator routes classification through the executor when enabled
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.agent.llm import LLMClient, LLMError
+from src.agent.model_router.budget import BudgetManager, PersistentBudgetManager
+from src.agent.model_router.hedging import (
+    HedgedExecutor,
+    HedgingConfig,
+    HedgingPolicy,
+    estimate_tokens,
+    init_hedging,
+)
+from src.agent.model_router.router import ModelTier
+from src.middleware.prometheus import REGISTRY
+
+_CONFIG = HedgingConfig(min_samples=3, default_delay_s=0.02, min_delay_s=0.0)
+
+
+def _executor(budget: BudgetManager | None = None) -> HedgedExecutor:
+    return HedgedExecutor(HedgingPolicy(_CONFIG), budget_manager=budget)
+
+
+def _llm(delays: dict[str, float], *, fail: set[str] | None = None) -> tuple[Mock, list[str]]:
+    """Client whose complete() sleeps per model; returns (client, cancelled models)."""
+    cancelled: list[str] = []
+    client = Mock(spec=LLMClient)
+
+    async def complete(*, messages, model, **kwargs):
+        try:
+            await asyncio.sleep(delays[model])
+        except asyncio.CancelledError:
+            cancelled.append(model)
+            raise
+        if fail and model in fail:
+            raise LLMError(f"{model} failed")
+        return f"response from {model}"
+
+    client.complete = AsyncMock(side_effect=complete)
+    return client, cancelled
+
+
+class TestHedgingPolicy:
+    def test_default_delay_until_min_samples(self):
+        policy = HedgingPolicy(HedgingConfig(min_samples=3, default_delay_s=0.5))
+        policy.record_latency("m", 0.1)
+        assert policy.delay_for("m") == 0.5
+
+    def test_percentile_delay(self):
+        policy = HedgingPolicy(HedgingConfig(percentile=0.9, min_samples=3))
+        for latency in [0.1] * 9 + [2.0]:
+            policy.record_latency("m", latency)
+        assert policy.delay_for("m") == 0.1
+        policy.record_latency("m", 3.0)
+        assert policy.delay_for("m") == 2.0
+
+    def test_delay_is_clamped(self):
+        policy = HedgingPolicy(HedgingConfig(min_samples=1, max_delay_s=1.0))
+        policy.record_latency("m", 30.0)
+        assert policy.delay_for("m") == 1.0
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens([{"role": "user", "content": "x" * 40}], 16) == 26
+
+
+class TestHedgedExecutor:
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        llm, _ = _llm({"primary": 0.0, "replica": 0.0})
+        executor = _executor()
+
+        result = await executor.complete(
+            llm, messages=[], model="primary", hedge_model="replica"
+        )
+
+        assert result == "response from primary"
+        assert llm.complete.await_count == 1
+        assert executor.stats()["hedges"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        llm, cancelled = _llm({"primary": 1.0, "replica": 0.0})
+        executor = _executor()
+
+        result = await executor.complete(
+            llm, messages=[], model="primary", hedge_model="replica"
+        )
+
+        assert result == "response from replica"
+        assert cancelled == ["primary"]
+        stats = executor.stats()
+        assert stats["hedge_rate"] == 1.0
+        assert stats["hedge_win_rate"] == 1.0
+        assert (
+            REGISTRY.get_sample_value(
+                "llm_hedge_wins_total", {"model": "primary", "winner": "hedge"}
+            )
+            >= 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win(self):
+        llm, cancelled = _llm({"primary": 0.04, "replica": 1.0})
+        executor = _executor()
+
+        result = await executor.complete(
+            llm, messages=[], model="primary", hedge_model="replica"
+        )
+
+        assert result == "response from primary"
+        assert cancelled == ["replica"]
+        assert executor.stats()["hedge_win_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_primary(self):
+        llm, _ = _llm({"primary": 0.05, "replica": 0.0}, fail={"replica"})
+
+        result = await _executor().complete(
+            llm, messages=[], model="primary", hedge_model="replica"
+        )
+
+        assert result == "response from primary"
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises_primary_error(self):
+        llm, _ = _llm({"primary": 0.05, "replica": 0.0}, fail={"primary", "replica"})
+
+        with pytest.raises(LLMError, match="primary failed"):
+            await _executor().complete(llm, messages=[], model="primary", hedge_model="replica")
+
+    @pytest.mark.asyncio
+    async def test_budget_guard_blocks_hedge(self):
+        tenant = uuid.uuid4()
+        budget = BudgetManager(default_daily_limit=150, default_monthly_limit=1000)
+        llm, _ = _llm({"primary": 0.05, "replica": 0.0})
+        executor = _executor(budget)
+
+        # 2 x 100 estimated tokens exceeds the 150-token daily budget
+        result = await executor.complete(
+            llm,
+            messages=[],
+            model="primary",
+            hedge_model="replica",
+            tenant_id=tenant,
+            estimated_tokens=100,
+        )
+
+        assert result == "response from primary"
+        assert llm.complete.await_count == 1
+        assert executor.stats()["budget_denied"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_spend_is_charged_to_budget(self):
+        tenant = uuid.uuid4()
+        budget = BudgetManager(default_daily_limit=1000, default_monthly_limit=1000)
+        llm, _ = _llm({"primary": 1.0, "replica": 0.0})
+
+        await _executor(budget).complete(
+            llm,
+            messages=[],
+            model="primary",
+            hedge_model="replica",
+            tenant_id=tenant,
+            estimated_tokens=100,
+        )
+
+        assert budget.get_usage(tenant).current_daily == 100
+
+    @staticmethod
+    def _persistent(can_afford: bool) -> tuple[PersistentBudgetManager, MagicMock]:
+        session = MagicMock()
+        session.commit = AsyncMock()
+        factory = MagicMock(
+            return_value=MagicMock(
+                __aenter__=AsyncMock(return_value=session),
+                __aexit__=AsyncMock(return_value=False),
+            )
+        )
+        budget = PersistentBudgetManager(session_factory=factory)
+        budget.async_check_budget = AsyncMock(return_value=can_afford)
+        budget.async_record_usage = AsyncMock()
+        return budget, session
+
+    @pytest.mark.asyncio
+    async def test_persistent_budget_is_checked_and_charged(self):
+        tenant = uuid.uuid4()
+        budget, session = self._persistent(can_afford=True)
+        llm, _ = _llm({"primary": 1.0, "replica": 0.0})
+
+        executor = _executor(budget)
+        await executor.complete(
+            llm,
+            messages=[],
+            model="primary",
+            hedge_model="replica",
+            tenant_id=tenant,
+            estimated_tokens=100,
+        )
+        await executor.wait_for_charges()
+
+        budget.async_check_budget.assert_awaited_once_with(session, tenant, 200)
+        budget.async_record_usage.assert_awaited_once_with(
+            session, tenant, ModelTier.LIGHT, 100, 0
+        )
+        session.commit.assert_awaited_once()
+        # The in-memory counters of the base class are not used
+        assert budget.get_usage(tenant).current_daily == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_charge_does_not_delay_the_winner(self):
+        tenant = uuid.uuid4()
+        budget, _ = self._persistent(can_afford=True)
+        charged = asyncio.Event()
+
+        async def slow_record_usage(*args):
+            await asyncio.sleep(0.5)
+            charged.set()
+
+        budget.async_record_usage = AsyncMock(side_effect=slow_record_usage)
+        llm, _ = _llm({"primary": 1.0, "replica": 0.0})
+        executor = _executor(budget)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await executor.complete(
+            llm,
+            messages=[],
+            model="primary",
+            hedge_model="replica",
+            tenant_id=tenant,
+            estimated_tokens=100,
+        )
+
+        assert result == "response from replica"
+        assert loop.time() - start < 0.3
+        assert not charged.is_set()
+        await executor.wait_for_charges()
+        assert charged.is_set()
+
+    @pytest.mark.asyncio
+    async def test_persistent_budget_exhausted_blocks_hedge(self):
+        budget, _ = self._persistent(can_afford=False)
+        llm, _ = _llm({"primary": 0.05, "replica": 0.0})
+        executor = _executor(budget)
+
+        await executor.complete(
+            llm,
+            messages=[],
+            model="primary",
+            hedge_model="replica",
+            tenant_id=uuid.uuid4(),
+            estimated_tokens=100,
+        )
+
+        assert llm.complete.await_count == 1
+        budget.async_record_usage.assert_not_awaited()
+        assert executor.stats()["budget_denied"] == 1
+
+    def test_init_uses_injected_budget_manager(self):
+        settings = MagicMock()
+        settings.llm_hedging_enabled = True
+        settings.llm_hedge_percentile = 0.9
+        settings.llm_hedge_min_samples = 5
+        settings.llm_hedge_default_delay_seconds = 0.5
+        settings.llm_hedge_max_delay_seconds = 2.0
+        budget, _ = self._persistent(can_afford=True)
+
+        try:
+            executor = init_hedging(settings, budget)
+            assert executor is not None and executor._budget is budget
+        finally:
+            settings.llm_hedging_enabled = False
+            init_hedging(settings)
+
+
+class TestOrchestratorHedging:
+    @pytest.mark.asyncio
+    async def test_complexity_assessment_uses_hedger(self):
+        from src.agent.orchestrator import (
+            AgentOrchestrator,
+            IntentClassification,
+            QueryComplexity,
+        )
+
+        settings = MagicMock()
+        settings.llm_hedge_model = "replica"
+        llm = MagicMock()
+        llm.extract_text.return_value = "DEEP"
+        hedger = Mock(spec=HedgedExecutor)
+        hedger.complete = AsyncMock(return_value=Mock())
+        tenant = uuid.uuid4()
+
+        with patch("src.agent.orchestrator.get_registry"), patch(
+            "src.agent.orchestrator.get_skill_registry"
+        ), patch("src.agent.orchestrator.RedTeam"):
+            orch = AgentOrchestrator(
+                db=AsyncMock(),
+                settings=settings,
+                llm_client=llm,
+                tool_gateway=MagicMock(),
+                hedger=hedger,
+            )
+
+        result = await orch._assess_complexity(
+            "Analyse this",
+            IntentClassification(primary_capability="general_knowledge", confidence=0.9),
+            tenant_id=tenant,
+        )
+
+        assert result.complexity == QueryComplexity.DEEP
+        kwargs = hedger.complete.await_args.kwargs
+        assert kwargs["hedge_model"] == "replica"
+        assert kwargs["tenant_id"] == tenant
+        llm.complete.assert_not_called()
@@ -0,0 +1,113 @@
+"""Tests for the app-scoped LLM transport.
+
+Covers:
+- Per-model concurrency limits (default and per-model override)
+- Pool statistics and slot accounting
+- LLMClient borrows the transport: per-call proxy routing, no global mutation
+- init/close install and remove the shared LiteLLM async session
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import litellm
+import pytest
+
+from src.agent.llm import LLMClient
+from src.agent.llm_transport import (
+    LLMTransport,
+    close_llm_transport,
+    get_llm_transport,
+    init_llm_transport,
+)
+
+
+def _transport(**kwargs) -> LLMTransport:
+    return LLMTransport(base_url="http://proxy:4000", api_key="sk-test", http2=False, **kwargs)
+
+
+async def _peak_concurrency(transport: LLMTransport, model: str, calls: int) -> int:
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with transport.slot(model):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(calls)))
+    return peak
+
+
+class TestLLMTransport:
+    @pytest.mark.asyncio
+    async def test_per_model_limit(self):
+        transport = _transport(max_concurrency_per_model=2, model_concurrency={"big": 1})
+        try:
+            assert await _peak_concurrency(transport, "small", 6) == 2
+            assert await _peak_concurrency(transport, "big", 4) == 1
+        finally:
+            await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unlimited_by_default(self):
+        transport = _transport()
+        try:
+            assert await _peak_concurrency(transport, "m", 5) == 5
+        finally:
+            await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stats_track_in_flight_and_waiting(self):
+        transport = _transport(max_concurrency_per_model=1)
+        try:
+            async with transport.slot("m"):
+                waiter = asyncio.ensure_future(transport.slot("m").__aenter__())
+                await asyncio.sleep(0)
+                stats = transport.stats()
+                assert stats["models"]["m"] == {"in_flight": 1, "waiting": 1, "limit": 1}
+            await waiter
+            assert transport.stats()["models"]["m"]["waiting"] == 0
+            assert transport.stats()["http2"] is False
+        finally:
+            await transport.aclose()
+
+
+class TestLLMClientWithTransport:
+    @pytest.mark.asyncio
+    async def test_routes_per_call_without_touching_globals(self, fake_settings):
+        transport = _transport()
+        response = SimpleNamespace(usage=None)
+        try:
+            with patch.object(litellm, "api_base", "unchanged"), patch(
+                "src.agent.llm.litellm.acompletion", new=AsyncMock(return_value=response)
+            ) as acompletion:
+                client = LLMClient(fake_settings, transport=transport)
+                await client.complete(messages=[], model="m")
+                assert litellm.api_base == "unchanged"
+
+            kwargs = acompletion.await_args.kwargs
+            assert kwargs["api_base"] == "http://proxy:4000"
+            assert kwargs["api_key"] == "sk-test"
+            assert transport.stats()["models"]["m"]["in_flight"] == 0
+        finally:
+            await transport.aclose()
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_init_installs_shared_session(self, fake_settings):
+        try:
+            transport = init_llm_transport(fake_settings)
+            assert get_llm_transport() is transport
+            assert litellm.aclient_session is transport.client
+            assert LLMClient(fake_settings)._transport is transport
+        finally:
+            await close_llm_transport()
+        assert get_llm_transport() is None
+        assert litellm.aclient_session is None
@@ -0,0 +1,169 @@
+"""Tests for token streaming from LLMClient through AgentRuntime.chat_stream.
+
+Covers:
+- LLMClient.stream yields content deltas and skips empty chunks
+- TTFT and inter-token latency are recorded in Prometheus
+- Errors opening the stream and mid-stream errors map to LLM exceptions
+- chat_stream yields tokens before persisting, then exposes ChatResponse
+- Cache hits are streamed as one chunk; abandoned streams are not persisted
+"""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.agent.llm import LLMClient, LLMError
+from src.agent.runtime import AgentRuntime, ChatRequest
+from src.middleware.prometheus import REGISTRY
+
+
+def _chunk(content: str | None) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def _stream(*contents: str | None, error: Exception | None = None):
+    async def chunks():
+        for content in contents:
+            yield _chunk(content)
+        if error is not None:
+            raise error
+
+    return chunks()
+
+
+def _sample(name: str, model: str) -> float:
+    return REGISTRY.get_sample_value(name, {"model": model}) or 0.0
+
+
+class TestLLMClientStream:
+    @pytest.mark.asyncio
+    async def test_yields_deltas_and_records_latency(self, fake_settings):
+        model = f"stream-{uuid.uuid4().hex[:8]}"
+        client = LLMClient(fake_settings)
+        with patch(
+            "src.agent.llm.litellm.acompletion",
+            new=AsyncMock(return_value=_stream("Hel", None, "lo", "", "!")),
+        ) as acompletion:
+            deltas = [d async for d in client.stream(messages=[], model=model)]
+
+        assert deltas == ["Hel", "lo", "!"]
+        assert acompletion.await_args.kwargs["stream"] is True
+        assert _sample("llm_time_to_first_token_seconds_count", model) == 1
+        # Two gaps between three content chunks
+        assert _sample("llm_inter_token_latency_seconds_count", model) == 2
+
+    @pytest.mark.asyncio
+    async def test_open_failure_raises_llm_error(self, fake_settings):
+        client = LLMClient(fake_settings)
+        with patch(
+            "src.agent.llm.litellm.acompletion",
+            new=AsyncMock(side_effect=ValueError("bad request")),
+        ):
+            with pytest.raises(LLMError):
+                async for _ in client.stream(messages=[], model="m"):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_failure_raises_llm_error(self, fake_settings):
+        client = LLMClient(fake_settings)
+        received = []
+        with patch(
+            "src.agent.llm.litellm.acompletion",
+            new=AsyncMock(return_value=_stream("a", error=ConnectionResetError("reset"))),
+        ):
+            with pytest.raises(LLMError, match="stream failed"):
+                async for delta in client.stream(messages=[], model="m"):
+                    received.append(delta)
+        assert received == ["a"]
+
+
+class TestChatStream:
+    def _runtime(self, llm, response_cache=None):
+        settings = SimpleNamespace(
+            vector_top_k=5,
+            litellm_default_model="test-model",
+            model_heavy="heavy-model",
+        )
+        db = MagicMock(add=Mock(), flush=AsyncMock())
+        runtime = AgentRuntime(
+            db=db, settings=settings, llm_client=llm, response_cache=response_cache
+        )
+        conversation = SimpleNamespace(id=uuid.uuid4(), updated_at=None)
+        runtime._load_conversation_context = AsyncMock(return_value=(conversation, []))
+        runtime._retrieve_rag_context = AsyncMock(return_value=([], "", None))
+        runtime._load_goals_context = AsyncMock(return_value=([], ""))
+        return runtime, db, conversation
+
+    def _user(self):
+        return SimpleNamespace(id=uuid.uuid4(), tenant_id=uuid.uuid4())
+
+    def _llm(self, *deltas: str) -> Mock:
+        async def stream(**kwargs):
+            for delta in deltas:
+                yield delta
+
+        llm = Mock()
+        llm.stream = Mock(side_effect=stream)
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_tokens_stream_before_persistence(self):
+        runtime, db, conversation = self._runtime(self._llm("The ", "answer"))
+        stream = runtime.chat_stream(user=self._user(), request=ChatRequest(message="q"))
+
+        received = []
+        async for delta in stream:
+            received.append(delta)
+            # Only the user message exists while tokens are flowing
+            assert db.add.call_count == 1
+            db.flush.assert_not_awaited()
+
+        assert received == ["The ", "answer"]
+        assert db.add.call_count == 2
+        assistant_msg = db.add.call_args.args[0]
+        assert assistant_msg.content == "The answer"
+        assert stream.response.response == "The answer"
+        assert stream.response.conversation_id == conversation.id
+        assert stream.response.ttft_ms is not None
+
+    @pytest.mark.asyncio
+    async def test_response_is_cached_after_stream(self):
+        cache = Mock()
+        cache.get_cached_response = AsyncMock(return_value=None)
+        cache.cache_response = AsyncMock()
+        runtime, _, _ = self._runtime(self._llm("a", "b"), response_cache=cache)
+
+        async for _ in runtime.chat_stream(user=self._user(), request=ChatRequest(message="q")):
+            pass
+
+        assert cache.cache_response.await_args.kwargs["response"] == "ab"
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_streams_single_chunk(self):
+        cache = Mock()
+        cache.get_cached_response = AsyncMock(
+            return_value=SimpleNamespace(content="cached", model="m", hit_count=3)
+        )
+        llm = self._llm("unused")
+        runtime, _, _ = self._runtime(llm, response_cache=cache)
+        stream = runtime.chat_stream(user=self._user(), request=ChatRequest(message="q"))
+
+        assert [d async for d in stream] == ["cached"]
+        llm.stream.assert_not_called()
+        assert stream.response.model_used == "m"
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_persisted(self):
+        runtime, db, _ = self._runtime(self._llm("a", "b", "c"))
+        stream = runtime.chat_stream(user=self._user(), request=ChatRequest(message="q"))
+
+        deltas = aiter(stream)
+        assert await anext(deltas) == "a"
+        await deltas.aclose()
+
+        db.flush.assert_not_awaited()
+        assert stream.response is None
@@ -0,0 +1,285 @@
+"""Tests for batched tool execution in ToolGateway.
+
+Covers:
+- Independent calls run concurrently and return in request order
+- Per-connector concurrency limits, shared by every gateway in the process
+- Role checks still apply to each call in a batch
+- The batch deadline cancels unfinished calls and logs each of them
+- LLM tool calls are parsed into ToolCall (bad arguments fail that call only)
+- Specialists submit a batch through _use_tools
+- DataAnalyst only fetches SAP stock totals for scoped questions its user may run
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.agent.specialists.base import AgentContext, AgentResponse, BaseSpecialistAgent
+from src.agent.specialists.data_analyst import DataAnalystAgent, _inventory_params
+from src.agent.tools import (
+    BaseTool,
+    ConnectorLimiter,
+    ToolCall,
+    ToolContext,
+    ToolGateway,
+    ToolResult,
+    get_connector_limiter,
+)
+from src.models.user import UserRole
+
+
+class _SleepTool(BaseTool):
+    """Sleeps for params["delay"] and echoes params["value"]."""
+
+    description = "test tool"
+    parameters_schema: dict[str, Any] = {"type": "object", "properties": {}}
+
+    def __init__(
+        self, name: str, connector: str | None = None, role: UserRole = UserRole.VIEWER
+    ) -> None:
+        self.name = name
+        self.connector = connector
+        self.required_role = role
+        self.running = 0
+        self.peak = 0
+        self.cancelled = 0
+
+    async def execute(self, params: dict[str, Any], context: ToolContext) -> ToolResult:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(params.get("delay", 0))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+        return ToolResult(success=True, data=params.get("value"))
+
+
+def _gateway(*tools: _SleepTool, **limits: Any) -> ToolGateway:
+    # A private limiter per test: the shared one outlives each test's event loop
+    gateway = ToolGateway(connector_limiter=ConnectorLimiter(**limits))
+    gateway._tools = {tool.name: tool for tool in tools}
+    return gateway
+
+
+def _context(role: UserRole = UserRole.OPERATOR) -> ToolContext:
+    return ToolContext(tenant_id=str(uuid.uuid4()), user_id=str(uuid.uuid4()), user_role=role)
+
+
+class TestExecuteMany:
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_in_request_order(self):
+        gateway = _gateway(_SleepTool("po", "sap"), _SleepTool("orders", "mes"))
+        calls = [
+            ToolCall("po", {"delay": 0.3, "value": "slow"}),
+            ToolCall("orders", {"delay": 0.01, "value": "fast"}),
+            ToolCall("po", {"delay": 0.2, "value": "medium"}),
+        ]
+
+        start = time.perf_counter()
+        results = await gateway.execute_many(calls, _context())
+        elapsed = time.perf_counter() - start
+
+        assert [result.data for result in results] == ["slow", "fast", "medium"]
+        assert elapsed < 0.45  # sequential would take 0.51s
+
+    @pytest.mark.asyncio
+    async def test_connector_limit_bounds_concurrency(self):
+        sap, mes = _SleepTool("po", "sap"), _SleepTool("orders", "mes")
+        gateway = _gateway(sap, mes, limits={"sap": 2})
+        calls = [ToolCall("po", {"delay": 0.02}) for _ in range(6)]
+        calls += [ToolCall("orders", {"delay": 0.02}) for _ in range(6)]
+
+        results = await gateway.execute_many(calls, _context())
+
+        assert all(result.success for result in results)
+        assert sap.peak == 2
+        assert mes.peak == 4  # default per-connector limit
+
+    @pytest.mark.asyncio
+    async def test_connector_limit_spans_gateways(self):
+        sap = _SleepTool("po", "sap")
+        limiter = ConnectorLimiter({"sap": 2})
+        gateways = []
+        for _ in range(3):  # one gateway per request, as AgentRuntime builds them
+            gateway = ToolGateway(connector_limiter=limiter)
+            gateway._tools = {sap.name: sap}
+            gateways.append(gateway)
+
+        await asyncio.gather(
+            *(g.execute_many([ToolCall("po", {"delay": 0.02})], _context()) for g in gateways)
+        )
+
+        assert sap.peak == 2
+
+    def test_gateways_share_the_process_limiter(self):
+        assert ToolGateway()._connector_limiter is get_connector_limiter()
+
+    @pytest.mark.asyncio
+    async def test_tools_without_connector_are_unbounded(self):
+        calc = _SleepTool("calc")
+        gateway = _gateway(calc, default_limit=1)
+        calls = [ToolCall("calc", {"delay": 0.01}) for _ in range(5)]
+        await gateway.execute_many(calls, _context())
+        assert calc.peak == 5
+
+    @pytest.mark.asyncio
+    async def test_role_checked_per_call(self):
+        gateway = _gateway(
+            _SleepTool("search"), _SleepTool("po", "sap", role=UserRole.OPERATOR)
+        )
+        results = await gateway.execute_many(
+            [ToolCall("po", {"value": 1}), ToolCall("search", {"value": 2}), ToolCall("nope")],
+            _context(UserRole.VIEWER),
+        )
+
+        assert not results[0].success
+        assert "cannot use tool 'po'" in results[0].error
+        assert results[1].data == 2
+        assert results[2].error == "Unknown tool: 'nope'"
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_unfinished_calls(self, monkeypatch):
+        import src.agent.tools as tools_module
+
+        warnings: list[tuple[str, dict[str, Any]]] = []
+        monkeypatch.setattr(
+            tools_module.log, "warning", lambda event, **kw: warnings.append((event, kw))
+        )
+        slow = _SleepTool("slow", "mes")
+        gateway = _gateway(slow, _SleepTool("fast"))
+
+        results = await gateway.execute_many(
+            [
+                ToolCall("slow", {"delay": 5}, call_id="c1"),
+                ToolCall("slow", {"delay": 5}, call_id="c2"),
+                ToolCall("fast", {"value": "ok"}),
+            ],
+            _context(),
+            deadline_s=0.05,
+        )
+
+        assert not results[0].success
+        assert results[0].metadata["timed_out"] is True
+        assert results[2].data == "ok"
+        assert slow.cancelled == 2
+        timed_out = [kw["call_id"] for event, kw in warnings if event == "tool.execution_timed_out"]
+        assert timed_out == ["c1", "c2"]
+
+    @pytest.mark.asyncio
+    async def test_call_ids_and_invalid_arguments(self):
+        gateway = _gateway(_SleepTool("search"))
+        calls = [
+            ToolCall.from_llm(
+                {"id": "call_1", "function": {"name": "search", "arguments": '{"value": 7}'}}
+            ),
+            ToolCall.from_llm(
+                SimpleNamespace(
+                    id="call_2", function=SimpleNamespace(name="search", arguments="{oops")
+                )
+            ),
+        ]
+
+        results = await gateway.execute_many(calls, _context())
+
+        assert results[0].data == 7
+        assert results[0].metadata["tool_call_id"] == "call_1"
+        assert not results[1].success
+        assert "Invalid tool arguments" in results[1].error
+        assert results[1].metadata["tool_call_id"] == "call_2"
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        assert await _gateway().execute_many([], _context()) == []
+
+
+class _BatchAgent(BaseSpecialistAgent):
+    async def process(self, message: str, context: AgentContext) -> AgentResponse:
+        raise NotImplementedError
+
+
+def _agent_context(role: UserRole = UserRole.OPERATOR) -> AgentContext:
+    return AgentContext(
+        tenant_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        user_role=role,
+        conversation_id=None,
+        rag_context="",
+        conversation_history=[],
+    )
+
+
+class TestSpecialistBatch:
+    @pytest.mark.asyncio
+    async def test_use_tools_submits_llm_tool_calls_as_one_batch(self):
+        search, po = _SleepTool("search"), _SleepTool("po", "sap")
+        gateway = _gateway(search, po)
+        agent = _BatchAgent(
+            spec=SimpleNamespace(agent_id="analyst"), llm_client=None, tool_gateway=gateway
+        )
+        context = _agent_context()
+        llm_calls = [
+            {"id": "a", "function": {"name": "po", "arguments": '{"delay": 0.2, "value": 1}'}},
+            {"id": "b", "function": {"name": "search", "arguments": '{"delay": 0.2, "value": 2}'}},
+        ]
+
+        start = time.perf_counter()
+        results = await agent._use_tools(llm_calls, context)
+
+        assert [result.data for result in results] == [1, 2]
+        assert time.perf_counter() - start < 0.35
+        assert results[1].metadata["tool_call_id"] == "b"
+
+
+class TestDataAnalystInventory:
+    def test_inventory_params_need_a_plant_or_material(self):
+        assert _inventory_params("What does inventory turnover mean?") is None
+        assert _inventory_params("inventory at the plant") is None
+        assert _inventory_params("How much is on hand at plant 1000?") == {
+            "plant": "1000",
+            "aggregate_by": "material",
+        }
+        assert _inventory_params("inventory of material MAT-0042") == {
+            "material_id": "MAT-0042",
+            "aggregate_by": "plant",
+        }
+
+    def _agent(self) -> tuple[DataAnalystAgent, _SleepTool]:
+        inventory = _SleepTool("sap_inventory", "sap", role=UserRole.OPERATOR)
+        inventory.execute = AsyncMock(
+            return_value=ToolResult(success=True, data={"total_records": 3, "total_groups": 1})
+        )
+        gateway = _gateway(_SleepTool("document_search"), inventory)
+        spec = SimpleNamespace(agent_id="data_analyst", requires_verification=False)
+        agent = DataAnalystAgent(spec=spec, llm_client=None, tool_gateway=gateway)
+        agent._build_messages = Mock(return_value=[])
+        agent._call_llm = AsyncMock(return_value="analysis")
+        return agent, inventory
+
+    @pytest.mark.asyncio
+    async def test_scoped_question_fetches_stock_totals(self):
+        agent, inventory = self._agent()
+        response = await agent.process("Inventory at plant 1000?", _agent_context())
+
+        assert inventory.execute.await_args.args[0] == {
+            "plant": "1000",
+            "aggregate_by": "material",
+        }
+        assert [t["tool"] for t in response.tools_used] == ["document_search", "sap_inventory"]
+
+    @pytest.mark.asyncio
+    async def test_unscoped_or_viewer_questions_skip_sap(self):
+        agent, inventory = self._agent()
+        await agent.process("How is inventory valued?", _agent_context())
+        await agent.process("Inventory at plant 1000?", _agent_context(UserRole.VIEWER))
+
+        inventory.execute.assert_not_awaited()
@@ -141,6 +141,60 @@ class TestChatEndpoint:
         routes = [r.path for r in app.routes if hasattr(r, "path")]
         assert "/chat/stream" in routes
 
+    @pytest.mark.asyncio
+    async def test_chat_stream_sends_tokens_then_citations_and_done(
+        self, app, fake_settings
+    ):
+        """Tokens are sent as they are produced; citations and done follow."""
+        import json
+
+        from src.agent.runtime import ChatResponse, ChatStream
+
+        conversation_id = uuid.uuid4()
+        citation = {
+            "index": 1,
+            "document_id": str(uuid.uuid4()),
+            "document_name": "policy.pdf",
+            "document_version": "1",
+            "chunk_index": 0,
+            "content_snippet": "Remote work is allowed",
+        }
+
+        async def deltas(stream):
+            for delta in ("Remote ", "work ", "is allowed."):
+                yield delta
+            stream.response = ChatResponse(
+                response="Remote work is allowed.",
+                conversation_id=conversation_id,
+                citations=[citation],
+                model_used="test-model",
+                ttft_ms=12,
+            )
+
+        def chat_stream(**kwargs):
+            stream = ChatStream()
+            stream._deltas = deltas(stream)
+            return stream
+
+        async with AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            with patch("src.api.chat.AgentRuntime") as mock_runtime_cls:
+                mock_runtime_cls.return_value.chat_stream = chat_stream
+                response = await ac.post("/chat/stream", json={"message": "Remote work?"})
+
+        assert response.status_code == 200
+        events = [
+            json.loads(line[len("data: "):])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        types = [e["type"] for e in events if e["type"] != "heartbeat"]
+        assert types == ["token", "token", "token", "citation", "done"]
+        assert "".join(e["data"] for e in events if e["type"] == "token") == (
+            "Remote work is allowed."
+        )
+        assert events[-1]["metadata"]["conversation_id"] == str(conversation_id)
+        assert events[-1]["metadata"]["ttft_ms"] == 12
+
     @pytest.mark.asyncio
     async def test_chat_respects_rate_limits(
         self, app, fake_settings
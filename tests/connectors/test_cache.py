@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
 
 import pytest
 
-from src.connectors.cache import ConnectorCache
+from src.cache.backend import InMemoryCacheBackend, RedisCacheBackend
+from src.cache.codecs import JsonCodec
+from src.connectors.base import ConnectorResult
+from src.connectors.cache import (
+    ConnectorCache,
+    RedisConnectorCache,
+    get_connector_cache,
+    init_connector_cache,
+)
+from src.connectors.mes import MachineStatus, MachineStatusData
+from src.middleware.prometheus import REGISTRY
 
 
 class TestConnectorCache:
@@ -282,3 +295,255 @@ class TestConnectorCache:
 
         assert stats["tenant_count"] == 2
         assert stats["total_entries"] == 2
+
+
+class _SlowFetch:
+    """Connector call stub that counts calls and can be held open."""
+
+    def __init__(self, data: object = "fresh", *, success: bool = True) -> None:
+        self.calls = 0
+        self.data = data
+        self.success = success
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> ConnectorResult:
+        self.calls += 1
+        await self.release.wait()
+        if not self.success:
+            return ConnectorResult(success=False, error="MES unavailable")
+        return ConnectorResult(success=True, data=self.data, metadata={"count": 1})
+
+
+def _lookup(cache: ConnectorCache, tenant_id: uuid.UUID, fetch: _SlowFetch, **params: object):
+    return cache.get_or_fetch(
+        tenant_id=tenant_id,
+        connector="mes",
+        operation="get_machine_status",
+        user_id=uuid.UUID(int=0),
+        params=params,
+        fetch=fetch,
+    )
+
+
+def _requests(result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "connector_cache_requests_total", {"connector": "mes", "result": result}
+        )
+        or 0.0
+    )
+
+
+class TestGetOrFetch:
+    """Single-flight and stale-while-revalidate."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self) -> None:
+        cache = ConnectorCache()
+        tenant = uuid.uuid4()
+        fetch = _SlowFetch({"machine": "M1"})
+        fetch.release.clear()
+        coalesced_before = _requests("coalesced")
+
+        calls = [asyncio.create_task(_lookup(cache, tenant, fetch)) for _ in range(20)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        results = await asyncio.gather(*calls)
+
+        assert fetch.calls == 1
+        assert all(result.data == {"machine": "M1"} for result in results)
+        sources = sorted(result.metadata["cache"] for result in results)
+        assert sources == ["coalesced"] * 19 + ["miss"]
+        assert results[0].metadata["count"] == 1
+        assert _requests("coalesced") == coalesced_before + 19
+        assert cache.get_stats()["requests"]["coalesced"] == 19
+        assert cache.get_stats()["in_flight"] == 0
+
+        hit = await _lookup(cache, tenant, fetch)
+        assert hit.cached and hit.metadata["cache"] == "hit"
+        assert fetch.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(self) -> None:
+        cache = ConnectorCache()
+        tenant = uuid.uuid4()
+        fetch = _SlowFetch()
+
+        await asyncio.gather(
+            _lookup(cache, tenant, fetch, machine="M1"),
+            _lookup(cache, tenant, fetch, machine="M2"),
+            _lookup(cache, uuid.uuid4(), fetch, machine="M1"),
+        )
+        assert fetch.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_but_not_cached(self) -> None:
+        cache = ConnectorCache()
+        tenant = uuid.uuid4()
+        fetch = _SlowFetch(success=False)
+
+        results = await asyncio.gather(*(_lookup(cache, tenant, fetch) for _ in range(3)))
+        assert fetch.calls == 1
+        assert all(not result.success for result in results)
+
+        await _lookup(cache, tenant, fetch)
+        assert fetch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_exception_becomes_error_result(self) -> None:
+        async def boom() -> ConnectorResult:
+            raise RuntimeError("connection reset")
+
+        result = await ConnectorCache().get_or_fetch(
+            uuid.uuid4(), "mes", "get_machine_status", uuid.uuid4(), {}, boom
+        )
+        assert not result.success
+        assert result.error == "connection reset"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self) -> None:
+        cache = ConnectorCache()
+        tenant = uuid.uuid4()
+        fetch = _SlowFetch()
+        fetch.release.clear()
+
+        first = asyncio.create_task(_lookup(cache, tenant, fetch))
+        second = asyncio.create_task(_lookup(cache, tenant, fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        fetch.release.set()
+
+        assert (await second).data == "fresh"
+        assert fetch.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_served_once_while_refreshing(self, monkeypatch) -> None:
+        cache = ConnectorCache(ttl_seconds=10, stale_ttl_seconds=60)
+        tenant = uuid.uuid4()
+        await _lookup(cache, tenant, _SlowFetch("v1"))
+
+        later = time.time() + 11
+        monkeypatch.setattr("src.connectors.cache.time.time", lambda: later)
+        refresh = _SlowFetch("v2")
+        refresh.release.clear()
+
+        stale = await _lookup(cache, tenant, refresh)
+        assert stale.data == "v1"
+        assert stale.metadata["cache"] == "stale"
+
+        # Arrives during the refresh: joins it instead of getting stale data again
+        joined = asyncio.create_task(_lookup(cache, tenant, refresh))
+        await asyncio.sleep(0)
+        refresh.release.set()
+        assert (await joined).data == "v2"
+        assert (await _lookup(cache, tenant, refresh)).metadata["cache"] == "hit"
+        assert refresh.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_past_stale_window_is_a_miss(self, monkeypatch) -> None:
+        cache = ConnectorCache(ttl_seconds=10, stale_ttl_seconds=5)
+        tenant = uuid.uuid4()
+        await _lookup(cache, tenant, _SlowFetch("v1"))
+
+        later = time.time() + 16
+        monkeypatch.setattr("src.connectors.cache.time.time", lambda: later)
+        result = await _lookup(cache, tenant, _SlowFetch("v2"))
+
+        assert result.data == "v2"
+        assert result.metadata["cache"] == "miss"
+        assert not result.cached
+
+
+class _JsonBackend(InMemoryCacheBackend):
+    """In-memory backend that encodes every value like RedisCacheBackend does."""
+
+    async def get(self, key, *, codec=None):
+        return await super().get(key, codec=codec or JsonCodec())
+
+    async def set(self, key, value, ttl, *, codec=None):
+        await super().set(key, value, ttl, codec=codec or JsonCodec())
+
+
+class TestRedisConnectorCache:
+    @pytest.mark.asyncio
+    async def test_hits_rebuild_connector_dataclasses(self) -> None:
+        backend = _JsonBackend()
+        replica_a = RedisConnectorCache(backend, namespace="mes_status", ttl_seconds=60)
+        replica_b = RedisConnectorCache(backend, namespace="mes_status", ttl_seconds=60)
+        tenant = uuid.uuid4()
+        status = MachineStatusData(
+            machine_id="M1",
+            machine_name="Press 1",
+            work_center="WC1",
+            status=MachineStatus.RUNNING,
+            current_order_id=None,
+            production_rate=12.5,
+            utilization_percent=80.0,
+            last_event_time=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+            alarms_active=["A1"],
+        )
+        fetch = _SlowFetch([status])
+
+        await _lookup(replica_a, tenant, fetch)
+        result = await _lookup(replica_b, tenant, fetch)
+
+        assert fetch.calls == 1
+        assert result.metadata["cache"] == "hit"
+        assert result.data == [status]
+        assert isinstance(result.data[0].status, MachineStatus)
+        assert isinstance(result.data[0].last_event_time, datetime)
+
+    @pytest.mark.asyncio
+    async def test_replicas_share_entries(self) -> None:
+        backend = InMemoryCacheBackend()
+        replica_a = RedisConnectorCache(backend, namespace="mes_status", ttl_seconds=60)
+        replica_b = RedisConnectorCache(backend, namespace="mes_status", ttl_seconds=60)
+        tenant = uuid.uuid4()
+        fetch = _SlowFetch({"machine": "M1", "state": "running"})
+
+        await _lookup(replica_a, tenant, fetch)
+        result = await _lookup(replica_b, tenant, fetch)
+
+        assert fetch.calls == 1
+        assert result.metadata["cache"] == "hit"
+        assert result.data == {"machine": "M1", "state": "running"}
+
+        assert await replica_b.clear_tenant(tenant) == 1
+        await _lookup(replica_a, tenant, fetch)
+        assert fetch.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_window_extends_backend_ttl(self, monkeypatch) -> None:
+        backend = InMemoryCacheBackend()
+        cache = RedisConnectorCache(
+            backend, namespace="po", ttl_seconds=10, stale_ttl_seconds=30
+        )
+        stored: list[int] = []
+        original_set = backend.set
+
+        async def spy(key, value, ttl, **kwargs):
+            stored.append(ttl)
+            await original_set(key, value, ttl, **kwargs)
+
+        monkeypatch.setattr(backend, "set", spy)
+        await _lookup(cache, uuid.uuid4(), _SlowFetch())
+        assert stored == [40]
+
+    def test_get_connector_cache_uses_shared_backend(self) -> None:
+        redis_backend = RedisCacheBackend("redis://localhost:6379/0")
+        try:
+            init_connector_cache(SimpleNamespace(), redis_backend)
+            cache = get_connector_cache("mes_status", ttl_seconds=30)
+            assert isinstance(cache, RedisConnectorCache)
+            assert get_connector_cache("mes_status") is cache
+
+            init_connector_cache(SimpleNamespace(), InMemoryCacheBackend())
+            assert type(get_connector_cache("mes_status")) is ConnectorCache
+
+            init_connector_cache(
+                SimpleNamespace(connector_cache_shared=True), InMemoryCacheBackend()
+            )
+            assert isinstance(get_connector_cache("mes_status"), RedisConnectorCache)
+        finally:
+            init_connector_cache(SimpleNamespace(), InMemoryCacheBackend())
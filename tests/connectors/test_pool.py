@@ -0,0 +1,300 @@
+"""Tests for the application-scoped ConnectorPool.
+
+Covers:
+- One long-lived connector and client per connector configuration
+- ``async with`` on a pooled connector holds a slot and keeps the client open
+- max_in_use bounds concurrent callers and records the wait
+- Health-based and idle eviction; in-use clients close once the last
+  holder and waiter are gone
+- ConnectorRegistry, the SAP tools and /health/detailed use the pool
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.connectors.base import (
+    BaseConnector,
+    ConnectorConfig,
+    ConnectorResult,
+    ConnectorStatus,
+)
+from src.connectors.pool import ConnectorPool
+from src.middleware.prometheus import REGISTRY
+from src.operations.write_framework import ConnectorRegistry
+
+
+class _EchoConnector(BaseConnector):
+    """Connector whose health is set by the test."""
+
+    health = ConnectorStatus.HEALTHY
+
+    async def _execute_request(
+        self, operation: str, tenant_id: uuid.UUID, params: dict[str, Any]
+    ) -> ConnectorResult:
+        response = await self._get_http_client().get("/echo")
+        return ConnectorResult(success=True, data=response.json())
+
+    async def health_check(self) -> ConnectorStatus:
+        self._status = self.health
+        return self._status
+
+
+def _config(name: str = "echo", **auth_params: Any) -> ConnectorConfig:
+    return ConnectorConfig(name=name, endpoint="https://echo.test", auth_params=auth_params)
+
+
+@pytest.fixture
+def clients(monkeypatch) -> list[httpx.AsyncClient]:
+    """Record every client the pool builds; serve them from a MockTransport."""
+    created: list[httpx.AsyncClient] = []
+
+    def _create(config: ConnectorConfig, limits: httpx.Limits | None = None):
+        client = httpx.AsyncClient(
+            base_url=config.endpoint,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": 1})),
+        )
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(BaseConnector, "create_http_client", staticmethod(_create))
+    return created
+
+
+class TestConnectorPool:
+    @pytest.mark.asyncio
+    async def test_one_client_per_config(self, clients):
+        pool = ConnectorPool(health_check_interval_s=0)
+        tenant, user = uuid.uuid4(), uuid.uuid4()
+
+        for _ in range(5):
+            async with pool.acquire(_EchoConnector, _config()) as connector:
+                result = await connector.execute("echo", tenant, user, {})
+                assert result.data == {"ok": 1}
+
+        assert len(clients) == 1
+        assert not clients[0].is_closed
+        assert pool.get(_EchoConnector, _config()) is connector
+        assert pool.get(_EchoConnector, _config(token="other")) is not connector
+        assert len(clients) == 2
+        await pool.aclose()
+        assert all(client.is_closed for client in clients)
+
+    @pytest.mark.asyncio
+    async def test_async_with_keeps_pooled_client_open(self, clients):
+        pool = ConnectorPool(health_check_interval_s=0)
+        connector = pool.get(_EchoConnector, _config())
+
+        async with connector:
+            assert next(iter(pool.stats()["connectors"].values()))["in_use"] == 1
+        async with connector:
+            pass
+
+        assert connector._http_client is clients[0]
+        assert not clients[0].is_closed
+        entry = next(iter(pool.stats()["connectors"].values()))
+        assert entry["in_use"] == 0
+        assert entry["acquisitions"] == 2
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_max_in_use_bounds_callers_and_records_wait(self, clients):
+        pool = ConnectorPool(max_in_use=2, health_check_interval_s=0)
+        connector = pool.get(_EchoConnector, _config(f"echo-{uuid.uuid4()}"))
+        label = next(iter(pool.stats()["connectors"]))
+        peak = 0
+
+        async def call() -> None:
+            nonlocal peak
+            async with connector:
+                peak = max(peak, pool.stats()["connectors"][label]["in_use"])
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        entry = pool.stats()["connectors"][label]
+        assert peak == 2
+        assert entry["acquisitions"] == 6
+        assert entry["wait_ms"]["max"] >= 5
+        assert REGISTRY.get_sample_value(
+            "connector_pool_wait_seconds_count", {"connector": label}
+        ) == 6
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_connector_is_evicted(self, clients):
+        pool = ConnectorPool(health_check_interval_s=0)
+        config = _config(f"echo-{uuid.uuid4()}")
+        connector = pool.get(_EchoConnector, config)
+        label = next(iter(pool.stats()["connectors"]))
+
+        async with connector:
+            connector.health = ConnectorStatus.UNAVAILABLE
+            await pool.check_health()
+            # Still in use: the client stays open until released
+            assert not clients[0].is_closed
+
+        assert clients[0].is_closed
+        assert pool.stats()["evictions"] == {"unhealthy": 1}
+        assert pool.get(_EchoConnector, config) is not connector
+        assert REGISTRY.get_sample_value(
+            "connector_pool_evictions_total", {"connector": label, "reason": "unhealthy"}
+        ) == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_eviction_keeps_client_open_for_waiting_caller(self, clients):
+        pool = ConnectorPool(max_in_use=1, health_check_interval_s=0)
+        connector = pool.get(_EchoConnector, _config(f"echo-{uuid.uuid4()}"))
+        tenant, user = uuid.uuid4(), uuid.uuid4()
+        done = asyncio.Event()
+
+        async def hold() -> None:
+            async with connector:
+                await done.wait()
+
+        async def call() -> ConnectorResult:
+            async with connector:
+                return await connector.execute("echo", tenant, user, {})
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        assert next(iter(pool.stats()["connectors"].values()))["waiting"] == 1
+
+        connector.health = ConnectorStatus.UNAVAILABLE
+        await pool.check_health()
+        done.set()
+        await holder
+        result = await waiter
+
+        # The waiter got the slot on the evicted entry and its client still worked
+        assert result.success
+        assert result.data == {"ok": 1}
+        assert clients[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_closes_evicted_client(self, clients):
+        pool = ConnectorPool(max_in_use=1, health_check_interval_s=0)
+        connector = pool.get(_EchoConnector, _config(f"echo-{uuid.uuid4()}"))
+        done = asyncio.Event()
+
+        async def hold() -> None:
+            async with connector:
+                await done.wait()
+
+        async def wait_for_slot() -> None:
+            async with connector:
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait_for_slot())
+        await asyncio.sleep(0)
+
+        connector.health = ConnectorStatus.UNAVAILABLE
+        await pool.check_health()
+        done.set()
+        waiter.cancel()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert clients[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_idle_connector_is_evicted(self, clients):
+        pool = ConnectorPool(health_check_interval_s=0, idle_ttl_s=0)
+        pool.get(_EchoConnector, _config())
+
+        await pool.check_health()
+
+        assert clients[0].is_closed
+        assert pool.stats()["connectors"] == {}
+        assert pool.stats()["evictions"] == {"idle": 1}
+
+    @pytest.mark.asyncio
+    async def test_healthy_connector_is_kept(self, clients):
+        pool = ConnectorPool(health_check_interval_s=0)
+        connector = pool.get(_EchoConnector, _config())
+
+        await pool.check_health()
+
+        assert pool.get(_EchoConnector, _config()) is connector
+        assert connector.status == ConnectorStatus.HEALTHY
+        await pool.aclose()
+
+
+class TestPoolWiring:
+    def test_unpooled_connector_owns_its_client(self):
+        connector = _EchoConnector(_config())
+        assert connector._owns_http_client
+        assert connector._http_client is None
+
+    def test_registry_returns_pooled_connector(self, clients):
+        pool = ConnectorPool(health_check_interval_s=0)
+        registry = ConnectorRegistry(pool=pool)
+        registry.register("echo", _EchoConnector, _config())
+
+        assert registry.create("echo") is registry.create("echo")
+        assert len(clients) == 1
+
+    def test_registry_without_pool_creates_fresh_connectors(self):
+        registry = ConnectorRegistry()
+        registry.register("echo", _EchoConnector, _config())
+        assert registry.create("echo") is not registry.create("echo")
+
+    @pytest.mark.asyncio
+    async def test_tools_borrow_pooled_connector(self, clients):
+        from src.agent.tools import MES_ProductionOrdersTool, ToolContext
+        from src.connectors.mes import MESConnector
+        from src.models.user import UserRole
+
+        pool = ConnectorPool(health_check_interval_s=0)
+        context = ToolContext(
+            tenant_id=str(uuid.uuid4()), user_id=str(uuid.uuid4()), user_role=UserRole.OPERATOR
+        )
+        with patch("src.agent.tools.get_connector_pool", return_value=pool), patch.object(
+            MESConnector, "_execute_request", return_value=ConnectorResult(success=True, data=[])
+        ):
+            for work_center in ("WC1", "WC2", "WC3"):
+                params = {"work_center": work_center}
+                result = await MES_ProductionOrdersTool().execute(params, context)
+                assert result.success, result.error
+
+        assert len(clients) == 1
+        assert not clients[0].is_closed
+        entry = next(iter(pool.stats()["connectors"].values()))
+        assert entry["acquisitions"] == 3
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_health_reports_pool_stats(self, clients, fake_settings):
+        from src.infra.health import ComponentStatus, HealthCheck
+
+        pool = ConnectorPool(health_check_interval_s=0)
+        connector = pool.get(_EchoConnector, _config())
+        checker = HealthCheck(fake_settings)
+
+        with patch("src.infra.health.get_connector_pool", return_value=pool):
+            healthy = await checker._check_connector_pools()
+            connector.health = ConnectorStatus.DEGRADED
+            await connector.health_check()
+            degraded = await checker._check_connector_pools()
+
+        label = next(iter(healthy.details["connectors"]))
+        assert healthy.status == ComponentStatus.HEALTHY
+        assert healthy.details["connectors"][label]["in_use"] == 0
+        assert degraded.status == ComponentStatus.DEGRADED
+        assert degraded.details["degraded"] == [label]
+        await pool.aclose()
+
+        with patch("src.infra.health.get_connector_pool", return_value=None):
+            assert (await checker._check_connector_pools()).status == ComponentStatus.UNKNOWN
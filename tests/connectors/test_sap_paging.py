@@ -0,0 +1,260 @@
+"""Tests for SAPConnector OData paging against a local OData stub.
+
+Covers:
+- Server-driven paging (v2 d.__next / $skiptoken, v4 @odata.nextLink)
+- Client-side $top/$skip paging when the service does not page
+- max_records and $top limits, early exit cancels the prefetched page
+- Prefetch is bounded: at most one page ahead of the consumer
+- Next links to another host and HTTP errors raise SAPQueryError
+- stream() audits the streamed record count
+- SAP_InventoryTool aggregates 100k stock rows page by page
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.connectors.base import ConnectorConfig
+from src.connectors.sap import InventoryItem, SAPConnector, SAPQueryError
+
+_ENDPOINT = "https://sap.test/sap/opu/odata/sap/API_STOCK"
+
+
+class _ODataStub:
+    """MaterialStockSet served over httpx.MockTransport.
+
+    With ``server_page`` the stub pages itself (ignoring $top) and returns a
+    next link carrying a $skiptoken; otherwise it honours $top/$skip.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        *,
+        server_page: int | None = None,
+        v4: bool = False,
+        next_host: str = _ENDPOINT,
+        fail_at: int | None = None,
+    ) -> None:
+        self.total = total
+        self.server_page = server_page
+        self.v4 = v4
+        self.next_host = next_host
+        self.fail_at = fail_at
+        self.requests: list[httpx.URL] = []
+
+    @staticmethod
+    def row(i: int) -> dict[str, Any]:
+        return {
+            "Material": f"M{i % 100:03d}",
+            "Description": f"Material {i % 100}",
+            "Plant": f"P{i % 3}",
+            "StorageLocation": "0001",
+            "Quantity": str(i % 10),
+            "UnitOfMeasure": "EA",
+            "ValuationClass": "3000",
+            "LastUpdated": "/Date(1700000000000)/",
+        }
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url)
+        if self.fail_at is not None and len(self.requests) == self.fail_at:
+            return httpx.Response(503)
+        params = request.url.params
+        start = int(params.get("$skiptoken") or params.get("$skip") or 0)
+        size = self.server_page or int(params.get("$top", self.total))
+        end = min(start + size, self.total)
+        rows = [self.row(i) for i in range(start, end)]
+        next_link = None
+        if self.server_page and end < self.total:
+            next_link = f"{self.next_host}/MaterialStockSet?$skiptoken={end}"
+        if self.v4:
+            body: dict[str, Any] = {"value": rows}
+            if next_link:
+                body["@odata.nextLink"] = next_link
+        else:
+            body = {"d": {"results": rows}}
+            if next_link:
+                body["d"]["__next"] = next_link
+        return httpx.Response(200, json=body)
+
+
+def _connector(stub: _ODataStub) -> SAPConnector:
+    connector = SAPConnector(ConnectorConfig(name="sap-test", endpoint=_ENDPOINT))
+    connector._http_client = httpx.AsyncClient(
+        base_url=_ENDPOINT, transport=httpx.MockTransport(stub.handler)
+    )
+    return connector
+
+
+async def _collect(pages) -> list[list[InventoryItem]]:
+    return [page async for page in pages]
+
+
+def _iter(connector: SAPConnector, **kwargs: Any):
+    return connector.iter_pages("MaterialStockSet", connector._map_inventory_item, **kwargs)
+
+
+class TestIterPages:
+    @pytest.mark.asyncio
+    async def test_follows_server_next_links(self):
+        stub = _ODataStub(250, server_page=100)
+        pages = await _collect(_iter(_connector(stub)))
+
+        assert [len(page) for page in pages] == [100, 100, 50]
+        assert isinstance(pages[0][0], InventoryItem)
+        assert stub.requests[1].params["$skiptoken"] == "100"
+
+    @pytest.mark.asyncio
+    async def test_follows_v4_next_links(self):
+        stub = _ODataStub(30, server_page=20, v4=True)
+        pages = await _collect(_iter(_connector(stub)))
+        assert [len(page) for page in pages] == [20, 10]
+
+    @pytest.mark.asyncio
+    async def test_client_side_paging_without_next_links(self):
+        stub = _ODataStub(25)
+        pages = await _collect(_iter(_connector(stub), page_size=10))
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert [url.params.get("$skip") for url in stub.requests] == [None, "10", "20"]
+
+    @pytest.mark.asyncio
+    async def test_empty_pages_are_not_yielded(self):
+        stub = _ODataStub(20)
+        pages = await _collect(_iter(_connector(stub), page_size=10))
+        assert [len(page) for page in pages] == [10, 10]
+        assert len(stub.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_max_records_stops_early(self):
+        stub = _ODataStub(1000, server_page=100)
+        pages = await _collect(_iter(_connector(stub), max_records=150))
+
+        assert sum(len(page) for page in pages) == 150
+        assert len(stub.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_is_bounded_to_one_page(self):
+        stub = _ODataStub(10_000, server_page=500)
+        consumed = 0
+        async for _page in _iter(_connector(stub)):
+            consumed += 1
+            # The page in hand plus at most one prefetched page
+            assert len(stub.requests) <= consumed + 1
+        assert consumed == 20
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetch(self):
+        stub = _ODataStub(10_000, server_page=100)
+        pages = _iter(_connector(stub))
+        async for _page in pages:
+            break
+        await pages.aclose()
+        assert len(stub.requests) <= 2
+
+    @pytest.mark.asyncio
+    async def test_next_link_to_other_host_is_rejected(self):
+        stub = _ODataStub(200, server_page=100, next_host="https://evil.test/odata")
+        with pytest.raises(SAPQueryError, match="outside the configured endpoint"):
+            await _collect(_iter(_connector(stub)))
+        assert len(stub.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_http_error_mid_stream_raises(self):
+        stub = _ODataStub(300, server_page=100, fail_at=2)
+        with pytest.raises(SAPQueryError, match="503"):
+            await _collect(_iter(_connector(stub)))
+
+
+class TestConnectorOperations:
+    @pytest.mark.asyncio
+    async def test_get_inventory_follows_server_paging_up_to_top(self):
+        stub = _ODataStub(1000, server_page=100)
+        result = await _connector(stub)._get_inventory(uuid.uuid4(), {"top": 250})
+
+        assert result.success
+        assert len(result.data) == 250
+        assert result.metadata["pages"] == 3
+
+    @pytest.mark.asyncio
+    async def test_get_inventory_reports_errors(self):
+        stub = _ODataStub(100, fail_at=1)
+        result = await _connector(stub)._get_inventory(uuid.uuid4(), {})
+        assert not result.success
+        assert "503" in result.error
+
+    @pytest.mark.asyncio
+    async def test_stream_audits_record_count(self):
+        stub = _ODataStub(120, server_page=50)
+        connector = _connector(stub)
+        connector._audit_log = AsyncMock()
+
+        pages = connector.stream(
+            "get_inventory", uuid.uuid4(), uuid.uuid4(), {"plant_id": "P1"}
+        )
+        total = sum([len(page) async for page in pages])
+
+        assert total == 120
+        assert stub.requests[0].params["$filter"] == "Plant eq 'P1'"
+        result = connector._audit_log.await_args.kwargs["result"]
+        assert result.success
+        assert result.metadata == {"count": 120, "streamed": True}
+
+    @pytest.mark.asyncio
+    async def test_stream_rejects_unknown_operation(self):
+        with pytest.raises(ValueError, match="Unknown SAP operation"):
+            connector = _connector(_ODataStub(0))
+            await _collect(connector.stream("drop_tables", uuid.uuid4(), uuid.uuid4(), {}))
+
+
+class TestInventoryToolAggregation:
+    @pytest.mark.asyncio
+    async def test_aggregates_100k_rows_in_pages(self):
+        from src.agent.tools import SAP_InventoryTool, ToolContext
+        from src.models.user import UserRole
+
+        stub = _ODataStub(100_000, server_page=1000)
+        max_in_flight = 0
+
+        class _StubSAP(SAPConnector):
+            async def __aenter__(self) -> SAPConnector:
+                self._http_client = httpx.AsyncClient(
+                    base_url=_ENDPOINT, transport=httpx.MockTransport(stub.handler)
+                )
+                return self
+
+            async def stream(self, *args: Any, **kwargs: Any):
+                nonlocal max_in_flight
+                consumed = 0
+                async for page in super().stream(*args, **kwargs):
+                    consumed += 1
+                    max_in_flight = max(max_in_flight, len(stub.requests) - consumed)
+                    yield page
+
+        context = ToolContext(
+            tenant_id=str(uuid.uuid4()), user_id=str(uuid.uuid4()), user_role=UserRole.OPERATOR
+        )
+        tool = SAP_InventoryTool()
+        with patch("src.agent.tools.SAPConnector", _StubSAP), patch.dict(
+            "os.environ", {"SAP_ENDPOINT": _ENDPOINT}
+        ):
+            result = await tool.execute({"aggregate_by": "plant", "plant": "P1"}, context)
+            cached = await tool.execute({"aggregate_by": "plant", "plant": "P1"}, context)
+
+        assert result.success, result.error
+        summary = result.data
+        assert summary["total_records"] == 100_000
+        # The stub does not filter; it only has to receive the translated $filter
+        assert summary["total_groups"] == 3
+        assert sum(group["records"] for group in summary["groups"]) == 100_000
+        assert sum(group["quantity"] for group in summary["groups"]) == 450_000
+        assert stub.requests[0].params["$filter"] == "Plant eq 'P1'"
+        assert len(stub.requests) == 100
+        assert max_in_flight <= 1
+        assert cached.metadata["cached"] is True
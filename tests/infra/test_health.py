@@ -173,3 +173,22 @@ class TestHealthCheck:
         import json
         json_str = json.dumps(health_dict)
         assert len(json_str) > 0
+
+    @pytest.mark.asyncio
+    async def test_open_model_circuit_degrades(self, health_check):
+        """Test that an open model circuit is reported and degrades health."""
+        from src.agent.model_router.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitBreakerRegistry,
+        )
+
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(min_calls=1))
+        registry.get("vllm/heavy").record_failure(1.0)
+        registry.get("ollama/light").record_success(0.1)
+
+        with patch("src.infra.health.get_circuit_breakers", return_value=registry):
+            circuits = await health_check._check_model_circuits()
+
+        assert circuits.status == ComponentStatus.DEGRADED
+        assert circuits.details["open"] == ["vllm/heavy"]
+        assert circuits.details["circuits"]["ollama/light"]["state"] == "closed"
@@ -0,0 +1,340 @@
+"""Tests for the durable, pipelined ingestion worker.
+
+Covers:
+- IngestionService.embed_and_store_chunks overlaps embedding and storage
+- Progress counters advance per batch
+- Repeated chunk text is embedded once per job
+- IngestionWorker parses the next job while the current one is embedding
+- Failures are handed to fail_claimed_job (requeue / fail)
+- A released job's chunks are deleted through the indexed ingestion_job_id
+- Cancellation between batches stops the job
+- A cancel after the last batch is not overwritten by completion
+- Shutdown stops draining after drain_timeout_s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.infra.background_worker import IngestionWorker
+from src.ingestion.chunker import Chunk
+from src.models.ingestion import IngestionStatus
+from src.services.ingestion import IngestionCancelledError, IngestionService
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [Chunk(content=f"chunk {i}", index=i, token_count=2) for i in range(n)]
+
+
+def _db() -> MagicMock:
+    """Session whose dedup lookup finds no previously embedded chunks."""
+    db = MagicMock()
+    result = MagicMock()
+    result.all.return_value = []
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _job() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        metadata_extracted={},
+        chunk_count=0,
+        chunks_embedded=0,
+        chunks_total=0,
+        chunks_deduplicated=0,
+    )
+
+
+class TestPipelinedEmbedAndStore:
+    """Batch N+1 is embedded while batch N is being stored."""
+
+    @pytest.mark.asyncio
+    async def test_next_batch_embeds_during_store(self):
+        events: list[str] = []
+        db = _db()
+        llm = MagicMock()
+
+        async def embed(texts):
+            events.append(f"embed:{texts[0]}")
+            await asyncio.sleep(0)
+            return [[0.1] * 3 for _ in texts]
+
+        async def write(rows):
+            events.append("write_start")
+            await asyncio.sleep(0.01)
+            events.append("write_end")
+            return len(rows)
+
+        llm.embed = AsyncMock(side_effect=embed)
+        service = IngestionService(db=db, settings=MagicMock(), llm_client=llm)
+        service._chunk_writer.write = AsyncMock(side_effect=write)
+        job = _job()
+
+        await service.embed_and_store_chunks(job, _chunks(70))  # batches: 32, 32, 6
+
+        # Second batch embedding starts before the first batch's write finishes
+        assert events.index("write_start") < events.index("embed:chunk 32")
+        assert events.index("embed:chunk 32") < events.index("write_end")
+        assert llm.embed.await_count == 3
+        written = [len(call.args[0]) for call in service._chunk_writer.write.await_args_list]
+        assert written == [32, 32, 6]
+        rows = service._chunk_writer.write.await_args_list[0].args[0]
+        assert {row.ingestion_job_id for row in rows} == {job.id}
+        assert job.chunk_count == 70
+        assert job.chunks_embedded == 70
+        assert job.chunks_deduplicated == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_embedded_once(self):
+        llm = MagicMock()
+        llm.embed = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+        service = IngestionService(db=_db(), settings=MagicMock(), llm_client=llm)
+        service._chunk_writer.write = AsyncMock()
+        job = _job()
+        # 40 chunks, only 4 distinct texts, spread over two batches
+        chunks = [Chunk(content=f"page footer {i % 4}", index=i, token_count=3) for i in range(40)]
+
+        await service.embed_and_store_chunks(job, chunks)
+
+        embedded = [t for call in llm.embed.await_args_list for t in call.args[0]]
+        assert sorted(embedded) == [f"page footer {i}" for i in range(4)]
+        assert job.chunks_deduplicated == 36
+        rows = [r for call in service._chunk_writer.write.await_args_list for r in call.args[0]]
+        assert len(rows) == 40
+        assert len({r.content_hash for r in rows}) == 4
+
+    @pytest.mark.asyncio
+    async def test_progress_callback_per_batch(self):
+        llm = MagicMock()
+        llm.embed = AsyncMock(side_effect=lambda texts: [[0.0] for _ in texts])
+        service = IngestionService(db=_db(), settings=MagicMock(), llm_client=llm)
+        service._chunk_writer.write = AsyncMock()
+        job = _job()
+        seen: list[int] = []
+
+        async def on_batch(current):
+            seen.append(current.chunk_count)
+
+        await service.embed_and_store_chunks(job, _chunks(40), on_batch_stored=on_batch)
+
+        assert seen == [32, 40]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_pending_embedding(self):
+        llm = MagicMock()
+        llm.embed = AsyncMock(side_effect=lambda texts: [[0.0] for _ in texts])
+        service = IngestionService(db=_db(), settings=MagicMock(), llm_client=llm)
+        service._chunk_writer.write = AsyncMock()
+
+        async def cancel(current):
+            raise IngestionCancelledError("cancelled")
+
+        with pytest.raises(IngestionCancelledError):
+            await service.embed_and_store_chunks(_job(), _chunks(100), on_batch_stored=cancel)
+        service._chunk_writer.write.assert_awaited_once()
+
+
+class TestJobChunkCleanup:
+    @pytest.mark.asyncio
+    async def test_deletes_by_indexed_job_column(self):
+        db = _db()
+        service = IngestionService(db=db, settings=MagicMock(), llm_client=MagicMock())
+        job = _job()
+
+        await service._delete_job_chunks(job)
+
+        compiled = db.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        assert "document_chunks.ingestion_job_id = " in str(compiled)
+        assert "chunk_metadata" not in str(compiled)
+        assert job.id in compiled.params.values()
+
+
+class TestCompleteJob:
+    @pytest.mark.asyncio
+    async def test_completes_unless_cancelled_meanwhile(self):
+        db = _db()
+        db.flush = AsyncMock()
+        db.execute.return_value.rowcount = 1
+        service = IngestionService(db=db, settings=MagicMock(), llm_client=MagicMock())
+        job = _job()
+
+        await service.complete_job(job)
+
+        compiled = db.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        assert "ingestion_jobs.status != " in str(compiled)
+        assert IngestionStatus.FAILED in compiled.params.values()
+
+        db.execute.return_value.rowcount = 0  # cancelled after the last batch
+        with pytest.raises(IngestionCancelledError):
+            await service.complete_job(job)
+
+
+class _FakeSession:
+    def __init__(self, jobs):
+        self._jobs = jobs
+        self.commit = AsyncMock()
+        self.refresh = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, model, job_id):
+        return self._jobs.get(job_id)
+
+
+class _FakeService:
+    """Stands in for IngestionService inside the worker."""
+
+    def __init__(self, queue, jobs, log):
+        self._queue = queue
+        self._jobs = jobs
+        self.log = log
+        self.embed_gate = asyncio.Event()
+        self.fail_claimed_job = AsyncMock(return_value=None)
+
+    async def claim_next_job(self, *, worker_id, default_tenant_concurrency):
+        return self._queue.pop(0) if self._queue else None
+
+    async def load_claimed_job(self, job_id):
+        return self._jobs[job_id], b"data"
+
+    async def parse_and_chunk(self, job, file_bytes):
+        self.log.append(f"parse:{job.name}")
+        if job.name == "bad":
+            raise ValueError("unparseable")
+        return _chunks(1)
+
+    async def embed_and_store_chunks(self, job, chunks, *, on_batch_stored=None):
+        self.log.append(f"embed_start:{job.name}")
+        if job.name == "first":
+            await self.embed_gate.wait()
+        self.log.append(f"embed_end:{job.name}")
+
+    async def complete_job(self, job):
+        job.status = IngestionStatus.COMPLETED
+
+
+class TestIngestionWorker:
+    """Pipelining and failure handling in the worker loop."""
+
+    def _worker(self, job_names, **kwargs):
+        jobs = {
+            uuid.uuid4(): SimpleNamespace(
+                name=name,
+                status=IngestionStatus.PROCESSING,
+                tenant_id=uuid.uuid4(),
+                filename=f"{name}.txt",
+                chunk_count=1,
+                error_message=None,
+            )
+            for name in job_names
+        }
+        for job_id, job in jobs.items():
+            job.id = job_id
+        log: list[str] = []
+        service = _FakeService(list(jobs), jobs, log)
+        worker = IngestionWorker(
+            session_factory=lambda: _FakeSession(jobs),
+            settings=MagicMock(),
+            concurrency=1,
+            poll_interval_s=0.01,
+            llm_client=MagicMock(),
+            **kwargs,
+        )
+        worker._service = lambda session: service
+        worker._audit = AsyncMock()
+        return worker, service, jobs, log
+
+    @pytest.mark.asyncio
+    async def test_parses_next_job_while_embedding_current(self):
+        worker, service, jobs, log = self._worker(["first", "second"])
+        await worker.start()
+        try:
+            for _ in range(100):
+                if "parse:second" in log:
+                    break
+                await asyncio.sleep(0.01)
+            # "first" is still embedding (gate closed) while "second" was parsed
+            assert "parse:second" in log
+            assert "embed_end:first" not in log
+            service.embed_gate.set()
+            for _ in range(100):
+                if "embed_end:second" in log:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.shutdown()
+
+        assert log.index("embed_end:first") < log.index("embed_start:second")
+        assert all(job.status == IngestionStatus.COMPLETED for job in jobs.values())
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_is_released(self):
+        worker, service, jobs, log = self._worker(["bad"])
+        await worker.start()
+        try:
+            for _ in range(100):
+                if service.fail_claimed_job.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.shutdown()
+
+        (job_id,) = jobs
+        service.fail_claimed_job.assert_awaited_once()
+        args, kwargs = service.fail_claimed_job.await_args
+        assert args == (job_id, "unparseable")
+        assert kwargs == {"max_attempts": 3}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_not_embedded(self):
+        worker, service, jobs, log = self._worker(["first"])
+        for job in jobs.values():
+            job.status = IngestionStatus.FAILED  # cancelled after parsing
+        service.embed_gate.set()
+        await worker.start()
+        try:
+            for _ in range(100):
+                if service.fail_claimed_job.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.shutdown()
+
+        assert "embed_start:first" not in log
+        worker._audit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_drain_gives_up_after_timeout(self):
+        worker, service, jobs, log = self._worker(["first"], drain_timeout_s=0.05)
+        await worker.start()
+        for _ in range(100):
+            if "embed_start:first" in log:
+                break
+            await asyncio.sleep(0.01)
+
+        # The embed gate never opens: shutdown must not wait for the job
+        await asyncio.wait_for(worker.shutdown(), timeout=1.0)
+
+        assert "embed_end:first" not in log
+        service.fail_claimed_job.assert_not_awaited()  # left to its lease
+
+    @pytest.mark.asyncio
+    async def test_shutdown_is_idempotent(self):
+        worker, *_ = self._worker([])
+        await worker.start()
+        assert worker.is_running
+        await worker.shutdown()
+        await worker.shutdown()
+        assert not worker.is_running
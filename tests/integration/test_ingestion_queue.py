@@ -0,0 +1,48 @@
+"""Integration tests for the ingestion_jobs work queue.
+
+Jobs are written through the ORM and claimed with the raw claim SQL, so the
+stored status labels must be the ones that SQL compares against.
+
+Run with (PostgreSQL only - the claim uses advisory locks and SKIP LOCKED):
+    TESTING_DATABASE_URL=postgresql+asyncpg://... pytest -m integration \\
+        tests/integration/test_ingestion_queue.py
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.ingestion import FileType, IngestionJob, IngestionStatus
+from src.services.ingestion import IngestionService
+
+
+@pytest.mark.integration
+async def test_orm_created_job_is_claimed(integration_db: AsyncSession, seed_data: dict):
+    """A PENDING job added through the ORM is claimed and moves to PROCESSING."""
+    if integration_db.get_bind().dialect.name != "postgresql":
+        pytest.skip("Claim query requires PostgreSQL")
+
+    tenant = seed_data["tenants"]["tenant_a"]
+    job = IngestionJob(
+        tenant_id=tenant.id,
+        filename="queued.txt",
+        file_type=FileType.TEXT,
+        file_size_bytes=5,
+        file_content=b"hello",
+        status=IngestionStatus.PENDING,
+    )
+    integration_db.add(job)
+    await integration_db.flush()
+
+    service = IngestionService(db=integration_db, settings=None, llm_client=None)
+    claimed = await service.claim_next_job(worker_id="test-worker")
+
+    assert claimed == job.id
+    await integration_db.refresh(job)
+    assert job.status == IngestionStatus.PROCESSING
+    assert job.locked_by == "test-worker"
+    assert job.attempts == 1
+
+    # Nothing else is pending
+    assert await service.claim_next_job(worker_id="test-worker") is None
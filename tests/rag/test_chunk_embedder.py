@@ -0,0 +1,129 @@
+"""Tests for the deduplicating ingestion embedder.
+
+Tests cover:
+- Only unseen text reaches the embedding API
+- Reuse from EmbeddingCache and from existing document_chunks rows
+- Cache keys are scoped to the embedding model
+- Cache failures do not fail ingestion
+- Dedup ratio accounting
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.cache.backend import InMemoryCacheBackend
+from src.cache.embedding_cache import EmbeddingCache
+from src.rag.chunk_embedder import ChunkEmbedder, DedupStats
+
+
+def _db(rows: list[tuple[str, object]] | None = None) -> MagicMock:
+    db = MagicMock()
+    result = MagicMock()
+    result.all.return_value = rows or []
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _llm() -> MagicMock:
+    llm = MagicMock()
+    llm.embed = AsyncMock(side_effect=lambda texts: [[float(len(t)), 1.0] for t in texts])
+    return llm
+
+
+class TestChunkEmbedder:
+    @pytest.mark.asyncio
+    async def test_duplicates_in_batch_embedded_once(self):
+        llm = _llm()
+        embedder = ChunkEmbedder(_db(), llm, model="m1")
+
+        vectors = await embedder.embed(["a", "bb", "a", "a"])
+
+        llm.embed.assert_awaited_once_with(["a", "bb"])
+        assert vectors == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [1.0, 1.0]]
+        assert embedder.stats.chunks == 4
+        assert embedder.stats.embedded == 2
+        assert embedder.stats.dedup_ratio == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_later_batches_reuse_earlier_vectors(self):
+        llm = _llm()
+        embedder = ChunkEmbedder(_db(), llm, model="m1")
+
+        await embedder.embed(["a", "b"])
+        await embedder.embed(["b", "c"])
+
+        assert [call.args[0] for call in llm.embed.await_args_list] == [["a", "b"], ["c"]]
+        assert embedder.stats.reused == 1
+
+    @pytest.mark.asyncio
+    async def test_preload_uses_cache_then_database(self):
+        cache = EmbeddingCache(InMemoryCacheBackend(), model="m1")
+        await cache.cache_embedding(ChunkEmbedder.hash_text("cached"), [9.0, 9.0])
+        db = _db([(ChunkEmbedder.hash_text("stored"), np.array([7.0, 7.0]))])
+        llm = _llm()
+        embedder = ChunkEmbedder(db, llm, model="m1", embedding_cache=cache)
+
+        await embedder.preload(["cached", "stored", "new"], uuid.uuid4())
+        vectors = await embedder.embed(["cached", "stored", "new"])
+
+        assert vectors == [[9.0, 9.0], [7.0, 7.0], [3.0, 1.0]]
+        llm.embed.assert_awaited_once_with(["new"])
+        # Only hashes the cache missed are looked up in document_chunks
+        db.execute.assert_awaited_once()
+        assert embedder.stats.cache_hits == 1
+        assert embedder.stats.db_hits == 1
+        # Database hits and new vectors are written back to the cache
+        assert await cache.get_embedding(ChunkEmbedder.hash_text("stored")) == [7.0, 7.0]
+        assert await cache.get_embedding(ChunkEmbedder.hash_text("new")) == [3.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_preload_skips_database_when_cache_covers_all(self):
+        cache = EmbeddingCache(InMemoryCacheBackend(), model="m1")
+        await cache.cache_embedding(ChunkEmbedder.hash_text("x"), [1.0])
+        db = _db()
+        embedder = ChunkEmbedder(db, _llm(), model="m1", embedding_cache=cache)
+
+        await embedder.preload(["x", "x"], uuid.uuid4())
+
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_to_model(self):
+        backend = InMemoryCacheBackend()
+        old = EmbeddingCache(backend, model="old-model")
+        await old.cache_embedding(ChunkEmbedder.hash_text("text"), [0.0])
+        llm = _llm()
+        embedder = ChunkEmbedder(
+            _db(), llm, model="new-model", embedding_cache=EmbeddingCache(backend, "new-model")
+        )
+
+        await embedder.preload(["text"], uuid.uuid4())
+        await embedder.embed(["text"])
+
+        llm.embed.assert_awaited_once_with(["text"])
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_count_as_misses(self):
+        cache = MagicMock()
+        cache.batch_get = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache.batch_cache = AsyncMock(side_effect=ConnectionError("redis down"))
+        llm = _llm()
+        embedder = ChunkEmbedder(_db(), llm, model="m1", embedding_cache=cache)
+
+        await embedder.preload(["a"], uuid.uuid4())
+        assert await embedder.embed(["a"]) == [[1.0, 1.0]]
+
+
+class TestDedupStats:
+    def test_ratio_without_chunks(self):
+        assert DedupStats().dedup_ratio == 0.0
+
+    def test_ratio(self):
+        stats = DedupStats(chunks=10, embedded=4)
+        assert stats.reused == 6
+        assert stats.dedup_ratio == pytest.approx(0.6)
@@ -0,0 +1,218 @@
+"""Tests for the bulk chunk writer.
+
+Tests cover:
+- Binary COPY stream encoding (decoded back field by field)
+- COPY is used on asyncpg connections, inside the session transaction
+- Multi-row INSERT fallback when COPY is unavailable or disabled
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.rag.chunk_writer import BulkChunkWriter, ChunkRow, encode_copy_binary
+
+
+def _row(index: int = 0, embedding: list[float] | None = None) -> ChunkRow:
+    return ChunkRow(
+        document_id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        content=f"chunk {index} – naïve",
+        chunk_index=index,
+        embedding=[0.5, -1.25, 2.0] if embedding is None else embedding,
+        metadata={"token_count": 4},
+        created_at=datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+    )
+
+
+def _decode(stream: bytes) -> list[list[bytes | None]]:
+    assert stream.startswith(b"PGCOPY\n\xff\r\n\x00")
+    pos = 11
+    flags, ext_len = struct.unpack_from(">ii", stream, pos)
+    assert (flags, ext_len) == (0, 0)
+    pos += 8
+    tuples = []
+    while True:
+        (field_count,) = struct.unpack_from(">h", stream, pos)
+        pos += 2
+        if field_count == -1:
+            break
+        fields: list[bytes | None] = []
+        for _ in range(field_count):
+            (length,) = struct.unpack_from(">i", stream, pos)
+            pos += 4
+            if length == -1:
+                fields.append(None)
+                continue
+            fields.append(stream[pos : pos + length])
+            pos += length
+        tuples.append(fields)
+    assert pos == len(stream)
+    return tuples
+
+
+class TestCopyEncoding:
+    def test_round_trip(self):
+        row = _row(7)
+        (fields,) = _decode(encode_copy_binary([row]))
+
+        assert uuid.UUID(bytes=fields[0]) == row.id
+        assert uuid.UUID(bytes=fields[1]) == row.document_id
+        assert uuid.UUID(bytes=fields[2]) == row.tenant_id
+        assert fields[3].decode("utf-8") == row.content
+        assert struct.unpack(">i", fields[4]) == (7,)
+        dim, unused = struct.unpack_from(">HH", fields[5])
+        assert (dim, unused) == (3, 0)
+        assert list(struct.unpack_from(">3f", fields[5], 4)) == [0.5, -1.25, 2.0]
+        assert fields[6][:1] == b"\x01"
+        assert json.loads(fields[6][1:]) == {"token_count": 4}
+        (micros,) = struct.unpack(">q", fields[7])
+        epoch = datetime(2000, 1, 1, tzinfo=UTC)
+        assert epoch + timedelta(microseconds=micros) == row.created_at
+        assert fields[8] is None and fields[9] is None and fields[10] is None
+
+    def test_content_hash_and_model(self):
+        row = _row()
+        row.content_hash = "ab" * 32
+        row.embedding_model = "text-embedding-3-small"
+        (fields,) = _decode(encode_copy_binary([row]))
+        assert fields[8] == b"ab" * 32
+        assert fields[9] == b"text-embedding-3-small"
+
+    def test_ingestion_job_id(self):
+        row = _row()
+        row.ingestion_job_id = uuid.uuid4()
+        (fields,) = _decode(encode_copy_binary([row]))
+        assert uuid.UUID(bytes=fields[10]) == row.ingestion_job_id
+
+    def test_null_embedding_and_many_rows(self):
+        rows = [_row(i) for i in range(3)]
+        rows[1].embedding = None
+        decoded = _decode(encode_copy_binary(rows))
+
+        assert len(decoded) == 3
+        assert decoded[1][5] is None
+        assert [struct.unpack(">i", t[4])[0] for t in decoded] == [0, 1, 2]
+
+    def test_naive_timestamp_treated_as_utc(self):
+        row = _row()
+        row.created_at = datetime(2000, 1, 1, 0, 0, 1)
+        (fields,) = _decode(encode_copy_binary([row]))
+        assert struct.unpack(">q", fields[7]) == (1_000_000,)
+
+
+def _session(driver_connection) -> MagicMock:
+    db = MagicMock()
+    raw = SimpleNamespace(driver_connection=driver_connection)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    db.connection = AsyncMock(return_value=connection)
+    db.execute = AsyncMock()
+    return db
+
+
+class _FakeAsyncpg:
+    """asyncpg stand-in that autocommits COPY outside a transaction."""
+
+    def __init__(self) -> None:
+        self.in_transaction = False
+        self.committed: list[bytes] = []
+        self.pending: list[bytes] = []
+
+    def is_in_transaction(self) -> bool:
+        return self.in_transaction
+
+    async def copy_to_table(self, table, *, source, columns, format):
+        (self.pending if self.in_transaction else self.committed).append(source)
+
+    def rollback(self) -> None:
+        self.pending.clear()
+        self.in_transaction = False
+
+
+class TestBulkChunkWriter:
+    @pytest.mark.asyncio
+    async def test_uses_copy_on_asyncpg(self):
+        driver = SimpleNamespace(copy_to_table=AsyncMock(), is_in_transaction=lambda: True)
+        db = _session(driver)
+        rows = [_row(i) for i in range(5)]
+
+        assert await BulkChunkWriter(db).write(rows) == 5
+
+        driver.copy_to_table.assert_awaited_once()
+        args, kwargs = driver.copy_to_table.await_args
+        assert args == ("document_chunks",)
+        assert kwargs["format"] == "binary"
+        assert kwargs["columns"][5] == "embedding"
+        assert len(_decode(kwargs["source"])) == 5
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_insert_without_copy(self):
+        db = _session(SimpleNamespace())  # e.g. aiosqlite connection
+        writer = BulkChunkWriter(db)
+        rows = [_row(i) for i in range(3)]
+
+        assert await writer.write(rows) == 3
+        assert await writer.write(rows) == 3
+
+        assert db.execute.await_count == 2
+        # The connection is only probed once
+        db.connection.assert_awaited_once()
+        params = db.execute.await_args.args[1]
+        assert [p["chunk_index"] for p in params] == [0, 1, 2]
+        assert params[0]["embedding"] == [0.5, -1.25, 2.0]
+        assert params[0]["chunk_metadata"] == {"token_count": 4}
+
+    @pytest.mark.asyncio
+    async def test_rollback_after_copy_removes_rows(self):
+        # First batch after a commit: the adapter has not issued BEGIN yet
+        driver = _FakeAsyncpg()
+        db = _session(driver)
+
+        async def execute(*args, **kwargs):
+            driver.in_transaction = True
+
+        db.execute = AsyncMock(side_effect=execute)
+
+        await BulkChunkWriter(db).write([_row(i) for i in range(3)])
+        driver.rollback()
+
+        assert driver.committed == []
+        assert driver.pending == []
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_open_transaction_is_reused(self):
+        driver = _FakeAsyncpg()
+        driver.in_transaction = True
+        db = _session(driver)
+
+        await BulkChunkWriter(db).write([_row()])
+
+        assert len(driver.pending) == 1
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_copy_disabled(self):
+        driver = SimpleNamespace(copy_to_table=AsyncMock(), is_in_transaction=lambda: True)
+        db = _session(driver)
+
+        await BulkChunkWriter(db, use_copy=False).write([_row()])
+
+        driver.copy_to_table.assert_not_awaited()
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_noop(self):
+        db = _session(None)
+        assert await BulkChunkWriter(db).write([]) == 0
+        db.connection.assert_not_awaited()
+        db.execute.assert_not_awaited()
@@ -11,7 +11,9 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -70,7 +72,12 @@ class TestSemanticSearch:
             MagicMock(chunk_id=uuid.uuid4(), score=0.85),
             MagicMock(chunk_id=uuid.uuid4(), score=0.75),
         ]
-        engine._db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=mock_rows)))
+        # The tenant only has these three chunks, so no exact-scan fallback
+        engine._db.execute = AsyncMock(
+            return_value=MagicMock(
+                all=MagicMock(return_value=mock_rows), scalar=MagicMock(return_value=3)
+            )
+        )
 
         results = await engine._semantic_search(
             query="test query",
@@ -189,6 +196,21 @@ class TestLexicalSearch:
 
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_lexical_search_uses_stored_tsvector(self, engine, tenant_id):
+        """Test lexical search matches the indexed content_tsv column, not inline to_tsvector."""
+        engine._db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+
+        await engine._lexical_search(
+            query="test query",
+            tenant_id=tenant_id,
+            top_k=10,
+        )
+
+        sql = str(engine._db.execute.call_args[0][0])
+        assert "dc.content_tsv @@" in sql
+        assert "to_tsvector" not in sql
+
 
 class TestReciprocalRankFusion:
     """Test RRF merging of semantic and lexical results."""
@@ -416,4 +438,77 @@ class TestHybridSearch:
             tenant_id=tenant_id,
             top_k=settings.vector_top_k * 2,
             document_ids=None,
+            query_embedding=None,
         )
+
+
+class TestConcurrentHybridSearch:
+    """Test concurrent leg execution and query-embedding reuse."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_uses_precomputed_embedding(self, engine, tenant_id):
+        """Test a supplied embedding skips the LLM embed call."""
+        engine._db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+
+        await engine._semantic_search(
+            query="test query",
+            tenant_id=tenant_id,
+            top_k=10,
+            query_embedding=[0.2] * 384,
+        )
+
+        engine._llm.embed.assert_not_called()
+        params = engine._db.execute.call_args[0][1]
+        assert params["embedding"].startswith("[0.2,")
+
+    @pytest.mark.asyncio
+    async def test_legs_run_concurrently_on_separate_sessions(self, mock_db, settings, mock_llm, tenant_id):
+        """Test both legs overlap in time and each gets its own session."""
+        sessions: list[AsyncMock] = []
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_execute(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(all=MagicMock(return_value=[]))
+
+        @asynccontextmanager
+        async def session_factory():
+            session = AsyncMock()
+            session.execute = AsyncMock(side_effect=slow_execute)
+            sessions.append(session)
+            yield session
+
+        engine = HybridSearchEngine(
+            db=mock_db,
+            settings=settings,
+            llm_client=mock_llm,
+            session_factory=session_factory,
+        )
+        engine._fetch_chunks = AsyncMock(return_value=[])
+
+        await engine.search(query="test query", tenant_id=tenant_id, query_embedding=[0.1] * 384)
+
+        assert len(sessions) == 2
+        assert max_in_flight == 2
+        mock_db.execute.assert_not_called()
+        mock_llm.embed.assert_not_called()
+        assert engine.last_timings.concurrent is True
+        assert engine.last_timings.embedding_reused is True
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_without_session_factory(self, engine, tenant_id):
+        """Test legs share the request session when no factory is configured."""
+        engine._db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+
+        await engine.search(query="test query", tenant_id=tenant_id)
+
+        statements = [str(c[0][0]) for c in engine._db.execute.call_args_list]
+        assert any("<=>" in sql for sql in statements)
+        assert any("content_tsv" in sql for sql in statements)
+        assert engine.last_timings.concurrent is False
+        assert engine.last_timings.total_ms >= engine.last_timings.semantic_ms
@@ -0,0 +1,193 @@
+"""Tests for the local CPU reranker backend and per-tenant backend selection.
+
+Tests cover:
+- BM25 and cosine scoring primitives
+- Lexical-only and fused lexical + embedding ranking
+- Determinism and tie ordering
+- RetrievalService picks the tenant's backend
+- Benchmark agreement metrics
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.rag import retrieve as retrieve_module
+from src.rag.local_reranker import LocalReranker, bm25_scores, cosine_scores
+from src.rag.reranker import CrossEncoderReranker, RerankBackend
+from src.rag.retrieve import RetrievalService
+from src.scripts.rerank_benchmark import kendall_tau, top_k_overlap
+
+
+@dataclass
+class MockSearchResult:
+    """Mock SearchResult for testing."""
+
+    chunk_id: uuid.UUID
+    document_id: uuid.UUID
+    score: float
+    content: str
+    chunk_index: int
+    metadata: dict
+    source: str
+    document_version: str
+
+
+def _result(content: str, index: int) -> MockSearchResult:
+    return MockSearchResult(
+        chunk_id=uuid.uuid4(),
+        document_id=uuid.uuid4(),
+        score=0.5,
+        content=content,
+        chunk_index=index,
+        metadata={},
+        source=f"doc{index}.pdf",
+        document_version="1.0",
+    )
+
+
+class TestScoringPrimitives:
+    def test_bm25_prefers_matching_document(self):
+        scores = bm25_scores(
+            "vacation policy",
+            ["The vacation policy grants 25 days", "Quarterly revenue grew", "Policy index"],
+        )
+        assert scores[0] > scores[2] > scores[1] == 0.0
+
+    def test_bm25_empty_query(self):
+        assert bm25_scores("   ", ["a", "b"]) == [0.0, 0.0]
+
+    def test_cosine_handles_missing_and_mismatched(self):
+        scores = cosine_scores([1.0, 0.0], [[1.0, 0.0], None, [0.0, 1.0], [1.0, 0.0, 0.0]])
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[1] is None
+        assert scores[2] == pytest.approx(0.0)
+        assert scores[3] is None
+
+    def test_cosine_clips_negative_similarity(self):
+        assert cosine_scores([1.0, 0.0], [[-1.0, 0.0]]) == [0.0]
+
+
+class TestLocalReranker:
+    @pytest.mark.asyncio
+    async def test_lexical_only_ranking(self):
+        results = [
+            _result("Quarterly revenue grew by 10%", 0),
+            _result("Employees accrue vacation days monthly; vacation policy", 1),
+            _result("The vacation policy is reviewed yearly", 2),
+        ]
+        ranked = await LocalReranker().rerank(query="vacation policy", results=results)
+
+        assert ranked[-1].chunk_index == 0
+        assert ranked[0].relevance_score == pytest.approx(1.0)
+        assert all(0.0 <= r.relevance_score <= 1.0 for r in ranked)
+
+    @pytest.mark.asyncio
+    async def test_embeddings_break_lexical_ties(self):
+        results = [_result("alpha", 0), _result("alpha", 1)]
+        embeddings = {results[0].chunk_id: [0.0, 1.0], results[1].chunk_id: [1.0, 0.0]}
+
+        ranked = await LocalReranker().rerank(
+            query="alpha",
+            results=results,
+            query_embedding=[1.0, 0.0],
+            result_embeddings=embeddings,
+        )
+
+        assert [r.chunk_index for r in ranked] == [1, 0]
+        assert ranked[0].relevance_score == pytest.approx(1.0)
+        assert ranked[1].relevance_score == pytest.approx(0.4)
+
+    @pytest.mark.asyncio
+    async def test_deterministic_and_ties_keep_retrieval_order(self):
+        results = [_result("unrelated text", i) for i in range(5)]
+        reranker = LocalReranker()
+
+        first = await reranker.rerank(query="query", results=results, top_k=3)
+        second = await reranker.rerank(query="query", results=results, top_k=3)
+
+        assert [r.chunk_index for r in first] == [0, 1, 2]
+        assert [r.chunk_id for r in first] == [r.chunk_id for r in second]
+
+    @pytest.mark.asyncio
+    async def test_empty_results(self):
+        assert await LocalReranker().rerank(query="q", results=[]) == []
+
+    def test_rejects_zero_weights(self):
+        with pytest.raises(ValueError):
+            LocalReranker(lexical_weight=0.0, semantic_weight=0.0)
+
+
+class TestBackendSelection:
+    @pytest.fixture(autouse=True)
+    def _clear_backend_cache(self):
+        retrieve_module._tenant_backend_cache.clear()
+        yield
+        retrieve_module._tenant_backend_cache.clear()
+
+    def _service(self, config):
+        db = AsyncMock()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = config
+        db.execute = AsyncMock(return_value=result)
+        db.begin_nested = MagicMock(return_value=AsyncMock())
+        settings = MagicMock()
+        settings.reranker_backend = "llm"
+        settings.rerank_mode = "listwise"
+        settings.rerank_max_concurrency = 4
+        settings.rerank_latency_budget_ms = None
+        settings.local_rerank_lexical_weight = 0.4
+        settings.local_rerank_semantic_weight = 0.6
+        return RetrievalService(db=db, settings=settings, llm_client=AsyncMock()), db
+
+    @pytest.mark.asyncio
+    async def test_tenant_override_selects_local(self):
+        service, _ = self._service({"reranker_backend": "local"})
+        backend = await service._rerank_backend_for(uuid.uuid4())
+        assert backend == RerankBackend.LOCAL
+        assert isinstance(service._rerankers[backend], LocalReranker)
+
+    @pytest.mark.asyncio
+    async def test_no_override_uses_default(self):
+        service, _ = self._service(None)
+        backend = await service._rerank_backend_for(uuid.uuid4())
+        assert backend == RerankBackend.LLM
+        assert isinstance(service._rerankers[backend], CrossEncoderReranker)
+
+    @pytest.mark.asyncio
+    async def test_invalid_override_falls_back_to_default(self):
+        service, _ = self._service({"reranker_backend": "gpu-magic"})
+        assert await service._rerank_backend_for(uuid.uuid4()) == RerankBackend.LLM
+
+    @pytest.mark.asyncio
+    async def test_choice_is_cached_per_tenant(self):
+        service, db = self._service({"reranker_backend": "local"})
+        tenant_id = uuid.uuid4()
+        await service._rerank_backend_for(tenant_id)
+        await service._rerank_backend_for(tenant_id)
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_is_isolated_in_savepoint(self):
+        service, db = self._service(None)
+        db.execute = AsyncMock(side_effect=RuntimeError("relation does not exist"))
+        assert await service._rerank_backend_for(uuid.uuid4()) == RerankBackend.LLM
+        db.begin_nested.assert_called_once()
+        savepoint = db.begin_nested.return_value
+        # The savepoint context saw the error, so it is rolled back on exit
+        assert savepoint.__aexit__.await_args[0][0] is RuntimeError
+
+
+class TestAgreementMetrics:
+    def test_kendall_tau(self):
+        assert kendall_tau([1, 2, 3], [1, 2, 3]) == 1.0
+        assert kendall_tau([1, 2, 3], [3, 2, 1]) == -1.0
+        assert kendall_tau([1, 2, 3], [1, 3, 2]) == pytest.approx(1 / 3)
+
+    def test_top_k_overlap(self):
+        assert top_k_overlap([1, 2, 3, 4], [2, 1, 4, 3], 2) == 1.0
+        assert top_k_overlap([1, 2, 3, 4], [3, 4, 1, 2], 2) == 0.0
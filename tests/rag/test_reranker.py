@@ -6,17 +6,25 @@ Tests cover:
 - Top-k limiting
 - LLM failure handling
 - Score normalization
+- Listwise batch scoring and its tolerant parser
+- Bounded concurrency and latency budget
 """
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.rag.reranker import CrossEncoderReranker, RankedResult
+from src.rag.reranker import (
+    CrossEncoderReranker,
+    RankedResult,
+    RerankMode,
+    parse_listwise_scores,
+)
 
 
 @dataclass
@@ -297,3 +305,142 @@ class TestReranker:
         prompt = call_args[1]["messages"][0]["content"]
         # Content should be truncated in the prompt
         assert len(prompt) < len(long_content) + 1000  # Some overhead for prompt template
+
+
+def _make_results(n: int) -> list[MockSearchResult]:
+    return [
+        MockSearchResult(
+            chunk_id=uuid.uuid4(),
+            document_id=uuid.uuid4(),
+            score=0.5,
+            content=f"Content {i}",
+            chunk_index=i,
+            metadata={},
+            source=f"doc{i}.pdf",
+            document_version="1.0",
+        )
+        for i in range(n)
+    ]
+
+
+class TestListwiseParser:
+    """Test the tolerant listwise response parser."""
+
+    def test_json_object(self):
+        assert parse_listwise_scores('{"1": 7, "2": 3}', 2) == [0.7, 0.3]
+
+    def test_json_in_code_fence_with_prose(self):
+        text = 'Sure!\n```json\n{"1": 10, "3": 0}\n```'
+        assert parse_listwise_scores(text, 3) == [1.0, None, 0.0]
+
+    def test_json_array_of_numbers(self):
+        assert parse_listwise_scores("[7, 3, 12]", 3) == [0.7, 0.3, 1.0]
+
+    def test_json_array_of_objects(self):
+        assert parse_listwise_scores('[{"id": 2, "score": 9}]', 2) == [None, 0.9]
+
+    def test_free_form_lines(self):
+        text = "[1] 7\n[2] 4.5\nPassage 3: 2"
+        assert parse_listwise_scores(text, 3) == [0.7, 0.45, 0.2]
+
+    def test_out_of_range_ids_ignored(self):
+        assert parse_listwise_scores('{"0": 5, "4": 5, "1": 6}', 2) == [0.6, None]
+
+    def test_garbage_returns_all_none(self):
+        assert parse_listwise_scores("I cannot help with that", 2) == [None, None]
+
+
+class TestListwiseReranker:
+    """Test listwise (one completion per batch) reranking."""
+
+    @pytest.mark.asyncio
+    async def test_single_call_scores_whole_batch(self, mock_llm):
+        reranker = CrossEncoderReranker(llm_client=mock_llm, mode=RerankMode.LISTWISE)
+        results = _make_results(3)
+        mock_llm.complete = AsyncMock(return_value=MagicMock())
+        mock_llm.extract_text = MagicMock(return_value='{"1": 2, "2": 9, "3": 5}')
+
+        ranked = await reranker.rerank(query="q", results=results)
+
+        assert mock_llm.complete.await_count == 1
+        assert [r.chunk_index for r in ranked] == [1, 2, 0]
+        assert all(r.reranked for r in ranked)
+
+    @pytest.mark.asyncio
+    async def test_batches_split_and_missing_scores_are_neutral(self, mock_llm):
+        reranker = CrossEncoderReranker(llm_client=mock_llm, mode=RerankMode.LISTWISE)
+        results = _make_results(12)  # two listwise batches (10 + 2)
+        mock_llm.complete = AsyncMock(return_value=MagicMock())
+        mock_llm.extract_text = MagicMock(side_effect=['{"1": 10}', '{"2": 1}'])
+
+        ranked = await reranker.rerank(query="q", results=results)
+
+        assert mock_llm.complete.await_count == 2
+        assert len(ranked) == 12
+        assert ranked[0].relevance_score == 1.0
+        assert ranked[-1].relevance_score == 0.1
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_gives_neutral_scores(self, mock_llm):
+        reranker = CrossEncoderReranker(llm_client=mock_llm, mode=RerankMode.LISTWISE)
+        mock_llm.complete = AsyncMock(side_effect=Exception("LLM error"))
+
+        ranked = await reranker.rerank(query="q", results=_make_results(2))
+
+        assert [r.relevance_score for r in ranked] == [0.5, 0.5]
+
+
+class TestConcurrencyAndBudget:
+    """Test bounded fan-out across batches and the latency budget."""
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_max_concurrency(self, mock_llm):
+        reranker = CrossEncoderReranker(
+            llm_client=mock_llm, mode=RerankMode.LISTWISE, max_concurrency=2
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_complete(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock()
+
+        mock_llm.complete = AsyncMock(side_effect=slow_complete)
+        mock_llm.extract_text = MagicMock(return_value="{}")
+
+        await reranker.rerank(query="q", results=_make_results(40))
+
+        assert mock_llm.complete.await_count == 4
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_latency_budget_returns_partial_scores(self, mock_llm):
+        reranker = CrossEncoderReranker(
+            llm_client=mock_llm, mode=RerankMode.LISTWISE, latency_budget_s=0.05
+        )
+        calls = 0
+
+        async def first_fast_then_hang(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                await asyncio.sleep(10)
+            return MagicMock()
+
+        mock_llm.complete = AsyncMock(side_effect=first_fast_then_hang)
+        mock_llm.extract_text = MagicMock(return_value='{"1": 9}')
+
+        ranked = await reranker.rerank(query="q", results=_make_results(15))
+
+        assert len(ranked) == 15
+        scored = [r for r in ranked if r.reranked]
+        unscored = [r for r in ranked if not r.reranked]
+        assert len(scored) == 10
+        assert len(unscored) == 5
+        assert ranked[0].relevance_score == 0.9
+        # Unscored chunks keep their original retrieval order
+        assert [r.chunk_index for r in unscored] == [10, 11, 12, 13, 14]
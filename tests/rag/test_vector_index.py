@@ -0,0 +1,178 @@
+"""Tests for vector_index module - ANN tuning, tenant-filtered search, recall.
+
+Tests cover:
+- Tuning resolution from settings (defaults and overrides)
+- ef_search over-fetch sizing and its upper bound
+- Transaction-local ef_search / probes parameters
+- Exact-scan fallback when the tenant filter prunes ANN results, inside a
+  rolled-back savepoint, and skipped when the filter has no more rows
+- recall@k computation
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from src.rag.vector_index import (
+    IndexMethod,
+    VectorSearchTuning,
+    apply_search_params,
+    execute_ann_query,
+    recall_at_k,
+)
+
+
+def _result(rows):
+    return MagicMock(all=MagicMock(return_value=rows))
+
+
+def _db(*results):
+    """AsyncSession mock whose begin_nested() yields a savepoint mock."""
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=list(results))
+    savepoint = AsyncMock()
+    db.begin_nested = MagicMock(return_value=MagicMock(
+        __aenter__=AsyncMock(return_value=savepoint),
+        __aexit__=AsyncMock(return_value=False),
+    ))
+    return db, savepoint
+
+
+class TestVectorSearchTuning:
+    """Test tuning resolution and candidate sizing."""
+
+    def test_defaults_when_settings_lack_fields(self):
+        tuning = VectorSearchTuning.from_settings(SimpleNamespace())
+        assert tuning.method == IndexMethod.HNSW
+        assert tuning.hnsw_ef_search == 40
+        assert tuning.overfetch_factor == 4
+
+    def test_settings_override(self):
+        tuning = VectorSearchTuning.from_settings(
+            SimpleNamespace(vector_index_method="ivfflat", ivfflat_probes=25, hnsw_ef_search=80)
+        )
+        assert tuning.method == IndexMethod.IVFFLAT
+        assert tuning.ivfflat_probes == 25
+        assert tuning.hnsw_ef_search == 80
+
+    def test_ef_search_overfetches_for_large_top_k(self):
+        tuning = VectorSearchTuning(hnsw_ef_search=40, overfetch_factor=4)
+        assert tuning.ef_search_for(5) == 40
+        assert tuning.ef_search_for(30) == 120
+
+    def test_ef_search_capped_at_pgvector_maximum(self):
+        tuning = VectorSearchTuning(overfetch_factor=50)
+        assert tuning.ef_search_for(100) == 1000
+
+
+class TestApplySearchParams:
+    """Test transaction-local query parameters."""
+
+    @pytest.mark.asyncio
+    async def test_hnsw_sets_ef_search(self):
+        db = AsyncMock()
+        await apply_search_params(db, VectorSearchTuning(), top_k=20)
+        sql, params = db.execute.call_args[0]
+        assert "hnsw.ef_search" in str(sql)
+        assert params == {"value": "80"}
+
+    @pytest.mark.asyncio
+    async def test_ivfflat_sets_probes(self):
+        db = AsyncMock()
+        tuning = VectorSearchTuning(method=IndexMethod.IVFFLAT, ivfflat_probes=12)
+        await apply_search_params(db, tuning, top_k=5)
+        sql, params = db.execute.call_args[0]
+        assert "ivfflat.probes" in str(sql)
+        assert params == {"value": "12"}
+
+
+class TestExecuteAnnQuery:
+    """Test tenant-filtered ANN execution with exact fallback."""
+
+    @pytest.mark.asyncio
+    async def test_full_result_skips_exact_scan(self):
+        rows = [MagicMock() for _ in range(5)]
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result([]), _result(rows)])
+
+        result = await execute_ann_query(
+            db, text("SELECT 1"), {}, settings=SimpleNamespace(), top_k=5
+        )
+
+        assert result == rows
+        assert db.execute.await_count == 2  # set_config + query
+
+    @pytest.mark.asyncio
+    async def test_pruned_result_falls_back_to_exact_scan(self):
+        pruned = [MagicMock()]
+        exact = [MagicMock() for _ in range(5)]
+        db, savepoint = _db(_result([]), _result(pruned), _result([]), _result(exact))
+
+        result = await execute_ann_query(
+            db, text("SELECT 1"), {}, settings=SimpleNamespace(), top_k=5
+        )
+
+        assert result == exact
+        statements = [str(c[0][0]) for c in db.execute.call_args_list]
+        assert "enable_indexscan" in statements[2]
+        # The SET LOCAL is undone with the savepoint, not left for the caller
+        db.begin_nested.assert_called_once()
+        savepoint.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_small_filtered_set_skips_exact_scan(self):
+        rows = [MagicMock() for _ in range(2)]
+        db, _ = _db(_result([]), _result(rows), MagicMock(scalar=MagicMock(return_value=2)))
+
+        result = await execute_ann_query(
+            db,
+            text("SELECT 1"),
+            {},
+            settings=SimpleNamespace(),
+            top_k=5,
+            count_sql=text("SELECT count(*)"),
+        )
+
+        assert result == rows
+        assert db.execute.await_count == 3  # set_config + query + count
+        db.begin_nested.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_above_returned_rows_falls_back(self):
+        pruned = [MagicMock()]
+        exact = [MagicMock() for _ in range(3)]
+        db, _ = _db(
+            _result([]),
+            _result(pruned),
+            MagicMock(scalar=MagicMock(return_value=3)),
+            _result([]),
+            _result(exact),
+        )
+
+        result = await execute_ann_query(
+            db,
+            text("SELECT 1"),
+            {},
+            settings=SimpleNamespace(),
+            top_k=5,
+            count_sql=text("SELECT count(*)"),
+        )
+
+        assert result == exact
+
+
+class TestRecall:
+    """Test recall@k computation."""
+
+    def test_perfect_recall(self):
+        assert recall_at_k({1, 2, 3}, {1, 2, 3}) == 1.0
+
+    def test_partial_recall(self):
+        assert recall_at_k({1, 2, 4, 5}, {1, 2, 3, 6}) == 0.5
+
+    def test_empty_exact_set(self):
+        assert recall_at_k(set(), set()) == 1.0
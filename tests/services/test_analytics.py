@@ -11,7 +11,7 @@ from datetime import date, datetime, timedelta, timezone
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.analytics import DailySummary, MetricType, UsageMetric
+from src.models.analytics import MetricType, UsageMetric
 from src.services.analytics import AnalyticsService
 
 # All tests require a real database (add, commit, query).
@@ -255,23 +255,22 @@ async def test_get_error_rate(db_session: AsyncSession, test_tenant_id: uuid.UUI
 
 @pytest.mark.asyncio
 async def test_get_daily_trends(db_session: AsyncSession, test_tenant_id: uuid.UUID) -> None:
-    """Test getting daily trend data."""
-    base_date = date.today() - timedelta(days=5)
+    """Test getting daily trend data from raw metrics."""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    base = today - timedelta(days=4)
 
-    # Create daily summaries for 5 days
+    # 10, 11, ..., 14 API calls on the last 5 UTC days, including today
     for day_offset in range(5):
-        summary = DailySummary(
-            tenant_id=test_tenant_id,
-            date=base_date + timedelta(days=day_offset),
-            total_api_calls=100 + (day_offset * 10),
-            total_tokens=5000 + (day_offset * 500),
-            total_agent_runs=20 + (day_offset * 2),
-            unique_users=5 + day_offset,
-            avg_response_time_ms=200.0 + (day_offset * 10),
-            error_count=2 + day_offset,
-            cost_estimate=10.0 + (day_offset * 1.5),
-        )
-        db_session.add(summary)
+        for _ in range(10 + day_offset):
+            db_session.add(
+                UsageMetric(
+                    tenant_id=test_tenant_id,
+                    metric_type=MetricType.API_CALL,
+                    value=1.0,
+                    dimensions={"endpoint": "/api/v1/chat", "status_code": 200},
+                    timestamp=base + timedelta(days=day_offset, minutes=1),
+                )
+            )
 
     await db_session.commit()
 
@@ -279,12 +278,12 @@ async def test_get_daily_trends(db_session: AsyncSession, test_tenant_id: uuid.U
     trends = await service.get_daily_trends(test_tenant_id, days=5)
 
     assert len(trends) == 5
-    assert trends[0].date == base_date
-    assert trends[-1].date == base_date + timedelta(days=4)
+    assert trends[0].date == base.date()
+    assert trends[-1].date == today.date()
 
     # Verify increasing trend
-    assert trends[0].total_api_calls == 100
-    assert trends[-1].total_api_calls == 140
+    assert trends[0].total_api_calls == 10
+    assert trends[-1].total_api_calls == 14
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,365 @@
+"""Tests for the usage rollups behind the analytics service.
+
+Covers:
+- split_range: daily rows for whole rolled-up days, hourly rows up to the
+  hourly watermark, raw metrics for the rest
+- AnalyticsRollupJob chunking, grace period, watermarks and advisory lock
+- AnalyticsService reads rollups plus raw metrics past the watermark, groups
+  daily trends by UTC day and maps aggregate rows to the response models
+
+No database is required: statements are compiled for PostgreSQL and
+inspected.
+"""
+
+from __future__ import annotations
+
+import re
+import uuid
+from datetime import UTC, date, datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.middleware.prometheus import REGISTRY
+from src.models.analytics import MetricType
+from src.services.analytics import AnalyticsService
+from src.services.analytics_rollup import (
+    AnalyticsRollupJob,
+    floor_day,
+    floor_hour,
+    split_range,
+)
+
+_DIALECT = postgresql.dialect()
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def _compile(stmt: Any) -> tuple[str, dict[str, Any]]:
+    compiled = stmt.compile(dialect=_DIALECT)
+    return str(compiled), compiled.params
+
+
+class _FakeDB:
+    """AsyncSession stand-in that answers the rollup job's statements."""
+
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.state = state
+        self.pending: dict[str, datetime] = {}
+
+    async def __aenter__(self) -> _FakeDB:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.pending.clear()
+
+    async def execute(self, stmt: Any) -> MagicMock:
+        sql, params = _compile(stmt)
+        result = MagicMock()
+        if "pg_try_advisory_xact_lock" in sql:
+            result.scalar.return_value = not self.state["locked"]
+        elif sql.startswith("SELECT usage_rollup_watermarks"):
+            result.all.return_value = list(self.state["marks"].items())
+        elif "min(usage_metrics.timestamp)" in sql:
+            result.scalar.return_value = self.state["first"]
+        elif sql.startswith("INSERT INTO usage_rollup_watermarks"):
+            self.pending[params["granularity"]] = params["rolled_up_to"]
+        elif sql.startswith("INSERT INTO usage_rollups"):
+            bounds = [value for value in params.values() if isinstance(value, datetime)]
+            self.state["upserts"].append((params["param_1"], min(bounds), max(bounds)))
+            result.rowcount = 10
+        return result
+
+    async def commit(self) -> None:
+        self.state["marks"].update(self.pending)
+
+
+def _job(
+    *,
+    first: datetime | None = None,
+    marks: dict[str, datetime] | None = None,
+    locked: bool = False,
+    grace_s: float = 120.0,
+    max_hours_per_pass: int = 24,
+) -> tuple[AnalyticsRollupJob, dict[str, Any]]:
+    state: dict[str, Any] = {
+        "first": first,
+        "marks": dict(marks or {}),
+        "locked": locked,
+        "upserts": [],
+    }
+    job = AnalyticsRollupJob(
+        session_factory=lambda: _FakeDB(state),
+        grace_s=grace_s,
+        max_hours_per_pass=max_hours_per_pass,
+    )
+    return job, state
+
+
+class TestSplitRange:
+    def test_days_then_hours_then_raw(self):
+        start, end = _utc(2026, 10, 1), _utc(2026, 10, 17)
+        assert split_range(start, end, _utc(2026, 10, 16), _utc(2026, 10, 16, 11)) == (
+            _utc(2026, 10, 16),
+            _utc(2026, 10, 16, 11),
+        )
+
+    def test_no_watermarks_reads_raw(self):
+        start, end = _utc(2026, 10, 1), _utc(2026, 10, 2)
+        assert split_range(start, end, None, None) == (start, start)
+
+    def test_range_fully_rolled_up(self):
+        start, end = _utc(2026, 10, 1), _utc(2026, 10, 3)
+        assert split_range(start, end, _utc(2026, 10, 16), _utc(2026, 10, 16, 11)) == (end, end)
+
+    def test_range_after_watermarks(self):
+        start, end = _utc(2026, 10, 20), _utc(2026, 10, 21)
+        assert split_range(start, end, _utc(2026, 10, 16), _utc(2026, 10, 16, 11)) == (
+            start,
+            start,
+        )
+
+    def test_floors_are_utc(self):
+        moment = datetime(2026, 10, 16, 1, 30, tzinfo=timezone(timedelta(hours=2)))
+        assert floor_hour(moment) == _utc(2026, 10, 15, 23)
+        assert floor_day(moment) == _utc(2026, 10, 15)
+
+
+class TestRollupJob:
+    @pytest.mark.asyncio
+    async def test_first_pass_catches_up_in_chunks(self):
+        job, state = _job(first=_utc(2026, 10, 14, 10, 30))
+
+        chunks = await job.run_once(now=_utc(2026, 10, 16, 12, 5))
+
+        assert chunks == {"hour": 3, "day": 2}
+        assert state["upserts"] == [
+            ("hour", _utc(2026, 10, 14, 10), _utc(2026, 10, 15, 10)),
+            ("day", _utc(2026, 10, 14), _utc(2026, 10, 15)),
+            ("hour", _utc(2026, 10, 15, 10), _utc(2026, 10, 16, 10)),
+            ("day", _utc(2026, 10, 15), _utc(2026, 10, 16)),
+            ("hour", _utc(2026, 10, 16, 10), _utc(2026, 10, 16, 12)),
+        ]
+        assert state["marks"] == {"hour": _utc(2026, 10, 16, 12), "day": _utc(2026, 10, 16)}
+
+    @pytest.mark.asyncio
+    async def test_hour_is_closed_after_grace(self):
+        marks = {"hour": _utc(2026, 10, 16, 11), "day": _utc(2026, 10, 16)}
+        job, state = _job(marks=marks, grace_s=120)
+
+        assert await job.run_once(now=_utc(2026, 10, 16, 12, 1)) == {"hour": 0, "day": 0}
+        assert await job.run_once(now=_utc(2026, 10, 16, 12, 2)) == {"hour": 1, "day": 0}
+        assert state["upserts"] == [("hour", _utc(2026, 10, 16, 11), _utc(2026, 10, 16, 12))]
+        # Nothing left: a second pass is a no-op
+        assert await job.run_once(now=_utc(2026, 10, 16, 12, 2)) == {"hour": 0, "day": 0}
+
+    @pytest.mark.asyncio
+    async def test_day_closes_with_its_last_hour(self):
+        marks = {"hour": _utc(2026, 10, 16, 23), "day": _utc(2026, 10, 16)}
+        job, state = _job(marks=marks)
+
+        await job.run_once(now=_utc(2026, 10, 17, 0, 30))
+
+        assert state["upserts"] == [
+            ("hour", _utc(2026, 10, 16, 23), _utc(2026, 10, 17)),
+            ("day", _utc(2026, 10, 16), _utc(2026, 10, 17)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_table_starts_at_cutoff(self):
+        job, state = _job(first=None)
+
+        assert await job.run_once(now=_utc(2026, 10, 16, 12, 5)) == {"hour": 0, "day": 0}
+        assert state["upserts"] == []
+        assert state["marks"] == {"hour": _utc(2026, 10, 16, 12), "day": _utc(2026, 10, 16)}
+
+    @pytest.mark.asyncio
+    async def test_locked_by_another_replica(self):
+        job, state = _job(first=_utc(2026, 10, 14), locked=True)
+
+        assert await job.run_once(now=_utc(2026, 10, 16, 12, 5)) == {"hour": 0, "day": 0}
+        assert state["upserts"] == []
+        assert state["marks"] == {}
+
+    @pytest.mark.asyncio
+    async def test_rebuild_stays_behind_watermarks(self):
+        marks = {"hour": _utc(2026, 10, 16, 12), "day": _utc(2026, 10, 16)}
+        job, state = _job(marks=marks, max_hours_per_pass=12)
+
+        await job.rebuild(_utc(2026, 10, 15, 20, 15), _utc(2026, 10, 17))
+
+        assert state["upserts"] == [
+            ("hour", _utc(2026, 10, 15, 20), _utc(2026, 10, 16, 8)),
+            ("hour", _utc(2026, 10, 16, 8), _utc(2026, 10, 16, 12)),
+            ("day", _utc(2026, 10, 15), _utc(2026, 10, 16)),
+        ]
+        assert state["marks"] == marks
+
+    @pytest.mark.asyncio
+    async def test_records_lag(self):
+        job, _ = _job(marks={"hour": _utc(2026, 10, 16, 10), "day": _utc(2026, 10, 16)})
+        await job.run_once(now=_utc(2026, 10, 16, 11, 30))
+        assert REGISTRY.get_sample_value(
+            "analytics_rollup_lag_seconds", {"granularity": "hour"}
+        ) > 0
+
+
+class _ServiceDB:
+    """Serves rollup watermarks, then one canned aggregate result."""
+
+    def __init__(self, marks: dict[str, datetime], rows: list[tuple[Any, ...]]) -> None:
+        self.marks = marks
+        self.rows = rows
+        self.statements: list[Any] = []
+
+    async def execute(self, stmt: Any) -> MagicMock:
+        self.statements.append(stmt)
+        result = MagicMock()
+        if _compile(stmt)[0].startswith("SELECT usage_rollup_watermarks"):
+            result.all.return_value = list(self.marks.items())
+        else:
+            result.one.return_value = self.rows[0] if self.rows else None
+            result.__iter__.return_value = iter(self.rows)
+        return result
+
+    def sql(self) -> tuple[str, dict[str, Any]]:
+        return _compile(self.statements[-1])
+
+
+_MARKS = {"hour": _utc(2026, 10, 16, 11), "day": _utc(2026, 10, 16)}
+
+
+class TestAnalyticsServiceRollups:
+    @pytest.mark.asyncio
+    async def test_summary_reads_rollups_and_current_hour(self):
+        db = _ServiceDB(_MARKS, [(30, 4500, 3, 2, 3000.0, 20, 1, 0.25)])
+
+        summary = await AnalyticsService(db).get_usage_summary(
+            uuid.uuid4(), date(2026, 10, 1), date(2026, 10, 16)
+        )
+
+        assert summary.total_api_calls == 30
+        assert summary.total_tokens == 4500
+        assert summary.unique_users == 2
+        assert summary.avg_response_time_ms == 150.0
+        assert summary.error_count == 1
+        assert summary.cost_estimate == 0.25
+        sql, params = db.sql()
+        assert "FROM usage_rollups" in sql and "UNION ALL" in sql
+        assert "FROM usage_metrics" in sql
+        assert params["granularity_1"] == "day"
+        assert params["bucket_start_2"] == _utc(2026, 10, 16)
+        assert params["granularity_2"] == "hour"
+        assert params["bucket_start_4"] == _utc(2026, 10, 16, 11)
+        # Raw metrics only from the hourly watermark to the end of the range
+        assert params["timestamp_1"] == _utc(2026, 10, 16, 11)
+        assert params["timestamp_2"] == _utc(2026, 10, 17)
+
+    @pytest.mark.asyncio
+    async def test_past_range_skips_raw_metrics(self):
+        db = _ServiceDB(_MARKS, [(10, 0)])
+
+        await AnalyticsService(db).get_error_rate(
+            uuid.uuid4(), date(2026, 10, 1), date(2026, 10, 7)
+        )
+
+        sql, _ = db.sql()
+        assert "FROM usage_rollups" in sql
+        assert "usage_metrics" not in sql
+
+    @pytest.mark.asyncio
+    async def test_without_rollups_aggregates_raw_in_sql(self):
+        db = _ServiceDB({}, [(200, 5)])
+
+        rate = await AnalyticsService(db, use_rollups=False).get_error_rate(
+            uuid.uuid4(), date(2026, 10, 1), date(2026, 10, 7)
+        )
+
+        assert (rate.total_requests, rate.error_count, rate.error_rate) == (200, 5, 2.5)
+        sql, params = db.sql()
+        assert "usage_rollups" not in sql
+        assert "GROUP BY metric_rows.metric_type" in sql
+        assert params["timestamp_1"] == _utc(2026, 10, 1)
+        # The watermark table is not consulted
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_grouped_queries_map_rows(self):
+        tenant = uuid.uuid4()
+        service = AnalyticsService(_ServiceDB(_MARKS, [("gpt-4o", 3500, 2000, 1500, 2, 0.5)]))
+        usage = await service.get_token_usage_by_model(
+            tenant, date(2026, 10, 1), date(2026, 10, 16)
+        )
+        assert usage[0].model == "gpt-4o"
+        assert (usage[0].total_tokens, usage[0].api_calls, usage[0].cost) == (3500, 2, 0.5)
+
+        service = AnalyticsService(_ServiceDB(_MARKS, [("agent-1", 4, 3, 4000.0, 10)]))
+        perf = await service.get_agent_performance(tenant, date(2026, 10, 1), date(2026, 10, 16))
+        assert perf[0].success_rate == 75.0
+        assert perf[0].avg_duration_ms == 1000.0
+        assert perf[0].avg_steps == 2.5
+
+        db = _ServiceDB(_MARKS, [("u1", 20, 100.0, 2), ("u2", 5, 0, 0)])
+        users = await AnalyticsService(db).get_top_users(
+            tenant, date(2026, 10, 1), date(2026, 10, 16), limit=2
+        )
+        assert [(user.user_id, user.api_calls, user.tokens) for user in users] == [
+            ("u1", 20, 100),
+            ("u2", 5, 0),
+        ]
+        sql, params = db.sql()
+        assert "ORDER BY api_calls DESC" in sql
+        assert params["param_10"] == 2
+
+        service = AnalyticsService(_ServiceDB(_MARKS, [("gpt-4o", 0.5), ("unknown", 0.25)]))
+        costs = await service.get_cost_breakdown(tenant, date(2026, 10, 1), date(2026, 10, 16))
+        assert costs.total_cost == 0.75
+        assert [item.model for item in costs.by_model] == ["gpt-4o", "unknown"]
+
+    @pytest.mark.asyncio
+    async def test_token_rows_without_model_roll_up_as_unknown(self):
+        db = _ServiceDB(_MARKS, [])
+        await AnalyticsService(db).get_token_usage_by_model(
+            uuid.uuid4(), date(2026, 10, 16), date(2026, 10, 16)
+        )
+        sql, params = db.sql()
+        # A missing model is "unknown" on token usage rows and "" elsewhere
+        owners = {
+            params[key]: params[owner]
+            for owner, key, default in re.findall(
+                r"metric_type = %\((\w+)\)s\) THEN coalesce\(CAST\(usage_metrics.dimensions "
+                r"->> %\((\w+)\)s::TEXT AS VARCHAR\), %\((\w+)\)s",
+                sql,
+            )
+            if params[default] == "unknown"
+        }
+        assert owners == {"model": MetricType.TOKEN_USAGE, "agent_id": MetricType.AGENT_RUN}
+
+    @pytest.mark.asyncio
+    async def test_daily_trends_group_rollups_and_today_by_day(self):
+        now = datetime.now(UTC)
+        today, hour = floor_day(now), floor_hour(now)
+        yesterday = today - timedelta(days=1)
+        db = _ServiceDB(
+            {"hour": hour, "day": today},
+            [(yesterday, 40, 3000.0, 4, 3, 0.5), (today, 12, 800.0, 1, 2, 0.125)],
+        )
+
+        trends = await AnalyticsService(db).get_daily_trends(uuid.uuid4(), days=7)
+
+        assert [trend.date for trend in trends] == [yesterday.date(), today.date()]
+        assert (trends[0].total_api_calls, trends[0].total_tokens) == (40, 3000)
+        assert (trends[1].unique_users, trends[1].cost_estimate) == (2, 0.125)
+        sql, params = db.sql()
+        assert "daily_summaries" not in sql
+        assert "GROUP BY facts.day ORDER BY facts.day" in sql
+        # Closed days from daily rollups, today from hourly rollups and raw metrics
+        assert params["granularity_1"] == "day"
+        assert params["bucket_start_1"] == today - timedelta(days=6)
+        assert params["bucket_start_2"] == today
+        assert params["timestamp_1"] == hour
+        assert params["timestamp_2"] == today + timedelta(days=1)
@@ -1,11 +1,14 @@
 """Tests for the Response Caching Layer.
 
 TDD methodology: tests define expected behaviour, covering:
-- InMemoryCacheBackend: get/set/TTL/delete/exists/pattern/flush
-- RedisCacheBackend: public interface delegation (mocked redis client)
+- InMemoryCacheBackend: get/set/TTL/delete/exists/pattern/flush, get_many/set_many
+- RedisCacheBackend: public interface delegation, MGET and pipelined SETEX (mocked)
 - get_cache_backend factory: selects backend from settings
 - ResponseCache: key generation, get/set, invalidation, stats
-- EmbeddingCache: single get/set, batch operations, hash_text utility
+- Codecs: JSON/msgpack structured values, raw float32/float16 vectors
+- EmbeddingCache: single get/set, batch operations in one round-trip, hash_text utility,
+  binary vector storage under a versioned key namespace
+- RoutingCache: fingerprint masking, TTL, LRU eviction, invalidation, stats
 - CacheMiddleware: HIT/MISS/SKIP headers, tenant isolation, non-GET bypass
 - Cache API endpoints: stats, invalidate, flush (admin-only enforcement)
 """
@@ -136,6 +139,94 @@ class TestInMemoryCacheBackend:
         assert info["hits"] >= 1
         assert info["misses"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_get_many_and_set_many(self, backend):
+        """set_many() stores every item; get_many() returns values in key order."""
+        await backend.set_many({"a": 1, "b": [2.0]}, ttl=60)
+        assert await backend.get_many(["b", "missing", "a"]) == [[2.0], None, 1]
+        info = await backend.info()
+        assert info["hits"] == 2
+        assert info["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_skips_expired(self, backend):
+        """get_many() treats expired entries as misses."""
+        await backend.set_many({"old": 1}, ttl=0)
+        assert await backend.get_many(["old"]) == [None]
+
+
+# ---------------------------------------------------------------------------
+# Codecs
+# ---------------------------------------------------------------------------
+
+
+def _tagged_json_codec():
+    """Stand-in for a non-JSON structured codec (msgpack is optional)."""
+    from src.cache.codecs import JsonCodec
+
+    class TaggedJsonCodec(JsonCodec):
+        name = "tagged-json"
+        tag = b"\xc1t"
+
+    return TaggedJsonCodec()
+
+
+class TestCodecs:
+    """Tests for cache value codecs."""
+
+    def test_json_round_trip(self):
+        """JsonCodec round-trips structured values, stringifying unknown types."""
+        from src.cache.codecs import JsonCodec
+        codec = JsonCodec()
+        tenant = uuid.uuid4()
+        data = codec.decode(codec.encode({"tenant": tenant, "n": [1, 2.5], "ok": True}))
+        assert data == {"tenant": str(tenant), "n": [1, 2.5], "ok": True}
+        assert codec.decode('{"legacy": 1}') == {"legacy": 1}
+
+    def test_vector_codec_sizes(self):
+        """float32 uses 4 bytes per dimension, float16 uses 2."""
+        from src.cache.codecs import VectorCodec
+        vector = [0.1] * 1536
+        assert len(VectorCodec("float32").encode(vector)) == 6144
+        assert len(VectorCodec("float16").encode(vector)) == 3072
+
+    def test_vector_codec_rejects_unknown_dtype(self):
+        """Only float32 and float16 are supported."""
+        from src.cache.codecs import VectorCodec
+        with pytest.raises(ValueError):
+            VectorCodec("float64")
+
+    def test_get_codec(self):
+        """get_codec() resolves structured codecs by name."""
+        from src.cache.codecs import JsonCodec, get_codec
+        assert isinstance(get_codec("json"), JsonCodec)
+        with pytest.raises(ValueError):
+            get_codec("pickle")
+
+    def test_tagged_payloads_reject_other_codecs(self):
+        """A structured payload only decodes with the codec that wrote it."""
+        from src.cache.codecs import (
+            CodecMismatchError,
+            JsonCodec,
+            decode_tagged,
+            encode_tagged,
+        )
+        json_codec, other = JsonCodec(), _tagged_json_codec()
+        assert encode_tagged(json_codec, 3) == b"3"  # untagged, as legacy entries
+        assert decode_tagged(json_codec, b"3") == 3
+        assert decode_tagged(other, encode_tagged(other, {"a": 1})) == {"a": 1}
+        with pytest.raises(CodecMismatchError):
+            decode_tagged(other, b"3")
+        with pytest.raises(CodecMismatchError):
+            decode_tagged(json_codec, encode_tagged(other, 3))
+
+    def test_msgpack_requires_package(self):
+        """MsgpackCodec explains how to install msgpack when it is missing."""
+        from src.cache.codecs import MsgpackCodec
+        with patch.dict("sys.modules", {"msgpack": None}):
+            with pytest.raises(RuntimeError, match="pip install msgpack"):
+                MsgpackCodec()
+
 
 # ---------------------------------------------------------------------------
 # get_cache_backend factory
@@ -322,12 +413,12 @@ class TestEmbeddingCache:
 
     @pytest.mark.asyncio
     async def test_store_and_retrieve_embedding(self, cache):
-        """cache_embedding() + get_embedding() round-trips correctly."""
+        """cache_embedding() + get_embedding() round-trips at float32 precision."""
         text_hash = "abc123"
         embedding = [0.1, 0.2, 0.3]
         await cache.cache_embedding(text_hash, embedding)
         result = await cache.get_embedding(text_hash)
-        assert result == embedding
+        assert result == pytest.approx(embedding, rel=1e-6)
 
     @pytest.mark.asyncio
     async def test_miss_returns_none(self, cache):
@@ -370,8 +461,62 @@ class TestEmbeddingCache:
             "hy": [0.3, 0.4],
         }
         await cache.batch_cache(embeddings)
-        assert await cache.get_embedding("hx") == [0.1, 0.2]
-        assert await cache.get_embedding("hy") == [0.3, 0.4]
+        assert await cache.get_embedding("hx") == pytest.approx([0.1, 0.2], rel=1e-6)
+        assert await cache.get_embedding("hy") == pytest.approx([0.3, 0.4], rel=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_batch_operations_use_one_backend_call(self, backend, cache):
+        """batch_cache()/batch_get() go through set_many()/get_many() once."""
+        with patch.object(backend, "set", wraps=backend.set) as single_set, patch.object(
+            backend, "get", wraps=backend.get
+        ) as single_get, patch.object(
+            backend, "get_many", wraps=backend.get_many
+        ) as get_many:
+            await cache.batch_cache({f"h{i}": [float(i)] for i in range(10)})
+            result = await cache.batch_get([f"h{i}" for i in range(12)])
+
+        single_set.assert_not_called()
+        single_get.assert_not_called()
+        get_many.assert_awaited_once()
+        assert result["h3"] == [3.0]
+        assert result["h11"] is None
+        assert list(result) == [f"h{i}" for i in range(12)]
+
+    @pytest.mark.asyncio
+    async def test_vectors_stored_as_raw_float32(self, backend, cache):
+        """Vectors are stored as 4 bytes per dimension under a versioned key."""
+        await cache.cache_embedding("h", [0.5] * 1536)
+        (key,) = backend._store
+        assert key == "emb:v2:f32:default:h"
+        assert len(backend._store[key].value) == 1536 * 4
+
+    @pytest.mark.asyncio
+    async def test_get_vector_is_zero_copy(self, backend, cache):
+        """get_vector() returns a read-only view over the stored bytes."""
+        import numpy as np
+        await cache.cache_embedding("h", [1.0, 2.0])
+        vector = await cache.get_vector("h")
+        assert isinstance(vector, np.ndarray)
+        assert vector.tolist() == [1.0, 2.0]
+        assert not vector.flags.writeable
+        assert not vector.flags.owndata
+
+    @pytest.mark.asyncio
+    async def test_float16_uses_separate_namespace(self, backend, cache):
+        """float16 entries are half the size and never read as float32."""
+        from src.cache.embedding_cache import EmbeddingCache
+        half = EmbeddingCache(backend=backend, dtype="float16")
+        await half.cache_embedding("h", [0.25] * 8)
+        assert await cache.get_embedding("h") is None
+        assert await half.get_embedding("h") == [0.25] * 8
+        assert len(backend._store["emb:v2:f16:default:h"].value) == 16
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_entries_are_ignored(self, backend, cache):
+        """Pre-v2 JSON entries (emb:<model>:<hash>) are never decoded."""
+        await backend.set("emb:default:h", [0.1, 0.2], ttl=60)
+        assert await cache.get_embedding("h") is None
+        assert await cache.batch_get(["h"]) == {"h": None}
 
     @pytest.mark.asyncio
     async def test_invalidate_removes_single_entry(self, cache):
@@ -380,6 +525,16 @@ class TestEmbeddingCache:
         await cache.invalidate("remove_me")
         assert await cache.get_embedding("remove_me") is None
 
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped_to_model(self, backend):
+        """A different embedding model never sees another model's vectors."""
+        from src.cache.embedding_cache import EmbeddingCache
+        old = EmbeddingCache(backend=backend, model="text-embedding-ada-002")
+        new = EmbeddingCache(backend=backend, model="text-embedding-3-small")
+        await old.cache_embedding("same_text", [1.0])
+        assert await new.get_embedding("same_text") is None
+        assert await old.get_embedding("same_text") == [1.0]
+
     @pytest.mark.asyncio
     async def test_flush_removes_all_embeddings(self, cache):
         """flush() removes all embedding entries."""
@@ -465,6 +620,63 @@ class TestRedisCacheBackendMocked:
         mock_redis.exists.return_value = 1
         assert await backend.exists("present") is True
 
+    @pytest.mark.asyncio
+    async def test_get_many_uses_mget(self, backend, mock_redis):
+        """get_many() issues one MGET and deserialises each value."""
+        import json
+        mock_redis.mget = AsyncMock(return_value=[json.dumps([1.0]), None])
+        assert await backend.get_many(["k1", "k2"]) == [[1.0], None]
+        mock_redis.mget.assert_awaited_once_with(["k1", "k2"])
+
+    @pytest.mark.asyncio
+    async def test_set_many_pipelines_setex(self, backend, mock_redis):
+        """set_many() queues SETEX per key on a non-transactional pipeline."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        await backend.set_many({"k1": 1, "k2": 2}, ttl=30)
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args[:2] for c in pipe.setex.call_args_list] == [("k1", 30), ("k2", 30)]
+        pipe.execute.assert_awaited_once()
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_with_vector_codec_sends_bytes(self, backend, mock_redis):
+        """A VectorCodec value is written as raw bytes, not JSON text."""
+        import numpy as np
+        from src.cache.codecs import VectorCodec
+        codec = VectorCodec()
+        await backend.set("vec", [1.0, 2.0], ttl=60, codec=codec)
+        payload = mock_redis.setex.call_args[0][2]
+        assert payload == np.array([1.0, 2.0], dtype="<f4").tobytes()
+        mock_redis.get.return_value = payload
+        assert (await backend.get("vec", codec=codec)).tolist() == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_switching_structured_codec_turns_entries_into_misses(self, mock_redis):
+        """Entries written under another CACHE_VALUE_CODEC read as misses, not garbage."""
+        from src.cache.backend import RedisCacheBackend
+        json_backend = RedisCacheBackend("redis://localhost:6379/0")
+        other_backend = RedisCacheBackend("redis://localhost:6379/0", codec=_tagged_json_codec())
+        json_backend._client = other_backend._client = mock_redis
+
+        await other_backend.set("hits", 3, ttl=60)
+        mock_redis.get.return_value = mock_redis.setex.call_args[0][2]
+        assert await other_backend.get("hits") == 3
+        assert await json_backend.get("hits") is None
+
+        mock_redis.get.return_value = b"3"
+        assert await json_backend.get("hits") == 3
+        assert await other_backend.get("hits") is None
+        mock_redis.mget = AsyncMock(return_value=[b"3", b'{"a": 1}'])
+        assert await other_backend.get_many(["k1", "k2"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_get_many_failure_returns_misses(self, backend, mock_redis):
+        """get_many() degrades to all misses when Redis errors."""
+        mock_redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        assert await backend.get_many(["k1", "k2"]) == [None, None]
+
     @pytest.mark.asyncio
     async def test_info_returns_connected_stats(self, backend, mock_redis):
         """info() returns connected=True and populated stats."""
@@ -615,3 +827,184 @@ class TestCacheAPIEndpoints:
         assert resp.status_code == 200
         data = resp.json()
         assert "message" in data
+
+
+# ---------------------------------------------------------------------------
+# RoutingCache tests
+# ---------------------------------------------------------------------------
+
+
+def _route(capability: str = "equipment_query", complexity: str = "simple"):
+    from src.cache.routing_cache import CachedRoute
+
+    return CachedRoute(
+        intent={
+            "primary_capability": capability,
+            "confidence": 0.9,
+            "secondary_capabilities": [],
+            "reasoning": "",
+        },
+        complexity=complexity,
+    )
+
+
+class TestRoutingCache:
+    """Unit tests for the tenant-scoped routing decision cache."""
+
+    @pytest.fixture
+    def backend(self):
+        from src.cache.backend import InMemoryCacheBackend
+        return InMemoryCacheBackend()
+
+    @pytest.fixture
+    def cache(self, backend):
+        from src.cache.routing_cache import RoutingCache
+        return RoutingCache(backend, ttl=60, max_entries_per_tenant=2)
+
+    def test_fingerprint_masks_numbers_and_ids(self):
+        from src.cache.routing_cache import fingerprint
+
+        assert fingerprint("Status of line 3") == fingerprint("status of LINE 4?")
+        assert fingerprint("Open WOs for P-101") == "open wos for <id>"
+        assert fingerprint(f"trace {uuid.uuid4()}") == "trace <id>"
+        assert fingerprint("status of line 3") != fingerprint("status of pump 3")
+
+    @pytest.mark.asyncio
+    async def test_near_identical_messages_hit(self, cache):
+        tenant_id = _make_tenant()
+        await cache.set(tenant_id, "status of line 3", _route(), registry_version="v1")
+
+        hit = await cache.get(tenant_id, "Status of line 4", registry_version="v1")
+
+        assert hit.intent["primary_capability"] == "equipment_query"
+        assert hit.complexity == "simple"
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scoped_by_tenant_and_registry(self, cache):
+        tenant_id = _make_tenant()
+        await cache.set(tenant_id, "status of line 3", _route(), registry_version="v1")
+
+        assert await cache.get(_make_tenant(), "status of line 3", registry_version="v1") is None
+        assert await cache.get(tenant_id, "status of line 3", registry_version="v2") is None
+        assert cache.stats(tenant_id)["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, cache):
+        tenant_id = _make_tenant()
+        await cache.set(tenant_id, "first question", _route(), registry_version="v1")
+        await cache.set(tenant_id, "second question", _route(), registry_version="v1")
+        await cache.get(tenant_id, "first question", registry_version="v1")
+        await cache.set(tenant_id, "third question", _route(), registry_version="v1")
+
+        assert await cache.get(tenant_id, "first question", registry_version="v1")
+        assert await cache.get(tenant_id, "second question", registry_version="v1") is None
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self, backend):
+        from src.cache.routing_cache import RoutingCache
+
+        cache = RoutingCache(backend, ttl=1)
+        tenant_id = _make_tenant()
+        await cache.set(tenant_id, "status", _route(), registry_version="v1")
+        with patch("src.cache.backend.time.monotonic", return_value=time.monotonic() + 5):
+            assert await cache.get(tenant_id, "status", registry_version="v1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tenant(self, cache):
+        tenant_id = _make_tenant()
+        other = _make_tenant()
+        for tenant in (tenant_id, other):
+            await cache.set(tenant, "status of line 3", _route(), registry_version="v1")
+
+        await cache.invalidate_tenant(tenant_id)
+
+        assert await cache.get(tenant_id, "status of line 3", registry_version="v1") is None
+        assert await cache.get(other, "status of line 3", registry_version="v1")
+
+    def test_registry_version_changes_on_register(self):
+        from src.agent.registry import AgentRegistry, AgentSpec
+
+        registry = AgentRegistry()
+        before = registry.version
+        registry.register(
+            AgentSpec(
+                agent_id="a",
+                name="A",
+                description="",
+                system_prompt="",
+                capabilities=["general_qa"],
+                tools=[],
+            )
+        )
+        assert registry.version != before
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint_reports_routing_hit_rate(self, fake_settings):
+        """GET /cache/stats includes the routing cache hit rate."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from src.api.cache import router, get_response_cache
+        from src.cache.backend import InMemoryCacheBackend
+        from src.cache.response_cache import ResponseCache
+        from src.cache.routing_cache import RoutingCache
+        from src.auth.dependencies import get_current_user, AuthenticatedUser
+        from src.models.user import User, UserRole
+
+        admin_user = MagicMock(spec=User)
+        admin_user.role = UserRole.ADMIN
+        admin_user.tenant_id = uuid.uuid4()
+        admin_user.id = uuid.uuid4()
+
+        routing_cache = RoutingCache(InMemoryCacheBackend())
+        await routing_cache.set(
+            admin_user.tenant_id, "status of line 3", _route(), registry_version="v1"
+        )
+        await routing_cache.get(admin_user.tenant_id, "status of line 9", registry_version="v1")
+        await routing_cache.get(admin_user.tenant_id, "open NCRs", registry_version="v1")
+
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+        app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(admin_user, {})
+        app.dependency_overrides[get_response_cache] = lambda: ResponseCache(InMemoryCacheBackend())
+
+        with patch("src.api.cache.get_routing_cache", return_value=routing_cache):
+            resp = TestClient(app).get("/api/v1/cache/stats")
+
+        routing = resp.json()["routing"]
+        assert routing["enabled"] is True
+        assert routing["hit_rate"] == 0.5
+        assert routing["tenant"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_memoizes_routing(self, cache):
+        from src.agent.orchestrator import (
+            AgentOrchestrator,
+            IntentClassification,
+            QueryComplexity,
+        )
+
+        with patch("src.agent.orchestrator.get_registry") as registry, \
+             patch("src.agent.orchestrator.get_skill_registry"), \
+             patch("src.agent.orchestrator.RedTeam"):
+            registry.return_value.version = "v1"
+            orch = AgentOrchestrator(
+                db=AsyncMock(),
+                settings=MagicMock(),
+                llm_client=MagicMock(),
+                tool_gateway=MagicMock(),
+                routing_cache=cache,
+            )
+        tenant_id = _make_tenant()
+        failed = IntentClassification(
+            "general_knowledge", 0.5, reasoning="Classification failed: x", degraded=True
+        )
+        await orch._cache_route(tenant_id, "status of line 3", failed, QueryComplexity.SIMPLE)
+        assert await orch._get_cached_route(tenant_id, "status of line 3") is None
+
+        intent = IntentClassification("equipment_query", 0.9)
+        await orch._cache_route(tenant_id, "status of line 3", intent, QueryComplexity.DEEP)
+        route = await orch._get_cached_route(tenant_id, "status of line 7")
+        assert IntentClassification(**route.intent) == intent
+        assert QueryComplexity(route.complexity) == QueryComplexity.DEEP
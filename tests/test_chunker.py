@@ -5,9 +5,12 @@ Test-first development: Define chunking behavior before implementation.
 
 from __future__ import annotations
 
+import types
+
 import pytest
 
-from src.ingestion.chunker import Chunk, chunk_document
+from src.ingestion import chunker
+from src.ingestion.chunker import Chunk, _split_into_sentences, chunk_document, iter_chunks
 
 
 def test_chunk_basic_text() -> None:
@@ -192,3 +195,48 @@ Content for section 3.
     # This is a soft requirement - implementation may vary
     # Ideally, section headers should start new chunks when possible
     assert len(chunks) > 0
+
+
+def test_iter_chunks_matches_chunk_document() -> None:
+    """Streaming variant yields the same chunks, lazily."""
+    text = ("The pump must be primed. Check valve 3 before start! " * 60) + "x" * 3000
+
+    stream = iter_chunks(text, chunk_size=64, overlap=12)
+    assert isinstance(stream, types.GeneratorType)
+
+    first = next(stream)
+    assert first.index == 0
+    streamed = [first, *stream]
+    assert streamed == chunk_document(text, chunk_size=64, overlap=12)
+
+
+def test_each_sentence_encoded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sentences are tokenized exactly once; chunk and overlap counts are reused."""
+    real = chunker._get_encoder()
+    calls: list[str] = []
+
+    class CountingEncoder:
+        def encode(self, text: str) -> list[int]:
+            calls.append(text)
+            return real.encode(text)
+
+        def decode(self, tokens: list[int]) -> str:
+            return real.decode(tokens)
+
+    monkeypatch.setattr(chunker, "_get_encoder", lambda: CountingEncoder())
+    text = "Alpha beta gamma delta. Epsilon zeta eta theta! " * 40 + "y" * 2000
+
+    chunk_document(text, chunk_size=40, overlap=10)
+
+    assert sorted(calls) == sorted(_split_into_sentences(text))
+
+
+def test_encoder_is_cached_at_module_level(monkeypatch: pytest.MonkeyPatch) -> None:
+    """tiktoken.get_encoding is not called again once the encoder is loaded."""
+    chunker._get_encoder()
+
+    def _fail(name: str) -> None:
+        raise AssertionError("encoder should be cached")
+
+    monkeypatch.setattr(chunker.tiktoken, "get_encoding", _fail)
+    assert chunk_document("A short sentence. Another one.", chunk_size=50, overlap=5)
@@ -12,6 +12,8 @@ import uuid
 from datetime import datetime, timezone
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
 
 from src.models.ingestion import FileType, IngestionJob, IngestionStatus
 
@@ -38,6 +40,17 @@ def test_file_type_enum_values() -> None:
     assert FileType.TEXT == "txt"
 
 
+def test_enum_columns_store_values() -> None:
+    """Enum columns use the lowercase labels that migration 008 created."""
+    table = IngestionJob.__table__
+    assert table.c.status.type.enums == [status.value for status in IngestionStatus]
+    assert table.c.file_type.type.enums == [file_type.value for file_type in FileType]
+
+    index = next(i for i in table.indexes if i.name == "ix_ingestion_jobs_pending_created")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "WHERE ingestion_jobs.status = 'pending'" in ddl
+
+
 def test_ingestion_job_tablename() -> None:
     """Test IngestionJob uses correct database table name."""
     assert IngestionJob.__tablename__ == "ingestion_jobs"
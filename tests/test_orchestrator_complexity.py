@@ -67,7 +67,8 @@ class TestAssessComplexity:
         orch._llm.extract_text = MagicMock(return_value="SIMPLE")
 
         result = await orch._assess_complexity("What is 2+2?", self._make_intent())
-        assert result == QueryComplexity.SIMPLE
+        assert result.complexity == QueryComplexity.SIMPLE
+        assert not result.degraded
 
     async def test_returns_deep_for_deep_response(self):
         orch = _make_orchestrator()
@@ -78,7 +79,7 @@ class TestAssessComplexity:
             "Explain step-by-step how to build a RAG pipeline",
             self._make_intent(),
         )
-        assert result == QueryComplexity.DEEP
+        assert result.complexity == QueryComplexity.DEEP
 
     async def test_returns_multi_perspective_for_decision_query(self):
         orch = _make_orchestrator()
@@ -89,7 +90,7 @@ class TestAssessComplexity:
             "Should we use PostgreSQL or MongoDB?",
             self._make_intent(),
         )
-        assert result == QueryComplexity.MULTI_PERSPECTIVE
+        assert result.complexity == QueryComplexity.MULTI_PERSPECTIVE
 
     async def test_returns_quality_critical_for_safety(self):
         orch = _make_orchestrator()
@@ -100,7 +101,7 @@ class TestAssessComplexity:
             "What is the maintenance procedure for the reactor cooling system?",
             self._make_intent(),
         )
-        assert result == QueryComplexity.QUALITY_CRITICAL
+        assert result.complexity == QueryComplexity.QUALITY_CRITICAL
 
     async def test_defaults_to_simple_on_unknown_response(self):
         orch = _make_orchestrator()
@@ -108,14 +109,26 @@ class TestAssessComplexity:
         orch._llm.extract_text = MagicMock(return_value="UNKNOWN_VALUE")
 
         result = await orch._assess_complexity("Any query", self._make_intent())
-        assert result == QueryComplexity.SIMPLE
+        assert result.complexity == QueryComplexity.SIMPLE
+        assert result.degraded
 
     async def test_defaults_to_simple_on_llm_failure(self):
         orch = _make_orchestrator()
         orch._llm.complete = AsyncMock(side_effect=Exception("LLM timeout"))
 
         result = await orch._assess_complexity("Any query", self._make_intent())
-        assert result == QueryComplexity.SIMPLE
+        assert result.complexity == QueryComplexity.SIMPLE
+        assert result.degraded
+
+    async def test_failed_intent_classification_is_degraded(self):
+        orch = _make_orchestrator()
+        orch._fast_path = None
+        orch._registry.list_agents.return_value = []
+        orch._llm.complete = AsyncMock(side_effect=Exception("LLM timeout"))
+
+        intent = await orch._classify_intent("Any query")
+        assert intent.primary_capability == "general_knowledge"
+        assert intent.degraded
 
     async def test_handles_lowercase_response(self):
         orch = _make_orchestrator()
@@ -123,7 +136,7 @@ class TestAssessComplexity:
         orch._llm.extract_text = MagicMock(return_value="deep")
 
         result = await orch._assess_complexity("Multi-step analysis needed", self._make_intent())
-        assert result == QueryComplexity.DEEP
+        assert result.complexity == QueryComplexity.DEEP
 
     async def test_handles_response_with_extra_text(self):
         orch = _make_orchestrator()
@@ -131,7 +144,7 @@ class TestAssessComplexity:
         orch._llm.extract_text = MagicMock(return_value="  SIMPLE  ")
 
         result = await orch._assess_complexity("Short question", self._make_intent())
-        assert result == QueryComplexity.SIMPLE
+        assert result.complexity == QueryComplexity.SIMPLE
 
 
 class TestComplexityIntegration:
@@ -2,6 +2,7 @@
 
 Covers:
 - Document chunking with correct token counts and overlap
+- Linear-time chunk offset accounting (tokens decoded per input size)
 - Embedding storage and retrieval from pgvector
 - Similarity search correctness
 - Citation formatting
@@ -17,7 +18,7 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.document import Document, DocumentChunk, DocumentStatus
+from src.models.document import Document, DocumentStatus
 
 
 class TestChunking:
@@ -88,6 +89,81 @@ class TestChunking:
         assert chunks[0].metadata["source"] == "test.txt"
 
 
+class TestChunkOffsets:
+    """Chunk character offsets and linear scaling of the chunker."""
+
+    @staticmethod
+    def _text_of_tokens(n_tokens: int) -> str:
+        import tiktoken
+
+        enc = tiktoken.get_encoding("cl100k_base")
+        sentence = "Torque the flange bolts to 45 Nm in a star pattern (étape 3). "
+        base = enc.encode(sentence * (n_tokens // 10 + 1))
+        return enc.decode(base[:n_tokens])
+
+    def test_offsets_match_prefix_decode(self) -> None:
+        """char_start equals the length of the decoded token prefix, incl. multi-byte text."""
+        import tiktoken
+
+        from src.rag.ingest import _chunk_text
+
+        enc = tiktoken.get_encoding("cl100k_base")
+        text = "naïve café 世界 😀 emoji and ascii words\n" * 40
+        tokens = enc.encode(text)
+        chunks = _chunk_text(text, chunk_size=23, chunk_overlap=4)
+
+        start = 0
+        for chunk in chunks:
+            assert chunk.metadata["char_start"] == len(enc.decode(tokens[:start]))
+            start += 23 - 4
+        assert chunks[-1].metadata["char_end"] == len(text)
+
+    def test_offsets_slice_source_text(self) -> None:
+        """For ASCII text, offsets slice exactly the chunk content out of the source."""
+        from src.rag.ingest import _chunk_text
+
+        text = self._text_of_tokens(2_000)
+        for chunk in _chunk_text(text, chunk_size=128, chunk_overlap=16):
+            start, end = chunk.metadata["char_start"], chunk.metadata["char_end"]
+            assert text[start:end] == chunk.content
+
+    def test_chunking_decodes_linear_token_count(self) -> None:
+        """Tokens decoded grow linearly with input size, not quadratically.
+
+        Counts tokens passed to decode/decode_tokens_bytes instead of timing
+        the chunker: every token is decoded once for the offsets and about
+        once more for chunk contents (plus the overlap). Decoding each
+        chunk's token prefix for its offset would grow ~100x per decade.
+        """
+        import tiktoken
+
+        from src.rag.ingest import _chunk_text
+
+        enc = tiktoken.get_encoding("cl100k_base")
+        decoded = 0
+
+        class _CountingEncoding:
+            def encode(self, text: str) -> list[int]:
+                return enc.encode(text)
+
+            def decode(self, tokens: list[int]) -> str:
+                nonlocal decoded
+                decoded += len(tokens)
+                return enc.decode(tokens)
+
+            def decode_tokens_bytes(self, tokens: list[int]) -> list[bytes]:
+                nonlocal decoded
+                decoded += len(tokens)
+                return enc.decode_tokens_bytes(tokens)
+
+        texts = {n: self._text_of_tokens(n) for n in (1_000, 10_000, 100_000)}
+        with patch("src.rag.ingest.tiktoken.get_encoding", return_value=_CountingEncoding()):
+            for n_tokens, text in texts.items():
+                decoded = 0
+                _chunk_text(text, chunk_size=512, chunk_overlap=50)
+                assert decoded <= 3 * n_tokens, (n_tokens, decoded)
+
+
 class TestIngestionPipeline:
     """IngestionPipeline state machine and embedding storage."""
 
@@ -154,32 +230,26 @@ class TestIngestionPipeline:
         mock_llm = AsyncMock()
         mock_llm.embed = AsyncMock(return_value=[fake_embedding])
 
-        # Track objects added to the session
-        added_chunks = []
-        original_add = db_session.add
-
-        def tracking_add(obj):
-            if isinstance(obj, DocumentChunk):
-                added_chunks.append(obj)
-            original_add(obj)
-
-        db_session.add = tracking_add
-
         pipeline = IngestionPipeline(
             db=db_session,
             settings=get_settings(),
             llm_client=mock_llm,
         )
+        pipeline._chunk_writer.write = AsyncMock()
         await pipeline.ingest_document(
             document=doc,
             file_bytes=b"Test document content with enough words to create at least one chunk.",
             content_type="text/plain",
         )
 
-        # Verify chunks were added to the session
-        assert len(added_chunks) >= 1
-        assert added_chunks[0].tenant_id == tenant_a.id
-        assert added_chunks[0].embedding is not None
+        # Verify chunk rows were handed to the bulk writer
+        written = [
+            row for call in pipeline._chunk_writer.write.await_args_list for row in call.args[0]
+        ]
+        assert len(written) >= 1
+        assert written[0].tenant_id == tenant_a.id
+        assert written[0].document_id == doc.id
+        assert written[0].embedding == fake_embedding
 
     @pytest.mark.asyncio
     async def test_ingestion_failure_sets_failed_status(
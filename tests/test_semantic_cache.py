@@ -0,0 +1,258 @@
+"""Tests for the semantic response cache.
+
+Covers:
+- Paraphrases above the similarity threshold hit, unrelated queries miss
+- Per-tenant thresholds and tenant/model/agent isolation
+- Entries citing a document whose version changed are dropped as stale
+- TTL expiry and the per-tenant entry bound
+- Lookups are exported to Prometheus
+- AgentRuntime falls back to the semantic cache after an exact-match miss
+  and reuses the retrieval's query embedding instead of embedding again
+- Turns with degraded context are not stored
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.agent.context_assembly import STATUS_TIMEOUT, AssembledContext, SourceResult
+from src.agent.runtime import AgentRuntime, ChatRequest
+from src.cache.semantic_cache import SemanticResponseCache, init_semantic_cache
+from src.middleware.prometheus import REGISTRY
+
+_QUERY = [1.0, 0.0, 0.0]
+_PARAPHRASE = [0.99, 0.1, 0.0]  # cosine ~0.995
+_UNRELATED = [0.0, 1.0, 0.0]
+
+
+def _versions(current: dict[str, str] | None = None):
+    return AsyncMock(return_value=current or {})
+
+
+def _sample(result: str) -> float:
+    return REGISTRY.get_sample_value("semantic_cache_lookups_total", {"result": result}) or 0.0
+
+
+def _turn(embedding, citations=None, context=None):
+    return SimpleNamespace(
+        query_embedding=embedding,
+        citations=citations or [],
+        context=context or AssembledContext(),
+    )
+
+
+async def _lookup(cache, tenant, embedding, *, model="m", agent_id=None, versions=None):
+    return await cache.lookup(
+        tenant,
+        embedding,
+        model=model,
+        agent_id=agent_id,
+        document_versions=versions or _versions(),
+    )
+
+
+class TestSemanticResponseCache:
+    @pytest.mark.asyncio
+    async def test_paraphrase_hits_and_unrelated_misses(self):
+        cache = SemanticResponseCache(threshold=0.95)
+        tenant = uuid.uuid4()
+        cache.store(tenant, _QUERY, model="m", agent_id=None, response="answer", documents={})
+
+        hit = await _lookup(cache, tenant, _PARAPHRASE)
+        miss = await _lookup(cache, tenant, _UNRELATED)
+
+        assert hit.content == "answer"
+        assert hit.model == "m"
+        assert miss is None
+        assert cache.stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_tenant_threshold_override(self):
+        tenant = uuid.uuid4()
+        cache = SemanticResponseCache(threshold=0.95, tenant_thresholds={str(tenant): 0.999})
+        cache.store(tenant, _QUERY, model="m", agent_id=None, response="answer", documents={})
+
+        assert await _lookup(cache, tenant, _PARAPHRASE) is None
+        cache.set_threshold(tenant, 0.9)
+        assert await _lookup(cache, tenant, _PARAPHRASE) is not None
+        with pytest.raises(ValueError):
+            cache.set_threshold(tenant, 1.5)
+
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped(self):
+        cache = SemanticResponseCache()
+        tenant, agent = uuid.uuid4(), uuid.uuid4()
+        cache.store(tenant, _QUERY, model="m", agent_id=agent, response="answer", documents={})
+
+        assert await _lookup(cache, uuid.uuid4(), _QUERY, agent_id=agent) is None
+        assert await _lookup(cache, tenant, _QUERY, model="other", agent_id=agent) is None
+        assert await _lookup(cache, tenant, _QUERY) is None
+        assert await _lookup(cache, tenant, _QUERY, model="M ", agent_id=agent) is not None
+
+    @pytest.mark.asyncio
+    async def test_changed_document_version_is_stale(self):
+        cache = SemanticResponseCache()
+        tenant = uuid.uuid4()
+        cache.store(
+            tenant, _QUERY, model="m", agent_id=None, response="answer", documents={"d1": "1.0"}
+        )
+        before = _sample("stale")
+
+        assert await _lookup(cache, tenant, _QUERY, versions=_versions({"d1": "1.0"}))
+        assert await _lookup(cache, tenant, _QUERY, versions=_versions({"d1": "2.0"})) is None
+
+        stats = cache.stats()
+        assert stats["stale"] == 1
+        assert stats["entries"] == 0
+        assert _sample("stale") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, monkeypatch):
+        cache = SemanticResponseCache(ttl=10)
+        tenant = uuid.uuid4()
+        cache.store(tenant, _QUERY, model="m", agent_id=None, response="answer", documents={})
+
+        later = time.monotonic() + 11
+        monkeypatch.setattr("src.cache.semantic_cache.time.monotonic", lambda: later)
+
+        assert await _lookup(cache, tenant, _QUERY) is None
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_oldest_entries_evicted(self):
+        cache = SemanticResponseCache(max_entries_per_tenant=2)
+        tenant = uuid.uuid4()
+        for i, vector in enumerate([_QUERY, _UNRELATED, [0.0, 0.0, 1.0]]):
+            cache.store(tenant, vector, model="m", agent_id=None, response=str(i), documents={})
+
+        assert cache.stats()["entries"] == 2
+        assert await _lookup(cache, tenant, _QUERY) is None
+        assert (await _lookup(cache, tenant, [0.0, 0.0, 1.0])).content == "2"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tenant(self):
+        cache = SemanticResponseCache()
+        tenant = uuid.uuid4()
+        cache.store(tenant, _QUERY, model="m", agent_id=None, response="answer", documents={})
+
+        assert cache.invalidate_tenant(tenant) == 1
+        assert await _lookup(cache, tenant, _QUERY) is None
+
+    @pytest.mark.asyncio
+    async def test_lookups_recorded_in_prometheus(self):
+        cache = SemanticResponseCache()
+        tenant = uuid.uuid4()
+        cache.store(tenant, _QUERY, model="m", agent_id=None, response="answer", documents={})
+        hits, misses = _sample("hit"), _sample("miss")
+
+        await _lookup(cache, tenant, _QUERY)
+        await _lookup(cache, tenant, _UNRELATED)
+
+        assert _sample("hit") == hits + 1
+        assert _sample("miss") == misses + 1
+
+    def test_disabled_by_default(self):
+        assert init_semantic_cache(SimpleNamespace()) is None
+
+
+class TestRuntimeSemanticCache:
+    def _runtime(self, cache: SemanticResponseCache, llm: Mock | None = None) -> AgentRuntime:
+        response_cache = Mock()
+        response_cache.get_cached_response = AsyncMock(return_value=None)
+        response_cache.cache_response = AsyncMock()
+        return AgentRuntime(
+            db=Mock(),
+            settings=SimpleNamespace(vector_top_k=5, litellm_default_model="test-model"),
+            llm_client=llm or Mock(),
+            response_cache=response_cache,
+            semantic_cache=cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_served_after_exact_miss(self):
+        cache = SemanticResponseCache()
+        runtime = self._runtime(cache)
+        runtime._document_versions = AsyncMock(return_value={"d1": "1.0"})
+        user = SimpleNamespace(id=uuid.uuid4(), tenant_id=uuid.uuid4())
+        citation = SimpleNamespace(document_id="d1", document_version="1.0")
+
+        await runtime._cache_response(
+            user=user,
+            request=ChatRequest(message="How do I lock out line 2?"),
+            model="m",
+            agent_id=None,
+            response_text="Follow LOTO-7",
+            turn=_turn(_QUERY, [citation]),
+        )
+        cached = await runtime._get_cached_response(
+            user=user,
+            request=ChatRequest(message="What is the lockout procedure for line 2?"),
+            model="m",
+            agent_id=None,
+            turn=_turn(_PARAPHRASE),
+        )
+
+        assert cached.content == "Follow LOTO-7"
+        runtime._document_versions.assert_awaited_once_with(user.tenant_id, ["d1"])
+
+    @pytest.mark.asyncio
+    async def test_degraded_turn_is_not_stored(self):
+        cache = SemanticResponseCache()
+        runtime = self._runtime(cache)
+        user = SimpleNamespace(id=uuid.uuid4(), tenant_id=uuid.uuid4())
+        timed_out = SourceResult(value=([], "", _QUERY), elapsed_ms=5000.0, status=STATUS_TIMEOUT)
+        degraded = AssembledContext(results={"retrieval": timed_out})
+
+        await runtime._cache_response(
+            user=user,
+            request=ChatRequest(message="How do I lock out line 2?"),
+            model="m",
+            agent_id=None,
+            response_text="No documents found",
+            turn=_turn(_QUERY, context=degraded),
+        )
+
+        assert cache.stats()["entries"] == 0
+        runtime._response_cache.cache_response.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_query_is_embedded_once_per_turn(self):
+        llm = Mock()
+        llm.embed = AsyncMock(return_value=[_QUERY])
+        runtime = self._runtime(SemanticResponseCache(), llm)
+        user = SimpleNamespace(id=uuid.uuid4(), tenant_id=uuid.uuid4())
+        turn = _turn(None)
+        request = ChatRequest(message="q")
+
+        await runtime._get_cached_response(
+            user=user, request=request, model="m", agent_id=None, turn=turn
+        )
+        await runtime._cache_response(
+            user=user, request=request, model="m", agent_id=None, response_text="a", turn=turn
+        )
+
+        llm.embed.assert_awaited_once_with(["q"])
+        assert turn.query_embedding == _QUERY
+
+    @pytest.mark.asyncio
+    async def test_retrieval_embedding_is_reused(self):
+        llm = Mock()
+        llm.embed = AsyncMock(return_value=[_UNRELATED])
+        runtime = self._runtime(SemanticResponseCache(), llm)
+        user = SimpleNamespace(id=uuid.uuid4(), tenant_id=uuid.uuid4())
+        retriever = Mock(query_embedding=_QUERY, retrieve=AsyncMock(return_value=[]))
+
+        with patch("src.rag.retrieve.RetrievalService", return_value=retriever):
+            citations, _, embedding = await runtime._retrieve_rag_context(user=user, query="q")
+        turn = _turn(embedding, citations)
+        await runtime._get_cached_response(
+            user=user, request=ChatRequest(message="q"), model="m", agent_id=None, turn=turn
+        )
+
+        assert embedding == _QUERY
+        llm.embed.assert_not_awaited()
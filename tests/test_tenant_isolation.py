@@ -263,6 +263,8 @@ class TestRAGIsolation:
         }
         mock_result = MagicMock()
         mock_result.mappings.return_value.all.return_value = [mock_row]
+        # Tenant A has only this chunk, so the ANN result is not re-run exactly
+        mock_result.scalar.return_value = 1
         db_session.execute = AsyncMock(return_value=mock_result)
 
         mock_llm = AsyncMock()
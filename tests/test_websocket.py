@@ -374,10 +374,10 @@ class TestWebSocketChatFlow:
     def test_message_receives_streaming_response(self, fake_settings) -> None:
         """Client sends a chat message and receives streamed response chunks.
 
-        Mocks AgentRuntime.chat directly to avoid the full DB + LLM chain
+        Mocks AgentRuntime.chat_stream directly to avoid the full DB + LLM chain
         while still verifying the WS message flow (auth -> message -> response).
         """
-        from src.agent.runtime import ChatResponse
+        from src.agent.runtime import ChatResponse, ChatStream
 
         token = _make_token()
         conv_id = uuid.uuid4()
@@ -412,8 +412,18 @@ class TestWebSocketChatFlow:
             mock_auth.return_value = auth_user
 
             # Set up runtime mock
-            mock_runtime_instance = AsyncMock()
-            mock_runtime_instance.chat = AsyncMock(return_value=fake_response)
+            async def deltas(stream):
+                for delta in ("This is ", "the agent ", "response"):
+                    yield delta
+                stream.response = fake_response
+
+            def chat_stream(**kwargs):
+                stream = ChatStream()
+                stream._deltas = deltas(stream)
+                return stream
+
+            mock_runtime_instance = MagicMock()
+            mock_runtime_instance.chat_stream = chat_stream
             MockRuntime.return_value = mock_runtime_instance
 
             with TestClient(app) as client:
@@ -441,9 +451,16 @@ class TestWebSocketChatFlow:
                     assert types_seen & {"response", "status"}, (
                         f"Expected response or status messages, got: {received}"
                     )
-                    # Final message should be done=True
+                    # Tokens arrive as done=False chunks, then the full response
+                    chunks = [
+                        m["content"]
+                        for m in received
+                        if m.get("type") == "response" and m.get("done") is False
+                    ]
+                    assert chunks == ["This is ", "the agent ", "response"]
                     final = received[-1]
-                    assert final.get("done") is True or final.get("type") == "error"
+                    assert final.get("done") is True
+                    assert final["content"] == "This is the agent response"
 
     def test_invalid_message_type_returns_error(self, fake_settings) -> None:
         """Sending an unknown message type returns an error message."""